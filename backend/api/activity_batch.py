@@ -0,0 +1,278 @@
+"""
+Batch operations on activities for the Activities board.
+
+A batch is a list of operations, each naming an activity::
+
+    {"op": "start", "id": "..."}
+    {"op": "pause", "id": "..."}
+    {"op": "reassign", "id": "...", "assigned_to": "alice"}
+    {"op": "reprioritize", "id": "...", "priority": "high"}
+
+The whole batch runs in one transaction. Every referenced activity is read
+(and locked) with a single query, operations are checked and applied in
+order in memory with the same rules as the single-activity endpoints, and
+the net changes are written as one ``UPDATE`` per distinct change set, with
+status_config/priority_config from the config registry in the same
+statement. An operation that fails its checks is reported and skipped; the
+rest still apply. Reassignments lock the new assignees' schedules before
+their double-booking check, as the single-activity endpoints do.
+
+Dashboard rollups move in the same transaction. There is no server-side
+activity cache to clear: list and calendar ETags follow ``updated_at``,
+which each UPDATE sets. Open Activities boards learn of the batch from the
+one ``activities_changed`` signal sent after commit.
+"""
+
+import uuid
+from collections import defaultdict
+from typing import Any, Dict, List, Tuple
+
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from .activity_calendar import FREE_STATUSES, find_conflicts, lock_schedules
+from .activity_config import get_activity_configs
+from .activity_events import send_activities_changed
+from .activity_rollups import apply_deltas, deltas_for_update
+from .models import Activity, ActivityPriority, ActivityStatus
+
+MAX_BATCH_OPERATIONS = 200
+START_PROGRESS = 10  # Minimum progress of a started activity
+
+OPERATIONS = ("start", "pause", "reassign", "reprioritize")
+PRIORITIES = {priority for priority, _ in Activity.PRIORITY_CHOICES}
+
+
+class BatchError(Exception):
+    """An operation that cannot be applied; reported per item"""
+
+    def __init__(self, error: str, code: str = "INVALID") -> None:
+        super().__init__(error)
+        self.code = code
+
+
+def _activity_id(operation) -> uuid.UUID:
+    try:
+        return uuid.UUID(str(operation.get("id")))
+    except ValueError:
+        raise BatchError("Activity not found", "NOT_FOUND")
+
+
+def _apply(activity: Activity, operation: Dict[str, Any]) -> Dict[str, Any]:
+    """Check one operation against the activity's current (in-batch) state
+
+    Returns the fields it sets; raises BatchError when it cannot apply.
+    """
+    op = operation.get("op")
+    if op == "start":
+        if activity.status == "completed":
+            raise BatchError("Cannot start a completed activity")
+        if activity.status == "in-progress":
+            raise BatchError("Activity is already in progress")
+        return {"status": "in-progress", "progress": START_PROGRESS}
+    if op == "pause":
+        if activity.status != "in-progress":
+            raise BatchError("Can only pause activities that are in progress")
+        return {"status": "planned"}
+    if op == "reassign":
+        assigned_to = str(operation.get("assigned_to") or "").strip()
+        if not assigned_to:
+            raise BatchError("assigned_to is required")
+        return {"assigned_to": assigned_to}
+    if op == "reprioritize":
+        priority = operation.get("priority")
+        if priority not in PRIORITIES:
+            raise BatchError(f"priority must be one of {sorted(PRIORITIES)}")
+        return {"priority": priority}
+    raise BatchError(f"op must be one of {list(OPERATIONS)}")
+
+
+def _check_reassignments(activities, originals, results) -> None:
+    """Reject reassignments that would double-book, in the table or the batch"""
+    moved = [
+        activity
+        for activity in activities.values()
+        if activity.assigned_to != originals[activity.pk]["assigned_to"]
+        and activity.status not in FREE_STATUSES
+    ]
+    lock_schedules(*(activity.assigned_to for activity in moved))
+    for activity in moved:
+        conflicts = [
+            other
+            for other in find_conflicts(
+                activity.assigned_to,
+                activity.start_time,
+                activity.end_time,
+                activity.pk,
+            )
+            # Batch members are judged by their new state below
+            if other.pk not in activities
+        ]
+        conflicts += [
+            other
+            for other in activities.values()
+            if other.pk != activity.pk
+            and other.assigned_to == activity.assigned_to
+            and other.status not in FREE_STATUSES
+            and other.start_time < activity.end_time
+            and other.end_time > activity.start_time
+        ]
+        if not conflicts:
+            continue
+        # Undo the move and fail the operations that made it
+        assignee = activity.assigned_to
+        activity.assigned_to = originals[activity.pk]["assigned_to"]
+        for result in results:
+            if result.get("_activity") is activity and result["op"] == "reassign":
+                result.update(
+                    success=False,
+                    error=f"{assignee} already has an activity at that time",
+                    code="SCHEDULE_CONFLICT",
+                    conflicts=[str(other.pk) for other in conflicts],
+                )
+
+
+def _result_payload(activity: Activity) -> Dict[str, Any]:
+    return {
+        "id": str(activity.id),
+        "status": activity.status,
+        "priority": activity.priority,
+        "assignedTo": activity.assigned_to,
+        "progress": activity.progress,
+        "updatedAt": activity.updated_at.isoformat(),
+    }
+
+
+def apply_activity_batch(operations: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Apply a batch of operations; returns per-item results and counts
+
+    Raises ValueError when the batch itself is malformed.
+    """
+    if not isinstance(operations, list) or not operations:
+        raise ValueError("operations must be a non-empty list")
+    if len(operations) > MAX_BATCH_OPERATIONS:
+        raise ValueError(f"A batch may hold at most {MAX_BATCH_OPERATIONS} operations")
+    if not all(isinstance(operation, dict) for operation in operations):
+        raise ValueError("Each operation must be an object")
+
+    with transaction.atomic():
+        ids = set()
+        for operation in operations:
+            try:
+                ids.add(_activity_id(operation))
+            except BatchError:
+                pass
+        activities = {
+            activity.pk: activity
+            for activity in Activity.objects.select_for_update()
+            .filter(pk__in=ids)
+            .only(
+                "id",
+                "type",
+                "status",
+                "priority",
+                "progress",
+                "assigned_to",
+                "start_time",
+                "end_time",
+                "updated_at",
+            )
+        }
+        originals = {
+            pk: {
+                "status": activity.status,
+                "priority": activity.priority,
+                "assigned_to": activity.assigned_to,
+                "progress": activity.progress,
+            }
+            for pk, activity in activities.items()
+        }
+
+        results: List[Dict[str, Any]] = []
+        for index, operation in enumerate(operations):
+            result = {
+                "index": index,
+                "id": operation.get("id"),
+                "op": operation.get("op"),
+            }
+            results.append(result)
+            try:
+                activity = activities.get(_activity_id(operation))
+                if activity is None:
+                    raise BatchError("Activity not found", "NOT_FOUND")
+                changes = _apply(activity, operation)
+            except BatchError as exc:
+                result.update(success=False, error=str(exc), code=exc.code)
+                continue
+            if "progress" in changes:
+                changes["progress"] = max(activity.progress, changes["progress"])
+            for field, value in changes.items():
+                setattr(activity, field, value)
+            result.update(success=True, _activity=activity)
+
+        _check_reassignments(activities, originals, results)
+        _write(activities, originals)
+
+    for result in results:
+        activity = result.pop("_activity", None)
+        if result["success"]:
+            result["activity"] = _result_payload(activity)
+    applied = sum(1 for result in results if result["success"])
+    return {"results": results, "applied": applied, "failed": len(results) - applied}
+
+
+def _write(activities, originals):
+    """One UPDATE per distinct set of net changes
+
+    Sets ``updated_at`` on the written activities; the others keep theirs.
+    """
+    configs = get_activity_configs()
+    groups: Dict[Tuple, List] = defaultdict(list)
+    for pk, activity in activities.items():
+        changes = tuple(
+            (field, getattr(activity, field))
+            for field in ("status", "priority", "assigned_to")
+            if getattr(activity, field) != originals[pk][field]
+        )
+        # Starting raises progress to a floor; rows keep anything higher
+        if activity.progress != originals[pk]["progress"]:
+            changes += (("progress_floor", START_PROGRESS),)
+        if changes:
+            groups[changes].append(pk)
+
+    now = timezone.now()
+    changed_fields: Dict[str, Any] = {}
+    for changes, pks in groups.items():
+        values = dict(changes)
+        queryset = Activity.objects.filter(pk__in=pks)
+        deltas = deltas_for_update(queryset, values)
+        update: Dict[str, Any] = {"updated_at": now}
+        if "status" in values:
+            update["status"] = values["status"]
+            update["status_config_id"] = configs.get(
+                ActivityStatus, values["status"]
+            ).pk
+        if "priority" in values:
+            update["priority"] = values["priority"]
+            update["priority_config_id"] = configs.get(
+                ActivityPriority, values["priority"]
+            ).pk
+        if "assigned_to" in values:
+            update["assigned_to"] = values["assigned_to"]
+        if "progress_floor" in values:
+            update["progress"] = Greatest(F("progress"), values["progress_floor"])
+        queryset.update(**update)
+        apply_deltas(deltas)
+        for pk in pks:
+            activities[pk].updated_at = now
+        for field, value in values.items():
+            field = "progress" if field == "progress_floor" else field
+            # Fields set to different values across groups are announced as None
+            if changed_fields.get(field, value) != value:
+                value = None
+            changed_fields[field] = value
+
+    changed_ids = [pk for pks in groups.values() for pk in pks]
+    send_activities_changed(Activity, changed_ids, changed_fields)
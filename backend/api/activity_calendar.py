@@ -0,0 +1,186 @@
+"""
+Calendar windows and double-booking checks over activity time spans.
+
+An activity occupies the half-open span ``[start_time, end_time)``. Two
+questions are asked of those spans, each as a single query:
+
+* which activities overlap a calendar window (optionally for one person);
+* which activities of a person overlap the span of one being saved.
+
+On PostgreSQL the overlap is a ``tstzrange && tstzrange`` test served by the
+GiST indexes from migration 0041 (``btree_gist`` lets the per-person index
+lead with ``assigned_to``). Elsewhere it is the equivalent
+``start_time < end AND end_time > start`` comparison, served by btree
+indexes that lead with ``end_time`` so rows that ended before the window
+are never read.
+
+A conflict check and the write it guards must run in one transaction after
+``lock_schedules()`` for the assignee, or two requests can both find the
+slot free and both book it.
+"""
+
+from datetime import datetime, time, timedelta
+from typing import List, Optional
+
+from django.db import connection
+from django.db.models import BooleanField, Expression, F, Value
+from django.db.transaction import TransactionManagementError
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from .models import Activity
+
+MAX_CALENDAR_DAYS = 366
+MAX_CALENDAR_RESULTS = 2000
+MAX_CONFLICTS = 20
+
+# Activities in these statuses no longer hold their time slot
+FREE_STATUSES = ("cancelled",)
+# An update that changes none of these cannot create a double booking
+SCHEDULE_FIELDS = ("start_time", "end_time", "assigned_to", "status")
+
+
+class Overlaps(Expression):
+    """True for rows whose ``[start_time, end_time)`` meets ``[start, end)``"""
+
+    output_field = BooleanField()
+    conditional = True
+
+    def __init__(self, start: datetime, end: datetime) -> None:
+        super().__init__()
+        self.source_expressions = [
+            F("start_time"),
+            F("end_time"),
+            Value(start),
+            Value(end),
+        ]
+
+    def get_source_expressions(self):
+        return self.source_expressions
+
+    def set_source_expressions(self, exprs):
+        self.source_expressions = list(exprs)
+
+    def _compile(self, compiler):
+        return [compiler.compile(expression) for expression in self.source_expressions]
+
+    def as_sql(self, compiler, connection):
+        row_start, row_end, start, end = self._compile(compiler)
+        return f"({row_start[0]} < {end[0]} AND {row_end[0]} > {start[0]})", (
+            *row_start[1],
+            *end[1],
+            *row_end[1],
+            *start[1],
+        )
+
+    def as_postgresql(self, compiler, connection):
+        row_start, row_end, start, end = self._compile(compiler)
+        # Same expression as the GiST indexes; GREATEST keeps a row whose end
+        # precedes its start from making tstzrange raise
+        return (
+            f"tstzrange({row_start[0]}, GREATEST({row_start[0]}, {row_end[0]}), '[)')"
+            f" && tstzrange({start[0]}, {end[0]}, '[)')"
+        ), (*row_start[1], *row_start[1], *row_end[1], *start[1], *end[1])
+
+
+def parse_moment(value: Optional[str], end_of_day: bool = False) -> datetime:
+    """An aware datetime from an ISO datetime or date; ValueError otherwise
+
+    A bare date means its start, or the start of the next day when
+    ``end_of_day`` (so ``to=2026-10-19`` includes that whole day).
+    """
+    if not value:
+        raise ValueError("A date or datetime is required")
+    value = value.strip().replace("Z", "+00:00")
+    try:
+        day = parse_date(value)
+        moment = None if day else parse_datetime(value)
+    except ValueError:
+        day = moment = None
+    if day is not None:
+        if end_of_day:
+            day += timedelta(days=1)
+        moment = datetime.combine(day, time.min)
+    elif moment is None:
+        raise ValueError(f"Invalid date or datetime {value!r}")
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
+
+def calendar_window(
+    start: datetime, end: datetime, assigned_to: Optional[str] = None, queryset=None
+):
+    """Activities overlapping ``[start, end)``, by start time"""
+    if end <= start:
+        raise ValueError("The window must end after it starts")
+    if end - start > timedelta(days=MAX_CALENDAR_DAYS):
+        raise ValueError(f"The window may span at most {MAX_CALENDAR_DAYS} days")
+    queryset = Activity.objects.all() if queryset is None else queryset
+    if assigned_to:
+        queryset = queryset.filter(assigned_to=assigned_to)
+    return queryset.filter(Overlaps(start, end)).order_by("start_time", "id")
+
+
+def schedule_of(activity) -> tuple:
+    """The SCHEDULE_FIELDS values of an activity, for spotting changes"""
+    return tuple(getattr(activity, field) for field in SCHEDULE_FIELDS)
+
+
+def lock_schedules(*assignees: str) -> None:
+    """Hold the schedules of ``assignees`` until the transaction ends
+
+    On PostgreSQL this takes a transaction-level advisory lock per assignee,
+    in sorted order so that two batches never deadlock. Other databases get
+    no lock; SQLite (development and tests) runs one writer at a time.
+    """
+    if not connection.in_atomic_block:
+        raise TransactionManagementError(
+            "lock_schedules() must be called inside transaction.atomic()"
+        )
+    if connection.vendor != "postgresql":
+        return
+    with connection.cursor() as cursor:
+        for assignee in sorted({assignee for assignee in assignees if assignee}):
+            cursor.execute("SELECT pg_advisory_xact_lock(hashtext(%s))", [assignee])
+
+
+def find_conflicts(
+    assigned_to: str,
+    start: datetime,
+    end: datetime,
+    exclude_id=None,
+    limit: int = MAX_CONFLICTS,
+) -> List[Activity]:
+    """Activities of ``assigned_to`` that overlap ``[start, end)``
+
+    Cancelled activities and ``exclude_id`` (the activity being updated) are
+    left out. Empty spans conflict with nothing.
+    """
+    if not assigned_to or not start or not end or end <= start:
+        return []
+    queryset = (
+        Activity.objects.filter(assigned_to=assigned_to)
+        .filter(Overlaps(start, end))
+        .exclude(status__in=FREE_STATUSES)
+    )
+    if exclude_id is not None:
+        queryset = queryset.exclude(pk=exclude_id)
+    return list(
+        queryset.only("id", "title", "start_time", "end_time", "status").order_by(
+            "start_time", "id"
+        )[:limit]
+    )
+
+
+def conflicts_payload(conflicts: List[Activity]) -> List[dict]:
+    return [
+        {
+            "id": str(activity.id),
+            "title": activity.title,
+            "status": activity.status,
+            "startTime": activity.start_time.isoformat(),
+            "endTime": activity.end_time.isoformat(),
+        }
+        for activity in conflicts
+    ]
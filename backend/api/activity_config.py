@@ -0,0 +1,146 @@
+"""
+Process-wide registry of the activity lookup tables.
+
+ActivityStatus and ActivityPriority hold a handful of rows that change only
+when someone edits them in the admin, yet Activity.save(), the serializers
+and the GraphQL types read them for every activity. The registry loads each
+table once per process and answers from memory.
+
+Saving or deleting a config row clears this process's copy (signals) and
+bumps the ``activity_config`` ReferenceDataVersion; other processes see the
+new stamp within ``ACTIVITY_CONFIG_CHECK_SECONDS`` and reload. A lookup that
+misses reloads its table once before giving up, so a row created by another
+process is found right away; a key or id still missing after that is
+remembered as missing until the next version bump or local edit, so
+repeated lookups of an unknown key do not query each time.
+
+Rows are shared between threads and requests: treat them as read-only.
+"""
+
+import threading
+import time
+from typing import Any, Dict, List, Optional, Set, Type
+
+from django.conf import settings
+from django.db import models
+
+from .models import ActivityPriority, ActivityStatus, ReferenceDataVersion
+
+ACTIVITY_CONFIG = "activity_config"
+DEFAULT_CHECK_SECONDS = 30
+
+# Config model -> the field activities refer to it by
+KEY_FIELDS: Dict[Type[models.Model], str] = {
+    ActivityStatus: "status",
+    ActivityPriority: "priority",
+}
+
+
+class ConfigTable:
+    """All rows of one config model, by primary key and by key field"""
+
+    def __init__(self, model: Type[models.Model]) -> None:
+        key_field = KEY_FIELDS[model]
+        self.rows: List[models.Model] = list(model.objects.all())
+        self.by_id = {row.pk: row for row in self.rows}
+        self.by_key = {getattr(row, key_field): row for row in self.rows}
+        # Looked up and absent even after a reload
+        self.missing_keys: Set[str] = set()
+        self.missing_ids: Set[Any] = set()
+
+
+class ActivityConfigRegistry:
+    def __init__(self) -> None:
+        self._tables: Dict[Type[models.Model], ConfigTable] = {}
+        self._version: Optional[int] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def _check_version(self) -> None:
+        interval = getattr(
+            settings, "ACTIVITY_CONFIG_CHECK_SECONDS", DEFAULT_CHECK_SECONDS
+        )
+        if time.monotonic() - self._checked_at < interval:
+            return
+        version = ReferenceDataVersion.current(ACTIVITY_CONFIG)
+        with self._lock:
+            if version != self._version:
+                self._tables = {}
+                self._version = version
+            self._checked_at = time.monotonic()
+
+    def _table(self, model: Type[models.Model]) -> ConfigTable:
+        self._check_version()
+        table = self._tables.get(model)
+        if table is None:
+            with self._lock:
+                table = self._tables.get(model)
+                if table is None:
+                    table = self._tables[model] = ConfigTable(model)
+        return table
+
+    def _reload(self, model: Type[models.Model]) -> ConfigTable:
+        """Reread ``model``'s table, keeping the misses it still lacks"""
+        table = ConfigTable(model)
+        with self._lock:
+            stale = self._tables.get(model)
+            if stale is not None:
+                table.missing_keys = stale.missing_keys - table.by_key.keys()
+                table.missing_ids = stale.missing_ids - table.by_id.keys()
+            self._tables[model] = table
+        return table
+
+    def get(self, model: Type[models.Model], key: str) -> models.Model:
+        """The row of ``model`` for ``key``; raises model.DoesNotExist"""
+        table = self._table(model)
+        row = table.by_key.get(key)
+        if row is None and key not in table.missing_keys:
+            table = self._reload(model)
+            row = table.by_key.get(key)
+            if row is None:
+                table.missing_keys.add(key)
+        if row is None:
+            raise model.DoesNotExist(f"No {model.__name__} for {key!r}")
+        return row
+
+    def get_by_id(self, model: Type[models.Model], pk) -> Optional[models.Model]:
+        if pk is None:
+            return None
+        table = self._table(model)
+        row = table.by_id.get(pk)
+        if row is None and pk not in table.missing_ids:
+            table = self._reload(model)
+            row = table.by_id.get(pk)
+            if row is None:
+                table.missing_ids.add(pk)
+        return row
+
+    def all(self, model: Type[models.Model]) -> List[models.Model]:
+        """Every row of ``model`` in its default ordering"""
+        return list(self._table(model).rows)
+
+    def invalidate(self, model: Optional[Type[models.Model]] = None) -> None:
+        with self._lock:
+            if model is None:
+                self._tables = {}
+                self._checked_at = 0.0
+            else:
+                self._tables.pop(model, None)
+
+
+_registry: Optional[ActivityConfigRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_activity_configs() -> ActivityConfigRegistry:
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ActivityConfigRegistry()
+    return _registry
+
+
+def bump_activity_config_version() -> int:
+    """Record that a config table changed so every process reloads"""
+    return ReferenceDataVersion.bump(ACTIVITY_CONFIG)
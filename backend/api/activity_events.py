@@ -0,0 +1,63 @@
+"""
+Bulk change notifications for activities.
+
+Set-based writes (``QuerySet.update``) skip ``post_save``, so the code doing
+them announces the change here instead: one ``activities_changed`` signal per
+batch, sent after the transaction commits, carrying the ids and the fields
+that were set. Receivers get ``activity_ids`` (list) and ``changes`` (dict
+of field to new value; None when the batch set different values).
+
+A receiver in signals.py forwards every batch to the ``activities`` channel
+layer group, where ``ws/activities/`` clients (the Activities board) hear it
+and refetch the rows they show.
+"""
+
+import json
+import logging
+from typing import Any, Iterable, Mapping
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.dispatch import Signal
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+
+logger = logging.getLogger(__name__)
+
+ACTIVITY_GROUP = "activities"
+
+activities_changed = Signal()
+
+
+def send_activities_changed(
+    sender, activity_ids: Iterable, changes: Mapping[str, Any]
+) -> None:
+    """Send ``activities_changed`` once the current transaction commits"""
+    activity_ids = [str(activity_id) for activity_id in activity_ids]
+    if not activity_ids:
+        return
+    changes = dict(changes)
+    transaction.on_commit(
+        lambda: activities_changed.send(
+            sender=sender, activity_ids=activity_ids, changes=changes
+        )
+    )
+
+
+def publish_activities_changed(activity_ids, changes: Mapping[str, Any]) -> None:
+    """Tell every ``ws/activities/`` client which activities changed"""
+    channel_layer = get_channel_layer()
+    if channel_layer is None:
+        return
+    try:
+        async_to_sync(channel_layer.group_send)(
+            ACTIVITY_GROUP,
+            {
+                "type": "activities.changed",
+                "activity_ids": list(activity_ids),
+                "changes": json.loads(json.dumps(changes, cls=DjangoJSONEncoder)),
+            },
+        )
+    except Exception:
+        logger.exception("Failed to publish activities_changed")
@@ -0,0 +1,118 @@
+"""
+Paged, projected activity listing.
+
+Activity lists page with a keyset on ``(created_at, id)``, newest first, so
+deep pages cost the same as the first. Rows are read with ``values()`` and
+only the columns a screen asks for (``fields=``) are selected; no model
+instances are built. The status, priority and type filters each have a
+composite index ending in ``(created_at, id)`` that serves filter and order
+together. The page also reports each row's ``updated_at`` so conditional GET
+can be answered from the page itself rather than from the whole table.
+"""
+
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from django.db.models import Q
+
+from .cursors import InvalidCursor, decode_cursor, encode_cursor
+
+DEFAULT_ACTIVITY_PAGE_SIZE = 50
+MAX_ACTIVITY_PAGE_SIZE = 200
+
+# Response key -> model field, in response order
+ACTIVITY_LIST_FIELDS: Dict[str, str] = {
+    "id": "id",
+    "title": "title",
+    "description": "description",
+    "type": "type",
+    "status": "status",
+    "priority": "priority",
+    "startTime": "start_time",
+    "endTime": "end_time",
+    "assignedTo": "assigned_to",
+    "assignedBy": "assigned_by",
+    "location": "location",
+    "progress": "progress",
+    "estimatedDuration": "estimated_duration",
+    "actualDuration": "actual_duration",
+    "notes": "notes",
+    "createdAt": "created_at",
+    "updatedAt": "updated_at",
+}
+
+
+def parse_activity_fields(value: Optional[str]) -> List[str]:
+    """Response keys named by a ``fields=`` parameter; all of them if empty
+
+    Accepts response keys (``startTime``) or model field names
+    (``start_time``). Raises ValueError for anything else.
+    """
+    if not value:
+        return list(ACTIVITY_LIST_FIELDS)
+    by_field = {field: key for key, field in ACTIVITY_LIST_FIELDS.items()}
+    keys = []
+    for name in (part.strip() for part in value.split(",")):
+        if not name:
+            continue
+        key = name if name in ACTIVITY_LIST_FIELDS else by_field.get(name)
+        if key is None:
+            raise ValueError(f"Unknown activity field {name!r}")
+        if key not in keys:
+            keys.append(key)
+    if not keys:
+        raise ValueError("No activity fields requested")
+    return keys
+
+
+def _json_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if value is not None and not isinstance(value, (str, int, float, bool)):
+        return str(value)  # UUID
+    return value
+
+
+def load_activity_page(
+    queryset,
+    keys: Sequence[str],
+    limit: int = DEFAULT_ACTIVITY_PAGE_SIZE,
+    cursor: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str], List[Tuple[Any, datetime]]]:
+    """Return a page of activity dicts (only ``keys``), the next cursor and
+    the page's ``(id, updated_at)`` pairs"""
+    if cursor:
+        created_at, activity_id = decode_cursor(cursor, 2)
+        try:
+            created_at = datetime.fromisoformat(created_at)
+            activity_id = uuid.UUID(activity_id)
+        except (TypeError, ValueError) as exc:
+            raise InvalidCursor("Invalid cursor") from exc
+        queryset = queryset.filter(
+            Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=activity_id)
+        )
+
+    columns = [ACTIVITY_LIST_FIELDS[key] for key in keys]
+    # The cursor needs the sort key even when the client did not ask for it
+    selected = list(dict.fromkeys([*columns, "created_at", "id", "updated_at"]))
+    rows = list(queryset.order_by("-created_at", "-id").values(*selected)[: limit + 1])
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor([last["created_at"].isoformat(), str(last["id"])])
+
+    stamps = [(row["id"], row["updated_at"]) for row in rows]
+    return [_project(row, keys) for row in rows], next_cursor, stamps
+
+
+def _project(row: Dict[str, Any], keys: Sequence[str]) -> Dict[str, Any]:
+    return {key: _json_value(row[ACTIVITY_LIST_FIELDS[key]]) for key in keys}
+
+
+def project_activities(queryset, keys: Sequence[str]) -> List[Dict[str, Any]]:
+    """Activity dicts with only ``keys``, in the queryset's order"""
+    columns = [ACTIVITY_LIST_FIELDS[key] for key in keys]
+    return [_project(row, keys) for row in queryset.values(*columns)]
@@ -0,0 +1,175 @@
+"""
+Incrementally maintained activity counts for the dashboard.
+
+ActivityDailyRollup holds the number of activities per (start day, type,
+status, priority). Saving or deleting an activity moves one unit between
+keys (signals; Activity.save() and delete() run them in the same transaction
+as the row change); set-based updates compute their moves with one grouped
+query via ``deltas_for_update`` and must apply them in their own
+transaction. If the counts ever drift, ``manage.py rebuild_activity_rollups``
+recounts the table.
+
+Dashboards then read a date range of the rollup, a few hundred rows at
+most, instead of every activity.
+
+Days are the start day in the current time zone, matching ``TruncDate``,
+so ``rebuild_rollups`` reproduces exactly what the increments maintain.
+"""
+
+from collections import Counter
+from datetime import date
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .models import Activity, ActivityDailyRollup
+
+RollupKey = Tuple[date, str, str, str]  # (day, type, status, priority)
+
+KEY_FIELDS = ("start_time", "type", "status", "priority")
+
+
+def _day(moment) -> date:
+    if timezone.is_naive(moment):
+        return moment.date()
+    return timezone.localdate(moment)
+
+
+def rollup_key(activity) -> Optional[RollupKey]:
+    if activity.start_time is None:
+        return None
+    return (
+        _day(activity.start_time),
+        activity.type,
+        activity.status,
+        activity.priority,
+    )
+
+
+def stored_rollup_key(activity_id) -> Optional[RollupKey]:
+    """The key of an activity as currently saved, before it is changed"""
+    row = Activity.objects.filter(pk=activity_id).values_list(*KEY_FIELDS).first()
+    if row is None:
+        return None
+    start_time, type, status, priority = row
+    return (_day(start_time), type, status, priority)
+
+
+def apply_deltas(deltas: Mapping[RollupKey, int]) -> int:
+    """Add each delta to its rollup row, creating rows as needed"""
+    changed = sorted((key, amount) for key, amount in deltas.items() if amount)
+    # Sorted keys make concurrent writers lock rows in the same order
+    with transaction.atomic():
+        for (day, type, status, priority), amount in changed:
+            rows = ActivityDailyRollup.objects.filter(
+                day=day, type=type, status=status, priority=priority
+            )
+            if rows.update(count=F("count") + amount):
+                continue
+            try:
+                with transaction.atomic():
+                    ActivityDailyRollup.objects.create(
+                        day=day,
+                        type=type,
+                        status=status,
+                        priority=priority,
+                        count=amount,
+                    )
+            except IntegrityError:
+                # A concurrent writer created the row first
+                rows.update(count=F("count") + amount)
+    return len(changed)
+
+
+def deltas_for_update(queryset, changes: Mapping[str, Any]) -> Counter:
+    """Rollup moves for ``queryset.update(**changes)``; call before updating
+
+    Only ``type``, ``status`` and ``priority`` changes move rows (a
+    ``start_time`` change does not fit a grouped query; save those one by
+    one).
+    """
+    moved = {field: changes[field] for field in KEY_FIELDS[1:] if field in changes}
+    deltas: Counter = Counter()
+    if not moved:
+        return deltas
+    groups = (
+        queryset.order_by()
+        .annotate(day=TruncDate("start_time"))
+        .values("day", "type", "status", "priority")
+        .annotate(total=Count("pk"))
+    )
+    for group in groups:
+        old = (group["day"], group["type"], group["status"], group["priority"])
+        new = (
+            group["day"],
+            moved.get("type", group["type"]),
+            moved.get("status", group["status"]),
+            moved.get("priority", group["priority"]),
+        )
+        if new != old:
+            deltas[old] -= group["total"]
+            deltas[new] += group["total"]
+    return deltas
+
+
+def rebuild_rollups() -> int:
+    """Recount every rollup row from the activities; returns the row count"""
+    groups = (
+        Activity.objects.order_by()
+        .annotate(day=TruncDate("start_time"))
+        .values("day", "type", "status", "priority")
+        .annotate(total=Count("pk"))
+    )
+    rows = [
+        ActivityDailyRollup(
+            day=group["day"],
+            type=group["type"],
+            status=group["status"],
+            priority=group["priority"],
+            count=group["total"],
+        )
+        for group in groups
+    ]
+    with transaction.atomic():
+        ActivityDailyRollup.objects.all().delete()
+        ActivityDailyRollup.objects.bulk_create(rows, batch_size=1000)
+    return len(rows)
+
+
+def activity_stats(
+    start_day: Optional[date] = None,
+    end_day: Optional[date] = None,
+    type: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Counts by status, priority, type and day over an inclusive day range"""
+    rollups = ActivityDailyRollup.objects.all()
+    if start_day:
+        rollups = rollups.filter(day__gte=start_day)
+    if end_day:
+        rollups = rollups.filter(day__lte=end_day)
+    if type:
+        rollups = rollups.filter(type=type)
+
+    by_status: Counter = Counter()
+    by_priority: Counter = Counter()
+    by_type: Counter = Counter()
+    by_day: Counter = Counter()
+    for row in rollups.values_list("day", "type", "status", "priority", "count"):
+        day, type_, status, priority, count = row
+        if not count:
+            continue
+        by_status[status] += count
+        by_priority[priority] += count
+        by_type[type_] += count
+        by_day[day.isoformat()] += count
+
+    return {
+        "total": sum(by_status.values()),
+        "by_status": dict(sorted(by_status.items())),
+        "by_priority": dict(sorted(by_priority.items())),
+        "by_type": dict(sorted(by_type.items())),
+        "by_day": dict(sorted(by_day.items())),
+    }
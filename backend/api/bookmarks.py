@@ -0,0 +1,79 @@
+"""
+Update bookmarks: per-user lists and bookmark state for feeds.
+
+Bookmark lists page with a keyset on ``(created_at, id)``, newest first, so
+deep pages cost the same as the first one. Feeds never ask "is this one
+bookmarked?" per update; they annotate the page queryset with an ``EXISTS``.
+"""
+
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Exists, Max, OuterRef, Q
+
+from .cursors import decode_cursor, encode_cursor
+from .models import Update, UpdateBookmark
+
+DEFAULT_BOOKMARK_PAGE_SIZE = 20
+MAX_BOOKMARK_PAGE_SIZE = 100
+
+
+def annotate_bookmarked(queryset, user):
+    """Annotate each update with ``is_bookmarked`` for ``user``"""
+    return queryset.annotate(
+        is_bookmarked=Exists(
+            UpdateBookmark.objects.filter(user=user, update_id=OuterRef("pk"))
+        )
+    )
+
+
+def bookmark_validators(user) -> tuple:
+    """Parts for a feed ETag that change whenever ``user`` toggles a bookmark"""
+    summary = UpdateBookmark.objects.filter(user=user).aggregate(
+        total=Count("pk"), latest=Max("created_at")
+    )
+    latest = summary["latest"]
+    return summary["total"], latest.isoformat() if latest else ""
+
+
+def toggle_bookmark(update_id: str, user) -> bool:
+    """Add or remove a bookmark; returns whether the update is now bookmarked"""
+    deleted, _ = UpdateBookmark.objects.filter(update_id=update_id, user=user).delete()
+    if deleted:
+        return False
+    try:
+        with transaction.atomic():
+            UpdateBookmark.objects.create(update_id=update_id, user=user)
+    except IntegrityError:
+        # A concurrent click created it first; the result is the same
+        pass
+    return True
+
+
+def _bookmark_cursor(bookmark: UpdateBookmark) -> str:
+    return encode_cursor([bookmark.created_at.isoformat(), bookmark.id])
+
+
+def load_bookmarks(
+    user, limit: int = DEFAULT_BOOKMARK_PAGE_SIZE, cursor: Optional[str] = None
+) -> Tuple[List[UpdateBookmark], Optional[str]]:
+    """Return a page of the user's bookmarks on live updates, newest first"""
+    bookmarks = UpdateBookmark.objects.filter(
+        user=user, update__in=Update.objects.live()
+    ).select_related("update")
+    if cursor:
+        created_at, bookmark_id = decode_cursor(cursor, 2)
+        created_at = datetime.fromisoformat(created_at)
+        bookmarks = bookmarks.filter(
+            Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=bookmark_id)
+        )
+    bookmarks = list(bookmarks.order_by("-created_at", "-id")[: limit + 1])
+
+    for bookmark in bookmarks:
+        bookmark.update.is_bookmarked = True
+
+    if len(bookmarks) > limit:
+        bookmarks = bookmarks[:limit]
+        return bookmarks, _bookmark_cursor(bookmarks[-1])
+    return bookmarks, None
@@ -0,0 +1,190 @@
+"""
+Bulk import of updates with their attachments and media.
+
+Every item is validated before anything is written, including a single query
+for id collisions. Valid items are then written with bulk_create, one
+transaction per chunk, so a failing chunk never leaves half an update behind
+and never rolls back the chunks before it.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import DatabaseError, transaction
+
+from .media_variants import schedule_media_processing
+from .models import Update, UpdateAttachment, UpdateMedia
+from .ranking import hot_score
+from .update_search import get_update_search
+from .update_stream import EVENT_CREATED, publish_update_event, update_payload
+
+DEFAULT_CHUNK_SIZE = 500
+MAX_CHUNK_SIZE = 5000
+
+UPDATE_FIELDS = (
+    "id",
+    "type",
+    "title",
+    "summary",
+    "body",
+    "author",
+    "icon",
+    "tags",
+    "status",
+    "priority",
+    "timestamp",
+    "expires_at",
+)
+REQUIRED_FIELDS = ("id", "type", "title", "summary", "body")
+
+
+def get_bulk_chunk_size(requested: Optional[Any] = None) -> int:
+    """Chunk size from the request, else settings.UPDATE_BULK_CHUNK_SIZE"""
+    if requested in (None, ""):
+        requested = getattr(settings, "UPDATE_BULK_CHUNK_SIZE", DEFAULT_CHUNK_SIZE)
+    return min(max(int(requested), 1), MAX_CHUNK_SIZE)
+
+
+def _errors(exc: ValidationError, prefix: str = "") -> Dict[str, List[str]]:
+    if hasattr(exc, "message_dict"):
+        return {
+            f"{prefix}{field}": list(messages)
+            for field, messages in exc.message_dict.items()
+        }
+    return {f"{prefix}__all__": list(exc.messages)}
+
+
+class PreparedUpdate:
+    """An unsaved update plus its unsaved children, ready for bulk_create"""
+
+    def __init__(self, index: int, update: Update) -> None:
+        self.index = index
+        self.update = update
+        self.attachments: List[UpdateAttachment] = []
+        self.media: List[UpdateMedia] = []
+
+
+def prepare_item(
+    index: int, item: Any, user
+) -> Tuple[Optional[PreparedUpdate], Dict[str, List[str]]]:
+    """Build and validate one item without touching the database"""
+    if not isinstance(item, dict):
+        return None, {"__all__": ["Each item must be an object"]}
+
+    errors: Dict[str, List[str]] = {}
+    for field in REQUIRED_FIELDS:
+        if item.get(field) in (None, ""):
+            errors[field] = ["This field is required."]
+
+    values = {field: item[field] for field in UPDATE_FIELDS if field in item}
+    values.setdefault("author", user.username)
+    update = Update(created_by=user, **values)
+    try:
+        # tags is a list field that may legitimately be empty; checked below
+        update.full_clean(
+            exclude=["created_by", "score", "tags"], validate_unique=False
+        )
+    except ValidationError as exc:
+        for field, messages in _errors(exc).items():
+            errors.setdefault(field, messages)
+    if not isinstance(update.tags, list):
+        errors["tags"] = ["Tags must be a list."]
+
+    prepared = PreparedUpdate(index, update)
+    children = (
+        ("attachments", UpdateAttachment, prepared.attachments, {}),
+        ("media", UpdateMedia, prepared.media, {"thumbnailUrl": "thumbnail_url"}),
+    )
+    for key, model, bucket, aliases in children:
+        entries = item.get(key) or []
+        if not isinstance(entries, list):
+            errors[key] = ["Must be a list."]
+            continue
+        writable = {
+            field.name
+            for field in model._meta.concrete_fields
+            if field.name not in ("id", "update", "created_at")
+        }
+        for position, entry in enumerate(entries):
+            if not isinstance(entry, dict):
+                errors[f"{key}[{position}]"] = ["Must be an object."]
+                continue
+            fields = {}
+            for name, value in entry.items():
+                name = aliases.get(name, name)
+                if name in writable:
+                    fields[name] = value
+            child = model(update=update, **fields)
+            try:
+                child.full_clean(exclude=["update"], validate_unique=False)
+            except ValidationError as exc:
+                errors.update(_errors(exc, prefix=f"{key}[{position}]."))
+            bucket.append(child)
+
+    if errors:
+        return None, errors
+    return prepared, {}
+
+
+def bulk_import_updates(
+    items: List[Any], user, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> List[Dict[str, Any]]:
+    """Validate then insert ``items``; return one result dict per item"""
+    results: List[Dict[str, Any]] = [{} for _ in items]
+    prepared: List[PreparedUpdate] = []
+
+    for index, item in enumerate(items):
+        ready, errors = prepare_item(index, item, user)
+        item_id = item.get("id") if isinstance(item, dict) else None
+        results[index] = {"index": index, "id": item_id, "success": not errors}
+        if errors:
+            results[index]["errors"] = errors
+        else:
+            prepared.append(ready)
+
+    # Id collisions, within the payload and against the table, in one query
+    seen = set()
+    existing = set(
+        Update.objects.filter(id__in=[p.update.id for p in prepared]).values_list(
+            "id", flat=True
+        )
+    )
+    valid: List[PreparedUpdate] = []
+    for ready in prepared:
+        if ready.update.id in existing or ready.update.id in seen:
+            results[ready.index].update(
+                success=False, errors={"id": ["An update with this id already exists."]}
+            )
+            continue
+        seen.add(ready.update.id)
+        valid.append(ready)
+
+    # bulk_create skips save(), so set the baseline score here
+    for ready in valid:
+        update = ready.update
+        update.score = hot_score(update.priority, update.timestamp, expires_at=None)
+
+    search = get_update_search()
+    for start in range(0, len(valid), chunk_size):
+        chunk = valid[start : start + chunk_size]
+        try:
+            with transaction.atomic():
+                Update.objects.bulk_create([ready.update for ready in chunk])
+                UpdateAttachment.objects.bulk_create(
+                    [att for ready in chunk for att in ready.attachments]
+                )
+                media = UpdateMedia.objects.bulk_create(
+                    [med for ready in chunk for med in ready.media]
+                )
+                schedule_media_processing(media)
+                search.index_updates([ready.update for ready in chunk])
+                for ready in chunk:
+                    publish_update_event(EVENT_CREATED, update_payload(ready.update))
+        except DatabaseError as exc:
+            for ready in chunk:
+                results[ready.index].update(
+                    success=False, errors={"__all__": [str(exc)]}
+                )
+
+    return results
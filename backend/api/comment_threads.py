@@ -0,0 +1,113 @@
+"""
+Threaded comment loading for updates.
+
+A thread page is read in two queries regardless of its size: one for a page of
+top-level comments, and one for the first few replies of every comment on that
+page, picked with ROW_NUMBER() partitioned by parent. Comments with more
+replies than the preview carry a cursor for fetching the rest.
+"""
+
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from django.db.models import Count, F, Q
+from django.db.models.expressions import Window
+from django.db.models.functions import RowNumber
+
+from .cursors import decode_cursor, encode_cursor
+from .models import UpdateComment
+
+DEFAULT_COMMENT_PAGE_SIZE = 20
+DEFAULT_REPLY_PREVIEW = 3
+MAX_COMMENT_PAGE_SIZE = 100
+
+
+def _comment_cursor(comment: UpdateComment) -> str:
+    return encode_cursor([comment.created_at.isoformat(), comment.id])
+
+
+def _after_cursor(queryset, cursor: Optional[str]):
+    if not cursor:
+        return queryset
+    created_at, comment_id = decode_cursor(cursor, 2)
+    created_at = datetime.fromisoformat(created_at)
+    return queryset.filter(
+        Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=comment_id)
+    )
+
+
+def load_comment_thread(
+    update_id: str,
+    limit: int = DEFAULT_COMMENT_PAGE_SIZE,
+    replies_per_comment: int = DEFAULT_REPLY_PREVIEW,
+    cursor: Optional[str] = None,
+) -> Tuple[List[UpdateComment], Optional[str]]:
+    """Return a page of top-level comments with a preview of their replies
+
+    Each returned comment has ``preview_replies`` (oldest first),
+    ``reply_total`` and ``replies_cursor`` (None when all replies are in the
+    preview) attached.
+    """
+    comments = _after_cursor(
+        UpdateComment.objects.filter(
+            update_id=update_id, is_active=True, parent_comment__isnull=True
+        ).select_related("author"),
+        cursor,
+    ).order_by("created_at", "id")
+    comments = list(comments[: limit + 1])
+
+    next_cursor = None
+    if len(comments) > limit:
+        comments = comments[:limit]
+        next_cursor = _comment_cursor(comments[-1])
+
+    for comment in comments:
+        comment.preview_replies = []
+        comment.reply_total = 0
+        comment.replies_cursor = None
+    if not comments or replies_per_comment <= 0:
+        return comments, next_cursor
+
+    by_id = {comment.id: comment for comment in comments}
+    partition = [F("parent_comment_id")]
+    replies = (
+        UpdateComment.objects.filter(parent_comment_id__in=by_id, is_active=True)
+        .select_related("author")
+        .annotate(
+            position=Window(
+                RowNumber(),
+                partition_by=partition,
+                order_by=[F("created_at").asc(), F("id").asc()],
+            ),
+            reply_total=Window(Count("id"), partition_by=partition),
+        )
+        .filter(position__lte=replies_per_comment)
+        .order_by("parent_comment_id", "position")
+    )
+    for reply in replies:
+        parent = by_id[reply.parent_comment_id]
+        parent.preview_replies.append(reply)
+        parent.reply_total = reply.reply_total
+
+    for comment in comments:
+        if comment.reply_total > len(comment.preview_replies):
+            comment.replies_cursor = _comment_cursor(comment.preview_replies[-1])
+    return comments, next_cursor
+
+
+def load_replies(
+    parent_id: int, limit: int = DEFAULT_COMMENT_PAGE_SIZE, cursor: Optional[str] = None
+) -> Tuple[List[UpdateComment], Optional[str]]:
+    """Return the next page of replies to a comment, oldest first"""
+    replies = _after_cursor(
+        UpdateComment.objects.filter(
+            parent_comment_id=parent_id, is_active=True
+        ).select_related("author"),
+        cursor,
+    ).order_by("created_at", "id")
+    replies = list(replies[: limit + 1])
+
+    if len(replies) > limit:
+        replies = replies[:limit]
+        return replies, _comment_cursor(replies[-1])
+    return replies, None
@@ -0,0 +1,116 @@
+"""
+Conditional GET helpers for JSON list and detail endpoints.
+
+Validators are derived from a single aggregate over the filtered queryset
+(row count plus max(updated_at)), so a client polling an unchanged list gets a
+304 before any rows are fetched or serialized.
+"""
+
+import hashlib
+from datetime import datetime
+from typing import Optional, Sequence, Tuple
+
+from django.db.models import Count, Max
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
+from django.utils.http import http_date
+
+Validators = Tuple[str, Optional[datetime]]
+
+
+def _weak_etag(*parts) -> str:
+    digest = hashlib.blake2b(
+        "|".join(str(part) for part in parts).encode("utf-8"), digest_size=12
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def queryset_validators(
+    request: HttpRequest,
+    queryset,
+    field: str = "updated_at",
+    user=None,
+    extra: Sequence = (),
+) -> Validators:
+    """Compute a weak ETag and Last-Modified for a filtered queryset
+
+    The ETag also covers the query string and the requesting user, because
+    responses carry per-user fields (like status, can_edit, ...). ``extra``
+    folds in any per-user state that changes without touching the rows.
+    """
+    summary = queryset.order_by().aggregate(last_modified=Max(field), total=Count("pk"))
+    last_modified = summary["last_modified"]
+    etag = _weak_etag(
+        request.path,
+        request.GET.urlencode(),
+        getattr(user, "pk", None),
+        summary["total"],
+        last_modified.isoformat() if last_modified else "",
+        *extra,
+    )
+    return etag, last_modified
+
+
+def page_validators(
+    request: HttpRequest, stamps: Sequence, user=None, extra: Sequence = ()
+) -> Validators:
+    """Compute a weak ETag and Last-Modified from an already-fetched page
+
+    ``stamps`` are the page's ``(pk, updated_at)`` pairs. Unlike
+    queryset_validators this adds no query, so keyset-paged lists over large
+    tables can use it; the cursor is covered through the query string.
+    """
+    last_modified = max((stamp for _, stamp in stamps if stamp), default=None)
+    etag = _weak_etag(
+        request.path,
+        request.GET.urlencode(),
+        getattr(user, "pk", None),
+        *(f"{pk}@{stamp.isoformat() if stamp else ''}" for pk, stamp in stamps),
+        *extra,
+    )
+    return etag, last_modified
+
+
+def instance_validators(
+    request: HttpRequest, instance, field: str = "updated_at", user=None
+) -> Validators:
+    """Compute a weak ETag and Last-Modified for a single already-loaded row"""
+    last_modified = getattr(instance, field, None)
+    etag = _weak_etag(
+        request.path,
+        request.GET.urlencode(),
+        getattr(user, "pk", None),
+        instance.pk,
+        last_modified.isoformat() if last_modified else "",
+    )
+    return etag, last_modified
+
+
+def not_modified(
+    request: HttpRequest, validators: Validators
+) -> Optional[HttpResponse]:
+    """Return a 304 response if the client's cached copy is still current"""
+    etag, last_modified = validators
+    response = get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=int(last_modified.timestamp()) if last_modified else None,
+    )
+    if response is not None:
+        set_validators(response, validators)
+    return response
+
+
+def set_validators(response: HttpResponse, validators: Validators) -> HttpResponse:
+    """Attach ETag/Last-Modified and make clients revalidate on every poll"""
+    etag, last_modified = validators
+    response["ETag"] = etag
+    if last_modified:
+        response["Last-Modified"] = http_date(last_modified.timestamp())
+    patch_cache_control(response, private=True, no_cache=True)
+    patch_vary_headers(response, ("Authorization",))
+    return response
@@ -7,6 +7,8 @@ from django.contrib.auth import get_user_model
 from channels.db import database_sync_to_async
 from channels.generic.websocket import AsyncWebsocketConsumer
 
+from .activity_events import ACTIVITY_GROUP
+
 
 class SystemMessageConsumer(AsyncWebsocketConsumer):
     async def connect(self):
@@ -67,6 +69,33 @@ class SystemMessageConsumer(AsyncWebsocketConsumer):
             return None
 
 
+class ActivityConsumer(AsyncWebsocketConsumer):
+    """Pushes activities_changed batches to signed-in Activities board clients"""
+
+    async def connect(self):
+        user = self.scope.get("user")
+        if user is None or not user.is_authenticated or self.channel_layer is None:
+            await self.close()
+            return
+        await self.channel_layer.group_add(ACTIVITY_GROUP, self.channel_name)
+        await self.accept()
+
+    async def disconnect(self, close_code):
+        if self.channel_layer is not None:
+            await self.channel_layer.group_discard(ACTIVITY_GROUP, self.channel_name)
+
+    async def activities_changed(self, event):
+        await self.send(
+            text_data=json.dumps(
+                {
+                    "type": "activities_changed",
+                    "activity_ids": event["activity_ids"],
+                    "changes": event["changes"],
+                }
+            )
+        )
+
+
 class TestConsumer(AsyncWebsocketConsumer):
     """Simple test consumer for WebSocket testing"""
 
@@ -0,0 +1,34 @@
+"""
+Opaque cursor tokens for keyset pagination.
+
+A cursor is the sort key of the last row a client has seen, serialized as
+URL-safe base64 JSON so it can travel in a query string.
+"""
+
+import base64
+import binascii
+import json
+from typing import Any, List, Sequence
+
+
+class InvalidCursor(ValueError):
+    """Raised when a client sends a cursor we did not issue"""
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Serialize a sort key (list of JSON-serializable values) into a cursor"""
+    raw = json.dumps(list(values), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, length: int) -> List[Any]:
+    """Parse a cursor back into its sort key, checking it has ``length`` parts"""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise InvalidCursor("Invalid cursor") from exc
+
+    if not isinstance(values, list) or len(values) != length:
+        raise InvalidCursor("Invalid cursor")
+    return values
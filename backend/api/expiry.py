@@ -0,0 +1,53 @@
+"""
+Expiry sweeping for time-sensitive updates.
+
+Reads already hide expired rows through ``Update.objects.live()``; the sweeper
+makes that permanent by deactivating them, a bounded batch at a time so each
+write transaction stays short.
+"""
+
+from typing import Optional
+
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Update
+from .update_stream import EVENT_DELETED, publish_update_event
+
+
+def expire_updates(
+    batch_size: int = 500, max_batches: Optional[int] = None, now=None
+) -> int:
+    """Deactivate expired updates in batches; return how many were expired"""
+    now = now or timezone.now()
+    expired = 0
+    batches = 0
+
+    while max_batches is None or batches < max_batches:
+        with transaction.atomic():
+            ids = list(
+                Update.objects.expired(now)
+                .order_by("expires_at")
+                .values_list("id", flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+            stamp = timezone.now()
+            Update.objects.filter(id__in=ids, is_active=True).update(
+                is_active=False, updated_at=stamp
+            )
+            # Only the rows this UPDATE changed; another writer may have
+            # deactivated some of ``ids`` since they were read
+            changed = list(
+                Update.objects.filter(
+                    id__in=ids, is_active=False, updated_at=stamp
+                ).values_list("id", flat=True)
+            )
+            expired += len(changed)
+            for update_id in changed:
+                publish_update_event(EVENT_DELETED, {"id": update_id})
+        batches += 1
+        if len(ids) < batch_size:
+            break
+
+    return expired
@@ -0,0 +1,450 @@
+"""
+In-memory gazetteer of countries, states, cities and zip codes.
+
+Location data changes about once a year but is read on every location
+picker, so each process keeps one compact copy. Cities and zip codes are
+held column-wise: interned strings plus ``array`` columns of ids and parent
+positions, no model instance per row. Sorted prefix indexes, searched with
+``bisect``, answer autocomplete and "starts with" filters; per-parent
+position lists answer "cities in this state" style filters.
+
+Results come back as unsaved-looking model instances whose parents are
+already attached, so GraphQL types and templates can use them without
+touching the database. Treat them as read-only: parents are shared.
+
+The copy is rebuilt when the ``locations`` ReferenceDataVersion moves, which
+the population commands and the admin do after writing. Each process checks
+the stamp at most every ``GAZETTEER_VERSION_CHECK_SECONDS``.
+"""
+
+import sys
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from decimal import Decimal
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import transaction
+
+from .models import City, Country, ReferenceDataVersion, State, ZipCode
+
+LOCATIONS = "locations"
+DEFAULT_CHECK_SECONDS = 30
+DEFAULT_SUGGESTION_LIMIT = 10
+MAX_SUGGESTION_LIMIT = 50
+
+NO_PARENT = -1
+NO_COORDINATE = float("nan")
+
+
+def _fold(text: str) -> str:
+    return text.casefold()
+
+
+class PrefixIndex:
+    """Sorted keys with parallel row positions; a prefix is one key range"""
+
+    def __init__(self, entries: Iterable[Tuple[str, int]]) -> None:
+        ordered = sorted(entries)
+        self.keys = [key for key, _ in ordered]
+        self.positions = array("i", (position for _, position in ordered))
+
+    def search(
+        self,
+        prefix: str,
+        limit: Optional[int] = None,
+        accept: Optional[Callable[[int], bool]] = None,
+    ) -> List[int]:
+        prefix = _fold(prefix)
+        found: List[int] = []
+        for i in range(bisect_left(self.keys, prefix), len(self.keys)):
+            if not self.keys[i].startswith(prefix):
+                break
+            position = self.positions[i]
+            if accept is None or accept(position):
+                found.append(position)
+                if limit and len(found) >= limit:
+                    break
+        return found
+
+
+def _as_id(value) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _mark_loaded(instance):
+    # Behave like a row fetched from the database (save() updates, not inserts)
+    instance._state.adding = False
+    instance._state.db = "default"
+    return instance
+
+
+class Gazetteer:
+    """Immutable snapshot of the location tables at one version"""
+
+    def __init__(self, version: int) -> None:
+        self.version = version
+
+        # Countries and states are few; keep them as model instances
+        self.countries: List[Country] = []
+        self.states: List[State] = []
+        self._country_pos: Dict[int, int] = {}
+        self._country_by_code: Dict[str, int] = {}
+        self._state_pos: Dict[int, int] = {}
+        self._states_by_name: Dict[str, List[int]] = defaultdict(list)
+
+        # Cities, column-wise, in name order
+        self.city_ids = array("q")
+        self.city_names: List[str] = []
+        self.city_state = array("i")
+        self.city_country = array("i")
+        self._city_pos: Dict[int, int] = {}
+
+        # Zip codes, column-wise, in code order
+        self.zip_ids = array("q")
+        self.zip_codes: List[str] = []
+        self.zip_city = array("i")
+        self.zip_state = array("i")
+        self.zip_country = array("i")
+        self.zip_latitude = array("d")
+        self.zip_longitude = array("d")
+        self._zip_pos: Dict[int, int] = {}
+
+        self._cities_by_state: Dict[int, array] = defaultdict(lambda: array("i"))
+        self._cities_by_country: Dict[int, array] = defaultdict(lambda: array("i"))
+        self._zips_by_city: Dict[int, array] = defaultdict(lambda: array("i"))
+        self._zips_by_state: Dict[int, array] = defaultdict(lambda: array("i"))
+
+        self.city_index = PrefixIndex(())
+        self.zip_index = PrefixIndex(())
+
+    @classmethod
+    def load(cls, version: int) -> "Gazetteer":
+        gazetteer = cls(version)
+        gazetteer._load_countries_and_states()
+        gazetteer._load_cities()
+        gazetteer._load_zip_codes()
+        return gazetteer
+
+    def _load_countries_and_states(self) -> None:
+        # Inactive parents are kept too: active children may point at them
+        for position, country in enumerate(Country.objects.order_by("name", "id")):
+            self.countries.append(_mark_loaded(country))
+            self._country_pos[country.id] = position
+            self._country_by_code[country.code.upper()] = position
+
+        states = State.objects.order_by("name", "id")
+        for position, state in enumerate(states):
+            state.country = self.countries[self._country_pos[state.country_id]]
+            self.states.append(_mark_loaded(state))
+            self._state_pos[state.id] = position
+            self._states_by_name[state.name].append(position)
+
+    def _load_cities(self) -> None:
+        rows = (
+            City.objects.filter(is_active=True)
+            .order_by("name", "id")
+            .values_list("id", "name", "state_id", "country_id")
+        )
+        for position, (city_id, name, state_id, country_id) in enumerate(
+            rows.iterator()
+        ):
+            state = self._state_pos.get(state_id, NO_PARENT)
+            country = self._country_pos.get(country_id, NO_PARENT)
+            self.city_ids.append(city_id)
+            self.city_names.append(sys.intern(name))
+            self.city_state.append(state)
+            self.city_country.append(country)
+            self._city_pos[city_id] = position
+            self._cities_by_state[state].append(position)
+            self._cities_by_country[country].append(position)
+
+        self.city_index = PrefixIndex(
+            (_fold(name), position) for position, name in enumerate(self.city_names)
+        )
+
+    def _load_zip_codes(self) -> None:
+        rows = (
+            # A zip code is only offered while its city is
+            ZipCode.objects.filter(is_active=True, city__is_active=True)
+            .order_by("code", "id")
+            .values_list(
+                "id",
+                "code",
+                "city_id",
+                "state_id",
+                "country_id",
+                "latitude",
+                "longitude",
+            )
+        )
+        for row in rows.iterator():
+            zip_id, code, city_id, state_id, country_id, latitude, longitude = row
+            city = self._city_pos.get(city_id)
+            if city is None:
+                continue  # City deactivated while loading; the next load has it
+            position = len(self.zip_ids)
+            state = self._state_pos.get(state_id, NO_PARENT)
+            self.zip_ids.append(zip_id)
+            self.zip_codes.append(sys.intern(code))
+            self.zip_city.append(city)
+            self.zip_state.append(state)
+            self.zip_country.append(self._country_pos.get(country_id, NO_PARENT))
+            self.zip_latitude.append(
+                NO_COORDINATE if latitude is None else float(latitude)
+            )
+            self.zip_longitude.append(
+                NO_COORDINATE if longitude is None else float(longitude)
+            )
+            self._zip_pos[zip_id] = position
+            self._zips_by_city[city].append(position)
+            self._zips_by_state[state].append(position)
+
+        self.zip_index = PrefixIndex(
+            (_fold(code), position) for position, code in enumerate(self.zip_codes)
+        )
+
+    # Model instances
+
+    def _parent(self, items: list, position: int):
+        return items[position] if position != NO_PARENT else None
+
+    def city_at(self, position: int) -> City:
+        city = City(
+            id=self.city_ids[position],
+            name=self.city_names[position],
+            is_active=True,
+        )
+        state = self._parent(self.states, self.city_state[position])
+        country = self._parent(self.countries, self.city_country[position])
+        if state is not None:
+            city.state = state
+        if country is not None:
+            city.country = country
+        return _mark_loaded(city)
+
+    def zip_code_at(self, position: int) -> ZipCode:
+        latitude = self.zip_latitude[position]
+        longitude = self.zip_longitude[position]
+        zip_code = ZipCode(
+            id=self.zip_ids[position],
+            code=self.zip_codes[position],
+            latitude=None if latitude != latitude else Decimal(f"{latitude:.6f}"),
+            longitude=None if longitude != longitude else Decimal(f"{longitude:.6f}"),
+            is_active=True,
+        )
+        zip_code.city = self.city_at(self.zip_city[position])
+        state = self._parent(self.states, self.zip_state[position])
+        country = self._parent(self.countries, self.zip_country[position])
+        if state is not None:
+            zip_code.state = state
+        if country is not None:
+            zip_code.country = country
+        return _mark_loaded(zip_code)
+
+    # Lookups
+
+    def _state_positions(
+        self, state_id=None, state_name: Optional[str] = None
+    ) -> Optional[List[int]]:
+        if state_id is not None:
+            position = self._state_pos.get(_as_id(state_id))
+            return [] if position is None else [position]
+        if state_name is not None:
+            return self._states_by_name.get(state_name, [])
+        return None
+
+    def get_countries(self) -> List[Country]:
+        return [country for country in self.countries if country.is_active]
+
+    def get_country(self, id=None, code: Optional[str] = None) -> Optional[Country]:
+        if id is not None:
+            position = self._country_pos.get(_as_id(id))
+        else:
+            position = self._country_by_code.get((code or "").upper())
+        if position is None or not self.countries[position].is_active:
+            return None
+        return self.countries[position]
+
+    def get_states(self, country_code: Optional[str] = None) -> List[State]:
+        states = [state for state in self.states if state.is_active]
+        if country_code:
+            code = country_code.upper()
+            states = [state for state in states if state.country.code.upper() == code]
+        return states
+
+    def get_state(self, id) -> Optional[State]:
+        position = self._state_pos.get(_as_id(id))
+        if position is None or not self.states[position].is_active:
+            return None
+        return self.states[position]
+
+    def get_cities(
+        self,
+        state_id=None,
+        state_name: Optional[str] = None,
+        country_code: Optional[str] = None,
+    ) -> List[City]:
+        states = self._state_positions(state_id, state_name)
+        if states is not None:
+            positions = sorted(
+                (p for state in states for p in self._cities_by_state.get(state, ())),
+                key=lambda p: (self.city_names[p], self.city_ids[p]),
+            )
+        elif country_code:
+            country = self._country_by_code.get(country_code.upper())
+            positions = list(self._cities_by_country.get(country, ()))
+        else:
+            positions = range(len(self.city_ids))
+        return [self.city_at(position) for position in positions]
+
+    def get_city(self, id) -> Optional[City]:
+        position = self._city_pos.get(_as_id(id))
+        return None if position is None else self.city_at(position)
+
+    def get_zip_codes(
+        self,
+        city_id=None,
+        city_name: Optional[str] = None,
+        state_id=None,
+        state_name: Optional[str] = None,
+        code_contains: Optional[str] = None,
+    ) -> List[ZipCode]:
+        if city_id is not None:
+            city = self._city_pos.get(_as_id(city_id))
+            positions = list(self._zips_by_city.get(city, ()))
+        elif city_name is not None:
+            cities = [
+                p
+                for p in self.city_index.search(city_name)
+                if self.city_names[p] == city_name
+            ]
+            positions = sorted(
+                (p for city in cities for p in self._zips_by_city.get(city, ())),
+                key=lambda p: (self.zip_codes[p], self.zip_ids[p]),
+            )
+        else:
+            states = self._state_positions(state_id, state_name)
+            if states is not None:
+                positions = sorted(
+                    (p for state in states for p in self._zips_by_state.get(state, ())),
+                    key=lambda p: (self.zip_codes[p], self.zip_ids[p]),
+                )
+            else:
+                positions = range(len(self.zip_ids))
+
+        if code_contains:
+            needle = _fold(code_contains)
+            positions = [p for p in positions if needle in _fold(self.zip_codes[p])]
+        return [self.zip_code_at(position) for position in positions]
+
+    def get_zip_code(self, id=None, code: Optional[str] = None) -> Optional[ZipCode]:
+        if id is not None:
+            position = self._zip_pos.get(_as_id(id))
+        else:
+            matches = [
+                p
+                for p in self.zip_index.search(code or "")
+                if self.zip_codes[p] == code
+            ]
+            position = matches[0] if matches else None
+        return None if position is None else self.zip_code_at(position)
+
+    # Autocomplete
+
+    def suggest_cities(
+        self,
+        prefix: str,
+        state_id=None,
+        country_code: Optional[str] = None,
+        limit: int = DEFAULT_SUGGESTION_LIMIT,
+    ) -> List[City]:
+        accept = None
+        if state_id is not None:
+            state = self._state_pos.get(_as_id(state_id), NO_PARENT - 1)
+
+            def accept(position: int) -> bool:
+                return self.city_state[position] == state
+
+        elif country_code:
+            country = self._country_by_code.get(country_code.upper(), NO_PARENT - 1)
+
+            def accept(position: int) -> bool:
+                return self.city_country[position] == country
+
+        return [
+            self.city_at(p)
+            for p in self.city_index.search(prefix, limit=limit, accept=accept)
+        ]
+
+    def suggest_zip_codes(
+        self,
+        prefix: str,
+        city_id=None,
+        state_id=None,
+        limit: int = DEFAULT_SUGGESTION_LIMIT,
+    ) -> List[ZipCode]:
+        accept = None
+        if city_id is not None:
+            city = self._city_pos.get(_as_id(city_id), NO_PARENT - 1)
+
+            def accept(position: int) -> bool:
+                return self.zip_city[position] == city
+
+        elif state_id is not None:
+            state = self._state_pos.get(_as_id(state_id), NO_PARENT - 1)
+
+            def accept(position: int) -> bool:
+                return self.zip_state[position] == state
+
+        return [
+            self.zip_code_at(p)
+            for p in self.zip_index.search(prefix, limit=limit, accept=accept)
+        ]
+
+
+_gazetteer: Optional[Gazetteer] = None
+_checked_at = 0.0
+_lock = threading.Lock()
+
+
+def get_gazetteer() -> Gazetteer:
+    """This process's gazetteer, reloaded if the locations version moved"""
+    global _gazetteer, _checked_at
+    interval = getattr(
+        settings, "GAZETTEER_VERSION_CHECK_SECONDS", DEFAULT_CHECK_SECONDS
+    )
+    current = _gazetteer
+    if current is not None and time.monotonic() - _checked_at < interval:
+        return current
+
+    with _lock:
+        if _gazetteer is not None and time.monotonic() - _checked_at < interval:
+            return _gazetteer
+        # Read the stamp before the rows: a bump mid-load just causes a reload
+        version = ReferenceDataVersion.current(LOCATIONS)
+        if _gazetteer is None or _gazetteer.version != version:
+            _gazetteer = Gazetteer.load(version)
+        _checked_at = time.monotonic()
+        return _gazetteer
+
+
+def reset_gazetteer() -> None:
+    """Drop this process's copy; the next lookup loads it again"""
+    global _gazetteer, _checked_at
+    with _lock:
+        _gazetteer = None
+        _checked_at = 0.0
+
+
+def bump_locations_version() -> int:
+    """Record that location data changed so every process reloads"""
+    version = ReferenceDataVersion.bump(LOCATIONS)
+    transaction.on_commit(reset_gazetteer)
+    return version
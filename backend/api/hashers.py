@@ -0,0 +1,24 @@
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+
+class TunedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """PBKDF2-SHA256 with the work factor from settings.PASSWORD_PBKDF2_ITERATIONS
+
+    It keeps the ``pbkdf2_sha256`` algorithm name, so existing hashes verify
+    unchanged. Without the setting it uses Django's default iteration count.
+    Hashes are re-encoded on the next successful login for the same reasons
+    as Django's (too few iterations, a short salt), except when that would
+    lower their iteration count.
+    """
+
+    @property
+    def iterations(self) -> int:
+        return getattr(
+            settings, "PASSWORD_PBKDF2_ITERATIONS", PBKDF2PasswordHasher.iterations
+        )
+
+    def must_update(self, encoded: str) -> bool:
+        if self.decode(encoded)["iterations"] > self.iterations:
+            return False
+        return super().must_update(encoded)
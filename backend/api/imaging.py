@@ -0,0 +1,70 @@
+"""
+Image resizing used by the media variant pipeline.
+
+This module is what process-pool workers import, so it must stay free of
+Django imports.
+"""
+
+import os
+from typing import Any, Dict, Iterable
+
+from PIL import Image, ImageOps
+
+THUMBNAIL_SIZE = (240, 240)
+
+# Pillow save options per output format
+FORMATS = {
+    "webp": ("WEBP", "image/webp", {"quality": 80, "method": 4}),
+    "jpeg": (
+        "JPEG",
+        "image/jpeg",
+        {"quality": 82, "optimize": True, "progressive": True},
+    ),
+}
+
+
+def render_variants(
+    source_path: str, output_dir: str, widths: Iterable[int]
+) -> Dict[str, Any]:
+    """Write thumbnails and resized copies of one image (runs in a worker)
+
+    Returns the original dimensions and, for every file written, its path
+    relative to ``output_dir`` plus its width, height, format and byte size.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    with Image.open(source_path) as opened:
+        image = ImageOps.exif_transpose(opened)
+        if image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        width, height = image.size
+
+        targets = sorted({w for w in widths if w < width} | {min(width, max(widths))})
+        renditions = [
+            (f"w{w}", image.resize((w, round(height * w / width)), Image.LANCZOS))
+            for w in targets
+        ]
+        renditions.append(("thumb", ImageOps.fit(image, THUMBNAIL_SIZE, Image.LANCZOS)))
+
+        files = []
+        for name, rendition in renditions:
+            for extension, (pil_format, mime, options) in FORMATS.items():
+                filename = f"{name}.{extension}"
+                path = os.path.join(output_dir, filename)
+                rendition.save(path, pil_format, **options)
+                files.append(
+                    {
+                        "name": name,
+                        "file": filename,
+                        "format": mime,
+                        "width": rendition.width,
+                        "height": rendition.height,
+                        "bytes": os.path.getsize(path),
+                    }
+                )
+
+    return {
+        "width": width,
+        "height": height,
+        "bytes": os.path.getsize(source_path),
+        "files": files,
+    }
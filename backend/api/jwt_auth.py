@@ -0,0 +1,138 @@
+"""
+JWT authentication shared by the middleware, views and WebSocket consumers.
+
+A request's token is decoded once and the result is memoized on the request,
+so the middleware and any view that asks again get the same answer for free.
+User rows are kept in a small per-process LRU keyed by ``(user_id, iat)``
+with a TTL; saving or deleting a user evicts its entries here, and the TTL
+bounds how long other processes can serve a stale row.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+
+import jwt
+
+User = get_user_model()
+
+DEFAULT_CACHE_SIZE = 1024
+DEFAULT_CACHE_TTL = 60
+
+_UNSET = object()
+REQUEST_ATTR = "_jwt_user"
+
+CacheKey = Tuple[Any, Any]
+
+
+class UserCache:
+    """Thread-safe LRU of user rows with a per-entry time to live"""
+
+    def __init__(
+        self, max_size: int = DEFAULT_CACHE_SIZE, ttl: float = DEFAULT_CACHE_TTL
+    ) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: CacheKey):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, user = entry
+            if expires <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        # Callers may mutate their user (last_login, set_password, ...)
+        return copy.copy(user)
+
+    def set(self, key: CacheKey, user) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, copy.copy(user))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate_user(self, user_id) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == user_id]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_cache: Optional[UserCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_user_cache() -> UserCache:
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = UserCache(
+                    getattr(settings, "JWT_USER_CACHE_SIZE", DEFAULT_CACHE_SIZE),
+                    getattr(settings, "JWT_USER_CACHE_TTL", DEFAULT_CACHE_TTL),
+                )
+    return _cache
+
+
+def decode_token(token: str) -> Optional[Dict[str, Any]]:
+    try:
+        return jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
+    except jwt.InvalidTokenError:
+        return None
+
+
+def user_for_payload(payload: Dict[str, Any]):
+    """The user a decoded token refers to, or None"""
+    user_id = payload.get("user_id")
+    if not user_id:
+        return None
+
+    cache = get_user_cache()
+    key = (user_id, payload.get("iat"))
+    user = cache.get(key)
+    if user is None:
+        try:
+            user = User.objects.get(id=user_id)
+        except (User.DoesNotExist, ValueError, TypeError):
+            return None
+        cache.set(key, user)
+    return user
+
+
+def bearer_token(request) -> Optional[str]:
+    auth_header = request.META.get("HTTP_AUTHORIZATION", "")
+    if auth_header.startswith("Bearer "):
+        return auth_header.split(" ")[1]
+    return None
+
+
+def authenticate_request(request):
+    """The JWT user of ``request`` or None, decoded at most once per request"""
+    user = getattr(request, REQUEST_ATTR, _UNSET)
+    if user is _UNSET:
+        user = None
+        token = bearer_token(request)
+        if token:
+            payload = decode_token(token)
+            if payload is not None:
+                user = user_for_payload(payload)
+        setattr(request, REQUEST_ATTR, user)
+    return user
@@ -0,0 +1,295 @@
+"""
+Contention-safe like toggling with write-behind counters.
+
+A toggle is one statement on the happy path: DELETE ... RETURNING removes the
+same reaction, UPDATE ... RETURNING flips an opposite one, and INSERT ... ON
+CONFLICT DO NOTHING RETURNING adds a new one. The reaction row is never read
+before it is written, so concurrent clicks cannot race between the two.
+
+The denormalized ``Update.likes_count``/``dislikes_count`` columns are not
+touched by the toggle itself. Deltas collect in a per-process buffer and a
+background thread folds them into one ``F()`` update per update every
+``LIKE_COUNTER_FLUSH_INTERVAL`` seconds, so a burst of likes on one hot
+update becomes a handful of row writes. Reactions created or deleted through
+the ORM feed the same buffer from signal handlers.
+
+Deltas still buffered when a process dies are lost, so schedule
+``manage.py reconcile_like_counters`` to recount the columns from the
+reaction rows. Counter events for the stream are published from the request
+that made the change, never from the flush thread.
+"""
+
+import atexit
+import logging
+import threading
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+from .models import Update, UpdateComment, UpdateLike
+from .update_stream import EVENT_COUNTERS, publish_update_event
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FLUSH_INTERVAL = 0.25
+MAX_TOGGLE_ATTEMPTS = 3
+
+ACTION_CREATED = "created"
+ACTION_UPDATED = "updated"
+ACTION_REMOVED = "removed"
+
+
+class LikeResult(NamedTuple):
+    action: str
+    # The user's reaction after the toggle: True like, False dislike, None
+    user_like_status: Optional[bool]
+    likes_delta: int
+    dislikes_delta: int
+    # Optimistic totals including this toggle, before it is flushed
+    likes_count: int
+    dislikes_count: int
+
+
+def _delta(is_like: bool, amount: int) -> Tuple[int, int]:
+    return (amount, 0) if is_like else (0, amount)
+
+
+def toggle_like(update_id: str, user_id: int, is_like: bool) -> LikeResult:
+    """Apply a like/dislike click and buffer the counter change"""
+    table = connection.ops.quote_name(UpdateLike._meta.db_table)
+    now = connection.ops.adapt_datetimefield_value(timezone.now())
+    # Read before writing so the totals never depend on whether our own delta
+    # has been buffered or flushed yet
+    likes_before, dislikes_before = optimistic_counts(update_id)
+
+    with transaction.atomic():
+        for _ in range(MAX_TOGGLE_ATTEMPTS):
+            with connection.cursor() as cursor:
+                # Same button again: remove the reaction
+                cursor.execute(
+                    f"DELETE FROM {table} "
+                    "WHERE update_id = %s AND user_id = %s AND is_like = %s "
+                    "RETURNING id",
+                    [update_id, user_id, is_like],
+                )
+                if cursor.fetchone():
+                    action, status = ACTION_REMOVED, None
+                    likes, dislikes = _delta(is_like, -1)
+                    break
+
+                # Other button: flip the existing reaction
+                cursor.execute(
+                    f"UPDATE {table} SET is_like = %s "
+                    "WHERE update_id = %s AND user_id = %s AND is_like <> %s "
+                    "RETURNING id",
+                    [is_like, update_id, user_id, is_like],
+                )
+                if cursor.fetchone():
+                    action, status = ACTION_UPDATED, is_like
+                    likes, dislikes = (1, -1) if is_like else (-1, 1)
+                    break
+
+                # No reaction yet; a concurrent insert makes this a no-op and
+                # the next attempt sees that row
+                cursor.execute(
+                    f"INSERT INTO {table} (update_id, user_id, is_like, created_at) "
+                    "VALUES (%s, %s, %s, %s) "
+                    "ON CONFLICT (update_id, user_id) DO NOTHING "
+                    "RETURNING id",
+                    [update_id, user_id, is_like, now],
+                )
+                if cursor.fetchone():
+                    action, status = ACTION_CREATED, is_like
+                    likes, dislikes = _delta(is_like, 1)
+                    break
+        else:
+            raise RuntimeError("Could not apply like toggle under contention")
+
+        get_counter_buffer().add_on_commit(update_id, likes, dislikes)
+        # Registered after the buffer callback, so the payload includes it
+        publish_update_event(EVENT_COUNTERS, lambda: counters_payload(update_id))
+
+    return LikeResult(
+        action,
+        status,
+        likes,
+        dislikes,
+        max(likes_before + likes, 0),
+        max(dislikes_before + dislikes, 0),
+    )
+
+
+def optimistic_counts(update_id: str) -> Tuple[int, int]:
+    """Stored counters plus deltas this process has not flushed yet"""
+    stored = (
+        Update.objects.filter(pk=update_id)
+        .values_list("likes_count", "dislikes_count")
+        .first()
+    ) or (0, 0)
+    pending = get_counter_buffer().pending(update_id)
+    return max(stored[0] + pending[0], 0), max(stored[1] + pending[1], 0)
+
+
+def counters_payload(update_id: str) -> Dict[str, object]:
+    likes, dislikes = optimistic_counts(update_id)
+    return {
+        "id": update_id,
+        "likes_count": likes,
+        "dislikes_count": dislikes,
+        "comments_count": UpdateComment.objects.filter(
+            update_id=update_id, is_active=True
+        ).count(),
+    }
+
+
+class LikeCounterBuffer:
+    """Per-process accumulator of like/dislike deltas keyed by update id"""
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._pending: Dict[str, List[int]] = defaultdict(lambda: [0, 0])
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def add_on_commit(self, update_id: str, likes: int, dislikes: int) -> None:
+        """Buffer a delta once the transaction that produced it commits"""
+        if likes or dislikes:
+            transaction.on_commit(lambda: self.add(update_id, likes, dislikes))
+
+    def add(self, update_id: str, likes: int, dislikes: int) -> None:
+        with self._lock:
+            totals = self._pending[update_id]
+            totals[0] += likes
+            totals[1] += dislikes
+
+        if self.interval <= 0:
+            # Write-through (used by the test settings)
+            self.flush()
+        else:
+            self._ensure_thread()
+
+    def pending(self, update_id: str) -> Tuple[int, int]:
+        with self._lock:
+            totals = self._pending.get(update_id)
+            return (totals[0], totals[1]) if totals else (0, 0)
+
+    def flush(self) -> int:
+        """Write buffered deltas with one F() update per update id"""
+        with self._lock:
+            pending, self._pending = self._pending, defaultdict(lambda: [0, 0])
+
+        changed = [
+            (update_id, likes, dislikes)
+            for update_id, (likes, dislikes) in pending.items()
+            if likes or dislikes
+        ]
+        if not changed:
+            return 0
+
+        now = timezone.now()
+        with transaction.atomic():
+            for update_id, likes, dislikes in changed:
+                Update.objects.filter(pk=update_id).update(
+                    likes_count=F("likes_count") + likes,
+                    dislikes_count=F("dislikes_count") + dislikes,
+                    updated_at=now,
+                )
+        return len(changed)
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="like-counter-flush", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._wakeup.wait(self.interval):
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Failed to flush like counters")
+            finally:
+                close_old_connections()
+
+
+def reconcile_like_counters(batch_size: int = 500) -> int:
+    """Recount likes_count/dislikes_count from UpdateLike where they drifted
+
+    Flushes this process's buffer first; deltas another process has not
+    flushed yet get counted twice until the next run. Returns the number of
+    updates corrected.
+    """
+    get_counter_buffer().flush()
+
+    updates = (
+        Update.objects.order_by()
+        .annotate(
+            actual_likes=Count("likes", filter=Q(likes__is_like=True)),
+            actual_dislikes=Count("likes", filter=Q(likes__is_like=False)),
+        )
+        .only("id", "likes_count", "dislikes_count")
+    )
+    now = timezone.now()
+    changed = []
+    corrected = 0
+    for update in updates.iterator(chunk_size=batch_size):
+        counts = (update.actual_likes, update.actual_dislikes)
+        if counts == (update.likes_count, update.dislikes_count):
+            continue
+        update.likes_count, update.dislikes_count = counts
+        update.updated_at = now
+        changed.append(update)
+        if len(changed) >= batch_size:
+            corrected += _write_counters(changed)
+            changed = []
+    if changed:
+        corrected += _write_counters(changed)
+    return corrected
+
+
+def _write_counters(updates: List[Update]) -> int:
+    with transaction.atomic():
+        Update.objects.bulk_update(
+            updates, ["likes_count", "dislikes_count", "updated_at"]
+        )
+        for update in updates:
+            publish_update_event(
+                EVENT_COUNTERS, lambda pk=update.pk: counters_payload(pk)
+            )
+    return len(updates)
+
+
+_buffer: Optional[LikeCounterBuffer] = None
+_buffer_lock = threading.Lock()
+
+
+def get_counter_buffer() -> LikeCounterBuffer:
+    global _buffer
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                _buffer = LikeCounterBuffer(
+                    getattr(
+                        settings, "LIKE_COUNTER_FLUSH_INTERVAL", DEFAULT_FLUSH_INTERVAL
+                    )
+                )
+                atexit.register(_flush_at_exit)
+    return _buffer
+
+
+def _flush_at_exit() -> None:
+    if _buffer is not None:
+        try:
+            _buffer.flush()
+        except Exception:
+            logger.exception("Failed to flush like counters at exit")
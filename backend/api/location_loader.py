@@ -0,0 +1,263 @@
+"""
+Streaming bulk loader for country, state, city and zip code data files.
+
+Every file uses one flat row shape (CSV header or JSON keys)::
+
+    country_code, country_name, state_code, state_name, city, zip_code,
+    latitude, longitude, flag_emoji, phone_code
+
+A row creates whatever it names that does not exist yet: a row with only
+country columns creates a country, one with a city but no zip code creates a
+city, and so on. Only ``country_code`` is required; a state is matched by
+name, or by code when the name is empty.
+
+Rows are read lazily and written in chunks, one transaction per chunk.
+Parents are resolved through in-memory maps built once per load, so the
+database sees a couple of ``bulk_create(ignore_conflicts=True)`` statements
+per chunk instead of a ``get_or_create`` per row. Existing rows are never
+updated.
+"""
+
+import csv
+import json
+import time
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from django.db import transaction
+
+from .models import City, Country, State, ZipCode
+
+DEFAULT_CHUNK_SIZE = 5000
+FORMATS = ("csv", "jsonl", "json")
+SUFFIX_FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl", ".json": "json"}
+
+Row = Dict[str, Any]
+
+
+def detect_format(path: Path) -> str:
+    try:
+        return SUFFIX_FORMATS[path.suffix.lower()]
+    except KeyError:
+        raise ValueError(f"Cannot tell the format of {path}; pass one of {FORMATS}")
+
+
+def read_rows(path, format: Optional[str] = None) -> Iterator[Row]:
+    """Yield the rows of a CSV, JSON Lines or JSON (array) data file"""
+    path = Path(path)
+    format = format or detect_format(path)
+    with path.open(encoding="utf-8", newline="") as f:
+        if format == "csv":
+            yield from csv.DictReader(f)
+        elif format == "jsonl":
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        elif format == "json":
+            # A JSON array has to be parsed whole; prefer JSON Lines for big files
+            yield from json.load(f)
+        else:
+            raise ValueError(f"Unknown format {format!r}; expected one of {FORMATS}")
+
+
+def _text(row: Row, field: str) -> str:
+    value = row.get(field)
+    return "" if value is None else str(value).strip()
+
+
+def _coordinate(row: Row, field: str) -> Optional[Decimal]:
+    value = _text(row, field)
+    return Decimal(value).quantize(Decimal("0.000001")) if value else None
+
+
+@dataclass
+class LoadStats:
+    rows: int = 0
+    countries: int = 0
+    states: int = 0
+    cities: int = 0
+    zip_codes: int = 0
+    skipped: int = 0
+    seconds: float = 0.0
+
+    @property
+    def created(self) -> int:
+        return self.countries + self.states + self.cities + self.zip_codes
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else float(self.rows)
+
+
+class LocationLoader:
+    """Loads location rows; keeps its parent maps across files and chunks"""
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        self.chunk_size = max(chunk_size, 1)
+        self._countries: Dict[str, int] = {
+            code.upper(): country_id
+            for country_id, code in Country.objects.values_list("id", "code")
+        }
+        self._states_by_name: Dict[Tuple[int, str], int] = {}
+        self._states_by_code: Dict[Tuple[int, str], int] = {}
+        for state_id, country_id, name, code in State.objects.values_list(
+            "id", "country_id", "name", "code"
+        ):
+            self._remember_state(state_id, country_id, name, code)
+        self._cities: Dict[Tuple[int, str], int] = {
+            (state_id, name): city_id
+            for city_id, state_id, name in City.objects.values_list(
+                "id", "state_id", "name"
+            ).iterator()
+        }
+        self._zip_codes: Set[Tuple[int, str]] = set(
+            ZipCode.objects.values_list("city_id", "code").iterator()
+        )
+
+    def _remember_state(self, state_id, country_id, name, code) -> None:
+        self._states_by_name[(country_id, name)] = state_id
+        if code:
+            self._states_by_code.setdefault((country_id, code.upper()), state_id)
+
+    def load(self, rows: Iterable[Row], stats: Optional[LoadStats] = None) -> LoadStats:
+        stats = stats or LoadStats()
+        started = time.perf_counter()
+        rows = iter(rows)
+        while True:
+            chunk = list(islice(rows, self.chunk_size))
+            if not chunk:
+                break
+            with transaction.atomic():
+                self._load_chunk(chunk, stats)
+            stats.rows += len(chunk)
+        stats.seconds += time.perf_counter() - started
+        return stats
+
+    # Parents
+
+    def _country_id(self, row: Row, stats: LoadStats) -> Optional[int]:
+        code = _text(row, "country_code").upper()
+        if not code:
+            return None
+        country_id = self._countries.get(code)
+        if country_id is None:
+            name = _text(row, "country_name")
+            if not name:
+                return None
+            defaults = {"name": name, "flag_emoji": _text(row, "flag_emoji") or None}
+            if _text(row, "phone_code"):
+                defaults["phone_code"] = _text(row, "phone_code")
+            # Countries and states are few; creating them one by one is fine
+            country, created = Country.objects.get_or_create(
+                code=code, defaults=defaults
+            )
+            stats.countries += created
+            country_id = self._countries[code] = country.id
+        return country_id
+
+    def _state_id(self, row: Row, country_id: int, stats: LoadStats) -> Optional[int]:
+        name = _text(row, "state_name")
+        code = _text(row, "state_code")
+        if name:
+            state_id = self._states_by_name.get((country_id, name))
+        elif code:
+            return self._states_by_code.get((country_id, code.upper()))
+        else:
+            return None
+        if state_id is None:
+            state, created = State.objects.get_or_create(
+                name=name, country_id=country_id, defaults={"code": code or None}
+            )
+            stats.states += created
+            state_id = state.id
+            self._remember_state(state_id, country_id, name, state.code)
+        return state_id
+
+    # Chunks
+
+    def _load_chunk(self, chunk: List[Row], stats: LoadStats) -> None:
+        # (country_id, state_id, city name, zip code or "", latitude, longitude)
+        resolved = []
+        for row in chunk:
+            try:
+                latitude = _coordinate(row, "latitude")
+                longitude = _coordinate(row, "longitude")
+            except InvalidOperation:
+                stats.skipped += 1
+                continue
+            country_id = self._country_id(row, stats)
+            if country_id is None:
+                stats.skipped += 1
+                continue
+            state_id = None
+            if _text(row, "state_name") or _text(row, "state_code"):
+                state_id = self._state_id(row, country_id, stats)
+                if state_id is None:
+                    stats.skipped += 1  # Unknown state code and no name
+                    continue
+            city = _text(row, "city")
+            zip_code = _text(row, "zip_code")
+            if (zip_code and not city) or (city and state_id is None):
+                stats.skipped += 1  # A zip code needs a city, a city a state
+                continue
+            if city:
+                resolved.append(
+                    (country_id, state_id, city, zip_code, latitude, longitude)
+                )
+
+        self._create_cities(resolved, stats)
+        self._create_zip_codes(resolved, stats)
+
+    def _create_cities(self, resolved, stats: LoadStats) -> None:
+        new_cities: Dict[Tuple[int, str], City] = {}
+        for country_id, state_id, city, *_ in resolved:
+            key = (state_id, city)
+            if key not in self._cities and key not in new_cities:
+                new_cities[key] = City(
+                    name=city, state_id=state_id, country_id=country_id
+                )
+        if not new_cities:
+            return
+
+        City.objects.bulk_create(
+            new_cities.values(), batch_size=self.chunk_size, ignore_conflicts=True
+        )
+        # ignore_conflicts leaves primary keys unset; read the ids back
+        state_ids = {state_id for state_id, _ in new_cities}
+        names = {name for _, name in new_cities}
+        for city_id, state_id, name in City.objects.filter(
+            state_id__in=state_ids, name__in=names
+        ).values_list("id", "state_id", "name"):
+            if (state_id, name) in new_cities and (state_id, name) not in self._cities:
+                self._cities[(state_id, name)] = city_id
+                stats.cities += 1
+
+    def _create_zip_codes(self, resolved, stats: LoadStats) -> None:
+        new_zip_codes: Dict[Tuple[int, str], ZipCode] = {}
+        for country_id, state_id, city, zip_code, latitude, longitude in resolved:
+            if not zip_code:
+                continue
+            city_id = self._cities.get((state_id, city))
+            key = (city_id, zip_code)
+            if city_id is None or key in self._zip_codes or key in new_zip_codes:
+                continue
+            new_zip_codes[key] = ZipCode(
+                code=zip_code,
+                city_id=city_id,
+                state_id=state_id,
+                country_id=country_id,
+                latitude=latitude,
+                longitude=longitude,
+            )
+        if not new_zip_codes:
+            return
+
+        ZipCode.objects.bulk_create(
+            new_zip_codes.values(), batch_size=self.chunk_size, ignore_conflicts=True
+        )
+        # A concurrent loader may have won some of these; count them anyway
+        self._zip_codes.update(new_zip_codes)
+        stats.zip_codes += len(new_zip_codes)
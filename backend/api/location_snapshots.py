@@ -0,0 +1,321 @@
+"""
+Versioned, pre-compressed JSON snapshots of the location lists.
+
+Location pickers need the same countries, states, cities and zip codes on
+every session. Instead of rebuilding them per request, each locations
+version is written once to disk::
+
+    <LOCATION_SNAPSHOT_ROOT>/<version>-<token>/
+        manifest.json
+        countries.json
+        countries/<country code>/states.json
+        states/<state id>/cities.json
+        states/<state id>/zip_codes.json
+    <LOCATION_SNAPSHOT_ROOT>/<version>.current
+
+Every file has ``.gz`` and ``.br`` siblings. The token is a digest of the
+files' contents, so a snapshot directory (and the URLs under it) never
+changes once written and can be served with immutable cache headers. A
+rebuild of the same version with different data (``--force`` after the
+database was recreated and version numbers started over) gets a new
+directory; ``<version>.current`` names the one to serve. Clients read the
+small manifest to learn the current snapshot and fetch only what they lack.
+
+A snapshot is built from the gazetteer after location data is loaded, or
+on first request for a version that has no snapshot yet. Builds go to a
+temporary directory that is renamed into place, so concurrent builders in
+different processes never expose a half-written snapshot.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.utils import timezone
+
+import brotli
+
+from .gazetteer import Gazetteer, get_gazetteer
+
+MANIFEST = "manifest.json"
+DEFAULT_KEEP_VERSIONS = 3
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+TOKEN_LENGTH = 12
+
+SNAPSHOT_ID = re.compile(r"^(\d+)-[0-9a-f]{%d}$" % TOKEN_LENGTH)
+SNAPSHOT_PATH = re.compile(r"^[A-Za-z0-9_-]+(/[A-Za-z0-9_-]+)*\.json$")
+
+_lock = threading.Lock()
+_manifests: Dict[str, Dict[str, Any]] = {}  # By snapshot id; never changes
+_pointers: Dict[int, Tuple[Tuple[int, int], str]] = {}  # Version -> stamp, id
+
+
+def snapshot_root() -> Path:
+    return Path(settings.LOCATION_SNAPSHOT_ROOT)
+
+
+def snapshot_dir(snapshot: str) -> Path:
+    return snapshot_root() / snapshot
+
+
+def _pointer(version: int) -> Path:
+    return snapshot_root() / f"{version}.current"
+
+
+def current_snapshot(version: int) -> Optional[str]:
+    """Id of the snapshot to serve for ``version``, None if none was built
+
+    The pointer is re-read whenever its file is replaced, so a rebuild in
+    another process is picked up on the next call.
+    """
+    path = _pointer(version)
+    try:
+        info = path.stat()
+    except FileNotFoundError:
+        _pointers.pop(version, None)
+        return None
+    stamp = (info.st_ino, info.st_mtime_ns)
+    cached = _pointers.get(version)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    snapshot = path.read_text().strip()
+    _pointers[version] = (stamp, snapshot)
+    return snapshot
+
+
+def _set_current(version: int, snapshot: str) -> None:
+    handle, temporary = tempfile.mkstemp(prefix=".current-", dir=snapshot_root())
+    with os.fdopen(handle, "w") as pointer:
+        pointer.write(snapshot)
+    os.replace(temporary, _pointer(version))
+
+
+def _dump(data) -> bytes:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _coordinate(value) -> Optional[float]:
+    return None if value is None else float(value)
+
+
+def snapshot_documents(gazetteer: Gazetteer) -> Dict[str, Any]:
+    """Relative path -> JSON document for every file of a snapshot"""
+    countries = gazetteer.get_countries()
+    documents: Dict[str, Any] = {
+        "countries.json": [
+            {
+                "id": country.id,
+                "name": country.name,
+                "code": country.code,
+                "flag_emoji": country.flag_emoji,
+                "phone_code": country.phone_code,
+            }
+            for country in countries
+        ]
+    }
+    for country in countries:
+        states = gazetteer.get_states(country_code=country.code)
+        documents[f"countries/{country.code}/states.json"] = [
+            {"id": state.id, "name": state.name, "code": state.code} for state in states
+        ]
+        for state in states:
+            documents[f"states/{state.id}/cities.json"] = [
+                {"id": city.id, "name": city.name}
+                for city in gazetteer.get_cities(state_id=state.id)
+            ]
+            documents[f"states/{state.id}/zip_codes.json"] = [
+                {
+                    "id": zip_code.id,
+                    "code": zip_code.code,
+                    "city_id": zip_code.city_id,
+                    "latitude": _coordinate(zip_code.latitude),
+                    "longitude": _coordinate(zip_code.longitude),
+                }
+                for zip_code in gazetteer.get_zip_codes(state_id=state.id)
+            ]
+    return documents
+
+
+def content_token(bodies: Dict[str, bytes]) -> str:
+    """Digest of every file's path and bytes"""
+    digest = hashlib.sha256()
+    for relative in sorted(bodies):
+        digest.update(relative.encode("utf-8") + b"\0")
+        digest.update(hashlib.sha256(bodies[relative]).digest())
+    return digest.hexdigest()[:TOKEN_LENGTH]
+
+
+def _write(directory: Path, relative: str, body: bytes) -> Dict[str, Any]:
+    path = directory / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(body)
+    # mtime=0 keeps the gzip bytes identical across rebuilds
+    gzipped = gzip.compress(body, compresslevel=9, mtime=0)
+    Path(f"{path}.gz").write_bytes(gzipped)
+    brotlied = brotli.compress(body, quality=11)
+    Path(f"{path}.br").write_bytes(brotlied)
+    return {
+        "bytes": len(body),
+        "gzip_bytes": len(gzipped),
+        "br_bytes": len(brotlied),
+        "sha256": hashlib.sha256(body).hexdigest(),
+    }
+
+
+def build_snapshot(
+    gazetteer: Optional[Gazetteer] = None, force: bool = False
+) -> Dict[str, Any]:
+    """Write the snapshot for the gazetteer's version unless it exists
+
+    ``force`` rebuilds it from the current data, e.g. after the database was
+    recreated and version numbers started over. Different data lands in a new
+    directory; an existing snapshot directory is never rewritten.
+    """
+    gazetteer = gazetteer or get_gazetteer()
+    version = gazetteer.version
+    if not force:
+        snapshot = current_snapshot(version)
+        if snapshot is not None and (snapshot_dir(snapshot) / MANIFEST).exists():
+            return read_manifest(snapshot)
+
+    root = snapshot_root()
+    root.mkdir(parents=True, exist_ok=True)
+    bodies = {
+        relative: _dump(document)
+        for relative, document in snapshot_documents(gazetteer).items()
+    }
+    snapshot = f"{version}-{content_token(bodies)}"
+    target = snapshot_dir(snapshot)
+    if not (target / MANIFEST).exists():
+        staging = Path(tempfile.mkdtemp(prefix=f".build-{version}-", dir=root))
+        try:
+            files = {
+                relative: _write(staging, relative, body)
+                for relative, body in bodies.items()
+            }
+            manifest = {
+                "version": version,
+                "snapshot": snapshot,
+                "generated_at": timezone.now().isoformat(),
+                "files": files,
+            }
+            (staging / MANIFEST).write_bytes(_dump(manifest))
+            try:
+                os.rename(staging, target)
+            except OSError:
+                pass  # Another process wrote the same snapshot first
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    _set_current(version, snapshot)
+    prune_snapshots()
+    return read_manifest(snapshot)
+
+
+def prune_snapshots() -> List[str]:
+    """Delete all but the current snapshots of the newest few versions
+
+    LOCATION_SNAPSHOT_KEEP_VERSIONS sets how many versions are kept.
+    """
+    keep = getattr(settings, "LOCATION_SNAPSHOT_KEEP_VERSIONS", DEFAULT_KEEP_VERSIONS)
+    root = snapshot_root()
+    versions = sorted(
+        (
+            int(entry.name.split(".")[0])
+            for entry in root.glob("*.current")
+            if entry.name.split(".")[0].isdigit()
+        ),
+        reverse=True,
+    )
+    kept = {current_snapshot(version) for version in versions[: max(keep, 1)]}
+    for version in versions[max(keep, 1) :]:
+        _pointer(version).unlink(missing_ok=True)
+        _pointers.pop(version, None)
+
+    removed = []
+    for entry in root.iterdir():
+        if SNAPSHOT_ID.match(entry.name) and entry.name not in kept:
+            shutil.rmtree(entry, ignore_errors=True)
+            _manifests.pop(entry.name, None)
+            removed.append(entry.name)
+    return removed
+
+
+def read_manifest(snapshot: str) -> Dict[str, Any]:
+    manifest = _manifests.get(snapshot)
+    if manifest is None:
+        manifest = json.loads((snapshot_dir(snapshot) / MANIFEST).read_bytes())
+        _manifests[snapshot] = manifest
+    return manifest
+
+
+def current_manifest() -> Dict[str, Any]:
+    """Manifest of the current locations snapshot, building it if needed"""
+    gazetteer = get_gazetteer()
+    snapshot = current_snapshot(gazetteer.version)
+    if snapshot is not None:
+        try:
+            return read_manifest(snapshot)
+        except FileNotFoundError:
+            pass  # Pruned under us by another process's build
+    with _lock:
+        return build_snapshot(gazetteer)
+
+
+def snapshot_file(
+    snapshot: str, relative: str, accept_encoding: str = ""
+) -> Optional[Tuple[Path, Optional[str]]]:
+    """Path and Content-Encoding of the best variant of a snapshot file"""
+    match = SNAPSHOT_ID.match(snapshot)
+    if match is None or not SNAPSHOT_PATH.match(relative) or relative == MANIFEST:
+        return None
+    directory = snapshot_dir(snapshot)
+    if not directory.exists() and int(match.group(1)) == get_gazetteer().version:
+        # Built by another server; the same data gives the same token here
+        current_manifest()
+    path = directory / relative
+    if not path.is_file():
+        return None
+
+    qualities = accepted_encodings(accept_encoding)
+    best = None
+    for encoding, suffix in ENCODINGS:
+        quality = qualities.get(encoding, qualities.get("*", 0.0))
+        if quality > 0 and (best is None or quality > best[0]):
+            best = quality, encoding, suffix
+    if best is None:
+        return path, None
+    return Path(f"{path}{best[2]}"), best[1]
+
+
+def accepted_encodings(accept_encoding: str) -> Dict[str, float]:
+    """Quality of each coding named in an Accept-Encoding header
+
+    Codings with a malformed q value are left out; ``q=0`` is kept so that it
+    overrides ``*``.
+    """
+    qualities: Dict[str, float] = {}
+    for token in accept_encoding.split(","):
+        coding, *params = (part.strip() for part in token.split(";"))
+        if not coding:
+            continue
+        quality: Optional[float] = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = min(max(float(value), 0.0), 1.0)
+                except ValueError:
+                    quality = None
+        if quality is not None:
+            qualities[coding.lower()] = quality
+    return qualities
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from api.gazetteer import reset_gazetteer
+from api.location_snapshots import build_snapshot
+
+
+class Command(BaseCommand):
+    help = "Write the pre-compressed location snapshot for the current version"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Rebuild even if this version was built (e.g. after a DB reset)",
+        )
+
+    def handle(self, *args, **options):
+        reset_gazetteer()  # Read the current version, not a cached one
+        manifest = build_snapshot(force=options["force"])
+        total = sum(meta["bytes"] for meta in manifest["files"].values())
+        brotli_total = sum(meta["br_bytes"] for meta in manifest["files"].values())
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✓ Location snapshot {manifest['snapshot']}: "
+                f"{len(manifest['files'])} files, {total:,} bytes "
+                f"({brotli_total:,} with brotli)"
+            )
+        )
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from api.expiry import expire_updates
+
+
+class Command(BaseCommand):
+    help = "Deactivate updates whose expires_at has passed, in bounded batches"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of updates deactivated per transaction (default: 500)",
+        )
+        parser.add_argument(
+            "--max-batches",
+            type=int,
+            default=None,
+            help="Stop after this many batches (default: until none are left)",
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write("Deactivating expired updates...")
+        expired = expire_updates(
+            batch_size=options["batch_size"], max_batches=options["max_batches"]
+        )
+        self.stdout.write(self.style.SUCCESS(f"✓ Expired {expired} updates"))
@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand
+
+from api.media_variants import get_executor, process_media
+from api.models import UpdateMedia
+
+
+class Command(BaseCommand):
+    help = "Generate thumbnails and responsive variants for UpdateMedia images"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Regenerate every image instead of only those without variants",
+        )
+
+    def handle(self, *args, **options):
+        media = UpdateMedia.objects.filter(type=UpdateMedia.MEDIA_TYPE_IMAGE)
+        if not options["all"]:
+            media = media.filter(variants_generated_at__isnull=True)
+
+        self.stdout.write(f"Generating variants for {media.count()} images...")
+        futures = [
+            future
+            for future in (process_media(item) for item in media.iterator())
+            if future is not None
+        ]
+        for future in futures:
+            future.exception()  # Wait; failures are logged by the pipeline
+
+        executor = get_executor()
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+        processed = UpdateMedia.objects.filter(
+            type=UpdateMedia.MEDIA_TYPE_IMAGE, variants_generated_at__isnull=False
+        ).count()
+        self.stdout.write(self.style.SUCCESS(f"✓ {processed} images have variants"))
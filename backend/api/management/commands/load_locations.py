@@ -0,0 +1,80 @@
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api.gazetteer import bump_locations_version
+from api.location_loader import (
+    DEFAULT_CHUNK_SIZE,
+    FORMATS,
+    LoadStats,
+    LocationLoader,
+    read_rows,
+)
+from api.location_snapshots import build_snapshot
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+
+class Command(BaseCommand):
+    help = "Bulk load countries, states, cities and zip codes from CSV/JSON files"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "paths",
+            nargs="+",
+            help="Data files; bare names are looked up in api/management/data",
+        )
+        parser.add_argument(
+            "--format",
+            choices=FORMATS,
+            help="File format (default: from each file's extension)",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help=f"Rows per insert transaction (default: {DEFAULT_CHUNK_SIZE})",
+        )
+
+    def handle(self, *args, **options):
+        paths = [self._resolve(path) for path in options["paths"]]
+        loader = LocationLoader(chunk_size=options["chunk_size"])
+        total = LoadStats()
+
+        for path in paths:
+            try:
+                stats = loader.load(read_rows(path, options["format"]))
+            except ValueError as e:
+                raise CommandError(f"{path}: {e}")
+            self.stdout.write(f"{path.name}: {self._describe(stats)}")
+            for field in ("rows", "countries", "states", "cities", "zip_codes"):
+                setattr(total, field, getattr(total, field) + getattr(stats, field))
+            total.skipped += stats.skipped
+            total.seconds += stats.seconds
+
+        if total.created:
+            # Let running processes reload their in-memory gazetteer
+            bump_locations_version()
+        self.stdout.write(self.style.SUCCESS(f"✓ Loaded {self._describe(total)}"))
+
+        manifest = build_snapshot()
+        self.stdout.write(
+            f"Location snapshot {manifest['snapshot']}: {len(manifest['files'])} files"
+        )
+
+    def _resolve(self, path: str) -> Path:
+        candidate = Path(path)
+        if not candidate.exists() and (DATA_DIR / path).exists():
+            candidate = DATA_DIR / path
+        if not candidate.exists():
+            raise CommandError(f"No such data file: {path}")
+        return candidate
+
+    def _describe(self, stats: LoadStats) -> str:
+        return (
+            f"{stats.rows} rows in {stats.seconds:.2f}s "
+            f"({stats.rows_per_second:,.0f} rows/s): "
+            f"+{stats.countries} countries, +{stats.states} states, "
+            f"+{stats.cities} cities, +{stats.zip_codes} zip codes, "
+            f"{stats.skipped} skipped"
+        )
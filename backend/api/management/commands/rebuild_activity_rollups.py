@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from api.activity_rollups import rebuild_rollups
+
+
+class Command(BaseCommand):
+    help = "Recount the activity dashboard rollup from the activities table"
+
+    def handle(self, *args, **options):
+        self.stdout.write("Rebuilding activity rollups...")
+        rows = rebuild_rollups()
+        self.stdout.write(self.style.SUCCESS(f"✓ Wrote {rows} rollup rows"))
@@ -0,0 +1,45 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from api.ranking import recompute_recent_scores, recompute_scores
+
+
+class Command(BaseCommand):
+    help = "Recompute materialized feed ranking scores for recently touched updates"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--minutes",
+            type=int,
+            default=15,
+            help="Recompute updates touched within the last N minutes (default: 15)",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Recompute every update instead of only recently touched ones",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of rows written per bulk update (default: 500)",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        if options["all"]:
+            self.stdout.write("Recomputing scores for all updates...")
+            updated = recompute_scores(batch_size=batch_size)
+        else:
+            minutes = options["minutes"]
+            self.stdout.write(
+                f"Recomputing scores for updates touched in the last {minutes} minutes..."
+            )
+            updated = recompute_recent_scores(
+                timedelta(minutes=minutes), batch_size=batch_size
+            )
+
+        self.stdout.write(self.style.SUCCESS(f"✓ Updated {updated} scores"))
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from api.likes import reconcile_like_counters
+
+
+class Command(BaseCommand):
+    help = "Recount update like/dislike counters from the reaction rows"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of rows written per bulk update (default: 500)",
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write("Reconciling like counters...")
+        corrected = reconcile_like_counters(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"✓ Corrected {corrected} updates"))
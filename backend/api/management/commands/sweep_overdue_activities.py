@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from api.overdue import sweep_overdue
+
+
+class Command(BaseCommand):
+    help = "Mark planned and in-progress activities past their end time overdue"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of activities updated per transaction (default: 500)",
+        )
+        parser.add_argument(
+            "--max-batches",
+            type=int,
+            default=None,
+            help="Stop after this many batches (default: until none are left)",
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write("Marking overdue activities...")
+        swept = sweep_overdue(
+            batch_size=options["batch_size"], max_batches=options["max_batches"]
+        )
+        self.stdout.write(self.style.SUCCESS(f"✓ Marked {swept} activities overdue"))
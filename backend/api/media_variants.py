@@ -0,0 +1,184 @@
+"""
+Thumbnail and responsive-variant pipeline for UpdateMedia images.
+
+Resizing and encoding run in a process pool so they neither block requests
+nor hold the GIL of the web process. Jobs are submitted once the transaction
+that created the media commits; the worker only touches files, and the parent
+process records dimensions, byte sizes and variant URLs on the row, and
+touches the parent update so feed and detail ETags change, when the job
+finishes.
+
+Only images uploaded under MEDIA_URL are processed (URLs on any other host
+are left as they are), and variants are written below MEDIA_ROOT, so this
+expects the default filesystem storage.
+"""
+
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import unquote, urlparse
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from .imaging import FORMATS, render_variants
+from .models import Update, UpdateMedia
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_VARIANT_WIDTHS = (320, 640, 1280)
+VARIANTS_DIR = "updates/variants"
+
+
+def source_path(media: UpdateMedia) -> Optional[str]:
+    """Local path of an image uploaded under MEDIA_URL, or None"""
+    url = urlparse(media.url or "")
+    media_url = urlparse(settings.MEDIA_URL)
+    # Absolute URLs only count when MEDIA_URL names the same host
+    if url.netloc and (url.scheme, url.netloc) != (media_url.scheme, media_url.netloc):
+        return None
+    path = url.path
+    if not path.startswith(media_url.path):
+        return None
+    root = os.path.realpath(settings.MEDIA_ROOT)
+    local = os.path.realpath(os.path.join(root, unquote(path[len(media_url.path) :])))
+    if not local.startswith(root + os.sep):
+        return None
+    return local
+
+
+def _output_dir(media_id: int) -> str:
+    return os.path.join(settings.MEDIA_ROOT, VARIANTS_DIR, str(media_id))
+
+
+def _variant_url(media_id: int, filename: str) -> str:
+    return f"{settings.MEDIA_URL}{VARIANTS_DIR}/{media_id}/{filename}"
+
+
+def store_result(media_id: int, result: Dict[str, Any]) -> None:
+    variants = [
+        {
+            "name": entry["name"],
+            "url": _variant_url(media_id, entry["file"]),
+            "format": entry["format"],
+            "width": entry["width"],
+            "height": entry["height"],
+            "bytes": entry["bytes"],
+        }
+        for entry in result["files"]
+    ]
+    now = timezone.now()
+    with transaction.atomic():
+        UpdateMedia.objects.filter(pk=media_id).update(
+            width=result["width"],
+            height=result["height"],
+            file_size=result["bytes"],
+            variants=variants,
+            variants_generated_at=now,
+        )
+        Update.objects.filter(
+            pk__in=UpdateMedia.objects.filter(pk=media_id).values("update_id")
+        ).update(updated_at=now)
+
+
+def _widths() -> List[int]:
+    return list(
+        getattr(settings, "UPDATE_MEDIA_VARIANT_WIDTHS", DEFAULT_VARIANT_WIDTHS)
+    )
+
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> Optional[ProcessPoolExecutor]:
+    """Shared worker pool, or None when UPDATE_MEDIA_WORKERS is 0 (inline)"""
+    global _executor
+    workers = getattr(settings, "UPDATE_MEDIA_WORKERS", 2)
+    if workers <= 0:
+        return None
+    with _executor_lock:
+        if _executor is None:
+            # Spawned workers import only api.imaging, never Django
+            _executor = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+    return _executor
+
+
+def _on_done(media_id: int, future: Future) -> None:
+    try:
+        result = future.result()
+        store_result(media_id, result)
+    except Exception:
+        logger.exception("Failed to generate variants for media %s", media_id)
+    finally:
+        close_old_connections()
+
+
+def process_media(media: UpdateMedia) -> Optional[Future]:
+    """Generate variants for one image now (inline) or in the worker pool"""
+    if media.type != UpdateMedia.MEDIA_TYPE_IMAGE:
+        return None
+    path = source_path(media)
+    if not path or not os.path.isfile(path):
+        return None
+
+    executor = get_executor()
+    if executor is None:
+        try:
+            store_result(
+                media.pk, render_variants(path, _output_dir(media.pk), _widths())
+            )
+        except Exception:
+            logger.exception("Failed to generate variants for media %s", media.pk)
+        return None
+
+    future = executor.submit(render_variants, path, _output_dir(media.pk), _widths())
+    future.add_done_callback(lambda done, media_id=media.pk: _on_done(media_id, done))
+    return future
+
+
+def schedule_media_processing(media_items: Iterable[UpdateMedia]) -> None:
+    """Process images after the current transaction commits"""
+    images = [m for m in media_items if m.type == UpdateMedia.MEDIA_TYPE_IMAGE]
+    if images:
+        transaction.on_commit(lambda: [process_media(media) for media in images])
+
+
+def media_payload(media: UpdateMedia) -> Dict[str, Any]:
+    """Media entry for API responses with srcset-ready variants"""
+    variants = media.variants or []
+    widths = [v for v in variants if v["name"] != "thumb"]
+    thumbnails = {v["format"]: v["url"] for v in variants if v["name"] == "thumb"}
+
+    sources = []
+    for _, mime, _ in FORMATS.values():
+        candidates = [v for v in widths if v["format"] == mime]
+        if candidates:
+            sources.append(
+                {
+                    "type": mime,
+                    "srcset": ", ".join(
+                        f"{v['url']} {v['width']}w" for v in candidates
+                    ),
+                }
+            )
+
+    return {
+        "type": media.type,
+        "url": media.url,
+        "label": media.label,
+        "thumbnailUrl": thumbnails.get("image/jpeg") or media.thumbnail_url,
+        "width": media.width,
+        "height": media.height,
+        "fileSize": media.file_size,
+        # Fallback srcset (JPEG) plus per-format sources for <picture>
+        "srcset": next((s["srcset"] for s in sources if s["type"] == "image/jpeg"), ""),
+        "sources": sources,
+        "variants": variants,
+    }
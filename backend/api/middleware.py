@@ -1,58 +1,36 @@
 import json
+import math
 from urllib.parse import parse_qs
 
-from django.conf import settings
-from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
+from django.http import JsonResponse
 from django.utils import timezone
 from django.utils.deprecation import MiddlewareMixin
 from django.utils.functional import SimpleLazyObject
 
-import jwt
 from channels.auth import AuthMiddlewareStack
 from channels.db import database_sync_to_async
 from channels.generic.websocket import AsyncWebsocketConsumer
 from channels.middleware import BaseMiddleware
 
-User = get_user_model()
+from .jwt_auth import authenticate_request, bearer_token, decode_token, user_for_payload
+from .rate_limit import get_bucket_table, route_rate
 
 
 def get_user_jwt(request):
     """
     Get user from JWT token in Authorization header
     """
-    user = None
-    auth_header = request.META.get("HTTP_AUTHORIZATION", "")
-
-    if auth_header.startswith("Bearer "):
-        token = auth_header.split(" ")[1]
-        try:
-            # For now, we'll use a simple approach - you might want to implement proper JWT validation
-            # This is a temporary solution to get the system working
-            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
-            user_id = payload.get("user_id")
-            if user_id:
-                user = User.objects.get(id=user_id)
-        except (jwt.InvalidTokenError, User.DoesNotExist) as e:
-            pass
-
-    fallback_user = AnonymousUser()
-    result = user or fallback_user
-
-    # Safely get username for logging
-    if result and hasattr(result, "username") and result.username:
-        username = result.username
-    elif isinstance(result, AnonymousUser):
-        username = "Anonymous"
-    else:
-        username = "None"
-
-    return result
+    return authenticate_request(request) or AnonymousUser()
 
 
 class JWTAuthenticationMiddleware(MiddlewareMixin):
     """
     Middleware to handle JWT authentication alongside session authentication
+
+    The token is decoded once here. A valid JWT user is also seeded as Django's
+    cached session user, so AuthenticationMiddleware (which runs next and
+    replaces ``request.user``) resolves to it without another lookup.
     """
 
     def process_request(self, request):
@@ -60,33 +38,50 @@ class JWTAuthenticationMiddleware(MiddlewareMixin):
         if request.path.startswith("/admin/") or request.path.startswith("/accounts/"):
             return
 
-        # Check if there's a JWT token in the Authorization header
-        auth_header = request.META.get("HTTP_AUTHORIZATION", "")
-        if auth_header.startswith("Bearer "):
-            # Only process JWT authentication if we have a Bearer token
-            user = get_user_jwt(request)
-            request.user = user
-        else:
-            # No Bearer token, skip JWT auth
-            pass
+        # Only process JWT authentication if we have a Bearer token
+        if bearer_token(request) is None:
+            return
+
+        user = get_user_jwt(request)
+        request.user = user
+        if not isinstance(user, AnonymousUser):
+            request._cached_user = user
+            request._acached_user = user
+
+
+class RateLimitMiddleware(MiddlewareMixin):
+    """
+    Token-bucket limits per URL name (settings.RATE_LIMITS), counted per user
+    when authenticated and per client IP otherwise, shared across workers
+    """
 
     def process_view(self, request, view_func, view_args, view_kwargs):
-        """
-        Ensure request.user is set correctly before the view is called
-        """
-        # Skip JWT processing for admin URLs to allow Django session auth
-        if request.path.startswith("/admin/") or request.path.startswith("/accounts/"):
+        match = getattr(request, "resolver_match", None)
+        url_name = match.url_name if match else None
+        rate = route_rate(url_name)
+        if rate is None:
             return None
 
-        # Check if there's a JWT token and ensure the user is set
-        auth_header = request.META.get("HTTP_AUTHORIZATION", "")
-        if auth_header.startswith("Bearer "):
-            # Re-check and set user if needed
-            user = get_user_jwt(request)
-            if user and not isinstance(user, AnonymousUser):
-                request.user = user
+        user = authenticate_request(request) or getattr(request, "user", None)
+        if user is not None and user.is_authenticated:
+            client = f"user:{user.pk}"
+        else:
+            client = f"ip:{request.META.get('REMOTE_ADDR', '')}"
+
+        allowed, retry_after = get_bucket_table().acquire(f"{url_name}|{client}", rate)
+        if allowed:
+            return None
 
-        return None
+        response = JsonResponse(
+            {
+                "success": False,
+                "error": "Too many requests",
+                "code": "RATE_LIMITED",
+            },
+            status=429,
+        )
+        response["Retry-After"] = str(max(math.ceil(retry_after), 1))
+        return response
 
 
 # WebSocket authentication middleware
@@ -98,15 +93,11 @@ class WebSocketAuthMiddleware(BaseMiddleware):
         token = query_params.get("token", [None])[0]
 
         if token:
-            try:
-                # Validate the token and get user
-                payload = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
-                user_id = payload.get("user_id")
-                if user_id:
-                    scope["user"] = await self.get_user(user_id)
-                else:
-                    scope["user"] = AnonymousUser()
-            except (jwt.InvalidTokenError, User.DoesNotExist):
+            # Validate the token and get user; unknown users come back anonymous
+            payload = decode_token(token)
+            if payload is not None:
+                scope["user"] = await self.get_user(payload)
+            else:
                 scope["user"] = AnonymousUser()
         else:
             scope["user"] = AnonymousUser()
@@ -114,11 +105,8 @@ class WebSocketAuthMiddleware(BaseMiddleware):
         return await super().__call__(scope, receive, send)
 
     @database_sync_to_async
-    def get_user(self, user_id):
-        try:
-            return User.objects.get(id=user_id)
-        except User.DoesNotExist:
-            return AnonymousUser()
+    def get_user(self, payload):
+        return user_for_payload(payload) or AnonymousUser()
 
 
 # Apply the WebSocket auth middleware
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.5 on 2026-10-19 04:01
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0030_remove_location_id_fields"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="update",
+            name="score",
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name="update",
+            index=models.Index(
+                fields=["is_active", "score"], name="api_update_is_acti_cc3b01_idx"
+            ),
+        ),
+    ]
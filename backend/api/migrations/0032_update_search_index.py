@@ -0,0 +1,75 @@
+from django.db import migrations
+
+POSTGRES_FORWARD = [
+    "ALTER TABLE api_update ADD COLUMN search_vector tsvector",
+    """
+    CREATE FUNCTION api_update_search_vector_refresh() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('english', coalesce(NEW.title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(NEW.summary, '')), 'B') ||
+            setweight(to_tsvector('english', coalesce(NEW.body, '')), 'C') ||
+            setweight(
+                jsonb_to_tsvector(
+                    'english', coalesce(NEW.tags, '[]'::jsonb), '["string"]'
+                ),
+                'A'
+            );
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER api_update_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, summary, body, tags ON api_update
+    FOR EACH ROW EXECUTE FUNCTION api_update_search_vector_refresh()
+    """,
+    "UPDATE api_update SET title = title",
+    "CREATE INDEX api_update_search_vector_gin ON api_update USING gin (search_vector)",
+]
+
+POSTGRES_REVERSE = [
+    "DROP INDEX IF EXISTS api_update_search_vector_gin",
+    "DROP TRIGGER IF EXISTS api_update_search_vector_trigger ON api_update",
+    "DROP FUNCTION IF EXISTS api_update_search_vector_refresh()",
+    "ALTER TABLE api_update DROP COLUMN IF EXISTS search_vector",
+]
+
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE api_update_fts USING fts5(
+        update_id UNINDEXED, title, summary, body, tags,
+        tokenize = 'porter unicode61'
+    )
+    """,
+    """
+    INSERT INTO api_update_fts (update_id, title, summary, body, tags)
+    SELECT u.id, u.title, u.summary, u.body,
+           coalesce((SELECT group_concat(t.value, ' ') FROM json_each(u.tags) t), '')
+    FROM api_update u
+    """,
+]
+
+SQLITE_REVERSE = ["DROP TABLE IF EXISTS api_update_fts"]
+
+
+def _run(statements_by_vendor):
+    def run(apps, schema_editor):
+        for statement in statements_by_vendor.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0031_update_score"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            _run({"postgresql": POSTGRES_FORWARD, "sqlite": SQLITE_FORWARD}),
+            _run({"postgresql": POSTGRES_REVERSE, "sqlite": SQLITE_REVERSE}),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.5 on 2026-10-19 04:09
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0033_update_read_state"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="update",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["-priority", "-timestamp"],
+                name="update_active_feed_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="update",
+            index=models.Index(
+                condition=models.Q(("expires_at__isnull", False), ("is_active", True)),
+                fields=["expires_at"],
+                name="update_active_expiry_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.5 on 2026-10-19 04:15
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_like_counters(apps, schema_editor):
+    Update = apps.get_model("api", "Update")
+    UpdateLike = apps.get_model("api", "UpdateLike")
+
+    def reactions(is_like):
+        counts = (
+            UpdateLike.objects.filter(update=OuterRef("pk"), is_like=is_like)
+            .order_by()
+            .values("update")
+            .annotate(total=Count("pk"))
+            .values("total")
+        )
+        return Coalesce(Subquery(counts), 0)
+
+    Update.objects.update(likes_count=reactions(True), dislikes_count=reactions(False))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0034_update_expiry_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="update",
+            name="dislikes_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="update",
+            name="likes_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_like_counters, migrations.RunPython.noop),
+    ]
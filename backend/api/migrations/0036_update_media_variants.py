@@ -0,0 +1,33 @@
+# Generated by Django 5.2.5 on 2026-10-19 04:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0035_update_like_counters"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="updatemedia",
+            name="height",
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="updatemedia",
+            name="variants",
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name="updatemedia",
+            name="variants_generated_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="updatemedia",
+            name="width",
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+    ]
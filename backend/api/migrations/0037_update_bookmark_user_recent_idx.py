@@ -0,0 +1,21 @@
+# Generated by Django 5.2.5 on 2026-10-19 04:20
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0036_update_media_variants"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="updatebookmark",
+            index=models.Index(
+                fields=["user", "-created_at", "-id"], name="bookmark_user_recent_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,74 @@
+from django.db import migrations
+
+# (table, column) pairs searched by substring and by prefix (api.text_search)
+TRIGRAM_FIELDS = [
+    ("zip_codes", "code"),
+    ("cities", "name"),
+    ("api_activity", "assigned_to"),
+    ("api_tag", "name"),
+    ("api_tag", "description"),
+    ("api_tag", "category"),
+]
+PREFIX_FIELDS = [
+    ("zip_codes", "code"),
+    ("cities", "name"),
+    ("api_activity", "assigned_to"),
+    ("api_tag", "name"),
+]
+
+# CONCURRENTLY keeps the tables writable while the indexes build; it cannot
+# run inside a transaction, hence atomic = False below
+POSTGRES_FORWARD = ["CREATE EXTENSION IF NOT EXISTS pg_trgm"]
+POSTGRES_FORWARD += [
+    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {table}_{column}_trgm "
+    f"ON {table} USING gin ({column} gin_trgm_ops)"
+    for table, column in TRIGRAM_FIELDS
+]
+POSTGRES_FORWARD += [
+    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {table}_{column}_prefix "
+    f"ON {table} (lower({column}) text_pattern_ops)"
+    for table, column in PREFIX_FIELDS
+]
+
+POSTGRES_REVERSE = [
+    f"DROP INDEX CONCURRENTLY IF EXISTS {table}_{column}_trgm"
+    for table, column in TRIGRAM_FIELDS
+] + [
+    f"DROP INDEX CONCURRENTLY IF EXISTS {table}_{column}_prefix"
+    for table, column in PREFIX_FIELDS
+]
+
+# SQLite has no trigram index; case-insensitive LIKE prefixes can use NOCASE
+SQLITE_FORWARD = [
+    f"CREATE INDEX IF NOT EXISTS {table}_{column}_prefix "
+    f"ON {table} ({column} COLLATE NOCASE)"
+    for table, column in PREFIX_FIELDS
+]
+
+SQLITE_REVERSE = [
+    f"DROP INDEX IF EXISTS {table}_{column}_prefix" for table, column in PREFIX_FIELDS
+]
+
+
+def _run(statements_by_vendor):
+    def run(apps, schema_editor):
+        for statement in statements_by_vendor.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("api", "0038_reference_data_version"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            _run({"postgresql": POSTGRES_FORWARD, "sqlite": SQLITE_FORWARD}),
+            _run({"postgresql": POSTGRES_REVERSE, "sqlite": SQLITE_REVERSE}),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.5 on 2026-10-19 04:43
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0039_search_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="activity",
+            index=models.Index(
+                fields=["created_at", "id"], name="api_activit_created_a96aa9_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="activity",
+            index=models.Index(
+                fields=["status", "created_at", "id"],
+                name="api_activit_status_11bf18_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="activity",
+            index=models.Index(
+                fields=["priority", "created_at", "id"],
+                name="api_activit_priorit_8a778a_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="activity",
+            index=models.Index(
+                fields=["type", "created_at", "id"], name="api_activit_type_d36d69_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,57 @@
+from django.db import migrations
+
+# Must match the overlap expression in api.activity_calendar.Overlaps
+SPAN = "tstzrange(start_time, GREATEST(start_time, end_time), '[)')"
+
+# CONCURRENTLY keeps the table writable while the indexes build; it cannot
+# run inside a transaction, hence atomic = False below
+POSTGRES_FORWARD = [
+    "CREATE EXTENSION IF NOT EXISTS btree_gist",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS api_activity_span_gist "
+    f"ON api_activity USING gist ({SPAN})",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS api_activity_assignee_span_gist "
+    f"ON api_activity USING gist (assigned_to, {SPAN})",
+]
+
+POSTGRES_REVERSE = [
+    "DROP INDEX CONCURRENTLY IF EXISTS api_activity_span_gist",
+    "DROP INDEX CONCURRENTLY IF EXISTS api_activity_assignee_span_gist",
+]
+
+# No range types elsewhere: leading with end_time skips everything that ended
+# before the window, which is most of the table for current calendars
+SQLITE_FORWARD = [
+    "CREATE INDEX IF NOT EXISTS api_activity_span "
+    "ON api_activity (end_time, start_time)",
+    "CREATE INDEX IF NOT EXISTS api_activity_assignee_span "
+    "ON api_activity (assigned_to, end_time, start_time)",
+]
+
+SQLITE_REVERSE = [
+    "DROP INDEX IF EXISTS api_activity_span",
+    "DROP INDEX IF EXISTS api_activity_assignee_span",
+]
+
+
+def _run(statements_by_vendor):
+    def run(apps, schema_editor):
+        for statement in statements_by_vendor.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("api", "0040_activity_list_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            _run({"postgresql": POSTGRES_FORWARD, "sqlite": SQLITE_FORWARD}),
+            _run({"postgresql": POSTGRES_REVERSE, "sqlite": SQLITE_REVERSE}),
+        ),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 5.2.5 on 2026-10-19 04:47
+
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+
+
+def backfill_rollups(apps, schema_editor):
+    Activity = apps.get_model("api", "Activity")
+    ActivityDailyRollup = apps.get_model("api", "ActivityDailyRollup")
+    groups = (
+        Activity.objects.order_by()
+        .annotate(day=TruncDate("start_time"))
+        .values("day", "type", "status", "priority")
+        .annotate(total=Count("pk"))
+    )
+    ActivityDailyRollup.objects.bulk_create(
+        [
+            ActivityDailyRollup(
+                day=group["day"],
+                type=group["type"],
+                status=group["status"],
+                priority=group["priority"],
+                count=group["total"],
+            )
+            for group in groups
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0041_activity_span_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ActivityDailyRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField()),
+                ("type", models.CharField(max_length=50)),
+                ("status", models.CharField(max_length=20)),
+                ("priority", models.CharField(max_length=20)),
+                ("count", models.IntegerField(default=0)),
+            ],
+            options={
+                "db_table": "activity_daily_rollups",
+                "unique_together": {("day", "type", "status", "priority")},
+            },
+        ),
+        migrations.RunPython(backfill_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.5 on 2026-10-19 04:49
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0042_activity_daily_rollups"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="activity",
+            index=models.Index(
+                condition=models.Q(("status__in", ["planned", "in-progress"])),
+                fields=["end_time"],
+                name="activity_open_end_time",
+            ),
+        ),
+    ]
@@ -3,7 +3,7 @@ import uuid
 from typing import List, Optional, Union
 
 from django.contrib.auth.models import User
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 
 # Custom User model temporarily disabled to avoid migration conflicts
@@ -596,17 +596,60 @@ class Activity(models.Model):
     class Meta:
         ordering = ["-created_at"]
         verbose_name_plural = "Activities"
+        # Keyset pages on (created_at, id), optionally within one filter value
+        indexes = [
+            models.Index(fields=["created_at", "id"]),
+            models.Index(fields=["status", "created_at", "id"]),
+            models.Index(fields=["priority", "created_at", "id"]),
+            models.Index(fields=["type", "created_at", "id"]),
+            # Open activities by end time, for the overdue sweep
+            models.Index(
+                fields=["end_time"],
+                condition=models.Q(status__in=["planned", "in-progress"]),
+                name="activity_open_end_time",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.title} ({self.status})"
 
     def save(self, *args, **kwargs):
-        # Auto-assign status and priority configs if not set
-        if not hasattr(self, "status_config") or not self.status_config:
-            self.status_config = ActivityStatus.objects.get(status=self.status)
-        if not hasattr(self, "priority_config") or not self.priority_config:
-            self.priority_config = ActivityPriority.objects.get(priority=self.priority)
-        super().save(*args, **kwargs)
+        # Keep the configs in step with status and priority, from the registry
+        from .activity_config import get_activity_configs
+
+        configs = get_activity_configs()
+        status_config = configs.get(ActivityStatus, self.status)
+        if self.status_config_id != status_config.pk:
+            self.status_config = status_config
+        priority_config = configs.get(ActivityPriority, self.priority)
+        if self.priority_config_id != priority_config.pk:
+            self.priority_config = priority_config
+        # The rollup signals must commit or roll back with the row; delete()
+        # already runs its signals inside the collector's transaction
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+
+class ActivityDailyRollup(models.Model):
+    """Number of activities per (start day, type, status, priority)
+
+    Kept current by api.activity_rollups as activities change; rebuild it
+    from scratch with ``manage.py rebuild_activity_rollups``.
+    """
+
+    day = models.DateField()
+    type = models.CharField(max_length=50)
+    status = models.CharField(max_length=20)
+    priority = models.CharField(max_length=20)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = "activity_daily_rollups"
+        # Leads with day, so date-range reads are one index range scan
+        unique_together = ["day", "type", "status", "priority"]
+
+    def __str__(self):
+        return f"{self.day} {self.type}/{self.status}/{self.priority}: {self.count}"
 
 
 class Chat(models.Model):
@@ -942,6 +985,11 @@ class UpdateMedia(models.Model):
     thumbnail_url = models.URLField(blank=True)
     duration = models.IntegerField(null=True, blank=True)  # in seconds for video/audio
     file_size = models.IntegerField(null=True, blank=True)  # in bytes
+    # Filled in by api.media_variants for images uploaded under MEDIA_URL
+    width = models.PositiveIntegerField(null=True, blank=True)
+    height = models.PositiveIntegerField(null=True, blank=True)
+    variants = models.JSONField(default=list, blank=True)  # Resized copies
+    variants_generated_at = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -985,6 +1033,20 @@ class Tag(models.Model):
             self.save(update_fields=["usage_count"])
 
 
+class UpdateQuerySet(models.QuerySet):
+    def live(self, now=None):
+        """Active updates that have not expired yet"""
+        now = now or timezone.now()
+        return self.filter(is_active=True).filter(
+            models.Q(expires_at__isnull=True) | models.Q(expires_at__gt=now)
+        )
+
+    def expired(self, now=None):
+        """Active updates whose expiry has passed (what the sweeper deactivates)"""
+        now = now or timezone.now()
+        return self.filter(is_active=True, expires_at__lte=now)
+
+
 class Update(models.Model):
     UPDATE_TYPE_NEWS = "news"
     UPDATE_TYPE_COMMUNICATION = "communication"
@@ -1028,9 +1090,15 @@ class Update(models.Model):
     expires_at = models.DateTimeField(
         null=True, blank=True
     )  # For time-sensitive updates
+    score = models.FloatField(default=0)  # Materialized feed ranking score
+    # Denormalized reaction counters, maintained write-behind by api.likes
+    likes_count = models.IntegerField(default=0)
+    dislikes_count = models.IntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = UpdateQuerySet.as_manager()
+
     class Meta:
         ordering = ["-priority", "-timestamp"]
         indexes = [
@@ -1038,15 +1106,46 @@ class Update(models.Model):
             models.Index(fields=["status", "timestamp"]),
             models.Index(fields=["created_by", "timestamp"]),
             models.Index(fields=["is_active", "timestamp"]),
+            models.Index(fields=["is_active", "score"]),
+            # Partial indexes over active rows only: the default feed order,
+            # and the expiry column that live() and the sweeper range-scan
+            models.Index(
+                fields=["-priority", "-timestamp"],
+                name="update_active_feed_idx",
+                condition=models.Q(is_active=True),
+            ),
+            models.Index(
+                fields=["expires_at"],
+                name="update_active_expiry_idx",
+                condition=models.Q(is_active=True, expires_at__isnull=False),
+            ),
         ]
 
     def __str__(self):
         return f"{self.title} ({self.type})"
 
-    def mark_as_read(self):
-        if self.status != self.UPDATE_STATUS_URGENT:
-            self.status = self.UPDATE_STATUS_READ
-            self.save(update_fields=["status"])
+    def save(self, *args, **kwargs):
+        # New updates get a baseline score so they rank before the next recompute
+        if self._state.adding and not self.score:
+            from .ranking import hot_score
+
+            self.score = hot_score(self.priority, self.timestamp, expires_at=None)
+        super().save(*args, **kwargs)
+
+    def mark_as_read(self, user):
+        """Record that ``user`` has read this update
+
+        Read state is per user (see UpdateReadReceipt); the shared ``status``
+        column is left to editors. Nothing is written when the user's
+        watermark already covers the update.
+        """
+        if UpdateReadWatermark.objects.filter(
+            user=user, read_before__gte=self.timestamp
+        ).exists():
+            return
+        UpdateReadReceipt.objects.bulk_create(
+            [UpdateReadReceipt(update=self, user=user)], ignore_conflicts=True
+        )
 
     def is_expired(self):
         if self.expires_at:
@@ -1190,11 +1289,11 @@ class UpdateComment(models.Model):
 
     def can_edit(self, user):
         """Check if user can edit this comment"""
-        return user == self.author or user.is_staff or user.is_superuser
+        return user.pk == self.author_id or user.is_staff or user.is_superuser
 
     def can_delete(self, user):
         """Check if user can delete this comment"""
-        return user == self.author or user.is_staff or user.is_superuser
+        return user.pk == self.author_id or user.is_staff or user.is_superuser
 
 
 class UpdateBookmark(models.Model):
@@ -1215,11 +1314,55 @@ class UpdateBookmark(models.Model):
             "user",
         ]  # One user can only bookmark once per update
         ordering = ["-created_at"]
+        indexes = [
+            # Keyset pagination of a user's bookmarks, newest first
+            models.Index(
+                fields=["user", "-created_at", "-id"], name="bookmark_user_recent_idx"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.user.username} bookmarked {self.update.title}"
 
 
+class UpdateReadReceipt(models.Model):
+    """Per-user record that an update was read after the user's watermark"""
+
+    id = models.AutoField(primary_key=True)
+    update = models.ForeignKey(
+        Update, on_delete=models.CASCADE, related_name="read_receipts"
+    )
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="update_read_receipts"
+    )
+    read_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        unique_together = [
+            "user",
+            "update",
+        ]  # Also serves as the (user, update) lookup index
+
+    def __str__(self):
+        return f"{self.user.username} read {self.update.title}"
+
+
+class UpdateReadWatermark(models.Model):
+    """Everything published at or before ``read_before`` counts as read"""
+
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="update_read_watermark",
+    )
+    read_before = models.DateTimeField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.user.username} read up to {self.read_before}"
+
+
 # Location Models for Countries, States, Cities, and Zip Codes
 class Country(models.Model):
     """Model for countries"""
@@ -1318,6 +1461,40 @@ class ZipCode(models.Model):
         return f"{self.code} - {self.city.name}, {self.state.name}, {self.country.name}"
 
 
+class ReferenceDataVersion(models.Model):
+    """Version stamp for slow-changing reference data such as locations
+
+    Loaders bump it after writing; in-memory copies (see api.gazetteer)
+    reload when the stamp they were built from is no longer current.
+    """
+
+    name = models.CharField(max_length=50, unique=True)
+    version = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "reference_data_versions"
+
+    def __str__(self):
+        return f"{self.name} v{self.version}"
+
+    @classmethod
+    def current(cls, name: str) -> int:
+        return (
+            cls.objects.filter(name=name).values_list("version", flat=True).first() or 0
+        )
+
+    @classmethod
+    def bump(cls, name: str) -> int:
+        """Increment the version of ``name`` and return the new value"""
+        with transaction.atomic():
+            stamp, _ = cls.objects.select_for_update().get_or_create(name=name)
+            stamp.version = models.F("version") + 1
+            stamp.save(update_fields=["version", "updated_at"])
+        stamp.refresh_from_db(fields=["version"])
+        return stamp.version
+
+
 class Contact(models.Model):
     """Model for storing contact form submissions"""
 
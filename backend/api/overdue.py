@@ -0,0 +1,130 @@
+"""
+Overdue detection for activities.
+
+An activity still planned or in progress after its end time becomes
+``overdue``. The sweeper flips a bounded batch per transaction with one
+``UPDATE`` that sets the status, its status_config and updated_at together,
+then moves the dashboard rollup counts and announces the rows it changed
+with a single ``activities_changed`` signal. A partial index on
+``end_time`` over open activities keeps finding each batch cheap however
+large the table grows; ``SKIP LOCKED`` lets several processes sweep at once
+on PostgreSQL.
+
+Run it from cron with ``manage.py sweep_overdue_activities``, or let each
+server process sweep every ``ACTIVITY_OVERDUE_SWEEP_SECONDS`` (0 disables)
+from a background thread started by the first activity request.
+"""
+
+import logging
+import threading
+from typing import Optional
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from .activity_config import get_activity_configs
+from .activity_events import send_activities_changed
+from .activity_rollups import apply_deltas, deltas_for_update
+from .models import Activity, ActivityStatus
+
+logger = logging.getLogger(__name__)
+
+OVERDUE = "overdue"
+OPEN_STATUSES = ("planned", "in-progress")
+DEFAULT_SWEEP_SECONDS = 300
+
+
+def sweep_overdue(
+    batch_size: int = 500, max_batches: Optional[int] = None, now=None
+) -> int:
+    """Mark open activities past their end time overdue; return how many"""
+    now = now or timezone.now()
+    overdue_config = get_activity_configs().get(ActivityStatus, OVERDUE)
+    swept = 0
+    batches = 0
+
+    while max_batches is None or batches < max_batches:
+        with transaction.atomic():
+            ids = list(
+                Activity.objects.filter(end_time__lt=now, status__in=OPEN_STATUSES)
+                .order_by("end_time", "id")
+                .select_for_update(skip_locked=True)
+                .values_list("id", flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+            batch = Activity.objects.filter(id__in=ids, status__in=OPEN_STATUSES)
+            deltas = deltas_for_update(batch, {"status": OVERDUE})
+            stamp = timezone.now()
+            batch.update(
+                status=OVERDUE, status_config_id=overdue_config.pk, updated_at=stamp
+            )
+            # Only the rows this UPDATE changed; another writer may have closed
+            # some of ``ids`` since they were read
+            changed = list(
+                Activity.objects.filter(
+                    id__in=ids, status=OVERDUE, updated_at=stamp
+                ).values_list("id", flat=True)
+            )
+            swept += len(changed)
+            apply_deltas(deltas)
+            send_activities_changed(Activity, changed, {"status": OVERDUE})
+        batches += 1
+        if len(ids) < batch_size:
+            break
+
+    return swept
+
+
+class OverdueSweeper:
+    """Per-process background thread running sweep_overdue on an interval"""
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def ensure_running(self) -> None:
+        if self.interval <= 0:
+            return
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="activity-overdue-sweep", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._wakeup.wait(self.interval):
+            try:
+                swept = sweep_overdue()
+                if swept:
+                    logger.info("Marked %d activities overdue", swept)
+            except Exception:
+                logger.exception("Failed to sweep overdue activities")
+            finally:
+                close_old_connections()
+
+
+_sweeper: Optional[OverdueSweeper] = None
+_sweeper_lock = threading.Lock()
+
+
+def get_overdue_sweeper() -> OverdueSweeper:
+    global _sweeper
+    if _sweeper is None:
+        with _sweeper_lock:
+            if _sweeper is None:
+                _sweeper = OverdueSweeper(
+                    getattr(
+                        settings,
+                        "ACTIVITY_OVERDUE_SWEEP_SECONDS",
+                        DEFAULT_SWEEP_SECONDS,
+                    )
+                )
+    return _sweeper
@@ -0,0 +1,174 @@
+"""
+Password hashing off the event loop.
+
+PBKDF2 takes hundreds of milliseconds per call. The async auth views hand
+every hash to a small dedicated thread pool (hashlib releases the GIL while
+it works) instead of Django's single thread-sensitive executor, so a burst of
+logins neither blocks the event loop nor queues behind unrelated sync work.
+The pool admits a bounded number of jobs; beyond that callers get
+``HashingPoolBusy`` right away and the views answer 503 with Retry-After
+rather than letting latency grow without bound.
+"""
+
+import asyncio
+import statistics
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Optional
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password, verify_password
+from django.contrib.auth.signals import user_login_failed
+
+User = get_user_model()
+
+DEFAULT_WORKERS = 4
+DEFAULT_MAX_PENDING = 32
+DEFAULT_RETRY_AFTER = 2
+LATENCY_WINDOW = 1000
+
+MODEL_BACKEND = "django.contrib.auth.backends.ModelBackend"
+
+
+class HashingPoolBusy(Exception):
+    """Raised when the hashing pool already holds its maximum of jobs"""
+
+
+def _summary(samples: Deque[float]) -> Dict[str, Optional[float]]:
+    if not samples:
+        return {"avg_ms": None, "p50_ms": None, "p95_ms": None, "max_ms": None}
+    ordered = sorted(samples)
+    return {
+        "avg_ms": round(statistics.fmean(ordered) * 1000, 2),
+        "p50_ms": round(ordered[len(ordered) // 2] * 1000, 2),
+        "p95_ms": round(
+            ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 2
+        ),
+        "max_ms": round(ordered[-1] * 1000, 2),
+    }
+
+
+class HashingPool:
+    """Bounded thread pool for password hashing with latency metrics"""
+
+    def __init__(self, workers: int, max_pending: int) -> None:
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="password-hash"
+        )
+        self._lock = threading.Lock()
+        self.pending = 0  # Queued plus running
+        self.running = 0
+        self.peak_pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self._hash_times: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._queue_waits: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run ``func(*args)`` in the pool, or raise HashingPoolBusy"""
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise HashingPoolBusy
+            self.pending += 1
+            self.peak_pending = max(self.peak_pending, self.pending)
+        submitted = time.perf_counter()
+
+        def job():
+            started = time.perf_counter()
+            with self._lock:
+                self.running += 1
+            try:
+                return func(*args)
+            finally:
+                finished = time.perf_counter()
+                with self._lock:
+                    self.running -= 1
+                    self.pending -= 1
+                    self.completed += 1
+                    self._queue_waits.append(started - submitted)
+                    self._hash_times.append(finished - started)
+
+        return await asyncio.wrap_future(self._executor.submit(job))
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "pending": self.pending,
+                "running": self.running,
+                "peak_pending": self.peak_pending,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "hash_time": _summary(self._hash_times),
+                "queue_wait": _summary(self._queue_waits),
+            }
+
+
+_pool: Optional[HashingPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_hashing_pool() -> HashingPool:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = HashingPool(
+                    getattr(settings, "PASSWORD_HASHING_WORKERS", DEFAULT_WORKERS),
+                    getattr(
+                        settings, "PASSWORD_HASHING_MAX_PENDING", DEFAULT_MAX_PENDING
+                    ),
+                )
+    return _pool
+
+
+def retry_after_seconds() -> int:
+    return getattr(settings, "PASSWORD_HASHING_RETRY_AFTER", DEFAULT_RETRY_AFTER)
+
+
+async def ahash_password(raw_password: str) -> str:
+    return await get_hashing_pool().run(make_password, raw_password)
+
+
+async def acheck_password(user, raw_password: str) -> bool:
+    """Check ``raw_password``, re-encoding it if the preferred hasher changed"""
+    pool = get_hashing_pool()
+    is_correct, must_update = await pool.run(
+        verify_password, raw_password, user.password
+    )
+    if is_correct and must_update:
+        try:
+            user.password = await pool.run(make_password, raw_password)
+        except HashingPoolBusy:
+            # Not worth failing a correct login; upgrade on a later one
+            return is_correct
+        await user.asave(update_fields=["password"])
+    return is_correct
+
+
+async def aauthenticate_password(request, username: str, password: str):
+    """Async equivalent of ModelBackend username/password authentication"""
+    try:
+        user = await User._default_manager.aget(**{User.USERNAME_FIELD: username})
+    except User.DoesNotExist:
+        # Hash anyway so unknown usernames take as long as wrong passwords
+        await ahash_password(password)
+        user = None
+    else:
+        if not await acheck_password(user, password) or not user.is_active:
+            user = None
+
+    if user is None:
+        await user_login_failed.asend(
+            sender=__name__, credentials={"username": username}, request=request
+        )
+        return None
+    user.backend = MODEL_BACKEND
+    return user
@@ -0,0 +1,184 @@
+"""
+Feed ranking for updates.
+
+The ``hot`` score is anchored to the update's publish timestamp instead of
+decaying with the wall clock: newer posts start higher and engagement pushes a
+post up logarithmically. Because the score of an untouched row never changes,
+the background recompute only needs to revisit rows that were edited, liked,
+commented on or that expired since the last run. A recompute that changes a
+score also moves ``updated_at``, so feed ETags see the new order.
+
+``top`` ignores recency: it ranks by raw engagement (likes minus dislikes
+plus weighted comments), then priority.
+"""
+
+import math
+from datetime import datetime, timedelta
+from typing import Iterable, Optional
+
+from django.db.models import Count, F, IntegerField, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+# Scores are relative to this epoch to keep the stored floats small
+SCORE_EPOCH = datetime(2024, 1, 1, tzinfo=timezone.get_fixed_timezone(0))
+
+# Seconds of recency worth one order of magnitude of engagement (12.5 hours)
+RECENCY_SECONDS = 45000
+
+# One point of Update.priority is worth roughly one day of recency
+PRIORITY_WEIGHT = 86400 / RECENCY_SECONDS
+
+# Comments signal more engagement than a like
+COMMENT_WEIGHT = 2
+
+# Expired updates sink below everything that is still live
+EXPIRED_PENALTY = 1000.0
+
+RANKING_HOT = "hot"
+RANKING_TOP = "top"
+RANKING_RECENT = "recent"
+
+RANKING_ORDERINGS = {
+    RANKING_HOT: ("-score", "-timestamp"),
+    RANKING_RECENT: ("-timestamp",),
+}
+
+
+def hot_score(
+    priority: int,
+    timestamp: datetime,
+    likes: int = 0,
+    dislikes: int = 0,
+    comments: int = 0,
+    expires_at: Optional[datetime] = None,
+    now: Optional[datetime] = None,
+) -> float:
+    """Compute the materialized ranking score for a single update"""
+    engagement = likes - dislikes + COMMENT_WEIGHT * comments
+    order = math.log10(max(abs(engagement), 1))
+    sign = 1 if engagement > 0 else -1 if engagement < 0 else 0
+    recency = (timestamp - SCORE_EPOCH).total_seconds() / RECENCY_SECONDS
+
+    score = int(priority or 0) * PRIORITY_WEIGHT + sign * order + recency
+
+    now = now or timezone.now()
+    if expires_at and expires_at <= now:
+        score -= EXPIRED_PENALTY
+
+    return round(score, 7)
+
+
+def engagement():
+    """Expression for likes - dislikes + COMMENT_WEIGHT * active comments"""
+    from .models import UpdateComment
+
+    comments = (
+        UpdateComment.objects.filter(update=OuterRef("pk"), is_active=True)
+        .order_by()
+        .values("update")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    return (
+        F("likes_count")
+        - F("dislikes_count")
+        + COMMENT_WEIGHT * Coalesce(Subquery(comments, output_field=IntegerField()), 0)
+    )
+
+
+def get_ranking_ordering(ranking: Optional[str]) -> Optional[tuple]:
+    """Return the order_by() arguments for a ranking mode, or None for default"""
+    if not ranking:
+        return None
+    ranking = ranking.lower()
+    if ranking == RANKING_TOP:
+        return (engagement().desc(), "-priority", "-timestamp")
+    return RANKING_ORDERINGS.get(ranking)
+
+
+def touched_update_ids(since: datetime, now: Optional[datetime] = None) -> set:
+    """Collect ids of updates whose score inputs changed since ``since``"""
+    from .models import Update, UpdateComment, UpdateLike
+
+    now = now or timezone.now()
+
+    touched = set(
+        Update.objects.filter(
+            Q(updated_at__gte=since) | Q(expires_at__gte=since, expires_at__lte=now)
+        ).values_list("id", flat=True)
+    )
+    touched.update(
+        UpdateLike.objects.filter(created_at__gte=since).values_list(
+            "update_id", flat=True
+        )
+    )
+    touched.update(
+        UpdateComment.objects.filter(updated_at__gte=since).values_list(
+            "update_id", flat=True
+        )
+    )
+    return touched
+
+
+def recompute_scores(
+    update_ids: Optional[Iterable[str]] = None, batch_size: int = 500
+) -> int:
+    """Recompute and store scores, optionally restricted to ``update_ids``
+
+    Returns the number of rows whose score changed.
+    """
+    from .models import Update
+
+    queryset = Update.objects.all()
+    if update_ids is not None:
+        update_ids = list(update_ids)
+        if not update_ids:
+            return 0
+        queryset = queryset.filter(id__in=update_ids)
+
+    queryset = (
+        queryset.order_by()
+        .annotate(
+            num_likes=Count("likes", filter=Q(likes__is_like=True), distinct=True),
+            num_dislikes=Count("likes", filter=Q(likes__is_like=False), distinct=True),
+            num_comments=Count(
+                "comments", filter=Q(comments__is_active=True), distinct=True
+            ),
+        )
+        .only("id", "priority", "timestamp", "expires_at", "score", "updated_at")
+    )
+
+    now = timezone.now()
+    changed = []
+    updated = 0
+    for update in queryset.iterator(chunk_size=batch_size):
+        score = hot_score(
+            update.priority,
+            update.timestamp,
+            likes=update.num_likes,
+            dislikes=update.num_dislikes,
+            comments=update.num_comments,
+            expires_at=update.expires_at,
+            now=now,
+        )
+        if score != update.score:
+            update.score = score
+            update.updated_at = now
+            changed.append(update)
+        if len(changed) >= batch_size:
+            Update.objects.bulk_update(changed, ["score", "updated_at"])
+            updated += len(changed)
+            changed = []
+
+    if changed:
+        Update.objects.bulk_update(changed, ["score", "updated_at"])
+        updated += len(changed)
+
+    return updated
+
+
+def recompute_recent_scores(window: timedelta, batch_size: int = 500) -> int:
+    """Recompute scores for updates touched within ``window``"""
+    since = timezone.now() - window
+    return recompute_scores(touched_update_ids(since), batch_size=batch_size)
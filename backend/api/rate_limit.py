@@ -0,0 +1,177 @@
+"""
+Token-bucket rate limiting shared by every worker process on a host.
+
+Buckets live in a fixed-size hash table in a memory-mapped file (in a
+private directory under /dev/shm where available), so all worker processes
+see the same counters without an external store. The file must belong to the
+app's user and be unreadable to anyone else, or the table refuses to open
+it. The table is split into groups of ``GROUP_SLOTS`` slots; a key always
+hashes to one group and probes only inside it. Each group is guarded by a
+POSIX record lock on its byte range (between processes) plus a striped
+thread lock (between threads of one process, which record locks do not
+separate).
+
+When a group is full, the slot whose bucket was touched longest ago is
+reused. Its old bucket would have refilled the most by now, so the only
+effect is that a rarely seen client starts again from a full bucket.
+"""
+
+import fcntl
+import hashlib
+import math
+import mmap
+import os
+import stat
+import struct
+import tempfile
+import threading
+import time
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+DEFAULT_SLOTS = 65536
+GROUP_SLOTS = 8
+THREAD_LOCK_STRIPES = 256
+
+# key hash (0 = empty), tokens left, last refill (unix time)
+SLOT = struct.Struct("<Qdd")
+
+PERIODS = {"s": 1, "sec": 1, "m": 60, "min": 60, "h": 3600, "hour": 3600}
+
+
+class Rate(NamedTuple):
+    capacity: int
+    per_second: float
+
+
+@lru_cache(maxsize=128)
+def parse_rate(rate: str) -> Rate:
+    """Parse ``"<requests>/<period>"``, e.g. ``"60/min"`` or ``"5/s"``"""
+    count, _, period = rate.partition("/")
+    count = int(count)
+    seconds = PERIODS.get(period.strip().lower())
+    if count <= 0 or seconds is None:
+        raise ValueError(f"Invalid rate limit: {rate!r}")
+    return Rate(count, count / seconds)
+
+
+def _key_hash(key: str) -> int:
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little") or 1
+
+
+class BucketTable:
+    """Fixed-size table of token buckets in a shared memory-mapped file"""
+
+    def __init__(self, path: str, slots: int = DEFAULT_SLOTS) -> None:
+        self.groups = max(slots // GROUP_SLOTS, 1)
+        self.size = self.groups * GROUP_SLOTS * SLOT.size
+        self.path = path
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+        try:
+            _check_private(os.fstat(self._fd), path)
+        except ImproperlyConfigured:
+            os.close(self._fd)
+            raise
+        if os.fstat(self._fd).st_size < self.size:
+            # New space reads as zeros, i.e. empty slots
+            os.ftruncate(self._fd, self.size)
+        self._map = mmap.mmap(self._fd, self.size)
+        self._thread_locks = [threading.Lock() for _ in range(THREAD_LOCK_STRIPES)]
+
+    def close(self) -> None:
+        self._map.close()
+        os.close(self._fd)
+
+    def acquire(
+        self, key: str, rate: Rate, now: Optional[float] = None
+    ) -> Tuple[bool, float]:
+        """Take one token for ``key``; returns (allowed, seconds until next)"""
+        now = time.time() if now is None else now
+        key_hash = _key_hash(key)
+        group = key_hash % self.groups
+        start = group * GROUP_SLOTS * SLOT.size
+        length = GROUP_SLOTS * SLOT.size
+
+        with self._thread_locks[group % THREAD_LOCK_STRIPES]:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, length, start)
+            try:
+                offset, tokens, last = self._find_slot(key_hash, start, rate, now)
+                tokens = min(rate.capacity, tokens + (now - last) * rate.per_second)
+                allowed = tokens >= 1
+                if allowed:
+                    tokens -= 1
+                SLOT.pack_into(self._map, offset, key_hash, tokens, now)
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN, length, start)
+
+        if allowed:
+            return True, 0.0
+        return False, (1 - tokens) / rate.per_second
+
+    def _find_slot(
+        self, key_hash: int, start: int, rate: Rate, now: float
+    ) -> Tuple[int, float, float]:
+        """Offset and (tokens, last refill) of the key's slot, claiming one if new"""
+        oldest_offset, oldest_time = start, math.inf
+        for position in range(GROUP_SLOTS):
+            offset = start + position * SLOT.size
+            slot_hash, tokens, last = SLOT.unpack_from(self._map, offset)
+            if slot_hash == key_hash:
+                return offset, tokens, last
+            if slot_hash == 0:
+                oldest_offset, oldest_time = offset, -math.inf
+            elif last < oldest_time:
+                oldest_offset, oldest_time = offset, last
+        # New bucket: starts full
+        return oldest_offset, float(rate.capacity), now
+
+
+def _check_private(info: os.stat_result, path: str) -> None:
+    """Refuse files or directories other local users could have planted"""
+    if info.st_uid != os.geteuid() or info.st_mode & 0o077:
+        raise ImproperlyConfigured(
+            f"Rate limit store {path} must be owned by this user with no group "
+            "or other permissions"
+        )
+
+
+def default_store_path(slots: int) -> str:
+    """A table file inside a 0700 directory of this user's under /dev/shm"""
+    base = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    directory = os.path.join(base, f"rnexus-ratelimit-{os.geteuid()}")
+    try:
+        os.mkdir(directory, 0o700)
+    except FileExistsError:
+        pass
+    info = os.lstat(directory)
+    if not stat.S_ISDIR(info.st_mode):
+        raise ImproperlyConfigured(f"Rate limit store {directory} is not a directory")
+    _check_private(info, directory)
+    return os.path.join(directory, f"buckets-{slots}.bin")
+
+
+_table: Optional[BucketTable] = None
+_table_lock = threading.Lock()
+
+
+def get_bucket_table() -> BucketTable:
+    global _table
+    if _table is None:
+        with _table_lock:
+            if _table is None:
+                slots = getattr(settings, "RATE_LIMIT_TABLE_SLOTS", DEFAULT_SLOTS)
+                path = getattr(settings, "RATE_LIMIT_STORE_PATH", None)
+                _table = BucketTable(path or default_store_path(slots), slots)
+    return _table
+
+
+def route_rate(url_name: Optional[str]) -> Optional[Rate]:
+    """The configured rate for a URL name, if it is limited"""
+    if not url_name:
+        return None
+    rate = getattr(settings, "RATE_LIMITS", {}).get(url_name)
+    return parse_rate(rate) if rate else None
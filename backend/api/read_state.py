@@ -0,0 +1,90 @@
+"""
+Per-user read state for updates.
+
+An update is read for a user when it was published at or before the user's
+watermark (set by "mark all as read"), or when a read receipt exists for it.
+Receipts are therefore only the exceptions above the watermark, and moving the
+watermark forward clears the ones it now covers.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from django.db import transaction
+from django.db.models import BooleanField, Exists, ExpressionWrapper, Max, OuterRef, Q
+from django.utils import timezone
+
+from .models import Update, UpdateReadReceipt, UpdateReadWatermark
+
+
+def get_watermark(user) -> Optional[datetime]:
+    return (
+        UpdateReadWatermark.objects.filter(user=user)
+        .values_list("read_before", flat=True)
+        .first()
+    )
+
+
+def read_condition(user, watermark: Optional[datetime]) -> Q:
+    """Filter condition matching updates ``user`` has read"""
+    condition = Q(
+        Exists(UpdateReadReceipt.objects.filter(user=user, update_id=OuterRef("pk")))
+    )
+    if watermark is not None:
+        condition |= Q(timestamp__lte=watermark)
+    return condition
+
+
+def annotate_read_state(queryset, user, watermark: Optional[datetime]):
+    """Annotate each update with ``is_read`` for ``user``"""
+    return queryset.annotate(
+        is_read=ExpressionWrapper(
+            read_condition(user, watermark), output_field=BooleanField()
+        )
+    )
+
+
+def unread_count(queryset, user, watermark: Optional[datetime]) -> int:
+    return queryset.exclude(read_condition(user, watermark)).count()
+
+
+def read_state_validators(user, watermark: Optional[datetime]) -> tuple:
+    """Cheap stand-ins for the unread count in a feed ETag
+
+    Receipts are only added (mark_all_read deletes the ones its new watermark
+    covers), so the watermark and the newest receipt id change whenever an
+    is_read flag could; the newest created_at changes when an update arrives.
+    """
+    latest_receipt = UpdateReadReceipt.objects.filter(user=user).aggregate(
+        latest=Max("id")
+    )["latest"]
+    latest_update = Update.objects.aggregate(latest=Max("created_at"))["latest"]
+    return (
+        watermark.isoformat() if watermark else "",
+        latest_receipt or 0,
+        latest_update.isoformat() if latest_update else "",
+    )
+
+
+def mark_all_read(user, before: Optional[datetime] = None) -> datetime:
+    """Mark every update published up to ``before`` as read with one row
+
+    The watermark never moves backwards, so a stale client cannot un-read
+    updates.
+    """
+    before = before or timezone.now()
+    with transaction.atomic():
+        watermarks = UpdateReadWatermark.objects.select_for_update()
+        watermark, created = watermarks.get_or_create(
+            user=user, defaults={"read_before": before}
+        )
+        if not created:
+            if watermark.read_before >= before:
+                return watermark.read_before
+            watermark.read_before = before
+            watermark.save(update_fields=["read_before", "updated_at"])
+
+        UpdateReadReceipt.objects.filter(
+            user=user, update__timestamp__lte=before
+        ).delete()
+    return before
@@ -1,9 +1,10 @@
 import graphene
 
+from api.bookmarks import toggle_bookmark
+from api.likes import toggle_like
 from api.models import (
-    UpdateBookmark,
+    Update,
     UpdateComment,
-    UpdateLike,
     UserBlock,
     UserFavorite,
 )
@@ -35,25 +36,21 @@ class ToggleLike(graphene.Mutation):
             return result
 
         try:
-            # Get or create like
-            like, created = UpdateLike.objects.get_or_create(  # type: ignore
-                update_id=update_id, user=user, defaults={"is_active": True}
-            )
-
-            if not created:
-                # Toggle the like
-                like.is_active = not like.is_active
-                like.save()
+            if not Update.objects.filter(id=update_id).exists():  # type: ignore
+                result = cls()
+                result.ok = False
+                result.liked = False
+                result.like_count = 0
+                result.errors = ["Update not found"]
+                return result
 
-            # Get updated like count
-            like_count = UpdateLike.objects.filter(  # type: ignore
-                update_id=update_id, is_active=True
-            ).count()
+            # Clicking like again removes it; a dislike is flipped to a like
+            outcome = toggle_like(update_id, user.pk, True)
 
             result = cls()
             result.ok = True
-            result.liked = like.is_active if not created else True
-            result.like_count = like_count
+            result.liked = outcome.user_like_status is True
+            result.like_count = outcome.likes_count
             result.errors = []
             return result
 
@@ -87,19 +84,16 @@ class ToggleBookmark(graphene.Mutation):
             return result
 
         try:
-            # Get or create bookmark
-            bookmark, created = UpdateBookmark.objects.get_or_create(  # type: ignore
-                update_id=update_id, user=user, defaults={"is_active": True}
-            )
-
-            if not created:
-                # Toggle the bookmark
-                bookmark.is_active = not bookmark.is_active
-                bookmark.save()
+            if not Update.objects.filter(id=update_id).exists():  # type: ignore
+                result = cls()
+                result.ok = False
+                result.bookmarked = False
+                result.errors = ["Update not found"]
+                return result
 
             result = cls()
             result.ok = True
-            result.bookmarked = bookmark.is_active if not created else True
+            result.bookmarked = toggle_bookmark(update_id, user)
             result.errors = []
             return result
 
@@ -1,6 +1,9 @@
 import graphene
+from graphene.types.generic import GenericScalar
 from graphene_django.types import DjangoObjectType
 
+from api.activity_config import get_activity_configs
+from api.media_variants import media_payload
 from api.models import (
     Activity,
     ActivityCategoryNew,
@@ -11,6 +14,7 @@ from api.models import (
     UpdateBookmark,
     UpdateComment,
     UpdateLike,
+    UpdateMedia,
 )
 
 from .user_types import UserType
@@ -104,6 +108,14 @@ class ActivityType(DjangoObjectType):
     def resolve_priority(self, info):
         return self.priority.lower() if self.priority else None
 
+    def resolve_statusConfig(self, info):
+        return get_activity_configs().get_by_id(ActivityStatus, self.status_config_id)
+
+    def resolve_priorityConfig(self, info):
+        return get_activity_configs().get_by_id(
+            ActivityPriority, self.priority_config_id
+        )
+
 
 class UpdateType(DjangoObjectType):
     class Meta:
@@ -138,6 +150,7 @@ class UpdateType(DjangoObjectType):
     comments = graphene.List(lambda: UpdateCommentType)
     bookmarks = graphene.List(lambda: UpdateBookmarkType)
     likes = graphene.List(lambda: UpdateLikeType)
+    media = graphene.List(lambda: UpdateMediaType)
 
     # Add computed count fields
     likesCount = graphene.Int()
@@ -152,6 +165,9 @@ class UpdateType(DjangoObjectType):
     def resolve_comments(self, info):
         return self.comments.order_by("-created_at")  # type: ignore
 
+    def resolve_media(self, info):
+        return self.media.all()  # type: ignore
+
     def resolve_bookmarks(self, info):
         return self.bookmarks
 
@@ -159,10 +175,10 @@ class UpdateType(DjangoObjectType):
         return self.likes
 
     def resolve_likesCount(self, info):
-        return self.get_likes_count()
+        return self.likes_count
 
     def resolve_dislikesCount(self, info):
-        return self.get_dislikes_count()
+        return self.dislikes_count
 
     def resolve_commentsCount(self, info):
         return self.get_comments_count()
@@ -182,6 +198,10 @@ class UpdateType(DjangoObjectType):
         return None
 
     def resolve_isBookmarked(self, info):
+        # List queries annotate this for the whole page in the same query
+        annotated = getattr(self, "is_bookmarked", None)
+        if annotated is not None:
+            return annotated
         user = info.context.user
         if not user.is_authenticated:
             return False
@@ -212,6 +232,10 @@ class UpdateCommentType(DjangoObjectType):
     replies = graphene.List(lambda: UpdateCommentType)
 
     def resolve_replies(self, info):
+        # Use prefetched replies when the parent query loaded them
+        prefetched = getattr(self, "_prefetched_objects_cache", {}).get("replies")
+        if prefetched is not None:
+            return [reply for reply in prefetched if reply.is_active]
         return self.replies.filter(is_active=True).order_by("created_at")  # type: ignore
 
 
@@ -223,6 +247,67 @@ class UpdateBookmarkType(DjangoObjectType):
     createdAt = graphene.DateTime(source="created_at")
 
 
+class ActivityCountType(graphene.ObjectType):
+    """One bucket of an activity breakdown (a status, a day, ...)"""
+
+    key = graphene.String()
+    count = graphene.Int()
+
+
+class ActivityStatsType(graphene.ObjectType):
+    """Activity counts from the daily rollup (see api.activity_rollups)"""
+
+    total = graphene.Int()
+    byStatus = graphene.List(ActivityCountType)
+    byPriority = graphene.List(ActivityCountType)
+    byType = graphene.List(ActivityCountType)
+    byDay = graphene.List(ActivityCountType)
+
+
+class UpdateBookmarkConnection(graphene.ObjectType):
+    """A page of bookmarks plus the cursor of the next page"""
+
+    bookmarks = graphene.List(UpdateBookmarkType)
+    next_cursor = graphene.String()
+    has_next_page = graphene.Boolean()
+
+
+class UpdateMediaType(DjangoObjectType):
+    class Meta:
+        model = UpdateMedia
+        fields = (
+            "id",
+            "type",
+            "url",
+            "label",
+            "thumbnail_url",
+            "duration",
+            "file_size",
+            "width",
+            "height",
+            "created_at",
+        )
+
+    thumbnailUrl = graphene.String()
+    fileSize = graphene.Int(source="file_size")
+    srcset = graphene.String()
+    sources = GenericScalar()
+    variants = GenericScalar()
+    createdAt = graphene.DateTime(source="created_at")
+
+    def resolve_thumbnailUrl(self, info):
+        return media_payload(self)["thumbnailUrl"]
+
+    def resolve_srcset(self, info):
+        return media_payload(self)["srcset"]
+
+    def resolve_sources(self, info):
+        return media_payload(self)["sources"]
+
+    def resolve_variants(self, info):
+        return self.variants or []
+
+
 class UpdateLikeType(DjangoObjectType):
     class Meta:
         model = UpdateLike
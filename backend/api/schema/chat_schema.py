@@ -2,6 +2,7 @@ import graphene
 from graphene_django.types import DjangoObjectType
 
 from api.models import Chat, Message, SystemMessage
+from api.spatial import get_spatial_index
 
 
 class MessageType(DjangoObjectType):
@@ -54,6 +55,22 @@ class MessageType(DjangoObjectType):
     contactName = graphene.String(source="contact_name")
     contactPhone = graphene.String(source="contact_phone")
     contactEmail = graphene.String(source="contact_email")
+    # common_types imports this module, so refer to the type by path
+    nearestZipCode = graphene.Field(
+        "api.schema.common_types.ZipCodeDistanceType",
+        description="Reverse geocode of a location message",
+    )
+
+    def resolve_nearestZipCode(self, info):
+        if self.latitude is None or self.longitude is None:
+            return None
+        try:
+            found = get_spatial_index().nearest_zip_codes(
+                float(self.latitude), float(self.longitude), k=1
+            )
+        except ValueError:
+            return None
+        return found[0] if found else None
 
 
 class ChatType(DjangoObjectType):
@@ -82,11 +82,27 @@ class CityType(DjangoObjectType):
 class ZipCodeType(DjangoObjectType):
     class Meta:
         model = ZipCode
-        fields = ("id", "code", "city", "state", "country", "is_active")
+        fields = (
+            "id",
+            "code",
+            "city",
+            "state",
+            "country",
+            "latitude",
+            "longitude",
+            "is_active",
+        )
 
     isActive = graphene.Boolean(source="is_active")
 
 
+class ZipCodeDistanceType(graphene.ObjectType):
+    """A zip code and its great-circle distance from the query point"""
+
+    zipCode = graphene.Field(ZipCodeType, source="zip_code")
+    distanceKm = graphene.Float(source="distance_km")
+
+
 class EmployeeType(DjangoObjectType):
     class Meta:
         model = Employee
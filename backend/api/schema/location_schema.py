@@ -3,11 +3,10 @@ GraphQL schema for location-related queries and types.
 Provides access to countries, states/provinces, and cities.
 """
 
-from django.db.models import Q
-
 import graphene
 from graphene_django import DjangoObjectType
 
+from ..gazetteer import get_gazetteer
 from ..models import City, Country, State, ZipCode
 
 
@@ -134,87 +133,50 @@ class LocationQuery(graphene.ObjectType):
 
     def resolve_all_countries(self, info, **kwargs):
         """Get all active countries"""
-        return Country.objects.filter(is_active=True).order_by("name")
+        return get_gazetteer().get_countries()
 
     def resolve_country_by_id(self, info, id, **kwargs):
         """Get country by ID"""
-        try:
-            return Country.objects.get(id=id, is_active=True)
-        except Country.DoesNotExist:
-            return None
+        return get_gazetteer().get_country(id=id)
 
     def resolve_country_by_code(self, info, code, **kwargs):
         """Get country by code"""
-        try:
-            return Country.objects.get(code=code.upper(), is_active=True)
-        except Country.DoesNotExist:
-            return None
+        return get_gazetteer().get_country(code=code)
 
     def resolve_all_states(self, info, country_code=None, **kwargs):
         """Get all active states, optionally filtered by country"""
-        queryset = State.objects.filter(is_active=True)
-
-        if country_code:
-            queryset = queryset.filter(country__code=country_code.upper())
-
-        return queryset.select_related("country").order_by("name")
+        return get_gazetteer().get_states(country_code=country_code)
 
     def resolve_state_by_id(self, info, id, **kwargs):
         """Get state by ID"""
-        try:
-            return State.objects.select_related("country").get(id=id, is_active=True)
-        except State.DoesNotExist:
-            return None
+        return get_gazetteer().get_state(id)
 
     def resolve_states_by_country(
         self, info, country_id=None, country_code=None, **kwargs
     ):
         """Get states by country ID or code"""
-        queryset = State.objects.filter(is_active=True)
-
+        gazetteer = get_gazetteer()
         if country_id:
-            queryset = queryset.filter(country_id=country_id)
-        elif country_code:
-            queryset = queryset.filter(country__code=country_code.upper())
-
-        return queryset.select_related("country").order_by("name")
+            country = gazetteer.get_country(id=country_id)
+            return gazetteer.get_states(country.code) if country else []
+        return gazetteer.get_states(country_code=country_code)
 
     def resolve_all_cities(self, info, state_id=None, country_code=None, **kwargs):
         """Get all active cities, optionally filtered by state or country"""
-        queryset = City.objects.filter(is_active=True)
-
-        if state_id:
-            queryset = queryset.filter(state_id=state_id)
-        elif country_code:
-            queryset = queryset.filter(country__code=country_code.upper())
-
-        return queryset.select_related("state", "country").order_by("name")
+        return get_gazetteer().get_cities(
+            state_id=state_id or None, country_code=country_code
+        )
 
     def resolve_city_by_id(self, info, id, **kwargs):
         """Get city by ID"""
-        try:
-            return City.objects.select_related("state", "country").get(
-                id=id, is_active=True
-            )
-        except City.DoesNotExist:
-            return None
+        return get_gazetteer().get_city(id)
 
     def resolve_cities_by_state(self, info, state_id, **kwargs):
         """Get cities by state ID"""
-        return (
-            City.objects.filter(state_id=state_id, is_active=True)
-            .select_related("state", "country")
-            .order_by("name")
-        )
+        return get_gazetteer().get_cities(state_id=state_id)
 
     def resolve_zip_codes(self, info, city_id=None, code=None, **kwargs):
         """Get ZIP codes, optionally filtered by city or code"""
-        queryset = ZipCode.objects.filter(is_active=True)
-
-        if city_id:
-            queryset = queryset.filter(city_id=city_id)
-
-        if code:
-            queryset = queryset.filter(code__icontains=code)
-
-        return queryset.select_related("city", "state", "country").order_by("code")
+        return get_gazetteer().get_zip_codes(
+            city_id=city_id or None, code_contains=code or None
+        )
@@ -5,27 +5,44 @@ from django.db.models import Q
 
 import graphene
 
+from api.activity_rollups import activity_stats
+from api.bookmarks import (
+    DEFAULT_BOOKMARK_PAGE_SIZE,
+    MAX_BOOKMARK_PAGE_SIZE,
+    annotate_bookmarked,
+    load_bookmarks,
+)
+from api.gazetteer import (
+    DEFAULT_SUGGESTION_LIMIT,
+    MAX_SUGGESTION_LIMIT,
+    get_gazetteer,
+)
 from api.models import (  # type: ignore
     Activity,
     Chat,
-    City,
     Contact,
-    Country,
     Department,
     Employee,
     Item,
     Message,
     Role,
-    State,
     SystemMessage,
     Update,
     UpdateComment,
     UserBlock,
     UserFavorite,
-    ZipCode,
 )
-
-from .activity_schema import ActivityType, UpdateCommentType, UpdateType
+from api.spatial import DEFAULT_NEAREST, get_spatial_index
+from api.text_search import contains
+
+from .activity_schema import (
+    ActivityCountType,
+    ActivityStatsType,
+    ActivityType,
+    UpdateBookmarkConnection,
+    UpdateCommentType,
+    UpdateType,
+)
 from .chat_schema import ChatType, MessageType, SystemMessageType
 from .common_types import (
     CityType,
@@ -36,11 +53,40 @@ from .common_types import (
     ItemType,
     RoleType,
     StateType,
+    ZipCodeDistanceType,
     ZipCodeType,
 )
 from .user_types import UserBlockType, UserFavoriteType, UserProfileType, UserType
 
 
+def _suggestion_limit(limit) -> int:
+    return min(max(limit or DEFAULT_SUGGESTION_LIMIT, 1), MAX_SUGGESTION_LIMIT)
+
+
+def _updates(info):
+    """Updates with media prefetched, annotated with the viewer's bookmarks"""
+    updates = Update.objects.prefetch_related("media")
+    user = info.context.user
+    if user and user.is_authenticated:
+        return annotate_bookmarked(updates, user)
+    return updates
+
+
+def _threaded_comments():
+    """Active comments with authors and active replies loaded up front"""
+    replies = (
+        UpdateComment.objects.filter(is_active=True)
+        .select_related("author")
+        .order_by("created_at", "id")
+    )
+    return (
+        UpdateComment.objects.filter(is_active=True)
+        .select_related("author")
+        .prefetch_related(models.Prefetch("replies", queryset=replies))
+        .order_by("created_at", "id")
+    )
+
+
 class Query(graphene.ObjectType):
     # Item queries
     all_items = graphene.List(ItemType)
@@ -89,6 +135,31 @@ class Query(graphene.ObjectType):
         state_name=graphene.String(),
     )
     zipcode = graphene.Field(ZipCodeType, id=graphene.ID(), code=graphene.String())
+    city_suggestions = graphene.List(
+        CityType,
+        prefix=graphene.String(required=True),
+        state_id=graphene.ID(),
+        country_code=graphene.String(),
+        limit=graphene.Int(),
+    )
+    zip_code_suggestions = graphene.List(
+        ZipCodeType,
+        prefix=graphene.String(required=True),
+        city_id=graphene.ID(),
+        state_id=graphene.ID(),
+        limit=graphene.Int(),
+    )
+    nearest_zip_codes = graphene.List(
+        ZipCodeDistanceType,
+        lat=graphene.Float(required=True),
+        lng=graphene.Float(required=True),
+        k=graphene.Int(),
+    )
+    zip_codes_within = graphene.List(
+        ZipCodeDistanceType,
+        code=graphene.String(required=True),
+        km=graphene.Float(required=True),
+    )
 
     # Contact queries
     all_contacts = graphene.List(ContactType, status=graphene.String())
@@ -108,6 +179,12 @@ class Query(graphene.ObjectType):
     activities_by_status = graphene.List(ActivityType, status=graphene.String())
     activities_by_priority = graphene.List(ActivityType, priority=graphene.String())
     activities_by_type = graphene.List(ActivityType, type=graphene.String())
+    activity_stats = graphene.Field(
+        ActivityStatsType,
+        from_day=graphene.Date(),
+        to_day=graphene.Date(),
+        type=graphene.String(),
+    )
 
     # Project queries (projects are activities with type="Projects")
     all_projects = graphene.List(ActivityType)
@@ -122,6 +199,10 @@ class Query(graphene.ObjectType):
     updates_by_status = graphene.List(UpdateType, status=graphene.String())
     news_updates = graphene.List(UpdateType)  # Convenience query for news type
 
+    my_bookmarks = graphene.Field(
+        UpdateBookmarkConnection, first=graphene.Int(), after=graphene.String()
+    )
+
     # Comment queries
     update_comments = graphene.List(
         UpdateCommentType, update_id=graphene.String(required=True)
@@ -244,6 +325,20 @@ class Query(graphene.ObjectType):
     def resolve_activities_by_type(self, info, type, **kwargs):
         return Activity.objects.filter(type=type).order_by("-created_at")
 
+    def resolve_activity_stats(self, info, from_day=None, to_day=None, type=None):
+        stats = activity_stats(from_day, to_day, type=type)
+
+        def buckets(counts):
+            return [ActivityCountType(key=k, count=v) for k, v in counts.items()]
+
+        return ActivityStatsType(
+            total=stats["total"],
+            byStatus=buckets(stats["by_status"]),
+            byPriority=buckets(stats["by_priority"]),
+            byType=buckets(stats["by_type"]),
+            byDay=buckets(stats["by_day"]),
+        )
+
     # Project resolvers (projects are activities with type="Projects")
     def resolve_all_projects(self, info, **kwargs):
         return Activity.objects.filter(type="Projects").order_by("-created_at")
@@ -266,28 +361,45 @@ class Query(graphene.ObjectType):
 
     # Update/News resolvers
     def resolve_all_updates(self, info, **kwargs):
-        return Update.objects.all().order_by("-created_at")
+        return _updates(info).order_by("-created_at")
 
     def resolve_update(self, info, id, **kwargs):
         try:
-            return Update.objects.get(id=id)
+            return _updates(info).get(id=id)
         except Update.DoesNotExist:
             return None
 
     def resolve_updates_by_type(self, info, type, **kwargs):
-        return Update.objects.filter(type=type).order_by("-created_at")
+        return _updates(info).filter(type=type).order_by("-created_at")
 
     def resolve_updates_by_status(self, info, status, **kwargs):
-        return Update.objects.filter(status=status).order_by("-created_at")
+        return _updates(info).filter(status=status).order_by("-created_at")
 
     def resolve_news_updates(self, info, **kwargs):
-        return Update.objects.filter(type="news").order_by("-created_at")
+        return _updates(info).filter(type="news").order_by("-created_at")
+
+    def resolve_my_bookmarks(self, info, first=None, after=None, **kwargs):
+        """The viewer's bookmarks, newest first, paged by ``after`` cursor"""
+        user = info.context.user
+        if not user or user.is_anonymous:
+            return UpdateBookmarkConnection(
+                bookmarks=[], next_cursor=None, has_next_page=False
+            )
+        limit = min(max(first or DEFAULT_BOOKMARK_PAGE_SIZE, 1), MAX_BOOKMARK_PAGE_SIZE)
+        bookmarks, next_cursor = load_bookmarks(user, limit=limit, cursor=after)
+        return UpdateBookmarkConnection(
+            bookmarks=bookmarks,
+            next_cursor=next_cursor,
+            has_next_page=next_cursor is not None,
+        )
 
-    def resolve_update_comments(self, info, **kwargs):
-        return UpdateComment.objects.all().order_by("-created_at")
+    def resolve_update_comments(self, info, update_id, **kwargs):
+        return _threaded_comments().filter(
+            update_id=update_id, parent_comment__isnull=True
+        )
 
-    def resolve_comment(self, info, **kwargs):
-        return UpdateComment.objects.all().order_by("-created_at")
+    def resolve_comment(self, info, id, **kwargs):
+        return _threaded_comments().filter(id=id).first()
 
     # New optimized resolvers
     def resolve_all_activities_new(
@@ -310,7 +422,7 @@ class Query(graphene.ObjectType):
         if priority_filter:
             queryset = queryset.filter(priority=priority_filter)
         if assigned_to_filter:
-            queryset = queryset.filter(assigned_to__icontains=assigned_to_filter)
+            queryset = contains(queryset, ["assigned_to"], assigned_to_filter)
 
         queryset = queryset.order_by("-created_at")
 
@@ -330,7 +442,7 @@ class Query(graphene.ObjectType):
         offset=None,
         **kwargs,
     ):
-        queryset = Update.objects.all()
+        queryset = _updates(info)
 
         if type_filter:
             queryset = queryset.filter(type=type_filter)
@@ -346,61 +458,40 @@ class Query(graphene.ObjectType):
 
         return queryset
 
-    # Location resolvers
+    # Location resolvers (served from the in-memory gazetteer)
     def resolve_all_countries(self, info, **kwargs):
         """Get all active countries"""
-        return Country.objects.filter(is_active=True).order_by("name")
+        return get_gazetteer().get_countries()
 
     def resolve_country(self, info, id=None, code=None, **kwargs):
         """Get country by ID or code"""
-        try:
-            if id:
-                return Country.objects.get(id=id, is_active=True)
-            elif code:
-                return Country.objects.get(code=code.upper(), is_active=True)
-            return None
-        except Country.DoesNotExist:
-            return None
+        if id:
+            return get_gazetteer().get_country(id=id)
+        elif code:
+            return get_gazetteer().get_country(code=code)
+        return None
 
     def resolve_all_states(self, info, country_code=None, **kwargs):
         """Get all active states, optionally filtered by country"""
-        queryset = State.objects.filter(is_active=True)
-
-        if country_code:
-            queryset = queryset.filter(country__code=country_code.upper())
-
-        return queryset.select_related("country").order_by("name")
+        return get_gazetteer().get_states(country_code=country_code)
 
     def resolve_state(self, info, id, **kwargs):
         """Get state by ID"""
-        try:
-            return State.objects.select_related("country").get(id=id, is_active=True)
-        except State.DoesNotExist:
-            return None
+        return get_gazetteer().get_state(id)
 
     def resolve_all_cities(
         self, info, state_id=None, state_name=None, country_code=None, **kwargs
     ):
         """Get all active cities, optionally filtered by state or country"""
-        queryset = City.objects.filter(is_active=True)
-
-        if state_id:
-            queryset = queryset.filter(state_id=state_id)
-        elif state_name:
-            queryset = queryset.filter(state__name=state_name)
-        elif country_code:
-            queryset = queryset.filter(country__code=country_code.upper())
-
-        return queryset.select_related("state", "country").order_by("name")
+        return get_gazetteer().get_cities(
+            state_id=state_id or None,
+            state_name=state_name or None,
+            country_code=country_code,
+        )
 
     def resolve_city(self, info, id, **kwargs):
         """Get city by ID"""
-        try:
-            return City.objects.select_related("state", "country").get(
-                id=id, is_active=True
-            )
-        except City.DoesNotExist:
-            return None
+        return get_gazetteer().get_city(id)
 
     def resolve_all_zipcodes(
         self,
@@ -412,33 +503,50 @@ class Query(graphene.ObjectType):
         **kwargs,
     ):
         """Get all active ZIP codes, optionally filtered by city or state"""
-        queryset = ZipCode.objects.filter(is_active=True)
-
-        if city_id:
-            queryset = queryset.filter(city_id=city_id)
-        elif city_name:
-            queryset = queryset.filter(city__name=city_name)
-        elif state_id:
-            queryset = queryset.filter(state_id=state_id)
-        elif state_name:
-            queryset = queryset.filter(state__name=state_name)
-
-        return queryset.select_related("city", "state", "country").order_by("code")
+        return get_gazetteer().get_zip_codes(
+            city_id=city_id or None,
+            city_name=city_name or None,
+            state_id=state_id or None,
+            state_name=state_name or None,
+        )
 
     def resolve_zipcode(self, info, id=None, code=None, **kwargs):
         """Get ZIP code by ID or code"""
-        try:
-            if id:
-                return ZipCode.objects.select_related("city", "state", "country").get(
-                    id=id, is_active=True
-                )
-            elif code:
-                return ZipCode.objects.select_related("city", "state", "country").get(
-                    code=code, is_active=True
-                )
-            return None
-        except ZipCode.DoesNotExist:
-            return None
+        if id:
+            return get_gazetteer().get_zip_code(id=id)
+        elif code:
+            return get_gazetteer().get_zip_code(code=code)
+        return None
+
+    def resolve_city_suggestions(
+        self, info, prefix, state_id=None, country_code=None, limit=None, **kwargs
+    ):
+        """Cities whose name starts with ``prefix`` (autocomplete)"""
+        return get_gazetteer().suggest_cities(
+            prefix,
+            state_id=state_id or None,
+            country_code=country_code,
+            limit=_suggestion_limit(limit),
+        )
+
+    def resolve_zip_code_suggestions(
+        self, info, prefix, city_id=None, state_id=None, limit=None, **kwargs
+    ):
+        """ZIP codes starting with ``prefix`` (autocomplete)"""
+        return get_gazetteer().suggest_zip_codes(
+            prefix,
+            city_id=city_id or None,
+            state_id=state_id or None,
+            limit=_suggestion_limit(limit),
+        )
+
+    def resolve_nearest_zip_codes(self, info, lat, lng, k=None, **kwargs):
+        """The ``k`` zip codes closest to a point, nearest first"""
+        return get_spatial_index().nearest_zip_codes(lat, lng, k or DEFAULT_NEAREST)
+
+    def resolve_zip_codes_within(self, info, code, km, **kwargs):
+        """Zip codes within ``km`` kilometres of zip ``code``, nearest first"""
+        return get_spatial_index().zip_codes_within(code, km)
 
     # Department resolvers
     def resolve_all_departments(self, info, **kwargs):
@@ -2,6 +2,7 @@ from django.contrib.auth.models import User
 
 from rest_framework import serializers
 
+from .activity_config import get_activity_configs
 from .models import Activity, ActivityPriority, ActivityStatus, Contact
 
 
@@ -26,8 +27,8 @@ class ActivityPrioritySerializer(serializers.ModelSerializer):
 
 
 class ActivitySerializer(serializers.ModelSerializer):
-    status_config = ActivityStatusSerializer(read_only=True)
-    priority_config = ActivityPrioritySerializer(read_only=True)
+    status_config = serializers.SerializerMethodField()
+    priority_config = serializers.SerializerMethodField()
     created_by = UserSerializer(read_only=True)
 
     class Meta:
@@ -35,6 +36,17 @@ class ActivitySerializer(serializers.ModelSerializer):
         fields = "__all__"
         read_only_fields = ["id", "created_at", "updated_at"]
 
+    # Configs come from the process registry rather than a join or query
+    def get_status_config(self, obj):
+        config = get_activity_configs().get_by_id(ActivityStatus, obj.status_config_id)
+        return ActivityStatusSerializer(config).data if config else None
+
+    def get_priority_config(self, obj):
+        config = get_activity_configs().get_by_id(
+            ActivityPriority, obj.priority_config_id
+        )
+        return ActivityPrioritySerializer(config).data if config else None
+
 
 class ContactSerializer(serializers.ModelSerializer):
     """Serializer for Contact model"""
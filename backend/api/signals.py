@@ -1,13 +1,57 @@
 import json
+from collections import Counter
 
 from django.contrib.auth.models import User
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
+from django.utils import timezone
 
 from asgiref.sync import async_to_sync
 from channels.layers import get_channel_layer
 
-from .models import UserProfile
+from .activity_config import (
+    KEY_FIELDS,
+    bump_activity_config_version,
+    get_activity_configs,
+)
+from .activity_events import activities_changed, publish_activities_changed
+from .activity_rollups import KEY_FIELDS as ROLLUP_FIELDS
+from .activity_rollups import (
+    apply_deltas,
+    rollup_key,
+    stored_rollup_key,
+)
+from .gazetteer import bump_locations_version
+from .jwt_auth import get_user_cache
+from .likes import counters_payload, get_counter_buffer
+from .media_variants import schedule_media_processing
+from .models import (
+    Activity,
+    City,
+    Country,
+    State,
+    Update,
+    UpdateComment,
+    UpdateLike,
+    UpdateMedia,
+    UserProfile,
+    ZipCode,
+)
+from .update_search import (
+    SEARCH_FIELDS,
+    get_update_search,
+    search_document,
+    stored_search_document,
+)
+from .update_stream import (
+    EVENT_CHANGED,
+    EVENT_COUNTERS,
+    EVENT_CREATED,
+    EVENT_DELETED,
+    publish_update_event,
+    update_payload,
+)
 
 # Temporarily commented out due to missing SystemMessage model
 # from .models import SystemMessage
@@ -64,6 +108,97 @@ def create_user_profile(sender, instance, created, **kwargs):
         print(f"Created UserProfile for user: {instance.username}")
 
 
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_user(sender, instance, **kwargs):
+    """Drop the user from the JWT user cache, again once the change commits
+
+    The second pass covers a request that re-cached the old row while the
+    transaction was still open.
+    """
+    user_id = instance.pk
+    get_user_cache().invalidate_user(user_id)
+    transaction.on_commit(lambda: get_user_cache().invalidate_user(user_id))
+
+
+def invalidate_activity_config(sender, instance, **kwargs):
+    """Reload a changed config table here now, and everywhere once committed"""
+    get_activity_configs().invalidate(sender)
+    bump_activity_config_version()
+    transaction.on_commit(lambda: get_activity_configs().invalidate(sender))
+
+
+for config_model in KEY_FIELDS:
+    post_save.connect(
+        invalidate_activity_config,
+        sender=config_model,
+        dispatch_uid=f"invalidate_activity_config_{config_model.__name__}",
+    )
+    post_delete.connect(
+        invalidate_activity_config,
+        sender=config_model,
+        dispatch_uid=f"invalidate_activity_config_delete_{config_model.__name__}",
+    )
+
+
+@receiver(post_save, sender=Country)
+@receiver(post_save, sender=State)
+@receiver(post_save, sender=City)
+@receiver(post_save, sender=ZipCode)
+@receiver(post_delete, sender=Country)
+@receiver(post_delete, sender=State)
+@receiver(post_delete, sender=City)
+@receiver(post_delete, sender=ZipCode)
+def invalidate_locations(sender, instance, **kwargs):
+    """Any ORM write to location data makes every gazetteer reload
+
+    Bulk loads skip signals and bump the version themselves.
+    """
+    bump_locations_version()
+
+
+def _touches_rollup(update_fields) -> bool:
+    return update_fields is None or bool(set(update_fields) & set(ROLLUP_FIELDS))
+
+
+@receiver(pre_save, sender=Activity)
+def remember_activity_rollup_key(sender, instance, update_fields=None, **kwargs):
+    """Read the stored rollup key so post_save can move the count"""
+    if instance._state.adding or not _touches_rollup(update_fields):
+        instance._previous_rollup_key = None
+    else:
+        instance._previous_rollup_key = stored_rollup_key(instance.pk)
+
+
+@receiver(post_save, sender=Activity)
+def update_activity_rollup(sender, instance, created, update_fields=None, **kwargs):
+    if not created and not _touches_rollup(update_fields):
+        return
+    previous = None if created else instance._previous_rollup_key
+    current = rollup_key(instance)
+    if previous == current:
+        return
+    deltas = Counter()
+    if previous:
+        deltas[previous] -= 1
+    if current:
+        deltas[current] += 1
+    apply_deltas(deltas)
+
+
+@receiver(post_delete, sender=Activity)
+def remove_activity_from_rollup(sender, instance, **kwargs):
+    key = rollup_key(instance)
+    if key:
+        apply_deltas({key: -1})
+
+
+@receiver(activities_changed)
+def broadcast_activities_changed(sender, activity_ids, changes, **kwargs):
+    """Already sent after commit; pass the batch on to the board clients"""
+    publish_activities_changed(activity_ids, changes)
+
+
 # This signal was causing issues by trying to access instance.profile
 # which triggers a SELECT * query on UserProfile table with old field names
 # Commenting out for now since the create_user_profile signal above should be sufficient
@@ -80,3 +215,94 @@ def create_user_profile(sender, instance, created, **kwargs):
 #         print(f"Error saving user profile for {instance.username}: {e}")
 #         # If profile doesn't exist or there's an error, create it
 #         create_user_profile(sender, instance, created=True, **kwargs)
+
+
+@receiver(post_save, sender=UpdateLike)
+@receiver(post_delete, sender=UpdateLike)
+@receiver(post_save, sender=UpdateComment)
+@receiver(post_delete, sender=UpdateComment)
+def touch_update_on_engagement_change(sender, instance, **kwargs):
+    """Bump the parent update's updated_at when its counters change
+
+    Like flips and removals leave no timestamp of their own behind, and the
+    feed's ETag and score recompute both key off Update.updated_at.
+    """
+    Update.objects.filter(pk=instance.update_id).update(updated_at=timezone.now())
+
+    update_id = instance.update_id
+    publish_update_event(EVENT_COUNTERS, lambda: counters_payload(update_id))
+
+
+@receiver(post_save, sender=UpdateLike)
+@receiver(post_delete, sender=UpdateLike)
+def buffer_like_counter_change(sender, instance, created=False, **kwargs):
+    """Keep like counters right for reactions written through the ORM
+
+    The like endpoint uses api.likes.toggle_like, which bypasses these signals
+    and buffers its own deltas.
+    """
+    if kwargs.get("signal") is post_delete:
+        amount = -1
+    elif created:
+        amount = 1
+    else:
+        return
+    likes, dislikes = (amount, 0) if instance.is_like else (0, amount)
+    get_counter_buffer().add_on_commit(instance.update_id, likes, dislikes)
+
+
+def _touches_search(update_fields) -> bool:
+    return update_fields is None or bool(set(update_fields) & set(SEARCH_FIELDS))
+
+
+@receiver(pre_save, sender=Update)
+def remember_search_document(sender, instance, update_fields=None, **kwargs):
+    """Read the indexed text so post_save can skip unchanged documents"""
+    instance._previous_search_document = None
+    if instance._state.adding or not _touches_search(update_fields):
+        return
+    if get_update_search().indexed_on_save:
+        instance._previous_search_document = stored_search_document(instance.pk)
+
+
+@receiver(post_save, sender=Update)
+def index_update_for_search(sender, instance, created, update_fields=None, **kwargs):
+    """Keep the full-text index in step when an update's text changes"""
+    search = get_update_search()
+    if not search.indexed_on_save:
+        return
+    if not created:
+        if not _touches_search(update_fields):
+            return
+        if instance._previous_search_document == search_document(instance):
+            return
+    search.index_updates([instance])
+
+
+@receiver(post_delete, sender=Update)
+def remove_update_from_search(sender, instance, **kwargs):
+    get_update_search().remove_updates([instance.pk])
+
+
+@receiver(post_save, sender=Update)
+def stream_update_saved(sender, instance, created, **kwargs):
+    """Tell connected Updates pages about new, edited and retired updates"""
+    if created:
+        event = EVENT_CREATED
+    elif instance.is_active:
+        event = EVENT_CHANGED
+    else:
+        event = EVENT_DELETED
+    publish_update_event(event, update_payload(instance))
+
+
+@receiver(post_delete, sender=Update)
+def stream_update_deleted(sender, instance, **kwargs):
+    publish_update_event(EVENT_DELETED, {"id": instance.pk})
+
+
+@receiver(post_save, sender=UpdateMedia)
+def generate_media_variants(sender, instance, created, **kwargs):
+    """Queue thumbnails and responsive widths for newly added images"""
+    if created:
+        schedule_media_processing([instance])
@@ -0,0 +1,64 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+
+from api.activity_config import KEY_FIELDS, get_activity_configs
+from api.models import Activity, ActivityPriority, ActivityStatus
+from api.views import create_jwt_token
+
+
+def create_config(model, key):
+    """An ActivityStatus or ActivityPriority row for ``key``"""
+    return model.objects.create(
+        **{KEY_FIELDS[model]: key},
+        display_name=key.title(),
+        color_bg="bg-gray-100",
+        color_text="text-gray-800",
+        color_border="border-gray-200",
+    )
+
+
+class ActivityFixtureMixin:
+    """Config rows, a signed-in planner and an activity factory
+
+    STATUSES and PRIORITIES name the config rows a test class needs; they
+    are available as ``self.statuses`` and ``self.priorities`` by key.
+    """
+
+    STATUSES = ("planned",)
+    PRIORITIES = ("medium",)
+
+    def setUp(self) -> None:
+        super().setUp()
+        get_activity_configs().invalidate()
+        self.addCleanup(get_activity_configs().invalidate)
+        self.statuses = {
+            status: create_config(ActivityStatus, status) for status in self.STATUSES
+        }
+        self.priorities = {
+            priority: create_config(ActivityPriority, priority)
+            for priority in self.PRIORITIES
+        }
+        self.user = User.objects.create_user(username="planner", password="x")
+        self.auth = {"HTTP_AUTHORIZATION": f"Bearer {create_jwt_token(self.user)}"}
+
+    def _activity(self, start, hours=1, save=True, **fields):
+        """An activity of ``hours`` from ``start``; saved unless ``save`` is False"""
+        fields = {
+            "title": "Check",
+            "description": "",
+            "type": "Production",
+            "assigned_to": "planner",
+            "assigned_by": "planner",
+            "estimated_duration": int(hours * 60),
+            **fields,
+        }
+        activity = Activity(
+            start_time=start,
+            end_time=start + timedelta(hours=hours),
+            created_by=self.user,
+            **fields,
+        )
+        if save:
+            activity.save()
+        return activity
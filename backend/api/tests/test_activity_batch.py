@@ -0,0 +1,170 @@
+import json
+import uuid
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from api.activity_calendar import lock_schedules
+from api.activity_events import activities_changed
+from api.models import Activity, ActivityDailyRollup
+from api.tests.activity_fixtures import ActivityFixtureMixin
+
+DAY = datetime(2026, 10, 19, tzinfo=dt_timezone.utc)
+
+
+class ActivityBatchTests(ActivityFixtureMixin, TestCase):
+    STATUSES = ("planned", "in-progress", "completed")
+    PRIORITIES = ("medium", "high")
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.planned = self._activity("alice", 8, progress=40)
+        self.running = self._activity("alice", 10, status="in-progress")
+        self.done = self._activity("alice", 12, status="completed")
+        self.clash = self._activity("alice", 14)
+        self._activity("bob", 14)
+
+        self.events = []
+
+        def handler(sender, **kwargs):
+            self.events.append(kwargs)
+
+        activities_changed.connect(handler, weak=False)
+        self.addCleanup(activities_changed.disconnect, handler)
+
+    def _activity(self, assigned_to, hour, **fields):
+        return super()._activity(
+            DAY + timedelta(hours=hour), title="Card", assigned_to=assigned_to, **fields
+        )
+
+    def _post(self, url, operations):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(
+                url,
+                data=json.dumps({"operations": operations}),
+                content_type="application/json",
+                **self.auth,
+            )
+
+    def test_batch_applies_operations_set_based(self):
+        operations = [
+            {"op": "start", "id": str(self.planned.pk)},
+            {"op": "reprioritize", "id": str(self.planned.pk), "priority": "high"},
+            {"op": "pause", "id": str(self.running.pk)},
+            {"op": "start", "id": str(self.done.pk)},
+            {"op": "reassign", "id": str(self.clash.pk), "assigned_to": "bob"},
+            {"op": "reassign", "id": str(self.running.pk), "assigned_to": "carol"},
+            {"op": "start", "id": str(uuid.uuid4())},
+            {"op": "archive", "id": str(self.planned.pk)},
+        ]
+        with CaptureQueriesContext(connection) as ctx:
+            response = self._post("/api/activities/batch/", operations)
+        body = response.json()
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(body["success"])
+        self.assertEqual((body["applied"], body["failed"]), (4, 4))
+        self.assertEqual(
+            [r["success"] for r in body["results"]],
+            [True, True, True, False, False, True, False, False],
+        )
+        self.assertEqual(body["results"][4]["code"], "SCHEDULE_CONFLICT")
+        self.assertEqual(body["results"][6]["code"], "NOT_FOUND")
+        self.assertEqual(body["results"][1]["activity"]["priority"], "high")
+
+        # One statement per distinct change set, not per operation
+        updates = [
+            q["sql"]
+            for q in ctx.captured_queries
+            if q["sql"].startswith('UPDATE "api_activity" ')
+        ]
+        self.assertEqual(len(updates), 2)
+        self.assertEqual(len(self.events), 1)
+        self.assertEqual(
+            set(self.events[0]["activity_ids"]),
+            {str(self.planned.pk), str(self.running.pk)},
+        )
+
+        self.planned.refresh_from_db()
+        self.assertEqual(
+            (self.planned.status, self.planned.priority, self.planned.progress),
+            ("in-progress", "high", 40),
+        )
+        self.assertEqual(self.planned.status_config, self.statuses["in-progress"])
+        self.assertEqual(self.planned.priority_config, self.priorities["high"])
+        self.running.refresh_from_db()
+        self.assertEqual(
+            (self.running.status, self.running.assigned_to), ("planned", "carol")
+        )
+        self.assertEqual(self.running.status_config, self.statuses["planned"])
+        self.clash.refresh_from_db()
+        self.assertEqual(self.clash.assigned_to, "alice")
+
+        counts = {}
+        for row in ActivityDailyRollup.objects.all():
+            key = (row.status, row.priority)
+            counts[key] = counts.get(key, 0) + row.count
+        self.assertEqual(counts[("in-progress", "high")], 1)
+        self.assertEqual(counts[("in-progress", "medium")], 0)
+        self.assertEqual(counts[("planned", "medium")], 3)
+
+    def test_reassignments_lock_the_new_schedules(self):
+        with mock.patch(
+            "api.activity_batch.lock_schedules", wraps=lock_schedules
+        ) as lock:
+            self._post(
+                "/api/activities/batch/",
+                [
+                    {
+                        "op": "reassign",
+                        "id": str(self.planned.pk),
+                        "assigned_to": "bob",
+                    },
+                    {
+                        "op": "reassign",
+                        "id": str(self.clash.pk),
+                        "assigned_to": "carol",
+                    },
+                    {"op": "start", "id": str(self.running.pk)},
+                ],
+            )
+        lock.assert_called_once()
+        self.assertEqual(sorted(lock.call_args.args), ["bob", "carol"])
+
+    def test_unchanged_activities_keep_their_updated_at(self):
+        stored = Activity.objects.get(pk=self.clash.pk).updated_at
+        response = self._post(
+            "/api/activities/batch/",
+            [{"op": "reprioritize", "id": str(self.clash.pk), "priority": "medium"}],
+        )
+        body = response.json()
+        self.assertTrue(body["success"], body)
+        self.assertEqual(
+            body["results"][0]["activity"]["updatedAt"], stored.isoformat()
+        )
+
+    def test_body_must_be_an_object(self):
+        for url in ("/api/activities/batch/", "/api/v2/activities/batch/"):
+            response = self.client.post(
+                url, data="[]", content_type="application/json", **self.auth
+            )
+            self.assertEqual(response.status_code, 400, url)
+            self.assertEqual(response.json()["error"], "Body must be a JSON object")
+
+    def test_v2_batch_action_and_bad_requests(self):
+        response = self._post(
+            "/api/v2/activities/batch/",
+            [{"op": "start", "id": str(self.clash.pk)}],
+        )
+        body = response.json()
+        self.assertEqual(response.status_code, 200, body)
+        self.assertTrue(body["success"])
+        self.assertEqual(body["results"][0]["activity"]["progress"], 10)
+
+        self.assertEqual(self._post("/api/activities/batch/", []).status_code, 400)
+        self.assertEqual(
+            self._post("/api/v2/activities/batch/", ["start"]).status_code, 400
+        )
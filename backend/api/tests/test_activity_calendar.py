@@ -0,0 +1,188 @@
+import json
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from unittest import mock
+
+from django.db import connection, transaction
+from django.db.backends.postgresql.base import DatabaseWrapper
+from django.db.transaction import TransactionManagementError
+from django.test import TestCase
+
+from api.activity_calendar import calendar_window, find_conflicts, lock_schedules
+from api.tests.activity_fixtures import ActivityFixtureMixin
+
+DAY = datetime(2026, 10, 19, tzinfo=dt_timezone.utc)
+
+
+def _at(hour):
+    return DAY + timedelta(hours=hour)
+
+
+class ActivityCalendarTests(ActivityFixtureMixin, TestCase):
+    STATUSES = ("planned", "cancelled")
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.morning = self._activity("Morning shift", "alice", 8, 12)
+        self.afternoon = self._activity("Afternoon shift", "alice", 13, 17)
+        self.bob = self._activity("Audit", "bob", 9, 10)
+        self.cancelled = self._activity("Cancelled", "alice", 12, 13, "cancelled")
+
+    def _activity(self, title, assigned_to, start, end, status="planned"):
+        return super()._activity(
+            _at(start),
+            hours=end - start,
+            title=title,
+            assigned_to=assigned_to,
+            status=status,
+        )
+
+    def test_window_and_conflicts(self):
+        titles = [a.title for a in calendar_window(_at(9), _at(13))]
+        self.assertEqual(titles, ["Morning shift", "Audit", "Cancelled"])
+        # Spans are half-open: ending at 12 does not overlap starting at 12
+        titles = [a.title for a in calendar_window(_at(12), _at(13), "alice")]
+        self.assertEqual(titles, ["Cancelled"])
+
+        self.assertEqual(find_conflicts("alice", _at(12), _at(13)), [])
+        self.assertEqual(
+            [a.pk for a in find_conflicts("alice", _at(11), _at(14))],
+            [self.morning.pk, self.afternoon.pk],
+        )
+        self.assertEqual(
+            find_conflicts("alice", _at(8), _at(12), exclude_id=self.morning.pk), []
+        )
+
+    def test_calendar_endpoint(self):
+        response = self.client.get(
+            "/api/activities/calendar/",
+            {"from": "2026-10-19T12:30:00Z", "to": "2026-10-19", "fields": "id,title"},
+            **self.auth,
+        )
+        body = response.json()
+        self.assertEqual(response.status_code, 200, body)
+        self.assertEqual(
+            [a["title"] for a in body["activities"]],
+            ["Cancelled", "Afternoon shift"],
+        )
+        self.assertEqual(set(body["activities"][0]), {"id", "title"})
+
+        bad = self.client.get(
+            "/api/activities/calendar/",
+            {"from": "2026-10-19", "to": "2026-01-01"},
+            **self.auth,
+        )
+        self.assertEqual(bad.status_code, 400)
+
+    def test_create_and_update_reject_double_booking(self):
+        payload = {
+            "title": "Overtime",
+            "description": "",
+            "type": "Production",
+            "start_time": "2026-10-19T11:00:00Z",
+            "end_time": "2026-10-19T14:00:00Z",
+            "assigned_to": "alice",
+            "estimated_duration": 180,
+        }
+        response = self.client.post(
+            "/api/activities/",
+            data=json.dumps(payload),
+            content_type="application/json",
+            **self.auth,
+        )
+        self.assertEqual(response.status_code, 409)
+        body = response.json()
+        self.assertEqual(body["code"], "SCHEDULE_CONFLICT")
+        self.assertEqual(
+            [c["id"] for c in body["conflicts"]],
+            [str(self.morning.pk), str(self.afternoon.pk)],
+        )
+
+        payload["assigned_to"] = "bob"
+        response = self.client.post(
+            "/api/activities/",
+            data=json.dumps(payload),
+            content_type="application/json",
+            **self.auth,
+        )
+        self.assertEqual(response.status_code, 201)
+
+        response = self.client.put(
+            f"/api/activities/{self.bob.pk}/",
+            data=json.dumps({"end_time": "2026-10-19T12:00:00Z"}),
+            content_type="application/json",
+            **self.auth,
+        )
+        self.assertEqual(response.status_code, 409)
+
+        response = self.client.patch(
+            f"/api/v2/activities/{self.afternoon.pk}/",
+            data=json.dumps({"start_time": "2026-10-19T10:00:00Z"}),
+            content_type="application/json",
+            **self.auth,
+        )
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()["conflicts"][0]["id"], str(self.morning.pk))
+
+    def test_existing_overlaps_do_not_block_other_edits(self):
+        # Saved directly, as legacy rows were: overlaps the morning shift
+        overlap = self._activity("Legacy", "alice", 9, 11)
+        response = self.client.put(
+            f"/api/activities/{overlap.pk}/",
+            data=json.dumps({"notes": "x", "progress": 50}),
+            content_type="application/json",
+            **self.auth,
+        )
+        self.assertEqual(response.status_code, 200, response.json())
+        response = self.client.patch(
+            f"/api/v2/activities/{overlap.pk}/",
+            data=json.dumps({"notes": "y", "assigned_to": "alice"}),
+            content_type="application/json",
+            **self.auth,
+        )
+        self.assertEqual(response.status_code, 200, response.json())
+        overlap.refresh_from_db()
+        self.assertEqual((overlap.notes, overlap.progress), ("y", 50))
+
+        # Moving it is still checked
+        response = self.client.put(
+            f"/api/activities/{overlap.pk}/",
+            data=json.dumps({"end_time": "2026-10-19T12:00:00Z"}),
+            content_type="application/json",
+            **self.auth,
+        )
+        self.assertEqual(response.status_code, 409)
+
+    def test_postgres_sql_matches_the_gist_index(self):
+        postgres = DatabaseWrapper(
+            {**connection.settings_dict, "ENGINE": "django.db.backends.postgresql"}
+        )
+        queryset = calendar_window(_at(9), _at(10), "alice")
+        sql, params = queryset.query.get_compiler(connection=postgres).as_sql()
+        self.assertIn(
+            'tstzrange("api_activity"."start_time", GREATEST('
+            '"api_activity"."start_time", "api_activity"."end_time"), \'[)\')'
+            " && tstzrange(%s, %s, '[)')",
+            sql,
+        )
+        self.assertEqual(params[-2:], (_at(9), _at(10)))
+
+    def test_schedule_locks_are_per_assignee_and_transactional(self):
+        with self.assertRaises(TransactionManagementError):
+            with mock.patch.object(connection, "in_atomic_block", False):
+                lock_schedules("alice")
+
+        postgres = mock.MagicMock(vendor="postgresql", in_atomic_block=True)
+        cursor = postgres.cursor.return_value.__enter__.return_value
+        with mock.patch("api.activity_calendar.connection", postgres):
+            lock_schedules("bob", "alice", "", "bob")
+        self.assertEqual(
+            cursor.execute.call_args_list,
+            [
+                mock.call("SELECT pg_advisory_xact_lock(hashtext(%s))", [name])
+                for name in ("alice", "bob")
+            ],
+        )
+
+        with transaction.atomic():
+            lock_schedules("alice")  # A no-op off PostgreSQL
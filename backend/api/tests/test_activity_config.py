@@ -0,0 +1,109 @@
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from api.activity_config import (
+    ACTIVITY_CONFIG,
+    bump_activity_config_version,
+    get_activity_configs,
+)
+from api.models import Activity, ActivityPriority, ActivityStatus, ReferenceDataVersion
+from api.schema.activity_schema import ActivityType
+from api.serializers import ActivitySerializer
+from api.tests.activity_fixtures import ActivityFixtureMixin
+
+
+class ActivityConfigRegistryTests(ActivityFixtureMixin, TestCase):
+    STATUSES = ("planned", "in-progress")
+    PRIORITIES = ("medium", "high")
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.planned = self.statuses["planned"]
+        self.in_progress = self.statuses["in-progress"]
+        self.medium = self.priorities["medium"]
+        self.high = self.priorities["high"]
+
+    def _activity(self, **fields):
+        return super()._activity(
+            timezone.now(), save=False, type="Inspection & Audit", **fields
+        )
+
+    def test_save_reads_configs_from_memory(self):
+        get_activity_configs().get(ActivityStatus, "planned")
+        get_activity_configs().get(ActivityPriority, "medium")
+
+        activity = self._activity()
+        with CaptureQueriesContext(connection) as ctx:
+            activity.save()
+        sql = " ".join(q["sql"] for q in ctx.captured_queries)
+        self.assertNotIn("api_activitystatus", sql)
+        self.assertNotIn("api_activitypriority", sql)
+        self.assertEqual(activity.status_config_id, self.planned.pk)
+        self.assertEqual(activity.priority_config_id, self.medium.pk)
+
+    def test_status_change_resyncs_config(self):
+        activity = self._activity()
+        activity.save()
+        activity.status = "in-progress"
+        activity.priority = "high"
+        activity.save()
+        activity.refresh_from_db()
+        self.assertEqual(activity.status_config_id, self.in_progress.pk)
+        self.assertEqual(activity.priority_config_id, self.high.pk)
+
+        activity.status = "cancelled"
+        with self.assertRaises(ActivityStatus.DoesNotExist):
+            activity.save()
+
+    def test_edits_invalidate_and_bump_version(self):
+        version = ReferenceDataVersion.current(ACTIVITY_CONFIG)
+        self.assertEqual(
+            get_activity_configs().get(ActivityStatus, "planned").display_name,
+            "Planned",
+        )
+        self.planned.display_name = "Scheduled"
+        self.planned.save()
+        self.assertEqual(
+            get_activity_configs().get(ActivityStatus, "planned").display_name,
+            "Scheduled",
+        )
+        self.assertGreater(ReferenceDataVersion.current(ACTIVITY_CONFIG), version)
+
+    @override_settings(ACTIVITY_CONFIG_CHECK_SECONDS=3600)
+    def test_misses_are_remembered_until_reload(self):
+        configs = get_activity_configs()
+        with self.assertRaises(ActivityStatus.DoesNotExist):
+            configs.get(ActivityStatus, "cancelled")
+        self.assertIsNone(configs.get_by_id(ActivityStatus, 0))
+        with self.assertNumQueries(0):
+            with self.assertRaises(ActivityStatus.DoesNotExist):
+                configs.get(ActivityStatus, "cancelled")
+            self.assertIsNone(configs.get_by_id(ActivityStatus, 0))
+
+        # Created by another process: no signal here, only the version bump
+        ActivityStatus.objects.bulk_create(
+            [ActivityStatus(status="cancelled", display_name="Cancelled")]
+        )
+        bump_activity_config_version()
+        with self.settings(ACTIVITY_CONFIG_CHECK_SECONDS=0):
+            self.assertEqual(
+                configs.get(ActivityStatus, "cancelled").display_name, "Cancelled"
+            )
+
+    def test_serializer_and_graphql_resolve_without_queries(self):
+        activity = self._activity(status="in-progress", priority="high")
+        activity.save()
+        activity = Activity.objects.get(pk=activity.pk)
+
+        with self.assertNumQueries(0):
+            status = ActivityType.resolve_statusConfig(activity, None)
+            priority = ActivityType.resolve_priorityConfig(activity, None)
+        self.assertEqual(status.status, "in-progress")
+        self.assertEqual(priority.priority, "high")
+
+        with self.assertNumQueries(1):  # created_by only
+            data = ActivitySerializer(activity).data
+        self.assertEqual(data["status_config"]["display_name"], "In-Progress")
+        self.assertEqual(data["priority_config"]["id"], self.high.pk)
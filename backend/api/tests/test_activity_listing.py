@@ -0,0 +1,90 @@
+from datetime import timedelta
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from api.models import Activity
+from api.tests.activity_fixtures import ActivityFixtureMixin
+
+
+class ActivityListTests(ActivityFixtureMixin, TestCase):
+    STATUSES = ("planned", "completed")
+
+    def setUp(self) -> None:
+        super().setUp()
+        start = timezone.now()
+        for index in range(5):
+            self._activity(
+                start,
+                title=f"Activity {index}",
+                description="Long description " * 50,
+                status="completed" if index % 2 else "planned",
+            )
+        # Two rows share a timestamp so the id tie-breaker is exercised
+        created = timezone.now() - timedelta(days=1)
+        Activity.objects.filter(title__in=["Activity 1", "Activity 2"]).update(
+            created_at=created
+        )
+
+    def _get(self, etag=None, **params):
+        headers = {"HTTP_IF_NONE_MATCH": etag} if etag else {}
+        return self.client.get("/api/activities/", params, **headers, **self.auth)
+
+    def test_pages_cover_every_row_once(self):
+        seen = []
+        cursor = None
+        while True:
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            body = self._get(**params).json()
+            self.assertTrue(body["success"], body)
+            self.assertLessEqual(body["count"], 2)
+            seen.extend(a["id"] for a in body["activities"])
+            cursor = body["next_cursor"]
+            if cursor is None:
+                break
+        expected = [
+            str(pk)
+            for pk in Activity.objects.order_by("-created_at", "-id").values_list(
+                "id", flat=True
+            )
+        ]
+        self.assertEqual(seen, expected)
+
+    def test_fields_projection_selects_only_requested_columns(self):
+        with CaptureQueriesContext(connection) as ctx:
+            body = self._get(fields="id,title,startTime", status="planned").json()
+        self.assertEqual(body["count"], 3)
+        self.assertEqual(set(body["activities"][0]), {"id", "title", "startTime"})
+        page_sql = ctx.captured_queries[-1]["sql"]
+        self.assertNotIn('"description"', page_sql)
+        self.assertIn('"start_time"', page_sql)
+
+        full = self._get(limit=1).json()["activities"][0]
+        self.assertIn("description", full)
+        self.assertIn("updatedAt", full)
+
+    def test_bad_parameters(self):
+        self.assertEqual(self._get(fields="title,password").status_code, 400)
+        self.assertEqual(self._get(limit="many").status_code, 400)
+        self.assertEqual(self._get(cursor="not-a-cursor").status_code, 400)
+
+    def test_etag_comes_from_the_page(self):
+        first = self._get(limit=2)
+        with CaptureQueriesContext(connection) as ctx:
+            cached = self._get(limit=2, etag=first["ETag"])
+        self.assertEqual(cached.status_code, 304)
+        sql = " ".join(q["sql"] for q in ctx.captured_queries)
+        self.assertNotIn("COUNT(", sql.upper())
+        self.assertNotIn("MAX(", sql.upper())
+
+        # A change to a row on the page changes the ETag; one elsewhere does not
+        page_ids = [a["id"] for a in first.json()["activities"]]
+        Activity.objects.exclude(id__in=page_ids).update(updated_at=timezone.now())
+        cached = self._get(limit=2, etag=first["ETag"])
+        self.assertEqual(cached.status_code, 304)
+        Activity.objects.filter(id=page_ids[0]).update(updated_at=timezone.now())
+        self.assertEqual(self._get(limit=2, etag=first["ETag"]).status_code, 200)
@@ -0,0 +1,121 @@
+import json
+from datetime import date, datetime, timedelta
+from datetime import timezone as dt_timezone
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from api.activity_rollups import activity_stats, apply_deltas, deltas_for_update
+from api.models import Activity, ActivityDailyRollup
+from api.tests.activity_fixtures import ActivityFixtureMixin
+
+DAY = datetime(2026, 10, 19, 9, tzinfo=dt_timezone.utc)
+
+
+def _rollup():
+    return {
+        (row.day, row.type, row.status, row.priority): row.count
+        for row in ActivityDailyRollup.objects.all()
+        if row.count
+    }
+
+
+class ActivityRollupTests(ActivityFixtureMixin, TestCase):
+    STATUSES = ("planned", "in-progress", "completed")
+    PRIORITIES = ("medium", "high")
+
+    def _activity(self, days=0, **fields):
+        return super()._activity(DAY + timedelta(days=days), **fields)
+
+    def test_signals_keep_counts_in_step(self):
+        first = self._activity()
+        self._activity(priority="high")
+        self._activity(days=1, type="Quality")
+        day = date(2026, 10, 19)
+        self.assertEqual(
+            _rollup(),
+            {
+                (day, "Production", "planned", "medium"): 1,
+                (day, "Production", "planned", "high"): 1,
+                (date(2026, 10, 20), "Quality", "planned", "medium"): 1,
+            },
+        )
+
+        first.status = "completed"
+        first.save()
+        first.progress = 100
+        first.save(update_fields=["progress"])
+        self.assertEqual(_rollup()[(day, "Production", "completed", "medium")], 1)
+        self.assertNotIn((day, "Production", "planned", "medium"), _rollup())
+
+        first.start_time += timedelta(days=1)
+        first.save()
+        first.delete()
+        incremental = _rollup()
+        self.assertEqual(sum(incremental.values()), 2)
+
+        call_command("rebuild_activity_rollups", stdout=StringIO())
+        self.assertEqual(_rollup(), incremental)
+
+    def test_failed_rollup_rolls_back_the_save(self):
+        with mock.patch("api.signals.apply_deltas", side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                self._activity()
+        self.assertFalse(Activity.objects.exists())
+        self.assertEqual(_rollup(), {})
+
+    def test_set_based_updates_move_counts(self):
+        for days in (0, 0, 1):
+            self._activity(days=days)
+        self._activity(status="completed")
+        queryset = Activity.objects.filter(status="planned")
+        deltas = deltas_for_update(queryset, {"status": "in-progress"})
+        queryset.update(status="in-progress")
+        apply_deltas(deltas)
+
+        self.assertEqual(
+            _rollup(),
+            {
+                (date(2026, 10, 19), "Production", "in-progress", "medium"): 2,
+                (date(2026, 10, 20), "Production", "in-progress", "medium"): 1,
+                (date(2026, 10, 19), "Production", "completed", "medium"): 1,
+            },
+        )
+
+    def test_stats_read_the_rollup_once(self):
+        self._activity()
+        self._activity(priority="high", status="completed")
+        self._activity(days=3, type="Quality")
+
+        with self.assertNumQueries(1):
+            stats = activity_stats(date(2026, 10, 19), date(2026, 10, 20))
+        self.assertEqual(stats["total"], 2)
+        self.assertEqual(stats["by_status"], {"completed": 1, "planned": 1})
+        self.assertEqual(stats["by_day"], {"2026-10-19": 2})
+
+        body = self.client.get(
+            "/api/activities/stats/", {"type": "Quality"}, **self.auth
+        ).json()
+        self.assertEqual(body["total"], 1)
+        self.assertEqual(body["by_type"], {"Quality": 1})
+        bad = self.client.get("/api/activities/stats/", {"from": "soon"}, **self.auth)
+        self.assertEqual(bad.status_code, 400)
+
+        query = (
+            '{ activityStats(fromDay: "2026-10-19")'
+            " { total byPriority { key count } } }"
+        )
+        body = self.client.post(
+            "/graphql/",
+            data=json.dumps({"query": query}),
+            content_type="application/json",
+        ).json()
+        self.assertFalse(body.get("errors"), body)
+        stats = body["data"]["activityStats"]
+        self.assertEqual(stats["total"], 3)
+        self.assertEqual(
+            stats["byPriority"],
+            [{"key": "high", "count": 1}, {"key": "medium", "count": 2}],
+        )
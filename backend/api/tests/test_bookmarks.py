@@ -0,0 +1,124 @@
+import json
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from api.models import Update, UpdateBookmark
+from api.views import create_jwt_token
+
+
+class BookmarkTests(TestCase):
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(username="reader", password="x")
+        self.other = User.objects.create_user(username="other", password="x")
+        self.auth = {"HTTP_AUTHORIZATION": f"Bearer {create_jwt_token(self.user)}"}
+        self.updates = [
+            Update.objects.create(
+                id=f"u{i}", title=f"t{i}", summary="s", body="b", created_by=self.user
+            )
+            for i in range(5)
+        ]
+        for update in self.updates[:4]:
+            UpdateBookmark.objects.create(update=update, user=self.user)
+        UpdateBookmark.objects.create(update=self.updates[4], user=self.other)
+
+    def _graphql(self, query):
+        response = self.client.post(
+            "/graphql/",
+            data=json.dumps({"query": query}),
+            content_type="application/json",
+            **self.auth,
+        )
+        body = response.json()
+        self.assertFalse(body.get("errors"), body)
+        return body["data"]
+
+    def test_rest_pages_newest_first_without_overlap(self):
+        seen = []
+        cursor = ""
+        while True:
+            response = self.client.get(
+                "/api/updates/bookmarks/", {"limit": 3, "cursor": cursor}, **self.auth
+            )
+            self.assertEqual(response.status_code, 200)
+            body = response.json()
+            seen.extend(b["update"]["id"] for b in body["bookmarks"])
+            cursor = body["next_cursor"]
+            if not cursor:
+                break
+
+        self.assertEqual(seen, ["u3", "u2", "u1", "u0"])
+
+    def test_rest_hides_inactive_updates_and_rejects_bad_cursor(self):
+        Update.objects.filter(id="u3").update(is_active=False)
+        response = self.client.get("/api/updates/bookmarks/", **self.auth)
+        ids = [b["update"]["id"] for b in response.json()["bookmarks"]]
+        self.assertEqual(ids, ["u2", "u1", "u0"])
+
+        response = self.client.get(
+            "/api/updates/bookmarks/", {"cursor": "garbage"}, **self.auth
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.client.get("/api/updates/bookmarks/").status_code, 401)
+
+    def test_feed_bookmark_state_is_one_query_for_the_page(self):
+        response = self.client.get("/api/updates/", **self.auth)
+        state = {u["id"]: u["is_bookmarked"] for u in response.json()["updates"]}
+        self.assertEqual(
+            state, {"u0": True, "u1": True, "u2": True, "u3": True, "u4": False}
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            self._graphql("{ allUpdates { id isBookmarked } }")
+        bookmark_queries = [
+            q for q in queries.captured_queries if "api_updatebookmark" in q["sql"]
+        ]
+        self.assertEqual(len(bookmark_queries), 1)
+
+    def test_feed_etag_changes_when_bookmarks_toggle(self):
+        etag = self.client.get("/api/updates/", **self.auth)["ETag"]
+        UpdateBookmark.objects.create(update=self.updates[4], user=self.user)
+
+        response = self.client.get(
+            "/api/updates/", HTTP_IF_NONE_MATCH=etag, **self.auth
+        )
+        self.assertEqual(response.status_code, 200)
+        state = {u["id"]: u["is_bookmarked"] for u in response.json()["updates"]}
+        self.assertTrue(state["u4"])
+
+        etag = response["ETag"]
+        UpdateBookmark.objects.filter(update=self.updates[0], user=self.user).delete()
+        response = self.client.get(
+            "/api/updates/", HTTP_IF_NONE_MATCH=etag, **self.auth
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_graphql_my_bookmarks_and_toggle(self):
+        data = self._graphql(
+            "{ myBookmarks(first: 2) { bookmarks { update { id isBookmarked } }"
+            " nextCursor hasNextPage } }"
+        )["myBookmarks"]
+        self.assertEqual([b["update"]["id"] for b in data["bookmarks"]], ["u3", "u2"])
+        self.assertTrue(all(b["update"]["isBookmarked"] for b in data["bookmarks"]))
+        self.assertTrue(data["hasNextPage"])
+
+        after = data["nextCursor"]
+        data = self._graphql(
+            f'{{ myBookmarks(first: 5, after: "{after}") '
+            "{ bookmarks { update { id } } hasNextPage } }"
+        )["myBookmarks"]
+        self.assertEqual([b["update"]["id"] for b in data["bookmarks"]], ["u1", "u0"])
+        self.assertFalse(data["hasNextPage"])
+
+        mutation = 'mutation { toggleBookmark(updateId: "u4") { ok bookmarked } }'
+        self.assertEqual(
+            self._graphql(mutation)["toggleBookmark"], {"ok": True, "bookmarked": True}
+        )
+        self.assertEqual(
+            self._graphql(mutation)["toggleBookmark"], {"ok": True, "bookmarked": False}
+        )
+        self.assertFalse(
+            UpdateBookmark.objects.filter(update_id="u4", user=self.user).exists()
+        )
@@ -0,0 +1,92 @@
+import json
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from api.models import Update, UpdateAttachment, UpdateMedia
+from api.views import create_jwt_token
+
+
+def _item(update_id, **extra):
+    item = {
+        "id": update_id,
+        "type": "news",
+        "title": f"Title {update_id}",
+        "summary": "Summary",
+        "body": "Body",
+    }
+    item.update(extra)
+    return item
+
+
+class BulkUpdateImportTests(TestCase):
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(username="importer", password="x")
+        self.auth = {"HTTP_AUTHORIZATION": f"Bearer {create_jwt_token(self.user)}"}
+        Update.objects.create(
+            id="taken", title="t", summary="s", body="b", created_by=self.user
+        )
+
+    def _post(self, payload, **params):
+        path = "/api/updates/bulk/"
+        if params:
+            path += "?" + "&".join(f"{k}={v}" for k, v in params.items())
+        return self.client.post(
+            path, data=json.dumps(payload), content_type="application/json", **self.auth
+        )
+
+    def test_import_writes_children_and_reports_per_item(self):
+        payload = {
+            "updates": [
+                _item(
+                    "a",
+                    attachments=[
+                        {"type": "pdf", "url": "https://x.test/a.pdf", "label": "A"}
+                    ],
+                    media=[
+                        {
+                            "type": "image",
+                            "url": "https://x.test/a.png",
+                            "label": "A",
+                            "thumbnailUrl": "https://x.test/a-thumb.png",
+                        }
+                    ],
+                ),
+                _item("b", type="not-a-type"),
+                _item("taken"),
+                _item("c", attachments=[{"type": "pdf", "url": "nope", "label": "C"}]),
+                _item("d", tags=["ops"]),
+            ]
+        }
+        response = self._post(payload, chunk_size=1)
+        self.assertEqual(response.status_code, 201)
+        data = response.json()
+        self.assertEqual(
+            (data["created"], data["failed"], data["chunk_size"]), (2, 3, 1)
+        )
+        self.assertEqual(
+            [result["success"] for result in data["results"]],
+            [True, False, False, False, True],
+        )
+        self.assertIn("type", data["results"][1]["errors"])
+        self.assertIn("id", data["results"][2]["errors"])
+        self.assertIn("attachments[0].url", data["results"][3]["errors"])
+
+        created = Update.objects.get(id="a")
+        self.assertNotEqual(created.score, 0)
+        self.assertEqual(UpdateAttachment.objects.filter(update=created).count(), 1)
+        self.assertEqual(
+            UpdateMedia.objects.get(update=created).thumbnail_url,
+            "https://x.test/a-thumb.png",
+        )
+        self.assertFalse(Update.objects.filter(id__in=["b", "c"]).exists())
+
+    def test_imported_updates_are_searchable(self):
+        self._post([_item("e", title="Quarterly forklift audit")])
+        response = self.client.get(
+            "/api/updates/search/", {"q": "forklift"}, **self.auth
+        )
+        self.assertEqual([r["id"] for r in response.json()["results"]], ["e"])
+
+    def test_rejects_empty_payload(self):
+        self.assertEqual(self._post({"updates": []}).status_code, 400)
@@ -0,0 +1,74 @@
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from api.models import Update, UpdateComment
+from api.views import create_jwt_token
+
+
+class CommentThreadTests(TestCase):
+    def setUp(self) -> None:
+        self.author = User.objects.create_user(username="author", password="x")
+        self.reader = User.objects.create_user(username="reader", password="x")
+        self.update = Update.objects.create(
+            id="u1", title="Hello", summary="s", body="b", created_by=self.author
+        )
+        self.top = []
+        for index in range(3):
+            comment = UpdateComment.objects.create(
+                update=self.update, author=self.author, content=f"top {index}"
+            )
+            self.top.append(comment)
+            for reply_index in range(index * 2):
+                UpdateComment.objects.create(
+                    update=self.update,
+                    author=self.reader,
+                    parent_comment=comment,
+                    content=f"reply {index}.{reply_index}",
+                )
+
+    def _get(self, path, user, **params):
+        return self.client.get(
+            path, params, HTTP_AUTHORIZATION=f"Bearer {create_jwt_token(user)}"
+        )
+
+    def test_thread_query_count_is_constant(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self._get("/api/updates/u1/comments/", self.reader, replies=1)
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(
+            [c["content"] for c in data["comments"]], ["top 0", "top 1", "top 2"]
+        )
+        self.assertEqual([len(c["replies"]) for c in data["comments"]], [0, 1, 1])
+        self.assertEqual([c["reply_count"] for c in data["comments"]], [0, 2, 4])
+        self.assertIsNone(data["comments"][0]["replies_cursor"])
+        self.assertFalse(data["comments"][0]["can_edit"])
+        self.assertTrue(data["comments"][1]["replies"][0]["can_delete"])
+
+        thread_queries = [
+            q for q in queries.captured_queries if "api_updatecomment" in q["sql"]
+        ]
+        self.assertEqual(len(thread_queries), 2)
+
+    def test_load_more_replies_and_top_level_cursor(self):
+        data = self._get(
+            "/api/updates/u1/comments/", self.author, limit=2, replies=1
+        ).json()
+        self.assertEqual(len(data["comments"]), 2)
+        self.assertIsNotNone(data["next_cursor"])
+
+        rest = self._get(
+            "/api/updates/u1/comments/", self.author, cursor=data["next_cursor"]
+        ).json()
+        self.assertEqual([c["content"] for c in rest["comments"]], ["top 2"])
+
+        parent = data["comments"][1]
+        more = self._get(
+            f"/api/updates/u1/comments/{parent['id']}/replies/",
+            self.author,
+            cursor=parent["replies_cursor"],
+        ).json()
+        self.assertEqual([r["content"] for r in more["replies"]], ["reply 1.1"])
+        self.assertIsNone(more["next_cursor"])
@@ -0,0 +1,66 @@
+from django.contrib.auth.models import User
+from django.test import Client, TestCase
+
+from api.models import Tag, Update, UpdateComment
+from api.views import create_jwt_token
+
+
+class ConditionalGetTests(TestCase):
+    def setUp(self) -> None:
+        self.client = Client()
+        self.user = User.objects.create_user(username="poller", password="x")
+        self.auth = {"HTTP_AUTHORIZATION": f"Bearer {create_jwt_token(self.user)}"}
+        Update.objects.create(
+            id="u1", title="Hello", summary="s", body="b", created_by=self.user
+        )
+
+    def test_update_list_returns_304_for_matching_etag(self):
+        first = self.client.get("/api/updates/", **self.auth)
+        self.assertEqual(first.status_code, 200)
+        etag = first["ETag"]
+        self.assertTrue(etag.startswith('W/"'))
+
+        second = self.client.get("/api/updates/", HTTP_IF_NONE_MATCH=etag, **self.auth)
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second.content, b"")
+
+    def test_update_list_etag_changes_after_edit(self):
+        etag = self.client.get("/api/updates/", **self.auth)["ETag"]
+
+        update = Update.objects.get(id="u1")
+        update.title = "Edited"
+        update.save()
+
+        response = self.client.get(
+            "/api/updates/", HTTP_IF_NONE_MATCH=etag, **self.auth
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_update_detail_etag_changes_after_comment_delete(self):
+        comment = UpdateComment.objects.create(
+            update_id="u1", author=self.user, content="First"
+        )
+        etag = self.client.get("/api/updates/u1/", **self.auth)["ETag"]
+
+        comment.delete()
+
+        response = self.client.get(
+            "/api/updates/u1/", HTTP_IF_NONE_MATCH=etag, **self.auth
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_etag_varies_with_filters(self):
+        all_etag = self.client.get("/api/updates/", **self.auth)["ETag"]
+        news_etag = self.client.get("/api/updates/?type=news", **self.auth)["ETag"]
+        self.assertNotEqual(all_etag, news_etag)
+
+    def test_tags_list_honors_if_modified_since(self):
+        Tag.objects.create(name="safety", category="ops")
+        first = self.client.get("/api/tags/")
+        self.assertEqual(first.status_code, 200)
+
+        second = self.client.get(
+            "/api/tags/", HTTP_IF_MODIFIED_SINCE=first["Last-Modified"]
+        )
+        self.assertEqual(second.status_code, 304)
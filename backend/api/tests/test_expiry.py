@@ -0,0 +1,78 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from api.expiry import expire_updates
+from api.models import Update, UpdateQuerySet
+from api.views import create_jwt_token
+
+
+class ExpiryTests(TestCase):
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(username="sweeper", password="x")
+        now = timezone.now()
+        for index in range(3):
+            Update.objects.create(
+                id=f"expired-{index}",
+                title="Old alert",
+                summary="s",
+                body="evacuation drill",
+                expires_at=now - timedelta(hours=index + 1),
+                created_by=self.user,
+            )
+        Update.objects.create(
+            id="future",
+            title="Upcoming alert",
+            summary="s",
+            body="evacuation drill",
+            expires_at=now + timedelta(days=1),
+            created_by=self.user,
+        )
+        Update.objects.create(
+            id="evergreen",
+            title="Handbook",
+            summary="s",
+            body="b",
+            created_by=self.user,
+        )
+
+    def test_live_excludes_expired_rows(self):
+        self.assertEqual(
+            set(Update.objects.live().values_list("id", flat=True)),
+            {"future", "evergreen"},
+        )
+
+    def test_feed_and_search_hide_expired_updates(self):
+        auth = {"HTTP_AUTHORIZATION": f"Bearer {create_jwt_token(self.user)}"}
+        feed = self.client.get("/api/updates/", **auth).json()
+        self.assertEqual(feed["pagination"]["total_count"], 2)
+
+        search = self.client.get("/api/updates/search/", {"q": "evacuation"}, **auth)
+        self.assertEqual([r["id"] for r in search.json()["results"]], ["future"])
+
+    def test_sweeper_works_in_bounded_batches(self):
+        self.assertEqual(expire_updates(batch_size=2, max_batches=1), 2)
+        self.assertEqual(Update.objects.expired().count(), 1)
+
+        call_command("expire_updates", batch_size=2, stdout=StringIO())
+        self.assertFalse(Update.objects.expired().exists())
+        self.assertTrue(Update.objects.get(id="future").is_active)
+
+    def test_sweeper_announces_only_rows_it_deactivated(self):
+        def stale_expired(queryset, now=None):
+            # Ids read before another writer deactivated expired-0
+            Update.objects.filter(id="expired-0").update(is_active=False)
+            return queryset.filter(expires_at__lte=now)
+
+        with mock.patch.object(UpdateQuerySet, "expired", stale_expired):
+            with mock.patch("api.expiry.publish_update_event") as publish:
+                self.assertEqual(expire_updates(), 2)
+        self.assertEqual(
+            {call.args[1]["id"] for call in publish.call_args_list},
+            {"expired-1", "expired-2"},
+        )
@@ -0,0 +1,165 @@
+import json
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from api.gazetteer import bump_locations_version, get_gazetteer, reset_gazetteer
+from api.models import City, Country, State, ZipCode
+from api.views import create_jwt_token
+
+
+class GazetteerTests(TestCase):
+    def setUp(self) -> None:
+        reset_gazetteer()
+        self.addCleanup(reset_gazetteer)
+
+        usa = Country.objects.create(name="United States", code="USA")
+        self.ca = State.objects.create(name="California", code="CA", country=usa)
+        self.tx = State.objects.create(name="Texas", code="TX", country=usa)
+        cities = {}
+        for name, state in (
+            ("San Diego", self.ca),
+            ("San Jose", self.ca),
+            ("Santa Ana", self.ca),
+            ("Sacramento", self.ca),
+            ("San Antonio", self.tx),
+            ("Austin", self.tx),
+        ):
+            cities[name] = City.objects.create(name=name, state=state, country=usa)
+        City.objects.create(
+            name="San Closed", state=self.ca, country=usa, is_active=False
+        )
+        for code, city in (
+            ("92101", "San Diego"),
+            ("92102", "San Diego"),
+            ("95112", "San Jose"),
+            ("78201", "San Antonio"),
+        ):
+            ZipCode.objects.create(
+                code=code,
+                city=cities[city],
+                state=cities[city].state,
+                country=usa,
+                latitude=Decimal("32.715736"),
+                longitude=Decimal("-117.161087"),
+            )
+        self.cities = cities
+        self.user = User.objects.create_user(username="picker", password="x")
+
+    def test_prefix_suggestions_and_filters(self):
+        gazetteer = get_gazetteer()
+        names = [c.name for c in gazetteer.suggest_cities("san")]
+        self.assertEqual(names, ["San Antonio", "San Diego", "San Jose", "Santa Ana"])
+        names = [c.name for c in gazetteer.suggest_cities("SAN", state_id=self.ca.id)]
+        self.assertEqual(names, ["San Diego", "San Jose", "Santa Ana"])
+        self.assertEqual(len(gazetteer.suggest_cities("sa", limit=2)), 2)
+        self.assertEqual(gazetteer.suggest_cities("zzz"), [])
+
+        codes = [z.code for z in gazetteer.suggest_zip_codes("921")]
+        self.assertEqual(codes, ["92101", "92102"])
+        zip_code = gazetteer.get_zip_code(code="95112")
+        self.assertEqual(zip_code.city.name, "San Jose")
+        self.assertEqual(zip_code.state.code, "CA")
+        self.assertEqual(zip_code.latitude, Decimal("32.715736"))
+
+        self.assertEqual(
+            [c.name for c in gazetteer.get_cities(state_name="Texas")],
+            ["Austin", "San Antonio"],
+        )
+        self.assertEqual(
+            [z.code for z in gazetteer.get_zip_codes(city_name="San Diego")],
+            ["92101", "92102"],
+        )
+        self.assertIsNone(gazetteer.get_city("not-a-number"))
+
+    def test_warm_graphql_location_queries_hit_no_database(self):
+        auth = {"HTTP_AUTHORIZATION": f"Bearer {create_jwt_token(self.user)}"}
+        query = (
+            "{ allCities(stateId: %d) { name state { code } country { code } }"
+            ' citySuggestions(prefix: "san a") { name }'
+            ' allZipcodes(cityName: "San Diego") { code city { name } } }'
+        ) % self.ca.id
+
+        def run():
+            response = self.client.post(
+                "/graphql/",
+                data=json.dumps({"query": query}),
+                content_type="application/json",
+                **auth,
+            )
+            return response.json()
+
+        run()
+        with CaptureQueriesContext(connection) as queries:
+            body = run()
+        self.assertFalse(body.get("errors"), body)
+        self.assertEqual(len(queries), 0)
+        data = body["data"]
+        self.assertEqual(
+            [c["name"] for c in data["allCities"]],
+            ["Sacramento", "San Diego", "San Jose", "Santa Ana"],
+        )
+        self.assertEqual(data["allCities"][0]["state"]["code"], "CA")
+        self.assertEqual([c["name"] for c in data["citySuggestions"]], ["San Antonio"])
+        self.assertEqual(
+            [z["city"]["name"] for z in data["allZipcodes"]], ["San Diego"] * 2
+        )
+
+    def test_model_writes_reload(self):
+        self.assertEqual(get_gazetteer().suggest_cities("oak"), [])
+        with self.captureOnCommitCallbacks(execute=True):
+            oakland = City.objects.create(
+                name="Oakland", state=self.ca, country=self.ca.country
+            )
+        self.assertEqual(
+            [c.name for c in get_gazetteer().suggest_cities("oak")], ["Oakland"]
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            oakland.delete()
+        self.assertEqual(get_gazetteer().suggest_cities("oak"), [])
+
+    def test_version_bump_reloads(self):
+        self.assertEqual(get_gazetteer().suggest_cities("oak"), [])
+        City.objects.bulk_create(
+            [City(name="Oakland", state=self.ca, country=self.ca.country)]
+        )
+        # bulk_create sends no signals: still the loaded snapshot
+        self.assertEqual(get_gazetteer().suggest_cities("oak"), [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            bump_locations_version()
+        self.assertEqual(
+            [c.name for c in get_gazetteer().suggest_cities("oak")], ["Oakland"]
+        )
+
+    def test_rest_autocomplete(self):
+        response = self.client.get(
+            "/api/locations/autocomplete/", {"q": "san d", "type": "city"}
+        )
+        self.assertEqual(
+            response.json()["results"],
+            [
+                {
+                    "id": self.cities["San Diego"].id,
+                    "name": "San Diego",
+                    "state": {"id": self.ca.id, "name": "California", "code": "CA"},
+                    "country": "USA",
+                }
+            ],
+        )
+        response = self.client.get(
+            "/api/locations/autocomplete/", {"q": "7", "type": "zip"}
+        )
+        results = response.json()["results"]
+        self.assertEqual([r["code"] for r in results], ["78201"])
+        self.assertEqual(results[0]["latitude"], 32.715736)
+        self.assertEqual(
+            self.client.get(
+                "/api/locations/autocomplete/", {"q": "7", "type": "planet"}
+            ).status_code,
+            400,
+        )
@@ -0,0 +1,63 @@
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+
+from api.jwt_auth import UserCache, authenticate_request, get_user_cache
+from api.views import create_jwt_token
+
+
+class JWTAuthTests(TestCase):
+    def setUp(self) -> None:
+        get_user_cache().clear()
+        self.user = User.objects.create_user(username="worker", password="x")
+        self.auth = {"HTTP_AUTHORIZATION": f"Bearer {create_jwt_token(self.user)}"}
+
+    def test_warm_cache_costs_no_auth_queries(self):
+        # mark-all-read only accepts POST, so a GET is pure authentication
+        self.assertEqual(
+            self.client.get("/api/updates/mark-all-read/", **self.auth).status_code,
+            405,
+        )
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/updates/mark-all-read/", **self.auth)
+        self.assertEqual(response.status_code, 405)
+        self.assertEqual(len(queries), 0)
+
+    def test_request_is_decoded_once(self):
+        request = RequestFactory().get("/", **self.auth)
+        with CaptureQueriesContext(connection) as queries:
+            first = authenticate_request(request)
+            second = authenticate_request(request)
+        self.assertEqual(first.pk, self.user.pk)
+        self.assertIs(first, second)
+        self.assertEqual(len(queries), 1)
+
+    def test_saving_user_invalidates_cache(self):
+        request = RequestFactory().get("/", **self.auth)
+        self.assertTrue(authenticate_request(request).is_active)
+
+        self.user.is_active = False
+        self.user.save()
+
+        request = RequestFactory().get("/", **self.auth)
+        self.assertFalse(authenticate_request(request).is_active)
+
+    def test_invalid_token_is_anonymous(self):
+        request = RequestFactory().get("/", HTTP_AUTHORIZATION="Bearer nope")
+        self.assertIsNone(authenticate_request(request))
+        response = self.client.get(
+            "/api/updates/mark-all-read/", HTTP_AUTHORIZATION="Bearer nope"
+        )
+        self.assertEqual(response.status_code, 401)
+
+    def test_cache_is_bounded_and_expires(self):
+        cache = UserCache(max_size=2, ttl=60)
+        for user_id in (1, 2, 3):
+            cache.set((user_id, 0), User(id=user_id))
+        self.assertIsNone(cache.get((1, 0)))
+        self.assertEqual(cache.get((3, 0)).id, 3)
+
+        expired = UserCache(max_size=2, ttl=0)
+        expired.set((1, 0), User(id=1))
+        self.assertIsNone(expired.get((1, 0)))
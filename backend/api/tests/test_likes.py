@@ -0,0 +1,96 @@
+import json
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+
+from api.likes import LikeCounterBuffer, toggle_like
+from api.models import Update, UpdateLike
+from api.views import create_jwt_token
+
+
+class ToggleLikeTests(TestCase):
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(username="fan", password="x")
+        self.other = User.objects.create_user(username="critic", password="x")
+        self.update = Update.objects.create(
+            id="u1", title="Hello", summary="s", body="b", created_by=self.user
+        )
+
+    def _click(self, user, is_like=True):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                "/api/updates/u1/like/",
+                data=json.dumps({"is_like": is_like}),
+                content_type="application/json",
+                HTTP_AUTHORIZATION=f"Bearer {create_jwt_token(user)}",
+            )
+        return response.json()
+
+    def test_like_flip_and_remove(self):
+        data = self._click(self.user)
+        self.assertEqual((data["action"], data["likes_count"]), ("created", 1))
+        self.assertIs(data["user_like_status"], True)
+
+        data = self._click(self.other, is_like=False)
+        self.assertEqual((data["likes_count"], data["dislikes_count"]), (1, 1))
+
+        data = self._click(self.user, is_like=False)
+        self.assertEqual(data["action"], "updated")
+        self.assertEqual((data["likes_count"], data["dislikes_count"]), (0, 2))
+
+        data = self._click(self.user, is_like=False)
+        self.assertEqual(data["action"], "removed")
+        self.assertIsNone(data["user_like_status"])
+
+        self.update.refresh_from_db()
+        self.assertEqual((self.update.likes_count, self.update.dislikes_count), (0, 1))
+        self.assertEqual(UpdateLike.objects.filter(update=self.update).count(), 1)
+
+    def test_reconcile_recounts_drifted_counters(self):
+        UpdateLike.objects.create(update=self.update, user=self.user, is_like=True)
+        UpdateLike.objects.create(update=self.update, user=self.other, is_like=False)
+        # Deltas lost with a crashed process
+        Update.objects.filter(pk="u1").update(likes_count=7, dislikes_count=0)
+
+        out = StringIO()
+        call_command("reconcile_like_counters", stdout=out)
+        self.assertIn("Corrected 1 updates", out.getvalue())
+        self.update.refresh_from_db()
+        self.assertEqual((self.update.likes_count, self.update.dislikes_count), (1, 1))
+
+        out = StringIO()
+        call_command("reconcile_like_counters", stdout=out)
+        self.assertIn("Corrected 0 updates", out.getvalue())
+
+    def test_toggle_is_single_row_per_user(self):
+        with mock.patch("api.likes.publish_update_event") as publish:
+            for _ in range(3):
+                toggle_like("u1", self.user.pk, True)
+        self.assertEqual(UpdateLike.objects.filter(user=self.user).count(), 1)
+        self.assertEqual(publish.call_count, 3)  # From the toggling thread
+
+
+class LikeCounterBufferTests(TestCase):
+    def test_flush_coalesces_deltas_per_update(self):
+        user = User.objects.create_user(username="buffer", password="x")
+        Update.objects.create(
+            id="hot", title="Hot", summary="s", body="b", created_by=user
+        )
+        buffer = LikeCounterBuffer(interval=60)
+        for _ in range(5):
+            buffer.add("hot", 1, 0)
+        buffer.add("hot", -1, 1)
+        self.assertEqual(buffer.pending("hot"), (4, 1))
+
+        with mock.patch("api.likes.publish_update_event") as publish:
+            with self.assertNumQueries(3):  # savepoint, one UPDATE, release
+                self.assertEqual(buffer.flush(), 1)
+        # Counter events come from the requests; the flush thread has no loop
+        publish.assert_not_called()
+
+        self.assertEqual(buffer.pending("hot"), (0, 0))
+        hot = Update.objects.get(id="hot")
+        self.assertEqual((hot.likes_count, hot.dislikes_count), (4, 1))
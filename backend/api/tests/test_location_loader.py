@@ -0,0 +1,122 @@
+import csv
+import json
+import tempfile
+from decimal import Decimal
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from api.gazetteer import LOCATIONS
+from api.location_loader import LocationLoader, read_rows
+from api.management.commands.load_locations import DATA_DIR
+from api.models import City, Country, ReferenceDataVersion, State, ZipCode
+
+
+class LocationLoaderTests(TestCase):
+    def write(self, name: str, text: str) -> Path:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = Path(directory.name) / name
+        path.write_text(text, encoding="utf-8")
+        return path
+
+    def test_bundled_locations_load_once(self):
+        with (DATA_DIR / "locations.csv").open(encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        cities = {(r["state_name"], r["city"]) for r in rows if r["city"]}
+        zip_codes = {
+            (r["state_name"], r["city"], r["zip_code"]) for r in rows if r["zip_code"]
+        }
+
+        out = StringIO()
+        call_command("populate_locations", stdout=out)
+        self.assertIn("rows/s", out.getvalue())
+        self.assertEqual(Country.objects.count(), 2)
+        self.assertEqual(State.objects.count(), 2)
+        self.assertEqual(City.objects.count(), len(cities))
+        self.assertEqual(ZipCode.objects.count(), len(zip_codes))
+        self.assertEqual(Country.objects.get(code="MEX").phone_code, "+52")
+        tijuana = City.objects.get(name="Tijuana")
+        self.assertEqual(tijuana.state.code, "BCN")
+        self.assertEqual(tijuana.country.code, "MEX")
+        self.assertTrue(ZipCode.objects.filter(city=tijuana).exists())
+        version = ReferenceDataVersion.current(LOCATIONS)
+
+        # A second run finds everything in place and does not bump the version
+        out = StringIO()
+        call_command("load_locations", "locations.csv", stdout=out)
+        self.assertIn("+0 cities, +0 zip codes", out.getvalue())
+        self.assertEqual(ReferenceDataVersion.current(LOCATIONS), version)
+
+    def test_jsonl_rows_resolve_parents_across_chunks(self):
+        lines = [
+            {"country_code": "USA", "country_name": "United States"},
+            {"country_code": "USA", "state_code": "NV", "state_name": "Nevada"},
+            # State by code only, once it exists
+            {"country_code": "USA", "state_code": "nv", "city": "Reno"},
+            {
+                "country_code": "USA",
+                "state_name": "Nevada",
+                "city": "Reno",
+                "zip_code": "89501",
+                "latitude": 39.5296,
+                "longitude": "-119.8138",
+            },
+            {"country_code": "USA", "state_name": "Nevada", "city": "Reno"},
+            {"country_code": "USA", "state_code": "ZZ", "city": "Nowhere"},
+            {"country_code": "USA", "zip_code": "00000"},
+            {
+                "country_code": "USA",
+                "state_name": "Nevada",
+                "city": "X",
+                "latitude": "?",
+            },
+            {"country_code": "CAN"},
+        ]
+        path = self.write("places.jsonl", "\n".join(map(json.dumps, lines)) + "\n")
+
+        stats = LocationLoader(chunk_size=2).load(read_rows(path))
+        self.assertEqual(
+            (stats.rows, stats.countries, stats.states, stats.cities, stats.zip_codes),
+            (9, 1, 1, 1, 1),
+        )
+        self.assertEqual(stats.skipped, 4)
+        zip_code = ZipCode.objects.get(code="89501")
+        self.assertEqual(zip_code.city.name, "Reno")
+        self.assertEqual(zip_code.state.code, "NV")
+        self.assertEqual(zip_code.latitude, Decimal("39.529600"))
+        self.assertEqual(City.objects.filter(name="Reno").count(), 1)
+
+    def test_bulk_insert_query_count(self):
+        rows = [
+            {
+                "country_code": "USA",
+                "country_name": "United States",
+                "state_code": "CA",
+                "state_name": "California",
+                "city": f"City {i // 10}",
+                "zip_code": f"{90000 + i}",
+            }
+            for i in range(500)
+        ]
+        path = self.write("zips.json", json.dumps(rows))
+        loader = LocationLoader(chunk_size=250)
+        with CaptureQueriesContext(connection) as queries:
+            stats = loader.load(read_rows(path))
+        inserts = [q["sql"] for q in queries if q["sql"].startswith("INSERT")]
+        # Bulk statements per chunk (SQLite splits them by its variable
+        # limit), not one per city and zip code
+        self.assertLessEqual(len(inserts), 12)
+        self.assertLess(len(queries), 40)
+        self.assertEqual((stats.cities, stats.zip_codes), (50, 500))
+
+    def test_unknown_file(self):
+        with self.assertRaises(CommandError):
+            call_command("load_locations", "missing.csv", stdout=StringIO())
+        path = self.write("places.txt", "")
+        with self.assertRaises(CommandError):
+            call_command("load_locations", str(path), stdout=StringIO())
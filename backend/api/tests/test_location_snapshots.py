@@ -0,0 +1,175 @@
+import gzip
+import json
+import shutil
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+import brotli
+
+from api.gazetteer import reset_gazetteer
+from api.location_snapshots import (
+    _set_current,
+    build_snapshot,
+    current_manifest,
+    current_snapshot,
+    snapshot_dir,
+)
+from api.models import City, Country, State, ZipCode
+
+
+class LocationSnapshotTests(TestCase):
+    def setUp(self) -> None:
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root, ignore_errors=True)
+        override = override_settings(
+            LOCATION_SNAPSHOT_ROOT=root, LOCATION_SNAPSHOT_KEEP_VERSIONS=2
+        )
+        override.enable()
+        self.addCleanup(override.disable)
+        reset_gazetteer()
+        self.addCleanup(reset_gazetteer)
+
+        self.mexico = Country.objects.create(
+            name="Mexico", code="MEX", flag_emoji="🇲🇽", phone_code="+52"
+        )
+        self.bcn = State.objects.create(
+            name="Baja California", code="BCN", country=self.mexico
+        )
+        self.tijuana = City.objects.create(
+            name="Tijuana", state=self.bcn, country=self.mexico
+        )
+        ZipCode.objects.create(
+            code="22000", city=self.tijuana, state=self.bcn, country=self.mexico
+        )
+
+    def fetch(self, url, encoding=""):
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING=encoding)
+        body = b"".join(response.streaming_content)
+        return response, body
+
+    def test_manifest_and_precompressed_files(self):
+        response = self.client.get("/api/locations/snapshot/manifest/")
+        manifest = response.json()
+        self.assertIn("no-cache", response["Cache-Control"])
+        files = manifest["files"]
+        self.assertEqual(
+            sorted(files),
+            [
+                "countries.json",
+                "countries/MEX/states.json",
+                f"states/{self.bcn.id}/cities.json",
+                f"states/{self.bcn.id}/zip_codes.json",
+            ],
+        )
+        cities_url = files[f"states/{self.bcn.id}/cities.json"]["url"]
+        snapshot = manifest["snapshot"]
+        self.assertRegex(snapshot, rf"^{manifest['version']}-[0-9a-f]{{12}}$")
+        self.assertEqual(
+            cities_url,
+            f"/api/locations/snapshot/{snapshot}/states/{self.bcn.id}/cities.json",
+        )
+        cached = self.client.get(
+            "/api/locations/snapshot/manifest/", HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+        self.assertEqual(cached.status_code, 304)
+
+        expected = [{"id": self.tijuana.id, "name": "Tijuana"}]
+        response, body = self.fetch(cities_url, "gzip, deflate, br")
+        self.assertEqual(response["Content-Encoding"], "br")
+        self.assertEqual(
+            response["Cache-Control"], "public, max-age=31536000, immutable"
+        )
+        self.assertIn("Accept-Encoding", response["Vary"])
+        self.assertEqual(json.loads(brotli.decompress(body)), expected)
+
+        response, body = self.fetch(cities_url, "gzip")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(json.loads(gzip.decompress(body)), expected)
+
+        response, body = self.fetch(cities_url, "br;q=0, gzip;q=0.5")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        response, body = self.fetch(cities_url, "gzip;q=0.8, br;q=0.2")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        response, body = self.fetch(cities_url, "*;q=0.5, gzip;q=0")
+        self.assertEqual(response["Content-Encoding"], "br")
+        response, body = self.fetch(cities_url, "br;q=0, gzip;q=0")
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+        response, body = self.fetch(cities_url)
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(json.loads(body), expected)
+        self.assertEqual(len(body), files[f"states/{self.bcn.id}/cities.json"]["bytes"])
+
+        for path in ("../../etc/passwd", "manifest.json", "countries.json.gz"):
+            response = self.client.get(f"/api/locations/snapshot/{snapshot}/{path}")
+            self.assertEqual(response.status_code, 404, path)
+        for other in (manifest["version"], f"{manifest['version'] + 9}-0123456789ab"):
+            response = self.client.get(
+                f"/api/locations/snapshot/{other}/countries.json"
+            )
+            self.assertEqual(response.status_code, 404, other)
+
+    def test_new_version_gets_new_snapshot_and_old_ones_are_pruned(self):
+        snapshots = [build_snapshot()["snapshot"]]
+        for name in ("Ensenada", "Mexicali"):
+            with self.captureOnCommitCallbacks(execute=True):
+                City.objects.create(name=name, state=self.bcn, country=self.mexico)
+            snapshots.append(
+                self.client.get("/api/locations/snapshot/manifest/").json()["snapshot"]
+            )
+
+        self.assertEqual(len(set(snapshots)), 3)
+        self.assertFalse(snapshot_dir(snapshots[0]).exists())
+        response, body = self.fetch(
+            f"/api/locations/snapshot/{snapshots[2]}/states/{self.bcn.id}/cities.json"
+        )
+        self.assertEqual(
+            [city["name"] for city in json.loads(body)],
+            ["Ensenada", "Mexicali", "Tijuana"],
+        )
+        # The previous version is still served as it was
+        response, body = self.fetch(
+            f"/api/locations/snapshot/{snapshots[1]}/states/{self.bcn.id}/cities.json"
+        )
+        self.assertEqual(len(json.loads(body)), 2)
+
+    def test_forced_rebuild_never_rewrites_a_served_url(self):
+        first = current_manifest()
+        url = f"/api/locations/snapshot/{first['snapshot']}/countries.json"
+        response, before = self.fetch(url)
+
+        # Same version number, different data: a recreated database
+        Country.objects.filter(pk=self.mexico.pk).update(name="México")
+        reset_gazetteer()
+        self.assertEqual(build_snapshot()["snapshot"], first["snapshot"])
+        second = build_snapshot(force=True)
+        self.assertEqual(second["version"], first["version"])
+        self.assertNotEqual(second["snapshot"], first["snapshot"])
+
+        manifest = self.client.get("/api/locations/snapshot/manifest/").json()
+        self.assertEqual(manifest["snapshot"], second["snapshot"])
+        response, body = self.fetch(
+            f"/api/locations/snapshot/{second['snapshot']}/countries.json"
+        )
+        self.assertEqual(json.loads(body)[0]["name"], "México")
+        # The old URL is gone rather than serving different bytes
+        self.assertEqual(self.client.get(url).status_code, 404)
+        self.assertEqual(json.loads(before)[0]["name"], "Mexico")
+
+    def test_rebuild_by_another_process_is_picked_up(self):
+        first = current_manifest()
+        version = first["version"]
+        self.assertEqual(current_snapshot(version), first["snapshot"])
+
+        # Another process repoints the version after a forced rebuild
+        _set_current(version, f"{version}-0123456789ab")
+        self.assertEqual(current_snapshot(version), f"{version}-0123456789ab")
+
+    def test_build_command(self):
+        out = StringIO()
+        call_command("build_location_snapshots", stdout=out)
+        self.assertIn("4 files", out.getvalue())
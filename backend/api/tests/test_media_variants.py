@@ -0,0 +1,107 @@
+import json
+import os
+import shutil
+import tempfile
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from PIL import Image
+
+from api.media_variants import media_payload
+from api.models import Update, UpdateMedia
+
+
+class MediaVariantTests(TestCase):
+    def setUp(self) -> None:
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        override = override_settings(
+            MEDIA_ROOT=self.media_root, UPDATE_MEDIA_VARIANT_WIDTHS=(320, 640)
+        )
+        override.enable()
+        self.addCleanup(override.disable)
+
+        os.makedirs(os.path.join(self.media_root, "uploads"))
+        Image.new("RGB", (800, 600), "teal").save(
+            os.path.join(self.media_root, "uploads", "photo.png")
+        )
+        user = User.objects.create_user(username="uploader", password="x")
+        self.update = Update.objects.create(
+            id="with-media", title="t", summary="s", body="b", created_by=user
+        )
+
+    def _create(self, url):
+        with self.captureOnCommitCallbacks(execute=True):
+            media = UpdateMedia.objects.create(
+                update=self.update, type="image", url=url, label="Photo"
+            )
+        media.refresh_from_db()
+        return media
+
+    def test_uploaded_image_gets_dimensions_and_variants(self):
+        updated_at = self.update.updated_at
+        media = self._create("/media/uploads/photo.png")
+
+        self.assertEqual((media.width, media.height), (800, 600))
+        self.assertIsNotNone(media.variants_generated_at)
+        self.assertGreater(media.file_size, 0)
+        names = {(v["name"], v["format"]) for v in media.variants}
+        self.assertIn(("w320", "image/webp"), names)
+        self.assertIn(("thumb", "image/jpeg"), names)
+        for variant in media.variants:
+            self.assertLessEqual(variant["width"], 640)
+            path = variant["url"][len("/media/") :]
+            self.assertTrue(os.path.isfile(os.path.join(self.media_root, path)))
+
+        payload = media_payload(media)
+        self.assertIn("320w", payload["srcset"])
+        self.assertIn("640w", payload["srcset"])
+        self.assertEqual(
+            [source["type"] for source in payload["sources"]],
+            ["image/webp", "image/jpeg"],
+        )
+        self.assertTrue(payload["thumbnailUrl"].endswith("/thumb.jpeg"))
+
+        # Cached feed and detail responses revalidate to pick up the srcset
+        self.update.refresh_from_db()
+        self.assertGreater(self.update.updated_at, updated_at)
+
+    def test_remote_and_escaping_urls_are_ignored(self):
+        for url in (
+            "https://cdn.example.com/photo.png",
+            "https://cdn.example.com/media/uploads/photo.png",
+            "https://example.com/media/../../etc/passwd",
+        ):
+            media = self._create(url)
+            self.assertEqual(media.variants, [])
+            self.assertIsNone(media.width)
+            self.assertEqual(media_payload(media)["srcset"], "")
+
+    def test_graphql_media_is_prefetched(self):
+        for number in range(3):
+            update = Update.objects.create(
+                id=f"gallery-{number}",
+                title="t",
+                summary="s",
+                body="b",
+                created_by=self.update.created_by,
+            )
+            UpdateMedia.objects.create(
+                update=update, type="image", url="https://cdn.example.com/a.png"
+            )
+
+        with CaptureQueriesContext(connection) as ctx:
+            body = self.client.post(
+                "/graphql/",
+                data=json.dumps({"query": "{ allUpdates { id media { url } } }"}),
+                content_type="application/json",
+            ).json()
+        self.assertFalse(body.get("errors"), body)
+        self.assertEqual(len(body["data"]["allUpdates"]), 4)
+        media_queries = [
+            query for query in ctx.captured_queries if "api_updatemedia" in query["sql"]
+        ]
+        self.assertEqual(len(media_queries), 1)
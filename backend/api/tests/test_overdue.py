@@ -0,0 +1,127 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from asgiref.sync import async_to_sync, sync_to_async
+from channels.testing import WebsocketCommunicator
+
+from api.activity_events import activities_changed
+from api.activity_rollups import deltas_for_update
+from api.consumers import ActivityConsumer
+from api.models import Activity, ActivityDailyRollup
+from api.overdue import sweep_overdue
+from api.tests.activity_fixtures import ActivityFixtureMixin
+
+
+class OverdueSweepTests(ActivityFixtureMixin, TestCase):
+    STATUSES = ("planned", "in-progress", "completed", "overdue")
+
+    def setUp(self) -> None:
+        super().setUp()
+        now = timezone.now()
+        self.late = [
+            self._activity(now - timedelta(hours=hours), status)
+            for hours, status in ((5, "planned"), (4, "in-progress"), (3, "planned"))
+        ]
+        self.done = self._activity(now - timedelta(hours=2), "completed")
+        self.upcoming = self._activity(now + timedelta(hours=2), "planned")
+
+        self.events = []
+
+        def handler(sender, **kwargs):
+            self.events.append(kwargs)
+
+        activities_changed.connect(handler, weak=False)
+        self.addCleanup(activities_changed.disconnect, handler)
+
+    def _activity(self, end_time, status):
+        return super()._activity(end_time - timedelta(hours=1), status=status)
+
+    def test_sweep_marks_batches_overdue(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with CaptureQueriesContext(connection) as ctx:
+                swept = sweep_overdue(batch_size=2)
+        self.assertEqual(swept, 3)
+
+        updates = [q["sql"] for q in ctx.captured_queries]
+        updates = [sql for sql in updates if sql.startswith('UPDATE "api_activity"')]
+        self.assertEqual(len(updates), 2)  # One statement per batch
+
+        overdue = Activity.objects.filter(status="overdue")
+        self.assertEqual(
+            set(overdue.values_list("id", flat=True)), {a.id for a in self.late}
+        )
+        self.assertEqual(
+            set(overdue.values_list("status_config_id", flat=True)),
+            {self.statuses["overdue"].pk},
+        )
+        self.done.refresh_from_db()
+        self.upcoming.refresh_from_db()
+        self.assertEqual(self.done.status, "completed")
+        self.assertEqual(self.upcoming.status, "planned")
+
+        self.assertEqual([len(e["activity_ids"]) for e in self.events], [2, 1])
+        self.assertEqual(self.events[0]["changes"], {"status": "overdue"})
+
+        by_status = {}
+        for row in ActivityDailyRollup.objects.all():
+            by_status[row.status] = by_status.get(row.status, 0) + row.count
+        self.assertEqual(by_status.get("overdue"), 3)
+        self.assertEqual(by_status.get("in-progress"), 0)
+
+    def test_sweep_announces_only_rows_it_changed(self):
+        closed = self.late[0]
+
+        def close_then_count(queryset, changes):
+            # Another writer completes a row after the sweeper read its id
+            Activity.objects.filter(pk=closed.pk).update(status="completed")
+            return deltas_for_update(queryset, changes)
+
+        with mock.patch("api.overdue.deltas_for_update", close_then_count):
+            with self.captureOnCommitCallbacks(execute=True):
+                swept = sweep_overdue()
+        self.assertEqual(swept, 2)
+        self.assertEqual(
+            set(self.events[0]["activity_ids"]), {str(a.id) for a in self.late[1:]}
+        )
+        closed.refresh_from_db()
+        self.assertEqual(closed.status, "completed")
+
+    def test_command_is_idempotent(self):
+        out = StringIO()
+        call_command("sweep_overdue_activities", stdout=out)
+        self.assertIn("Marked 3 activities overdue", out.getvalue())
+        out = StringIO()
+        call_command("sweep_overdue_activities", stdout=out)
+        self.assertIn("Marked 0 activities overdue", out.getvalue())
+
+    def _sweep(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            sweep_overdue()
+
+    def test_sweep_reaches_activity_board_clients(self):
+        async def listen(user):
+            communicator = WebsocketCommunicator(
+                ActivityConsumer.as_asgi(), "/ws/activities/"
+            )
+            communicator.scope["user"] = user
+            connected, _ = await communicator.connect()
+            if not connected:
+                return None
+            await sync_to_async(self._sweep)()
+            message = await communicator.receive_json_from(timeout=1)
+            await communicator.disconnect()
+            return message
+
+        self.assertIsNone(async_to_sync(listen)(AnonymousUser()))
+        message = async_to_sync(listen)(self.user)
+        self.assertEqual(message["type"], "activities_changed")
+        self.assertEqual(set(message["activity_ids"]), {str(a.id) for a in self.late})
+        self.assertEqual(message["changes"], {"status": "overdue"})
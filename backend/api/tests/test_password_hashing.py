@@ -0,0 +1,112 @@
+import json
+from unittest import mock
+
+from django.contrib.auth.hashers import PBKDF2PasswordHasher, make_password
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+
+from api.password_hashing import HashingPool
+from api.views import create_jwt_token
+
+TUNED_HASHERS = [
+    "api.hashers.TunedPBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.MD5PasswordHasher",
+]
+
+
+class AsyncAuthViewTests(TestCase):
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(username="operator", password="s3cret!")
+
+    def _post(self, path, payload, **extra):
+        return self.client.post(
+            path, data=json.dumps(payload), content_type="application/json", **extra
+        )
+
+    def _login(self, password="s3cret!"):
+        return self._post("/api/login/", {"username": "operator", "password": password})
+
+    def test_login_and_failures(self):
+        response = self._login()
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()["token"])
+
+        self.assertEqual(self._login("wrong").status_code, 401)
+        unknown = self._post("/api/login/", {"username": "nobody", "password": "x"})
+        self.assertEqual(unknown.status_code, 401)
+
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self._login().status_code, 401)
+
+    @override_settings(PASSWORD_HASHERS=TUNED_HASHERS, PASSWORD_PBKDF2_ITERATIONS=1000)
+    def test_login_rehashes_to_tuned_hasher(self):
+        User.objects.filter(pk=self.user.pk).update(
+            password=make_password("s3cret!", hasher="md5")
+        )
+        self.assertEqual(self._login().status_code, 200)
+
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.password.startswith("pbkdf2_sha256$1000$"))
+        self.assertEqual(self._login().status_code, 200)
+
+    @override_settings(PASSWORD_HASHERS=TUNED_HASHERS, PASSWORD_PBKDF2_ITERATIONS=1000)
+    def test_login_never_lowers_the_work_factor(self):
+        stronger = PBKDF2PasswordHasher().encode("s3cret!", "salt", iterations=2000)
+        User.objects.filter(pk=self.user.pk).update(password=stronger)
+        self.assertEqual(self._login().status_code, 200)
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.password, stronger)
+
+    @override_settings(PASSWORD_HASHERS=TUNED_HASHERS, PASSWORD_PBKDF2_ITERATIONS=1000)
+    def test_login_renews_a_short_salt(self):
+        short_salt = PBKDF2PasswordHasher().encode("s3cret!", "salt", iterations=1000)
+        User.objects.filter(pk=self.user.pk).update(password=short_salt)
+        self.assertEqual(self._login().status_code, 200)
+
+        self.user.refresh_from_db()
+        self.assertNotEqual(self.user.password, short_salt)
+        self.assertTrue(self.user.password.startswith("pbkdf2_sha256$1000$"))
+
+    def test_saturated_pool_sheds_with_retry_after(self):
+        with mock.patch(
+            "api.password_hashing._pool", HashingPool(workers=1, max_pending=0)
+        ) as pool:
+            response = self._login()
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json()["code"], "AUTH_BUSY")
+        self.assertEqual(response["Retry-After"], "2")
+        self.assertEqual(pool.snapshot()["rejected"], 1)
+
+    def test_register_and_change_password(self):
+        response = self._post(
+            "/api/register/",
+            {"username": "newbie", "email": "New@Example.COM", "password": "pw-1"},
+        )
+        self.assertEqual(response.status_code, 200)
+        user = User.objects.get(username="newbie")
+        self.assertEqual(user.email, "New@example.com")
+        self.assertTrue(user.check_password("pw-1"))
+
+        auth = {"HTTP_AUTHORIZATION": f"Bearer {create_jwt_token(self.user)}"}
+        path = "/api/user/change-password/"
+        wrong = {"current_password": "nope", "new_password": "fresh-pw"}
+        self.assertEqual(self._post(path, wrong, **auth).status_code, 400)
+        right = {"current_password": "s3cret!", "new_password": "fresh-pw"}
+        self.assertEqual(self._post(path, right, **auth).status_code, 200)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.check_password("fresh-pw"))
+
+    def test_metrics_are_staff_only(self):
+        self._login()
+        auth = {"HTTP_AUTHORIZATION": f"Bearer {create_jwt_token(self.user)}"}
+        self.assertEqual(self.client.get("/api/auth/metrics/", **auth).status_code, 403)
+
+        self.user.is_staff = True
+        self.user.save()
+        metrics = self.client.get("/api/auth/metrics/", **auth).json()
+        hashing = metrics["password_hashing"]
+        self.assertGreaterEqual(hashing["completed"], 1)
+        self.assertIsNotNone(hashing["hash_time"]["p95_ms"])
+        self.assertEqual(hashing["pending"], 0)
@@ -0,0 +1,114 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.utils import timezone
+
+from api.models import Update, UpdateComment, UpdateLike
+from api.ranking import (
+    get_ranking_ordering,
+    hot_score,
+    recompute_recent_scores,
+    recompute_scores,
+)
+
+
+class HotScoreTests(TestCase):
+    def test_newer_updates_score_higher(self):
+        now = timezone.now()
+        older = hot_score(0, now - timedelta(days=1), now=now)
+        newer = hot_score(0, now, now=now)
+        self.assertGreater(newer, older)
+
+    def test_engagement_and_priority_raise_score(self):
+        now = timezone.now()
+        base = hot_score(0, now, now=now)
+        self.assertGreater(hot_score(0, now, likes=10, now=now), base)
+        self.assertGreater(hot_score(0, now, comments=1, now=now), base)
+        self.assertGreater(hot_score(1, now, now=now), base)
+        self.assertLess(hot_score(0, now, dislikes=10, now=now), base)
+
+    def test_expired_updates_sink(self):
+        now = timezone.now()
+        expired = hot_score(5, now, likes=100, expires_at=now, now=now)
+        stale = hot_score(0, now - timedelta(days=30), now=now)
+        self.assertLess(expired, stale)
+
+
+class RecomputeScoresTests(TestCase):
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(username="ranker", password="x")
+        self.quiet = Update.objects.create(
+            id="quiet", title="Quiet", summary="s", body="b", created_by=self.user
+        )
+        self.busy = Update.objects.create(
+            id="busy", title="Busy", summary="s", body="b", created_by=self.user
+        )
+
+    def test_new_updates_get_baseline_score(self):
+        self.assertNotEqual(self.quiet.score, 0)
+
+    def test_recompute_reflects_engagement(self):
+        UpdateLike.objects.create(update=self.busy, user=self.user)
+        UpdateComment.objects.create(update=self.busy, author=self.user, content="!")
+
+        recompute_scores()
+
+        self.busy.refresh_from_db()
+        self.quiet.refresh_from_db()
+        self.assertGreater(self.busy.score, self.quiet.score)
+        ordered = list(
+            Update.objects.filter(is_active=True)
+            .order_by("-score")
+            .values_list("id", flat=True)
+        )
+        self.assertEqual(ordered[0], "busy")
+
+    def test_recent_recompute_only_touches_recent_rows(self):
+        long_ago = timezone.now() - timedelta(days=2)
+        Update.objects.filter(id="quiet").update(updated_at=long_ago, score=0)
+        Update.objects.filter(id="busy").update(score=0)
+
+        recompute_recent_scores(timedelta(minutes=5))
+
+        self.quiet.refresh_from_db()
+        self.busy.refresh_from_db()
+        self.assertEqual(self.quiet.score, 0)
+        self.assertNotEqual(self.busy.score, 0)
+
+    def test_top_ranks_by_engagement_without_recency(self):
+        old = Update.objects.create(
+            id="old",
+            title="Old",
+            summary="s",
+            body="b",
+            created_by=self.user,
+            timestamp=timezone.now() - timedelta(days=10),
+        )
+        for number in range(5):
+            liker = User.objects.create_user(username=f"liker{number}", password="x")
+            UpdateLike.objects.create(update=old, user=liker)
+        Update.objects.filter(id="old").update(likes_count=5)
+        recompute_scores()
+
+        def ranked(mode):
+            return list(
+                Update.objects.filter(is_active=True)
+                .order_by(*get_ranking_ordering(mode))
+                .values_list("id", flat=True)
+            )
+
+        self.assertEqual(ranked("top")[0], "old")
+        self.assertEqual(ranked("hot")[-1], "old")
+
+        # Priority breaks engagement ties
+        Update.objects.filter(id="quiet").update(priority=5)
+        self.assertEqual(ranked("top"), ["old", "quiet", "busy"])
+
+    def test_recompute_moves_updated_at(self):
+        long_ago = timezone.now() - timedelta(days=2)
+        Update.objects.filter(id="busy").update(updated_at=long_ago)
+        UpdateLike.objects.create(update=self.busy, user=self.user)
+        recompute_scores(["busy"])
+        self.busy.refresh_from_db()
+        self.assertGreater(self.busy.updated_at, long_ago)
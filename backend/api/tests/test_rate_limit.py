@@ -0,0 +1,119 @@
+import multiprocessing
+import os
+import tempfile
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from api.rate_limit import GROUP_SLOTS, BucketTable, default_store_path, parse_rate
+from api.views import create_jwt_token
+
+
+def _hit_table(path, count, results):
+    table = BucketTable(path, slots=64)
+    rate = parse_rate("10/hour")
+    results.put(sum(table.acquire("shared|ip:1", rate)[0] for _ in range(count)))
+
+
+class BucketTableTests(SimpleTestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "buckets.bin")
+
+    def test_bucket_refills_at_rate(self):
+        table = BucketTable(self.path, slots=64)
+        self.addCleanup(table.close)
+        rate = parse_rate("2/s")
+
+        self.assertEqual(table.acquire("k", rate, now=100.0), (True, 0.0))
+        self.assertEqual(table.acquire("k", rate, now=100.0), (True, 0.0))
+        allowed, retry_after = table.acquire("k", rate, now=100.0)
+        self.assertFalse(allowed)
+        self.assertAlmostEqual(retry_after, 0.5)
+        self.assertTrue(table.acquire("k", rate, now=100.5)[0])
+        # Other keys have their own buckets
+        self.assertTrue(table.acquire("other", rate, now=100.5)[0])
+
+    def test_full_group_reuses_least_recent_slot(self):
+        table = BucketTable(self.path, slots=GROUP_SLOTS)
+        self.addCleanup(table.close)
+        rate = parse_rate("1/hour")
+        for i in range(GROUP_SLOTS + 1):
+            self.assertTrue(table.acquire(f"k{i}", rate, now=float(i))[0])
+        # k0 was evicted, so it starts over with a full bucket
+        self.assertTrue(table.acquire("k0", rate, now=20.0)[0])
+        self.assertFalse(table.acquire(f"k{GROUP_SLOTS}", rate, now=20.0)[0])
+
+    def test_limits_hold_across_processes(self):
+        context = multiprocessing.get_context("fork")
+        results = context.Queue()
+        workers = [
+            context.Process(target=_hit_table, args=(self.path, 8, results))
+            for _ in range(2)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(10)
+        self.assertEqual(results.get(timeout=5) + results.get(timeout=5), 10)
+
+    def test_store_must_be_private(self):
+        with open(self.path, "wb"):
+            pass
+        os.chmod(self.path, 0o666)  # Planted or widened by another user
+        with self.assertRaises(ImproperlyConfigured):
+            BucketTable(self.path, slots=64)
+
+    def test_default_store_is_a_private_directory(self):
+        base = os.path.dirname(self.path)
+        with (
+            mock.patch("api.rate_limit.os.path.isdir", return_value=False),
+            mock.patch("api.rate_limit.tempfile.gettempdir", return_value=base),
+        ):
+            path = default_store_path(64)
+            directory = os.path.dirname(path)
+            self.assertEqual(os.stat(directory).st_mode & 0o777, 0o700)
+
+            os.chmod(directory, 0o777)
+            with self.assertRaises(ImproperlyConfigured):
+                default_store_path(64)
+
+    def test_parse_rate(self):
+        self.assertEqual(parse_rate("60/min").capacity, 60)
+        self.assertAlmostEqual(parse_rate("60/min").per_second, 1.0)
+        with self.assertRaises(ValueError):
+            parse_rate("60/fortnight")
+
+
+@override_settings(RATE_LIMITS={"api_health": "2/hour"})
+class RateLimitMiddlewareTests(TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        table = BucketTable(os.path.join(directory.name, "buckets.bin"), slots=64)
+        self.addCleanup(table.close)
+        patcher = mock.patch("api.rate_limit._table", table)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_limited_route_returns_429_with_retry_after(self):
+        self.assertEqual(self.client.get("/api/health/").status_code, 200)
+        self.assertEqual(self.client.get("/api/health/").status_code, 200)
+        response = self.client.get("/api/health/")
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response.json()["code"], "RATE_LIMITED")
+        self.assertGreaterEqual(int(response["Retry-After"]), 1)
+
+        # Unlisted routes are not limited
+        self.assertEqual(self.client.get("/api/version/").status_code, 200)
+
+    def test_authenticated_users_have_their_own_buckets(self):
+        user = User.objects.create_user(username="poller", password="x")
+        auth = {"HTTP_AUTHORIZATION": f"Bearer {create_jwt_token(user)}"}
+        for _ in range(2):
+            self.client.get("/api/health/")
+        self.assertEqual(self.client.get("/api/health/").status_code, 429)
+        self.assertEqual(self.client.get("/api/health/", **auth).status_code, 200)
@@ -0,0 +1,117 @@
+import json
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.utils import timezone
+
+from api.models import Update, UpdateReadReceipt, UpdateReadWatermark
+from api.read_state import get_watermark, mark_all_read, unread_count
+from api.views import create_jwt_token
+
+
+class ReadStateTests(TestCase):
+    def setUp(self) -> None:
+        self.alice = User.objects.create_user(username="alice", password="x")
+        self.bob = User.objects.create_user(username="bob", password="x")
+        now = timezone.now()
+        self.old = Update.objects.create(
+            id="old",
+            title="Old",
+            summary="s",
+            body="b",
+            timestamp=now - timedelta(days=2),
+            created_by=self.alice,
+        )
+        self.new = Update.objects.create(
+            id="new", title="New", summary="s", body="b", created_by=self.alice
+        )
+        self.live = Update.objects.filter(is_active=True)
+
+    def _auth(self, user):
+        return {"HTTP_AUTHORIZATION": f"Bearer {create_jwt_token(user)}"}
+
+    def test_reading_is_per_user(self):
+        self.client.force_login(self.alice)
+        self.client.get("/api/updates/new/")
+
+        self.new.refresh_from_db()
+        self.assertEqual(self.new.status, Update.UPDATE_STATUS_NEW)
+        self.assertEqual(unread_count(self.live, self.alice, None), 1)
+        self.assertEqual(unread_count(self.live, self.bob, None), 2)
+
+    def test_mark_all_read_writes_one_watermark_row(self):
+        self.old.mark_as_read(self.alice)
+        mark_all_read(self.alice, timezone.now() - timedelta(days=1))
+
+        self.assertEqual(UpdateReadWatermark.objects.count(), 1)
+        # The receipt is now covered by the watermark
+        self.assertFalse(UpdateReadReceipt.objects.exists())
+        self.assertEqual(
+            unread_count(self.live, self.alice, get_watermark(self.alice)), 1
+        )
+
+        # A stale request cannot move the watermark backwards
+        earlier = timezone.now() - timedelta(days=5)
+        self.assertGreater(mark_all_read(self.alice, earlier), earlier)
+
+    def test_list_reports_is_read_and_unread_count(self):
+        response = self.client.post(
+            "/api/updates/mark-all-read/",
+            data=json.dumps({}),
+            content_type="application/json",
+            **self._auth(self.alice),
+        )
+        self.assertEqual(response.json()["unread_count"], 0)
+
+        Update.objects.create(
+            id="newer", title="Newer", summary="s", body="b", created_by=self.bob
+        )
+        data = self.client.get("/api/updates/", **self._auth(self.alice)).json()
+        self.assertEqual(data["unread_count"], 1)
+        read_flags = {update["id"]: update["is_read"] for update in data["updates"]}
+        self.assertEqual(read_flags, {"old": True, "new": True, "newer": False})
+
+    def test_list_etag_changes_when_user_reads(self):
+        etag = self.client.get("/api/updates/", **self._auth(self.bob))["ETag"]
+        self.new.mark_as_read(self.bob)
+        response = self.client.get(
+            "/api/updates/", HTTP_IF_NONE_MATCH=etag, **self._auth(self.bob)
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_detail_skips_writes_covered_or_not_modified(self):
+        mark_all_read(self.alice, timezone.now() - timedelta(days=1))
+        self.client.force_login(self.alice)
+
+        self.client.get("/api/updates/old/")
+        self.assertFalse(UpdateReadReceipt.objects.exists())
+
+        etag = self.client.get("/api/updates/new/")["ETag"]
+        self.assertEqual(UpdateReadReceipt.objects.count(), 1)
+        UpdateReadReceipt.objects.all().delete()
+        response = self.client.get("/api/updates/new/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertFalse(UpdateReadReceipt.objects.exists())
+
+    def test_unchanged_list_poll_skips_unread_count(self):
+        etag = self.client.get("/api/updates/", **self._auth(self.bob))["ETag"]
+        with mock.patch("api.views.unread_count") as count:
+            response = self.client.get(
+                "/api/updates/", HTTP_IF_NONE_MATCH=etag, **self._auth(self.bob)
+            )
+        self.assertEqual(response.status_code, 304)
+        count.assert_not_called()
+
+        # A new update outside the filter still moves the unread count
+        alerts = self.client.get("/api/updates/?type=alert", **self._auth(self.bob))
+        Update.objects.create(
+            id="newer", title="Newer", summary="s", body="b", created_by=self.alice
+        )
+        response = self.client.get(
+            "/api/updates/?type=alert",
+            HTTP_IF_NONE_MATCH=alerts["ETag"],
+            **self._auth(self.bob),
+        )
+        self.assertEqual(response.status_code, 200)
@@ -0,0 +1,134 @@
+import json
+from decimal import Decimal
+
+from django.test import TestCase
+
+from api.gazetteer import bump_locations_version, reset_gazetteer
+from api.models import City, Country, Message, State, ZipCode
+from api.schema.chat_schema import MessageType
+from api.spatial import get_spatial_index
+
+
+class SpatialIndexTests(TestCase):
+    def setUp(self) -> None:
+        reset_gazetteer()
+        self.addCleanup(reset_gazetteer)
+
+        self.usa = Country.objects.create(name="United States", code="USA")
+        self.ca = State.objects.create(name="California", code="CA", country=self.usa)
+        ny = State.objects.create(name="New York", code="NY", country=self.usa)
+        self.san_diego = City.objects.create(
+            name="San Diego", state=self.ca, country=self.usa
+        )
+        los_angeles = City.objects.create(
+            name="Los Angeles", state=self.ca, country=self.usa
+        )
+        new_york = City.objects.create(name="New York", state=ny, country=self.usa)
+        for code, city, latitude, longitude in (
+            ("92101", self.san_diego, "32.715736", "-117.161087"),
+            ("92037", self.san_diego, "32.832800", "-117.271300"),
+            ("90012", los_angeles, "34.052200", "-118.243700"),
+            ("10001", new_york, "40.712800", "-74.006000"),
+            ("92199", self.san_diego, None, None),
+        ):
+            ZipCode.objects.create(
+                code=code,
+                city=city,
+                state=city.state,
+                country=self.usa,
+                latitude=latitude and Decimal(latitude),
+                longitude=longitude and Decimal(longitude),
+            )
+
+    def test_nearest_and_within(self):
+        index = get_spatial_index()
+        self.assertEqual(len(index), 4)  # 92199 has no coordinates
+
+        found = index.nearest_zip_codes(32.72, -117.16, k=3)
+        self.assertEqual([z.zip_code.code for z in found], ["92101", "92037", "90012"])
+        self.assertLess(found[0].distance_km, 1)
+        self.assertAlmostEqual(found[2].distance_km, 179, delta=2)
+        self.assertEqual(found[0].zip_code.city.name, "San Diego")
+
+        within = index.zip_codes_within("92101", 50)
+        self.assertEqual([z.zip_code.code for z in within], ["92101", "92037"])
+        self.assertEqual(within[0].distance_km, 0)
+        self.assertIsNone(index.zip_codes_within("92199", 50))
+        self.assertIsNone(index.zip_codes_within("00000", 50))
+        with self.assertRaises(ValueError):
+            index.nearest_zip_codes(91, 0)
+        with self.assertRaises(ValueError):
+            index.zip_codes_within("92101", -1)
+
+    def test_rebuilt_when_locations_change(self):
+        before = get_spatial_index()
+        self.assertIs(get_spatial_index(), before)
+        ZipCode.objects.create(
+            code="92102",
+            city=self.san_diego,
+            state=self.ca,
+            country=self.usa,
+            latitude=Decimal("32.716000"),
+            longitude=Decimal("-117.161000"),
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            bump_locations_version()
+        after = get_spatial_index()
+        self.assertIsNot(after, before)
+        self.assertEqual(len(after), 5)
+
+    def test_graphql_and_rest(self):
+        query = (
+            "{ nearestZipCodes(lat: 34.05, lng: -118.24, k: 1)"
+            " { distanceKm zipCode { code city { name } } }"
+            ' zipCodesWithin(code: "92037", km: 20) { zipCode { code } } }'
+        )
+        body = self.client.post(
+            "/graphql/",
+            data=json.dumps({"query": query}),
+            content_type="application/json",
+        ).json()
+        self.assertFalse(body.get("errors"), body)
+        nearest = body["data"]["nearestZipCodes"]
+        self.assertEqual(nearest[0]["zipCode"]["code"], "90012")
+        self.assertEqual(nearest[0]["zipCode"]["city"]["name"], "Los Angeles")
+        self.assertEqual(
+            [z["zipCode"]["code"] for z in body["data"]["zipCodesWithin"]],
+            ["92037", "92101"],
+        )
+
+        response = self.client.get(
+            "/api/locations/nearest/", {"lat": "40.7", "lng": "-74", "k": "2"}
+        )
+        results = response.json()["results"]
+        self.assertEqual([r["code"] for r in results], ["10001", "92101"])
+        self.assertIn("distance_km", results[0])
+        response = self.client.get(
+            "/api/locations/within/", {"code": "92101", "km": "5"}
+        )
+        self.assertEqual([r["code"] for r in response.json()["results"]], ["92101"])
+
+        self.assertEqual(
+            self.client.get("/api/locations/nearest/", {"lat": "x"}).status_code, 400
+        )
+        self.assertEqual(
+            self.client.get(
+                "/api/locations/within/", {"code": "99999", "km": "5"}
+            ).status_code,
+            404,
+        )
+
+    def test_location_message_reverse_geocode(self):
+        message = Message.objects.create(
+            chat_id="1",
+            chat_type="direct",
+            sender_id="1",
+            sender_name="Ana",
+            message_type="location",
+            latitude=Decimal("32.830000"),
+            longitude=Decimal("-117.270000"),
+        )
+        nearest = MessageType.resolve_nearestZipCode(message, None)
+        self.assertEqual(nearest.zip_code.code, "92037")
+        message.latitude = None
+        self.assertIsNone(MessageType.resolve_nearestZipCode(message, None))
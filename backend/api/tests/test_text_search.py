@@ -0,0 +1,83 @@
+from django.db import connection
+from django.db.backends.postgresql.base import DatabaseWrapper
+from django.test import TestCase
+
+from api.models import City, Country, State, Tag
+from api.text_search import contains, similar, startswith
+
+
+class TextSearchTests(TestCase):
+    def setUp(self) -> None:
+        usa = Country.objects.create(name="United States", code="USA")
+        ca = State.objects.create(name="California", code="CA", country=usa)
+        for name in ("San Diego", "Santa Ana", "Pasadena", "Sandy_Town", "Diego%"):
+            City.objects.create(name=name, state=ca, country=usa)
+        Tag.objects.create(name="Safety", category="Operations")
+        Tag.objects.create(name="Safe", description="Protective gear")
+        Tag.objects.create(name="Quality", category="Safety audits")
+        Tag.objects.create(name="Maintenance")
+
+    def names(self, queryset):
+        return [row.name for row in queryset]
+
+    def test_lookups(self):
+        cities = City.objects.order_by("name")
+        self.assertEqual(
+            self.names(startswith(cities, "name", "san")),
+            ["San Diego", "Sandy_Town", "Santa Ana"],
+        )
+        self.assertEqual(
+            self.names(startswith(cities, "name", "sandy_")), ["Sandy_Town"]
+        )
+        self.assertEqual(self.names(startswith(cities, "name", "sand_")), [])
+        self.assertEqual(
+            self.names(contains(cities, ["name"], "DIEGO")), ["Diego%", "San Diego"]
+        )
+        self.assertEqual(self.names(contains(cities, ["name"], "o%")), ["Diego%"])
+
+        tags = contains(Tag.objects.order_by("name"), ["name", "category"], "safe")
+        self.assertEqual(self.names(tags), ["Quality", "Safe", "Safety"])
+
+        ranked = similar(Tag.objects.all(), "name", "safe")
+        self.assertEqual(
+            [(tag.name, tag.similarity) for tag in ranked],
+            [("Safe", 1.0), ("Safety", 0.75)],
+        )
+
+    def test_prefix_search_uses_an_index(self):
+        sql, params = startswith(
+            City.objects.all(), "name", "san"
+        ).query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+            plan = " ".join(str(row) for row in cursor.fetchall())
+        self.assertIn("cities_name_prefix", plan)
+
+    def test_postgres_sql_matches_the_indexes(self):
+        postgres = DatabaseWrapper(
+            {**connection.settings_dict, "ENGINE": "django.db.backends.postgresql"}
+        )
+
+        def where(queryset):
+            sql, params = queryset.query.get_compiler(connection=postgres).as_sql()
+            return sql.split(" WHERE ")[1].split(" ORDER BY ")[0], params
+
+        self.assertEqual(
+            where(contains(Tag.objects.all(), ["name"], "50%")),
+            ('"api_tag"."name" ILIKE %s', ("%50\\%%",)),
+        )
+        self.assertEqual(
+            where(startswith(City.objects.all(), "name", "San")),
+            ('lower("cities"."name") LIKE lower(%s)', ("San%",)),
+        )
+
+    def test_tag_list_match_modes(self):
+        def tag_names(**params):
+            response = self.client.get("/api/tags/", params)
+            return [tag["name"] for tag in response.json()["tags"]]
+
+        self.assertEqual(tag_names(q="safe"), ["Safe", "Safety", "Quality"])
+        self.assertEqual(tag_names(q="saf", match="prefix"), ["Safe", "Safety"])
+        self.assertEqual(tag_names(q="Safe", match="similar"), ["Safe", "Safety"])
+        response = self.client.get("/api/tags/", {"q": "x", "match": "regex"})
+        self.assertEqual(response.status_code, 400)
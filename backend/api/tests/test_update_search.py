@@ -0,0 +1,119 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from api.models import Update
+from api.update_search import ContainsUpdateSearch, SQLiteUpdateSearch
+from api.views import create_jwt_token
+
+
+class UpdateSearchViewTests(TestCase):
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(username="searcher", password="x")
+        self.client.defaults["HTTP_AUTHORIZATION"] = (
+            f"Bearer {create_jwt_token(self.user)}"
+        )
+        Update.objects.create(
+            id="title-hit",
+            title="Forklift safety training",
+            summary="Quarterly session",
+            body="Bring your badge.",
+            tags=["training"],
+            created_by=self.user,
+        )
+        Update.objects.create(
+            id="body-hit",
+            title="Shift notes",
+            summary="Night shift",
+            body="Reminder that forklift keys stay at the desk.",
+            created_by=self.user,
+        )
+        Update.objects.create(
+            id="miss",
+            title="Cafeteria menu",
+            summary="Tacos",
+            body="Tuesday special.",
+            created_by=self.user,
+        )
+
+    def test_title_matches_rank_above_body_matches(self):
+        response = self.client.get("/api/updates/search/", {"q": "forklift"})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        ids = [result["id"] for result in data["results"]]
+        self.assertEqual(ids, ["title-hit", "body-hit"])
+        self.assertIn("<mark>", data["results"][1]["headline"])
+
+    def test_edits_are_searchable(self):
+        update = Update.objects.get(id="miss")
+        update.body = "Forklift parking moved."
+        update.save()
+
+        response = self.client.get("/api/updates/search/", {"q": "forklift"})
+        ids = {result["id"] for result in response.json()["results"]}
+        self.assertIn("miss", ids)
+
+    def test_cursor_pagination_walks_all_results(self):
+        first = self.client.get("/api/updates/search/", {"q": "forklift", "limit": 1})
+        data = first.json()
+        self.assertEqual(len(data["results"]), 1)
+        self.assertIsNotNone(data["next_cursor"])
+
+        second = self.client.get(
+            "/api/updates/search/",
+            {"q": "forklift", "limit": 1, "cursor": data["next_cursor"]},
+        ).json()
+        self.assertEqual(
+            [result["id"] for result in data["results"] + second["results"]],
+            ["title-hit", "body-hit"],
+        )
+        self.assertIsNone(second["next_cursor"])
+
+    def test_tag_filter_and_invalid_cursor(self):
+        response = self.client.get(
+            "/api/updates/search/", {"q": "forklift", "tags": "training"}
+        )
+        self.assertEqual(
+            [result["id"] for result in response.json()["results"]], ["title-hit"]
+        )
+
+        bad = self.client.get("/api/updates/search/", {"q": "x", "cursor": "nope"})
+        self.assertEqual(bad.status_code, 400)
+
+    def test_requires_jwt(self):
+        response = self.client.get(
+            "/api/updates/search/", {"q": "forklift"}, HTTP_AUTHORIZATION=""
+        )
+        self.assertEqual(response.status_code, 401)
+
+    def test_other_databases_fall_back_to_contains(self):
+        with mock.patch("api.views.get_update_search", ContainsUpdateSearch):
+            first = self.client.get(
+                "/api/updates/search/", {"q": "forklift", "limit": 1}
+            ).json()
+            second = self.client.get(
+                "/api/updates/search/",
+                {"q": "forklift", "cursor": first["next_cursor"]},
+            ).json()
+            tagged = self.client.get(
+                "/api/updates/search/", {"q": "forklift", "tags": "training"}
+            ).json()
+        self.assertEqual(
+            [result["id"] for result in first["results"] + second["results"]],
+            ["title-hit", "body-hit"],
+        )
+        self.assertEqual([result["id"] for result in tagged["results"]], ["title-hit"])
+
+    def test_only_text_changes_reindex(self):
+        update = Update.objects.get(id="miss")
+        with mock.patch.object(SQLiteUpdateSearch, "index_updates") as index:
+            update.score = 42
+            update.save(update_fields=["score"])
+            update.priority = 3
+            update.save()
+            index.assert_not_called()
+
+            update.tags = ["forklift"]
+            update.save()
+            index.assert_called_once_with([update])
@@ -0,0 +1,108 @@
+import asyncio
+import json
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+
+from api.models import Update
+from api.update_stream import (
+    UPDATE_STREAM_GROUP,
+    UpdateStreamHub,
+    format_sse,
+)
+
+
+class FlakyLayer:
+    """Channel layer whose receive() raises any exception queued for it"""
+
+    def __init__(self) -> None:
+        self.inbox: asyncio.Queue = asyncio.Queue()
+
+    async def new_channel(self):
+        return "listener"
+
+    async def group_add(self, group, channel):
+        pass
+
+    async def receive(self, channel):
+        item = await self.inbox.get()
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+
+def _message(event_id, event="update.created", data="{}"):
+    return {"type": "update.event", "id": event_id, "event": event, "data": data}
+
+
+class UpdateStreamHubTests(SimpleTestCase):
+    async def test_fan_out_and_last_event_id_resume(self):
+        hub = UpdateStreamHub(buffer_size=2)
+        try:
+            queue, backlog = await hub.subscribe()
+            self.assertEqual(backlog, [])
+
+            layer = get_channel_layer()
+            for number in range(3):
+                await layer.group_send(UPDATE_STREAM_GROUP, _message(f"e{number}"))
+            received = [(await asyncio.wait_for(queue.get(), 1))[0] for _ in range(3)]
+            self.assertEqual(received, ["e0", "e1", "e2"])
+
+            _, backlog = await hub.subscribe("e1")
+            self.assertEqual([item[0] for item in backlog], ["e2"])
+
+            # e0 has been pushed out of the ring buffer
+            _, backlog = await hub.subscribe("e0")
+            self.assertIsNone(backlog)
+        finally:
+            await hub.close()
+
+    async def test_listener_failure_resets_streams_and_restarts(self):
+        layer = FlakyLayer()
+        hub = UpdateStreamHub()
+        with (
+            mock.patch("api.update_stream.get_channel_layer", return_value=layer),
+            mock.patch("api.update_stream.LISTENER_RETRY_SECONDS", (0,)),
+        ):
+            try:
+                queue, _ = await hub.subscribe()
+                await layer.inbox.put(RuntimeError("connection lost"))
+                self.assertIsNone(await asyncio.wait_for(queue.get(), 1))
+                self.assertNotIn(queue, hub.subscribers)
+
+                queue, _ = await hub.subscribe()
+                await layer.inbox.put(_message("e1"))
+                self.assertEqual((await asyncio.wait_for(queue.get(), 1))[0], "e1")
+            finally:
+                await hub.close()
+
+    def test_format_sse(self):
+        self.assertEqual(
+            format_sse("e1", "update.changed", '{"id": "u1"}'),
+            'id: e1\nevent: update.changed\ndata: {"id": "u1"}\n\n',
+        )
+
+
+class UpdateStreamSignalTests(TestCase):
+    def test_saving_an_update_publishes_after_commit(self):
+        layer = get_channel_layer()
+        channel = async_to_sync(layer.new_channel)()
+        async_to_sync(layer.group_add)(UPDATE_STREAM_GROUP, channel)
+        user = User.objects.create_user(username="streamer", password="x")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Update.objects.create(
+                id="u1", title="Hello", summary="s", body="b", created_by=user
+            )
+
+        message = async_to_sync(layer.receive)(channel)
+        self.assertEqual(message["event"], "update.created")
+        self.assertEqual(json.loads(message["data"])["id"], "u1")
+        async_to_sync(layer.group_discard)(UPDATE_STREAM_GROUP, channel)
+
+    def test_stream_requires_authentication(self):
+        self.assertEqual(self.client.get("/api/updates/stream/").status_code, 401)
@@ -0,0 +1,107 @@
+"""
+Index-backed text lookups for search boxes and filters.
+
+Plain ``icontains``/``istartswith`` compile to ``UPPER(col) LIKE UPPER(...)``
+on PostgreSQL, which no ordinary index can serve, so every search was a
+sequential scan. Views and resolvers go through the helpers here instead,
+each matched by an index from migration 0039:
+
+* ``contains``: ``col ILIKE '%term%'`` on PostgreSQL, served by a
+  ``gin_trgm_ops`` GIN index (pg_trgm).
+* ``startswith``: ``lower(col) LIKE lower('term%')`` on PostgreSQL, served by
+  a ``lower(col) text_pattern_ops`` btree; ``LIKE 'term%'`` on SQLite, served
+  by a ``COLLATE NOCASE`` index.
+* ``similar``: the pg_trgm ``%`` operator ranked by ``similarity()`` on
+  PostgreSQL (typo tolerant); elsewhere a contains match with prefix hits
+  ranked first.
+
+Other databases get the stock case-insensitive lookups.
+"""
+
+from functools import reduce
+from operator import or_
+from typing import Sequence
+
+from django.contrib.postgres.lookups import TrigramSimilar
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db import connections
+from django.db.models import Case, CharField, FloatField, Q, TextField, Value, When
+from django.db.models.lookups import IContains, IStartsWith
+
+
+class IndexedContains(IContains):
+    """Case-insensitive substring match that a trigram index can serve"""
+
+    lookup_name = "indexed_contains"
+
+    def get_rhs_op(self, connection, rhs):
+        return connection.operators["icontains"] % rhs
+
+    def as_postgresql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f"{lhs} ILIKE {rhs}", (*lhs_params, *rhs_params)
+
+
+class IndexedStartsWith(IStartsWith):
+    """Case-insensitive prefix match that a text_pattern_ops index can serve"""
+
+    lookup_name = "indexed_startswith"
+
+    def get_rhs_op(self, connection, rhs):
+        return connection.operators["istartswith"] % rhs
+
+    def as_postgresql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f"lower({lhs}) LIKE lower({rhs})", (*lhs_params, *rhs_params)
+
+
+for field_class in (CharField, TextField):
+    field_class.register_lookup(IndexedContains)
+    field_class.register_lookup(IndexedStartsWith)
+    field_class.register_lookup(TrigramSimilar)
+
+
+def _is_postgres(queryset) -> bool:
+    return connections[queryset.db].vendor == "postgresql"
+
+
+def contains(queryset, fields: Sequence[str], term: str):
+    """Rows where any of ``fields`` contains ``term``, ignoring case"""
+    return queryset.filter(
+        reduce(or_, (Q(**{f"{field}__indexed_contains": term}) for field in fields))
+    )
+
+
+def startswith(queryset, field: str, term: str):
+    """Rows where ``field`` starts with ``term``, ignoring case"""
+    return queryset.filter(**{f"{field}__indexed_startswith": term})
+
+
+def similar(queryset, field: str, term: str):
+    """Rows whose ``field`` resembles ``term``, best match first
+
+    Results are annotated with ``similarity`` (0 to 1).
+    """
+    if _is_postgres(queryset):
+        return (
+            queryset.filter(
+                Q(**{f"{field}__trigram_similar": term})
+                | Q(**{f"{field}__indexed_contains": term})
+            )
+            .annotate(similarity=TrigramSimilarity(field, term))
+            .order_by("-similarity", field, "pk")
+        )
+    return (
+        contains(queryset, [field], term)
+        .annotate(
+            similarity=Case(
+                When(**{f"{field}__iexact": term}, then=Value(1.0)),
+                When(**{f"{field}__indexed_startswith": term}, then=Value(0.75)),
+                default=Value(0.5),
+                output_field=FloatField(),
+            )
+        )
+        .order_by("-similarity", field, "pk")
+    )
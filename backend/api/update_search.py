@@ -0,0 +1,285 @@
+"""
+Ranked full-text search over updates.
+
+Two backends share one interface:
+
+* PostgreSQL: a weighted ``search_vector`` tsvector column (title A, summary B,
+  body C, tags A) kept current by a trigger and indexed with GIN. Results are
+  ordered by ``ts_rank_cd`` and carry ``ts_headline`` snippets.
+* SQLite (test settings): an FTS5 table ranked with column-weighted bm25 and
+  ``snippet()``. SQLite rebuilds tables on many schema changes, which would
+  drop triggers, so this index is maintained from Update save/delete signals.
+* Anything else: the feed's icontains filter, unranked, newest id first.
+
+All of them paginate with a cursor over (rank, id).
+"""
+
+import json
+import re
+from abc import ABC, abstractmethod
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+from django.contrib.postgres.search import (
+    SearchHeadline,
+    SearchQuery,
+    SearchRank,
+    SearchVectorField,
+)
+from django.db import connection
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+from .cursors import decode_cursor, encode_cursor
+from .models import Update
+
+SEARCH_CONFIG = "english"
+HEADLINE_START = "<mark>"
+HEADLINE_STOP = "</mark>"
+
+SQLITE_FTS_TABLE = "api_update_fts"
+
+# bm25 weights per FTS5 column: update_id, title, summary, body, tags
+SQLITE_BM25_WEIGHTS = (0.0, 4.0, 2.0, 1.0, 4.0)
+
+# Update fields that make up the indexed document
+SEARCH_FIELDS = ("title", "summary", "body", "tags")
+
+
+class UpdateSearchResult(NamedTuple):
+    update: Update
+    rank: float
+    headline: str
+
+
+class UpdateSearchBackend(ABC):
+    """Interface shared by the database-specific search implementations"""
+
+    # Whether index_updates() has to run when an update's text changes
+    indexed_on_save = False
+
+    @abstractmethod
+    def search(
+        self,
+        text: str,
+        update_type: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[UpdateSearchResult], Optional[str]]:
+        """Return one page of ranked results and the cursor for the next page"""
+
+    def index_updates(self, updates: Iterable[Update]) -> None:
+        """Bring the index up to date for updates written outside save()"""
+
+    def remove_updates(self, update_ids: Iterable[str]) -> None:
+        """Drop deleted updates from the index"""
+
+    def base_queryset(self, update_type: Optional[str] = None):
+        updates = Update.objects.live()
+        if update_type and update_type != "all":
+            updates = updates.filter(type=update_type)
+        return updates
+
+    @staticmethod
+    def _page(rows: list, limit: int) -> Tuple[list, Optional[str]]:
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        last = rows[-1]
+        return rows, encode_cursor([last.rank, last.update.id])
+
+
+class PostgresUpdateSearch(UpdateSearchBackend):
+    def search(self, text, update_type=None, tags=None, limit=20, cursor=None):
+        query = SearchQuery(text, config=SEARCH_CONFIG, search_type="websearch")
+        vector = RawSQL(
+            f'"{Update._meta.db_table}"."search_vector"',
+            [],
+            output_field=SearchVectorField(),
+        )
+
+        updates = self.base_queryset(update_type).annotate(
+            document=vector,
+            rank=SearchRank(vector, query, cover_density=True),
+        )
+        updates = updates.filter(document=query)
+
+        if tags:
+            tag_filter = Q()
+            for tag in tags:
+                tag_filter |= Q(tags__contains=[tag])
+            updates = updates.filter(tag_filter)
+
+        if cursor:
+            last_rank, last_id = decode_cursor(cursor, 2)
+            updates = updates.filter(
+                Q(rank__lt=last_rank) | Q(rank=last_rank, id__lt=last_id)
+            )
+
+        updates = updates.annotate(
+            headline=SearchHeadline(
+                "body",
+                query,
+                config=SEARCH_CONFIG,
+                start_sel=HEADLINE_START,
+                stop_sel=HEADLINE_STOP,
+                max_fragments=2,
+                min_words=8,
+                max_words=24,
+            )
+        ).order_by("-rank", "-id")[: limit + 1]
+
+        rows = [
+            UpdateSearchResult(update, float(update.rank), update.headline)
+            for update in updates
+        ]
+        return self._page(rows, limit)
+
+
+class SQLiteUpdateSearch(UpdateSearchBackend):
+    TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+    indexed_on_save = True
+
+    def _match_expression(self, text: str, tags: Optional[List[str]]) -> str:
+        terms = " ".join(
+            '"{}"'.format(token.replace('"', '""'))
+            for token in self.TOKEN_RE.findall(text)
+        )
+        if not terms:
+            return ""
+        if tags:
+            tag_terms = " OR ".join(
+                '"{}"'.format(tag.replace('"', '""')) for tag in tags if tag
+            )
+            if tag_terms:
+                terms = f"{terms} AND tags : ({tag_terms})"
+        return terms
+
+    def search(self, text, update_type=None, tags=None, limit=20, cursor=None):
+        match = self._match_expression(text, tags)
+        if not match:
+            return [], None
+
+        weights = ", ".join(str(weight) for weight in SQLITE_BM25_WEIGHTS)
+        sql = f"""
+            SELECT update_id, rank, headline FROM (
+                SELECT f.update_id AS update_id,
+                       -bm25({SQLITE_FTS_TABLE}, {weights}) AS rank,
+                       snippet({SQLITE_FTS_TABLE}, 3, %s, %s, '…', 24) AS headline
+                FROM {SQLITE_FTS_TABLE} f
+                WHERE {SQLITE_FTS_TABLE} MATCH %s
+            )
+            WHERE update_id IN ({{ids}})
+        """
+        params: list = [HEADLINE_START, HEADLINE_STOP, match]
+
+        candidates = self.base_queryset(update_type).order_by().values("id")
+        candidate_sql, candidate_params = candidates.query.sql_with_params()
+        sql = sql.replace("{ids}", candidate_sql)
+        params.extend(candidate_params)
+
+        if cursor:
+            last_rank, last_id = decode_cursor(cursor, 2)
+            sql += " AND (rank < %s OR (rank = %s AND update_id < %s))"
+            params.extend([last_rank, last_rank, last_id])
+
+        sql += " ORDER BY rank DESC, update_id DESC LIMIT %s"
+        params.append(limit + 1)
+
+        with connection.cursor() as db_cursor:
+            db_cursor.execute(sql, params)
+            hits = db_cursor.fetchall()
+
+        updates = Update.objects.in_bulk([update_id for update_id, _, _ in hits])
+        rows = [
+            UpdateSearchResult(updates[update_id], rank, headline or "")
+            for update_id, rank, headline in hits
+            if update_id in updates
+        ]
+        return self._page(rows, limit)
+
+    def index_updates(self, updates):
+        rows = [
+            (
+                update.id,
+                update.title,
+                update.summary,
+                update.body,
+                " ".join(str(tag) for tag in (update.tags or [])),
+            )
+            for update in updates
+        ]
+        if not rows:
+            return
+        with connection.cursor() as db_cursor:
+            db_cursor.executemany(
+                f"DELETE FROM {SQLITE_FTS_TABLE} WHERE update_id = %s",
+                [(row[0],) for row in rows],
+            )
+            db_cursor.executemany(
+                f"INSERT INTO {SQLITE_FTS_TABLE} "
+                "(update_id, title, summary, body, tags) VALUES (%s, %s, %s, %s, %s)",
+                rows,
+            )
+
+    def remove_updates(self, update_ids):
+        update_ids = [(update_id,) for update_id in update_ids]
+        if not update_ids:
+            return
+        with connection.cursor() as db_cursor:
+            db_cursor.executemany(
+                f"DELETE FROM {SQLITE_FTS_TABLE} WHERE update_id = %s", update_ids
+            )
+
+
+class ContainsUpdateSearch(UpdateSearchBackend):
+    """Fallback for databases without a full-text index: every hit ranks 0"""
+
+    @staticmethod
+    def _has_tag(tag: str) -> Q:
+        if connection.features.supports_json_field_contains:
+            return Q(tags__contains=[tag])
+        # Match the tag as a quoted JSON string inside the serialized list
+        return Q(tags__icontains=json.dumps(tag))
+
+    def search(self, text, update_type=None, tags=None, limit=20, cursor=None):
+        updates = self.base_queryset(update_type).filter(
+            Q(title__icontains=text)
+            | Q(summary__icontains=text)
+            | Q(body__icontains=text)
+            | self._has_tag(text)
+        )
+        if tags:
+            tag_filter = Q()
+            for tag in tags:
+                tag_filter |= self._has_tag(tag)
+            updates = updates.filter(tag_filter)
+
+        if cursor:
+            _, last_id = decode_cursor(cursor, 2)
+            updates = updates.filter(id__lt=last_id)
+
+        rows = [
+            UpdateSearchResult(update, 0.0, update.summary)
+            for update in updates.order_by("-id")[: limit + 1]
+        ]
+        return self._page(rows, limit)
+
+
+def get_update_search() -> UpdateSearchBackend:
+    """Return the search backend matching the default database"""
+    if connection.vendor == "postgresql":
+        return PostgresUpdateSearch()
+    if connection.vendor == "sqlite":
+        return SQLiteUpdateSearch()
+    return ContainsUpdateSearch()
+
+
+def stored_search_document(update_id: str) -> Optional[tuple]:
+    """The indexed fields of an update as currently saved"""
+    return Update.objects.filter(pk=update_id).values_list(*SEARCH_FIELDS).first()
+
+
+def search_document(update: Update) -> tuple:
+    return tuple(getattr(update, field) for field in SEARCH_FIELDS)
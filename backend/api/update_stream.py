@@ -0,0 +1,268 @@
+"""
+Server-Sent Events feed of update changes.
+
+Signals publish events to the ``update_stream`` channel-layer group once the
+surrounding transaction commits. Each server process runs one hub that joins
+that group a single time, keeps the most recent events in a bounded ring
+buffer for ``Last-Event-ID`` resume, and fans every event out to the open
+streams. An idle stream is just a parked coroutine plus a heartbeat comment
+every few seconds; nothing touches the database.
+
+Events only cross processes when ``CHANNEL_LAYERS`` is a shared layer (Redis
+in production settings). If the hub's listener fails it resets every open
+stream, since events may have been lost, and reconnects with backoff.
+"""
+
+import asyncio
+import json
+import logging
+import uuid
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+
+logger = logging.getLogger(__name__)
+
+UPDATE_STREAM_GROUP = "update_stream"
+
+EVENT_CREATED = "update.created"
+EVENT_CHANGED = "update.changed"
+EVENT_DELETED = "update.deleted"
+EVENT_COUNTERS = "update.counters"
+EVENT_RESET = "reset"
+
+DEFAULT_BUFFER_SIZE = 500
+DEFAULT_HEARTBEAT_SECONDS = 15
+SUBSCRIBER_QUEUE_SIZE = 100
+# Channel-layer group memberships expire; re-join well before they do
+GROUP_REFRESH_SECONDS = 3600
+# Backoff between listener restarts, and how long a new stream waits for one
+LISTENER_RETRY_SECONDS = (1, 2, 5, 10, 30)
+LISTENER_READY_TIMEOUT = 10
+
+StreamEvent = Tuple[str, str, str]  # (id, event name, JSON data)
+
+
+def update_payload(update) -> Dict[str, Any]:
+    return {
+        "id": update.id,
+        "type": update.type,
+        "title": update.title,
+        "summary": update.summary,
+        "timestamp": update.timestamp,
+        "status": update.status,
+        "priority": update.priority,
+        "is_active": update.is_active,
+        "expires_at": update.expires_at,
+        "updated_at": update.updated_at,
+    }
+
+
+def publish_update_event(event: str, data: Dict[str, Any]) -> None:
+    """Send an event to every stream once the current transaction commits
+
+    ``data`` may be a callable, evaluated at commit time, for payloads that
+    should reflect committed state.
+    """
+
+    def send():
+        channel_layer = get_channel_layer()
+        if channel_layer is None:
+            return
+        payload = data() if callable(data) else data
+        try:
+            async_to_sync(channel_layer.group_send)(
+                UPDATE_STREAM_GROUP,
+                {
+                    "type": "update.event",
+                    "id": uuid.uuid4().hex,
+                    "event": event,
+                    "data": json.dumps(payload, cls=DjangoJSONEncoder),
+                },
+            )
+        except Exception:
+            logger.exception("Failed to publish %s event", event)
+
+    transaction.on_commit(send)
+
+
+def format_sse(event_id: Optional[str], event: str, data: str) -> str:
+    lines = []
+    if event_id:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.extend(f"data: {line}" for line in data.splitlines() or [""])
+    return "\n".join(lines) + "\n\n"
+
+
+class StreamUnavailable(Exception):
+    """The hub could not join the channel-layer group"""
+
+
+class UpdateStreamHub:
+    """Per-process fan-out from the channel-layer group to open streams"""
+
+    def __init__(self, buffer_size: int = DEFAULT_BUFFER_SIZE) -> None:
+        self.buffer: Deque[StreamEvent] = deque(maxlen=buffer_size)
+        self.subscribers: Set[asyncio.Queue] = set()
+        self._listener: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._ready: Optional[asyncio.Event] = None
+
+    async def _ensure_listening(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._listener is None or self._listener.done():
+            self._loop = loop
+            self._ready = asyncio.Event()
+            self._listener = loop.create_task(self._listen())
+        try:
+            await asyncio.wait_for(self._ready.wait(), LISTENER_READY_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise StreamUnavailable("Update stream is not connected")
+
+    async def _listen(self) -> None:
+        failures = 0
+        while True:
+            try:
+                await self._receive_forever()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Update stream listener failed; restarting")
+                self._ready.clear()
+                self.reset_subscribers()
+                delay = LISTENER_RETRY_SECONDS[
+                    min(failures, len(LISTENER_RETRY_SECONDS) - 1)
+                ]
+                failures += 1
+                await asyncio.sleep(delay)
+
+    async def _receive_forever(self) -> None:
+        channel_layer = get_channel_layer()
+        channel = await channel_layer.new_channel()
+        await channel_layer.group_add(UPDATE_STREAM_GROUP, channel)
+        self._ready.set()
+        while True:
+            try:
+                message = await asyncio.wait_for(
+                    channel_layer.receive(channel), GROUP_REFRESH_SECONDS
+                )
+            except asyncio.TimeoutError:
+                await channel_layer.group_add(UPDATE_STREAM_GROUP, channel)
+                continue
+            self.dispatch((message["id"], message["event"], message["data"]))
+
+    def dispatch(self, item: StreamEvent) -> None:
+        self.buffer.append(item)
+        for queue in list(self.subscribers):
+            try:
+                queue.put_nowait(item)
+            except asyncio.QueueFull:
+                # A stalled client; make it reconnect and resync instead of
+                # buffering without bound
+                self.subscribers.discard(queue)
+                queue.overflowed = True
+
+    def reset_subscribers(self) -> None:
+        """End every open stream with a reset; it may have missed events"""
+        for queue in list(self.subscribers):
+            self.subscribers.discard(queue)
+            queue.overflowed = True
+            try:
+                queue.put_nowait(None)
+            except asyncio.QueueFull:
+                pass  # Picked up as an overflow once the queue drains
+
+    def replay_after(self, last_event_id: str) -> Optional[List[StreamEvent]]:
+        """Events after ``last_event_id``, or None if it left the buffer"""
+        for position, (event_id, _, _) in enumerate(self.buffer):
+            if event_id == last_event_id:
+                return list(self.buffer)[position + 1 :]
+        return None
+
+    async def subscribe(
+        self, last_event_id: Optional[str] = None
+    ) -> Tuple[asyncio.Queue, Optional[List[StreamEvent]]]:
+        """Register a stream; returns its queue and the events it missed
+
+        The backlog is None when ``last_event_id`` is no longer buffered and
+        the client has to refetch.
+        """
+        await self._ensure_listening()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        queue.overflowed = False
+        backlog: Optional[List[StreamEvent]] = []
+        if last_event_id:
+            backlog = self.replay_after(last_event_id)
+        self.subscribers.add(queue)
+        return queue, backlog
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self.subscribers.discard(queue)
+
+    async def close(self) -> None:
+        """Stop listening; open streams get no further events"""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+
+_hub: Optional[UpdateStreamHub] = None
+
+
+def get_update_stream_hub() -> UpdateStreamHub:
+    global _hub
+    if _hub is None:
+        _hub = UpdateStreamHub(
+            getattr(settings, "UPDATE_STREAM_BUFFER_SIZE", DEFAULT_BUFFER_SIZE)
+        )
+    return _hub
+
+
+async def stream_events(last_event_id: Optional[str] = None):
+    """Async iterator of SSE frames for one client"""
+    hub = get_update_stream_hub()
+    heartbeat = getattr(
+        settings, "UPDATE_STREAM_HEARTBEAT_SECONDS", DEFAULT_HEARTBEAT_SECONDS
+    )
+    try:
+        queue, backlog = await hub.subscribe(last_event_id)
+    except StreamUnavailable:
+        yield f"retry: {heartbeat * 1000}\n\n"
+        yield format_sse(None, EVENT_RESET, json.dumps({"reason": "unavailable"}))
+        return
+    try:
+        yield f"retry: {heartbeat * 1000}\n\n"
+        if backlog is None:
+            yield format_sse(None, EVENT_RESET, json.dumps({"reason": "expired"}))
+        else:
+            for item in backlog:
+                yield format_sse(*item)
+
+        while True:
+            try:
+                item = await asyncio.wait_for(queue.get(), heartbeat)
+            except asyncio.TimeoutError:
+                if queue.overflowed:
+                    yield format_sse(
+                        None, EVENT_RESET, json.dumps({"reason": "overflow"})
+                    )
+                    return
+                yield ": heartbeat\n\n"
+                continue
+            if item is None:
+                yield format_sse(None, EVENT_RESET, json.dumps({"reason": "restart"}))
+                return
+            yield format_sse(*item)
+    finally:
+        hub.unsubscribe(queue)
@@ -1,16 +1,63 @@
 from datetime import datetime
 
+from django.db import transaction
 from django.shortcuts import get_object_or_404
 
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import APIException
 from rest_framework.response import Response
 
+from ..activity_batch import apply_activity_batch
+from ..activity_calendar import (
+    FREE_STATUSES,
+    SCHEDULE_FIELDS,
+    conflicts_payload,
+    find_conflicts,
+    lock_schedules,
+)
 from ..models import Activity
 from ..serializers import ActivitySerializer
 from .permissions import IsAuthenticatedJWT
 
 
+class ScheduleConflict(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = "The assignee already has an activity at that time"
+    default_code = "schedule_conflict"
+
+    def __init__(self, conflicts):
+        super().__init__()
+        self.conflicts = conflicts
+
+
+def check_schedule(serializer, instance=None):
+    """Raise ScheduleConflict if saving would double-book the assignee
+
+    Call it inside the transaction that saves the activity.
+    """
+    data = serializer.validated_data
+
+    def value(field):
+        return data.get(field, getattr(instance, field, None))
+
+    if value("status") in FREE_STATUSES:
+        return
+    if instance is not None and all(
+        value(field) == getattr(instance, field) for field in SCHEDULE_FIELDS
+    ):
+        return  # Existing overlaps do not block unrelated edits
+    lock_schedules(value("assigned_to"))
+    conflicts = find_conflicts(
+        value("assigned_to"),
+        value("start_time"),
+        value("end_time"),
+        exclude_id=getattr(instance, "pk", None),
+    )
+    if conflicts:
+        raise ScheduleConflict(conflicts)
+
+
 class ActivityViewSet(viewsets.ModelViewSet):
     serializer_class = ActivitySerializer
     permission_classes = [IsAuthenticatedJWT]
@@ -19,9 +66,30 @@ class ActivityViewSet(viewsets.ModelViewSet):
         qs = Activity.objects.all().order_by("-created_at")  # type: ignore[attr-defined]
         return qs
 
+    def handle_exception(self, exc):
+        # Conflicts carry a list of activities, which DRF would stringify
+        if isinstance(exc, ScheduleConflict):
+            return Response(
+                {
+                    "success": False,
+                    "error": str(exc.detail),
+                    "code": "SCHEDULE_CONFLICT",
+                    "conflicts": conflicts_payload(exc.conflicts),
+                },
+                status=exc.status_code,
+            )
+        return super().handle_exception(exc)
+
     def perform_create(self, serializer):
         user = self.request.user  # set by permission
-        serializer.save(created_by=user)
+        with transaction.atomic():
+            check_schedule(serializer)
+            serializer.save(created_by=user)
+
+    def perform_update(self, serializer):
+        with transaction.atomic():
+            check_schedule(serializer, serializer.instance)
+            serializer.save()
 
     def update(self, request, *args, **kwargs):
         data = request.data.copy()
@@ -36,6 +104,19 @@ class ActivityViewSet(viewsets.ModelViewSet):
         request._full_data = data  # type: ignore[attr-defined]
         return super().update(request, *args, **kwargs)
 
+    @action(detail=False, methods=["post"])
+    def batch(self, request):
+        try:
+            if not isinstance(request.data, dict):
+                raise ValueError("Body must be a JSON object")
+            outcome = apply_activity_batch(request.data.get("operations"))
+        except ValueError as e:
+            return Response(
+                {"success": False, "error": str(e)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return Response({"success": outcome["failed"] == 0, **outcome})
+
     @action(detail=True, methods=["post"])
     def start(self, request, pk=None):
         activity = get_object_or_404(Activity, pk=pk)
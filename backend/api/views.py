@@ -1,23 +1,105 @@
 import json
 import logging
 import re
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Any, Dict, List, Optional, TypeAlias, Union, cast
 
 from django.conf import settings
-from django.contrib.auth import authenticate, login, logout
+from django.contrib.auth import alogin, authenticate, login, logout
 from django.contrib.auth.base_user import AbstractBaseUser
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.models import User
+from django.db import transaction
 from django.db.models import F, Q
-from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.http import (
+    FileResponse,
+    HttpRequest,
+    HttpResponse,
+    JsonResponse,
+    StreamingHttpResponse,
+)
 from django.shortcuts import get_object_or_404, render
+from django.urls import reverse
 from django.utils import timezone
+from django.utils.cache import patch_vary_headers
 from django.views.decorators.csrf import csrf_exempt
 
 import jwt
-
+from asgiref.sync import sync_to_async
+
+from api.activity_batch import apply_activity_batch
+from api.activity_calendar import (
+    FREE_STATUSES,
+    MAX_CALENDAR_RESULTS,
+    calendar_window,
+    conflicts_payload,
+    find_conflicts,
+    lock_schedules,
+    parse_moment,
+    schedule_of,
+)
+from api.activity_listing import (
+    DEFAULT_ACTIVITY_PAGE_SIZE,
+    MAX_ACTIVITY_PAGE_SIZE,
+    load_activity_page,
+    parse_activity_fields,
+    project_activities,
+)
+from api.activity_rollups import activity_stats
+from api.bookmarks import (
+    DEFAULT_BOOKMARK_PAGE_SIZE,
+    MAX_BOOKMARK_PAGE_SIZE,
+    annotate_bookmarked,
+    bookmark_validators,
+    load_bookmarks,
+)
+from api.bulk_updates import bulk_import_updates, get_bulk_chunk_size
+from api.comment_threads import (
+    DEFAULT_COMMENT_PAGE_SIZE,
+    DEFAULT_REPLY_PREVIEW,
+    MAX_COMMENT_PAGE_SIZE,
+    load_comment_thread,
+    load_replies,
+)
+from api.conditional import (
+    instance_validators,
+    not_modified,
+    page_validators,
+    queryset_validators,
+    set_validators,
+)
+from api.cursors import InvalidCursor
 from api.decorators import jwt_login_required
+from api.gazetteer import (
+    DEFAULT_SUGGESTION_LIMIT,
+    MAX_SUGGESTION_LIMIT,
+    get_gazetteer,
+)
+from api.jwt_auth import authenticate_request
+from api.likes import toggle_like
+from api.location_snapshots import current_manifest, snapshot_file
+from api.media_variants import media_payload
+from api.overdue import get_overdue_sweeper
+from api.password_hashing import (
+    HashingPoolBusy,
+    aauthenticate_password,
+    acheck_password,
+    ahash_password,
+    get_hashing_pool,
+    retry_after_seconds,
+)
+from api.ranking import get_ranking_ordering
+from api.read_state import (
+    annotate_read_state,
+    get_watermark,
+    mark_all_read,
+    read_state_validators,
+    unread_count,
+)
+from api.spatial import DEFAULT_NEAREST, ZipCodeDistance, get_spatial_index
+from api.text_search import contains, similar, startswith
+from api.update_search import get_update_search
+from api.update_stream import stream_events
 
 # Set up logger
 logger = logging.getLogger(__name__)
@@ -34,6 +116,7 @@ from .models import (
     ActivityPriority,
     ActivityStatus,
     Chat,
+    City,
     Contact,
     Message,
     SystemMessage,
@@ -41,9 +124,9 @@ from .models import (
     Update,
     UpdateAttachment,
     UpdateComment,
-    UpdateLike,
     UpdateMedia,
     UserProfile,
+    ZipCode,
 )
 
 
@@ -125,6 +208,26 @@ def version_view(request: HttpRequest) -> JsonResponse:
     )
 
 
+def auth_metrics_view(request: HttpRequest) -> JsonResponse:
+    """Password hashing pool latency and concurrency (staff only)"""
+    user = get_user_from_jwt(request)
+    if not user:
+        return JsonResponse(
+            {
+                "success": False,
+                "error": "Authentication required",
+                "code": "AUTH_REQUIRED",
+            },
+            status=401,
+        )
+    if not user.is_staff:
+        return JsonResponse({"success": False, "error": "Forbidden"}, status=403)
+
+    return JsonResponse(
+        {"success": True, "password_hashing": get_hashing_pool().snapshot()}
+    )
+
+
 # Type alias for Django User to help with type checking
 DjangoUser: TypeAlias = User
 
@@ -156,17 +259,7 @@ def create_jwt_token(user: Union[User, AbstractBaseUser]) -> str:
 
 def get_user_from_jwt(request: HttpRequest) -> Optional[User]:
     """Get user from JWT token in Authorization header"""
-    auth_header = request.META.get("HTTP_AUTHORIZATION", "")
-    if auth_header.startswith("Bearer "):
-        token = auth_header.split(" ")[1]
-        try:
-            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
-            user_id = payload.get("user_id")
-            if user_id:
-                return User.objects.get(id=user_id)
-        except (jwt.InvalidTokenError, User.DoesNotExist):
-            pass
-    return None
+    return authenticate_request(request)
 
 
 @csrf_exempt
@@ -241,8 +334,22 @@ def django_login_view(request: HttpRequest) -> Union[JsonResponse, HttpResponse]
     return HttpResponse(login_form)
 
 
+def _hashing_busy_response() -> JsonResponse:
+    """503 for auth requests shed because the password hashing pool is full"""
+    response = JsonResponse(
+        {
+            "success": False,
+            "error": "Server is busy, please retry shortly",
+            "code": "AUTH_BUSY",
+        },
+        status=503,
+    )
+    response["Retry-After"] = str(retry_after_seconds())
+    return response
+
+
 @csrf_exempt
-def login_view(request: HttpRequest) -> JsonResponse:
+async def login_view(request: HttpRequest) -> JsonResponse:
     """Handle user login"""
     if request.method == "POST":
         try:
@@ -256,9 +363,9 @@ def login_view(request: HttpRequest) -> JsonResponse:
                     status=400,
                 )
 
-            user = authenticate(username=username, password=password)
+            user = await aauthenticate_password(request, username, password)
             if user is not None:
-                login(request, user)
+                await alogin(request, user)
                 # Create JWT token
                 token = create_jwt_token(user)
                 return JsonResponse(
@@ -278,6 +385,8 @@ def login_view(request: HttpRequest) -> JsonResponse:
                 return JsonResponse(
                     {"success": False, "error": "Invalid credentials"}, status=401
                 )
+        except HashingPoolBusy:
+            return _hashing_busy_response()
         except Exception as e:
             return JsonResponse({"success": False, "error": str(e)}, status=500)
 
@@ -295,7 +404,7 @@ def logout_view(request: HttpRequest) -> JsonResponse:
 
 
 @csrf_exempt
-def register_view(request: HttpRequest) -> JsonResponse:
+async def register_view(request: HttpRequest) -> JsonResponse:
     """Handle user registration"""
     if request.method == "POST":
         try:
@@ -315,23 +424,25 @@ def register_view(request: HttpRequest) -> JsonResponse:
                     status=400,
                 )
 
-            if User.objects.filter(username=username).exists():
+            if await User.objects.filter(username=username).aexists():
                 return JsonResponse(
                     {"success": False, "error": "Username already exists"}, status=400
                 )
 
-            if User.objects.filter(email=email).exists():
+            if await User.objects.filter(email=email).aexists():
                 return JsonResponse(
                     {"success": False, "error": "Email already exists"}, status=400
                 )
 
-            user = User.objects.create_user(
-                username=username,
-                email=email,
-                password=password,
+            # What create_user() does, with the hashing moved off the loop
+            user = User(
+                username=User.normalize_username(username),
+                email=User.objects.normalize_email(email),
                 first_name=first_name,
                 last_name=last_name,
             )
+            user.password = await ahash_password(password)
+            await user.asave()
 
             return JsonResponse(
                 {
@@ -345,6 +456,8 @@ def register_view(request: HttpRequest) -> JsonResponse:
                     },
                 }
             )
+        except HashingPoolBusy:
+            return _hashing_busy_response()
         except Exception as e:
             return JsonResponse({"success": False, "error": str(e)}, status=500)
 
@@ -899,7 +1012,7 @@ def download_cv_view(request: HttpRequest) -> HttpResponse:
 
 @csrf_exempt
 @login_required
-def change_password_view(request: HttpRequest) -> JsonResponse:
+async def change_password_view(request: HttpRequest) -> JsonResponse:
     """Handle password change"""
     if request.method == "POST":
         try:
@@ -916,19 +1029,22 @@ def change_password_view(request: HttpRequest) -> JsonResponse:
                     status=400,
                 )
 
-            user = request.user
-            if not user.check_password(current_password):
+            user = await request.auser()
+            if not await acheck_password(user, current_password):
                 return JsonResponse(
                     {"success": False, "error": "Current password is incorrect"},
                     status=400,
                 )
 
-            user.set_password(new_password)
-            user.save()
+            user.password = await ahash_password(new_password)
+            user._password = new_password  # For password_changed() validators
+            await user.asave()
 
             return JsonResponse(
                 {"success": True, "message": "Password changed successfully"}
             )
+        except HashingPoolBusy:
+            return _hashing_busy_response()
         except Exception as e:
             return JsonResponse({"success": False, "error": str(e)}, status=500)
 
@@ -1404,7 +1520,7 @@ def chat_search_view(request: HttpRequest) -> JsonResponse:
 
 # Update API Views
 @csrf_exempt
-def update_list_view(request: HttpRequest) -> JsonResponse:
+def update_list_view(request: HttpRequest) -> HttpResponse:
     """Handle GET requests to list updates and POST requests to create new updates"""
 
     # Check JWT authentication first
@@ -1425,11 +1541,20 @@ def update_list_view(request: HttpRequest) -> JsonResponse:
             update_type = request.GET.get("type", "all")
             status = request.GET.get("status", "all")
             search_query = request.GET.get("q", "")
+            ranking = request.GET.get("ranking", "")
             page = int(request.GET.get("page", 1))
             page_size = int(request.GET.get("page_size", 20))
 
-            # Start with base queryset
-            updates = Update.objects.filter(is_active=True)
+            ordering = get_ranking_ordering(ranking)
+            if ranking and ordering is None:
+                return JsonResponse(
+                    {"success": False, "error": "Invalid ranking value"}, status=400
+                )
+
+            # Start with active, unexpired updates
+            updates = Update.objects.live()
+            if ordering:
+                updates = updates.order_by(*ordering)
 
             # Apply filters
             if update_type != "all":
@@ -1446,11 +1571,29 @@ def update_list_view(request: HttpRequest) -> JsonResponse:
                     | Q(tags__contains=[search_query])
                 )
 
+            # Answer unchanged polls before fetching or serializing any rows;
+            # the read-state validators stand in for is_read and unread_count
+            watermark = get_watermark(user)
+            validators = queryset_validators(
+                request,
+                updates,
+                user=user,
+                extra=read_state_validators(user, watermark)
+                + bookmark_validators(user),
+            )
+            cached = not_modified(request, validators)
+            if cached is not None:
+                return cached
+
+            unread = unread_count(Update.objects.live(), user, watermark)
+
             # Apply pagination
             start = (page - 1) * page_size
             end = start + page_size
             total_count = updates.count()
-            updates_page = updates[start:end]
+            updates_page = annotate_bookmarked(
+                annotate_read_state(updates, user, watermark), user
+            ).prefetch_related("attachments", "media")[start:end]
 
             # Prepare response data
             updates_data = []
@@ -1462,12 +1605,15 @@ def update_list_view(request: HttpRequest) -> JsonResponse:
                     "summary": update.summary,
                     "timestamp": update.timestamp.isoformat(),
                     "status": update.status,
+                    "is_read": update.is_read,
+                    "is_bookmarked": update.is_bookmarked,
                     "tags": update.tags,
                     "author": update.author,
                     "icon": update.icon,
                     "priority": update.priority,
-                    "likes_count": update.get_likes_count(),
-                    "dislikes_count": update.get_dislikes_count(),
+                    "score": update.score,
+                    "likes_count": update.likes_count,
+                    "dislikes_count": update.dislikes_count,
                     "comments_count": update.get_comments_count(),
                     "user_like_status": update.user_has_liked(user),
                     "can_edit": update.can_edit(user),
@@ -1483,32 +1629,27 @@ def update_list_view(request: HttpRequest) -> JsonResponse:
                             for att in update.get_attachments()
                             if hasattr(update, "get_attachments")
                         ],
-                        "media": [
-                            {
-                                "type": getattr(med, "type", None),
-                                "url": getattr(med, "url", None),
-                                "label": getattr(med, "label", None),
-                                "thumbnailUrl": getattr(med, "thumbnail_url", None),
-                            }
-                            for med in update.get_media()
-                            if hasattr(update, "get_media")
-                        ],
+                        "media": [media_payload(med) for med in update.get_media()],
                         "related": update.get_related_updates(),
                     },
                 }
                 updates_data.append(update_data)
 
-            return JsonResponse(
-                {
-                    "success": True,
-                    "updates": updates_data,
-                    "pagination": {
-                        "page": page,
-                        "page_size": page_size,
-                        "total_count": total_count,
-                        "total_pages": (total_count + page_size - 1) // page_size,
-                    },
-                }
+            return set_validators(
+                JsonResponse(
+                    {
+                        "success": True,
+                        "updates": updates_data,
+                        "unread_count": unread,
+                        "pagination": {
+                            "page": page,
+                            "page_size": page_size,
+                            "total_count": total_count,
+                            "total_pages": (total_count + page_size - 1) // page_size,
+                        },
+                    }
+                ),
+                validators,
             )
 
         except Exception as e:
@@ -1589,7 +1730,7 @@ def update_list_view(request: HttpRequest) -> JsonResponse:
 
 @csrf_exempt
 @login_required
-def update_detail_view(request: HttpRequest, update_id: str) -> JsonResponse:
+def update_detail_view(request: HttpRequest, update_id: str) -> HttpResponse:
     """Handle GET, PUT, and DELETE requests for a specific update"""
     try:
         update = Update.objects.get(id=update_id, is_active=True)
@@ -1597,13 +1738,18 @@ def update_detail_view(request: HttpRequest, update_id: str) -> JsonResponse:
         return JsonResponse({"success": False, "error": "Update not found"}, status=404)
 
     if request.method == "GET":
-        # Mark as read if user is viewing it
-        if update.status == "new":
-            update.mark_as_read()
+        # A 304 means this user was already served (and recorded reading) it
+        validators = instance_validators(request, update, user=request.user)
+        cached = not_modified(request, validators)
+        if cached is not None:
+            return cached
+
+        # Record the read for this user only; status is shared by everyone
+        update.mark_as_read(request.user)
 
         # Get related data
-        attachments = list(getattr(update, "attachments", []))
-        media = list(getattr(update, "media", []))
+        attachments = list(update.get_attachments())
+        media = list(update.get_media())
 
         update_data = {
             "id": update.id,
@@ -1622,20 +1768,14 @@ def update_detail_view(request: HttpRequest, update_id: str) -> JsonResponse:
                     {"type": att.type, "url": att.url, "label": att.label}
                     for att in attachments
                 ],
-                "media": [
-                    {
-                        "type": med.type,
-                        "url": med.url,
-                        "label": med.label,
-                        "thumbnailUrl": med.thumbnail_url,
-                    }
-                    for med in media
-                ],
+                "media": [media_payload(med) for med in media],
                 "related": update.get_related_updates(),
             },
         }
 
-        return JsonResponse({"success": True, "update": update_data})
+        return set_validators(
+            JsonResponse({"success": True, "update": update_data}), validators
+        )
 
     elif request.method == "PUT":
         try:
@@ -1736,46 +1876,184 @@ def update_status_view(request: HttpRequest, update_id: str) -> JsonResponse:
 
 
 @csrf_exempt
-@login_required
+async def update_stream_view(request: HttpRequest) -> HttpResponse:
+    """Stream new, edited and deleted updates and counter changes as SSE
+
+    Clients reconnect with ``Last-Event-ID`` to replay what they missed; a
+    ``reset`` event means the id has aged out and the list must be refetched.
+    """
+    user = await sync_to_async(get_user_from_jwt)(request)
+    if not user:
+        return JsonResponse(
+            {
+                "success": False,
+                "error": "Authentication required",
+                "code": "AUTH_REQUIRED",
+            },
+            status=401,
+        )
+
+    if request.method != "GET":
+        return JsonResponse(
+            {"success": False, "error": "Method not allowed"}, status=405
+        )
+
+    last_event_id = request.headers.get("Last-Event-ID") or request.GET.get(
+        "last_event_id"
+    )
+    response = StreamingHttpResponse(
+        stream_events(last_event_id), content_type="text/event-stream"
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+@csrf_exempt
+def update_mark_all_read_view(request: HttpRequest) -> JsonResponse:
+    """Mark every update published up to ``before`` (default: now) as read"""
+    user = get_user_from_jwt(request)
+    if not user:
+        return JsonResponse(
+            {
+                "success": False,
+                "error": "Authentication required",
+                "code": "AUTH_REQUIRED",
+            },
+            status=401,
+        )
+
+    if request.method != "POST":
+        return JsonResponse(
+            {"success": False, "error": "Method not allowed"}, status=405
+        )
+
+    try:
+        data = json.loads(request.body) if request.body else {}
+        before = None
+        if data.get("before"):
+            before = datetime.fromisoformat(data["before"])
+            if timezone.is_naive(before):
+                before = timezone.make_aware(before)
+    except (json.JSONDecodeError, TypeError, ValueError):
+        return JsonResponse(
+            {"success": False, "error": "Invalid before timestamp"}, status=400
+        )
+
+    read_before = mark_all_read(user, before)
+    return JsonResponse(
+        {
+            "success": True,
+            "read_before": read_before.isoformat(),
+            "unread_count": unread_count(Update.objects.live(), user, read_before),
+        }
+    )
+
+
+@csrf_exempt
+def update_bookmark_list_view(request: HttpRequest) -> JsonResponse:
+    """Get a page of the current user's bookmarked updates, newest first"""
+    user = get_user_from_jwt(request)
+    if not user:
+        return JsonResponse(
+            {
+                "success": False,
+                "error": "Authentication required",
+                "code": "AUTH_REQUIRED",
+            },
+            status=401,
+        )
+
+    if request.method != "GET":
+        return JsonResponse(
+            {"success": False, "error": "Method not allowed"}, status=405
+        )
+
+    try:
+        limit = min(
+            max(int(request.GET.get("limit", DEFAULT_BOOKMARK_PAGE_SIZE)), 1),
+            MAX_BOOKMARK_PAGE_SIZE,
+        )
+        bookmarks, next_cursor = load_bookmarks(
+            user, limit=limit, cursor=request.GET.get("cursor") or None
+        )
+    except (InvalidCursor, ValueError):
+        return JsonResponse(
+            {"success": False, "error": "Invalid cursor or page size"}, status=400
+        )
+
+    return JsonResponse(
+        {
+            "success": True,
+            "bookmarks": [
+                {
+                    "id": bookmark.id,
+                    "created_at": bookmark.created_at.isoformat(),
+                    "update": {
+                        "id": bookmark.update.id,
+                        "type": bookmark.update.type,
+                        "title": bookmark.update.title,
+                        "summary": bookmark.update.summary,
+                        "timestamp": bookmark.update.timestamp.isoformat(),
+                        "status": bookmark.update.status,
+                        "author": bookmark.update.author,
+                        "icon": bookmark.update.icon,
+                        "priority": bookmark.update.priority,
+                        "is_bookmarked": True,
+                    },
+                }
+                for bookmark in bookmarks
+            ],
+            "next_cursor": next_cursor,
+        }
+    )
+
+
+@csrf_exempt
+@jwt_login_required
 def update_search_view(request: HttpRequest) -> JsonResponse:
-    """Handle GET requests to search updates"""
+    """Handle GET requests to search updates
+
+    Results are ranked by relevance (title and tags weigh most, then summary,
+    then body), carry a highlighted snippet, and page with ``cursor``.
+    """
     if request.method == "GET":
         try:
-            query = request.GET.get("q", "")
+            query = request.GET.get("q", "").strip()
             update_type = request.GET.get("type", "all")
             tags = request.GET.get("tags", "")
+            cursor = request.GET.get("cursor") or None
 
             if not query:
                 return JsonResponse(
                     {"success": False, "error": "Search query is required"}, status=400
                 )
 
-            # Start with base queryset
-            updates = Update.objects.filter(is_active=True)
-
-            # Apply type filter
-            if update_type != "all":
-                updates = updates.filter(type=update_type)
-
-            # Apply tag filter
-            if tags:
-                tag_list = [tag.strip() for tag in tags.split(",")]
-                updates = updates.filter(tags__overlap=tag_list)
+            try:
+                limit = min(max(int(request.GET.get("limit", 20)), 1), 50)
+            except ValueError:
+                return JsonResponse(
+                    {"success": False, "error": "Invalid limit value"}, status=400
+                )
 
-            # Apply search query
-            updates = updates.filter(
-                Q(title__icontains=query)
-                | Q(summary__icontains=query)
-                | Q(body__icontains=query)
-                | Q(tags__contains=[query])
-            )
+            tag_list = [tag.strip() for tag in tags.split(",") if tag.strip()]
 
-            # Limit results
-            updates = updates[:50]
+            try:
+                hits, next_cursor = get_update_search().search(
+                    query,
+                    update_type=update_type,
+                    tags=tag_list,
+                    limit=limit,
+                    cursor=cursor,
+                )
+            except InvalidCursor:
+                return JsonResponse(
+                    {"success": False, "error": "Invalid cursor"}, status=400
+                )
 
             # Prepare response data
             results = []
-            for update in updates:
+            for update, rank, headline in hits:
                 result = {
                     "id": update.id,
                     "type": update.type,
@@ -1786,11 +2064,18 @@ def update_search_view(request: HttpRequest) -> JsonResponse:
                     "author": update.author,
                     "icon": update.icon,
                     "tags": update.tags,
+                    "rank": rank,
+                    "headline": headline,
                 }
                 results.append(result)
 
             return JsonResponse(
-                {"success": True, "results": results, "total_count": len(results)}
+                {
+                    "success": True,
+                    "results": results,
+                    "total_count": len(results),
+                    "next_cursor": next_cursor,
+                }
             )
 
         except Exception as e:
@@ -1807,6 +2092,70 @@ def websocket_test_view(request: HttpRequest) -> JsonResponse:
 
 
 # New API endpoints for Update CRUD operations
+@csrf_exempt
+def update_bulk_create_view(request: HttpRequest) -> JsonResponse:
+    """Import many updates with nested attachments and media in one request
+
+    Body: ``{"updates": [...], "chunk_size": 500}`` (or a bare list). Every
+    item is validated first; valid items are written one transaction per
+    chunk and the response reports a result per item.
+    """
+    user = get_user_from_jwt(request)
+    if not user:
+        return JsonResponse(
+            {
+                "success": False,
+                "error": "Authentication required",
+                "code": "AUTH_REQUIRED",
+            },
+            status=401,
+        )
+
+    if request.method != "POST":
+        return JsonResponse(
+            {"success": False, "error": "Method not allowed"}, status=405
+        )
+
+    try:
+        data = json.loads(request.body)
+    except json.JSONDecodeError:
+        return JsonResponse({"success": False, "error": "Invalid JSON"}, status=400)
+
+    items = data.get("updates") if isinstance(data, dict) else data
+    if not isinstance(items, list) or not items:
+        return JsonResponse(
+            {"success": False, "error": "Expected a non-empty list of updates"},
+            status=400,
+        )
+
+    try:
+        chunk_size = get_bulk_chunk_size(
+            request.GET.get("chunk_size")
+            or (data.get("chunk_size") if isinstance(data, dict) else None)
+        )
+    except (TypeError, ValueError):
+        return JsonResponse(
+            {"success": False, "error": "Invalid chunk_size value"}, status=400
+        )
+
+    try:
+        results = bulk_import_updates(items, user, chunk_size=chunk_size)
+    except Exception as e:
+        return JsonResponse({"success": False, "error": str(e)}, status=500)
+
+    created = sum(1 for result in results if result["success"])
+    return JsonResponse(
+        {
+            "success": created > 0,
+            "created": created,
+            "failed": len(results) - created,
+            "chunk_size": chunk_size,
+            "results": results,
+        },
+        status=201 if created else 400,
+    )
+
+
 @csrf_exempt
 def update_create_view(request: HttpRequest) -> JsonResponse:
     """Create a new update"""
@@ -2003,38 +2352,22 @@ def update_like_view(request: HttpRequest, update_id: str) -> JsonResponse:
         )
 
     try:
-        update = Update.objects.get(id=update_id)
+        update = Update.objects.only("id").get(id=update_id)
 
         if request.method == "POST":
             data = json.loads(request.body)
-            is_like = data.get("is_like", True)
-
-            # Check if user already has a like/dislike
-            existing_like, created = UpdateLike.objects.get_or_create(
-                update=update, user=user, defaults={"is_like": is_like}
-            )
+            is_like = bool(data.get("is_like", True))
 
-            if not created:
-                # Update existing like/dislike
-                if existing_like.is_like == is_like:
-                    # Remove like/dislike if clicking the same button
-                    existing_like.delete()
-                    action = "removed"
-                else:
-                    # Change from like to dislike or vice versa
-                    existing_like.is_like = is_like
-                    existing_like.save()
-                    action = "updated"
-            else:
-                action = "created"
+            # Remove, flip or add the reaction in a single statement
+            result = toggle_like(update.id, user.pk, is_like)
 
             return JsonResponse(
                 {
                     "success": True,
-                    "action": action,
-                    "likes_count": update.get_likes_count(),
-                    "dislikes_count": update.get_dislikes_count(),
-                    "user_like_status": update.user_has_liked(user),
+                    "action": result.action,
+                    "likes_count": result.likes_count,
+                    "dislikes_count": result.dislikes_count,
+                    "user_like_status": result.user_like_status,
                 }
             )
         else:
@@ -2221,73 +2554,67 @@ def comment_delete_view(request: HttpRequest, comment_id: str) -> JsonResponse:
         return JsonResponse({"success": False, "error": str(e)}, status=400)
 
 
+def _serialize_comment(comment: UpdateComment, user) -> Dict[str, Any]:
+    """Serialize a comment; permissions come from already-loaded columns"""
+    authenticated = user is not None and user.is_authenticated
+    return {
+        "id": comment.id,
+        "content": comment.content,
+        "author": comment.author.username,
+        "created_at": comment.created_at.isoformat(),
+        "can_edit": comment.can_edit(user) if authenticated else False,
+        "can_delete": comment.can_delete(user) if authenticated else False,
+    }
+
+
+def _page_size(request: HttpRequest, name: str, default: int) -> int:
+    return min(max(int(request.GET.get(name, default)), 0), MAX_COMMENT_PAGE_SIZE)
+
+
 @csrf_exempt
 def comment_list_view(request: HttpRequest, update_id: str) -> JsonResponse:
-    """Get comments for an update"""
+    """Get a page of top-level comments, each with a preview of its replies"""
     try:
-        update = Update.objects.get(id=update_id)
+        if not Update.objects.filter(id=update_id).exists():
+            raise Update.DoesNotExist
 
         if request.method == "GET":
-            # Get comments using the Django relationship
-            # Django models use dynamic attributes that aren't visible to static type checkers
             try:
-                comments = (
-                    update.comments.filter(  # type: ignore
-                        is_active=True,
-                        parent_comment__isnull=True,  # Only top-level comments
-                    )
-                    .select_related("author")
-                    .prefetch_related("replies__author")
+                limit = max(_page_size(request, "limit", DEFAULT_COMMENT_PAGE_SIZE), 1)
+                replies_per_comment = _page_size(
+                    request, "replies", DEFAULT_REPLY_PREVIEW
+                )
+            except ValueError:
+                return JsonResponse(
+                    {"success": False, "error": "Invalid page size"}, status=400
+                )
+
+            try:
+                comments, next_cursor = load_comment_thread(
+                    update_id,
+                    limit=limit,
+                    replies_per_comment=replies_per_comment,
+                    cursor=request.GET.get("cursor") or None,
+                )
+            except (InvalidCursor, ValueError):
+                return JsonResponse(
+                    {"success": False, "error": "Invalid cursor"}, status=400
                 )
-            except AttributeError:
-                # Fallback if comments relationship doesn't exist
-                comments = []
 
+            user = getattr(request, "user", None)
             comments_data = []
             for comment in comments:
-                comment_data = {
-                    "id": comment.id,
-                    "content": comment.content,
-                    "author": comment.author.username,
-                    "created_at": comment.created_at.isoformat(),
-                    "can_edit": (
-                        comment.can_edit(request.user)
-                        if hasattr(request, "user") and request.user.is_authenticated
-                        else False
-                    ),
-                    "can_delete": (
-                        comment.can_delete(request.user)
-                        if hasattr(request, "user") and request.user.is_authenticated
-                        else False
-                    ),
-                    "replies": [],
-                }
-
-                # Add replies
-                for reply in comment.replies.filter(is_active=True):
-                    reply_data = {
-                        "id": reply.id,
-                        "content": reply.content,
-                        "author": reply.author.username,
-                        "created_at": reply.created_at.isoformat(),
-                        "can_edit": (
-                            reply.can_edit(request.user)
-                            if hasattr(request, "user")
-                            and request.user.is_authenticated
-                            else False
-                        ),
-                        "can_delete": (
-                            reply.can_delete(request.user)
-                            if hasattr(request, "user")
-                            and request.user.is_authenticated
-                            else False
-                        ),
-                    }
-                    comment_data["replies"].append(reply_data)
-
+                comment_data = _serialize_comment(comment, user)
+                comment_data["replies"] = [
+                    _serialize_comment(reply, user) for reply in comment.preview_replies
+                ]
+                comment_data["reply_count"] = comment.reply_total
+                comment_data["replies_cursor"] = comment.replies_cursor
                 comments_data.append(comment_data)
 
-            return JsonResponse({"success": True, "comments": comments_data})
+            return JsonResponse(
+                {"success": True, "comments": comments_data, "next_cursor": next_cursor}
+            )
         else:
             return JsonResponse(
                 {"success": False, "error": "Method not allowed"}, status=405
@@ -2299,16 +2626,243 @@ def comment_list_view(request: HttpRequest, update_id: str) -> JsonResponse:
         return JsonResponse({"success": False, "error": str(e)}, status=400)
 
 
+@csrf_exempt
+def comment_replies_view(
+    request: HttpRequest, update_id: str, comment_id: int
+) -> JsonResponse:
+    """Get the next page of replies to a top-level comment"""
+    if request.method != "GET":
+        return JsonResponse(
+            {"success": False, "error": "Method not allowed"}, status=405
+        )
+
+    try:
+        if not UpdateComment.objects.filter(
+            id=comment_id, update_id=update_id, is_active=True
+        ).exists():
+            return JsonResponse(
+                {"success": False, "error": "Comment not found"}, status=404
+            )
+
+        try:
+            limit = max(_page_size(request, "limit", DEFAULT_COMMENT_PAGE_SIZE), 1)
+            replies, next_cursor = load_replies(
+                comment_id, limit=limit, cursor=request.GET.get("cursor") or None
+            )
+        except (InvalidCursor, ValueError):
+            return JsonResponse(
+                {"success": False, "error": "Invalid cursor or page size"}, status=400
+            )
+
+        user = getattr(request, "user", None)
+        return JsonResponse(
+            {
+                "success": True,
+                "replies": [_serialize_comment(reply, user) for reply in replies],
+                "next_cursor": next_cursor,
+            }
+        )
+    except Exception as e:
+        return JsonResponse({"success": False, "error": str(e)}, status=400)
+
+
+def _city_suggestion(city: City) -> Dict[str, Any]:
+    state = city.state
+    return {
+        "id": city.id,
+        "name": city.name,
+        "state": {"id": state.id, "name": state.name, "code": state.code},
+        "country": city.country.code,
+    }
+
+
+def _zip_code_payload(zip_code: ZipCode) -> Dict[str, Any]:
+    return {
+        "id": zip_code.id,
+        "code": zip_code.code,
+        "city": _city_suggestion(zip_code.city),
+        "latitude": float(zip_code.latitude) if zip_code.latitude is not None else None,
+        "longitude": (
+            float(zip_code.longitude) if zip_code.longitude is not None else None
+        ),
+    }
+
+
+def location_autocomplete_view(request: HttpRequest) -> JsonResponse:
+    """Autocomplete city names (``type=city``) or ZIP codes (``type=zip``)
+
+    Served from the in-memory gazetteer; no database queries per keystroke.
+    """
+    if request.method != "GET":
+        return JsonResponse(
+            {"success": False, "error": "Method not allowed"}, status=405
+        )
+
+    prefix = request.GET.get("q", "").strip()
+    kind = request.GET.get("type", "city")
+    if kind not in ("city", "zip"):
+        return JsonResponse({"success": False, "error": "Invalid type"}, status=400)
+    try:
+        limit = min(
+            max(int(request.GET.get("limit", DEFAULT_SUGGESTION_LIMIT)), 1),
+            MAX_SUGGESTION_LIMIT,
+        )
+    except ValueError:
+        return JsonResponse({"success": False, "error": "Invalid limit"}, status=400)
+    if not prefix:
+        return JsonResponse({"success": True, "results": []})
+
+    gazetteer = get_gazetteer()
+    if kind == "city":
+        cities = gazetteer.suggest_cities(
+            prefix,
+            state_id=request.GET.get("state_id") or None,
+            country_code=request.GET.get("country_code") or None,
+            limit=limit,
+        )
+        results = [_city_suggestion(city) for city in cities]
+    else:
+        zip_codes = gazetteer.suggest_zip_codes(
+            prefix,
+            city_id=request.GET.get("city_id") or None,
+            state_id=request.GET.get("state_id") or None,
+            limit=limit,
+        )
+        results = [_zip_code_payload(zip_code) for zip_code in zip_codes]
+
+    return JsonResponse({"success": True, "results": results})
+
+
+def _distance_results(found: List[ZipCodeDistance]) -> List[Dict[str, Any]]:
+    return [
+        {**_zip_code_payload(zip_code), "distance_km": distance_km}
+        for zip_code, distance_km in found
+    ]
+
+
+def location_nearest_view(request: HttpRequest) -> JsonResponse:
+    """The ``k`` ZIP codes nearest to ``lat``/``lng``, nearest first"""
+    if request.method != "GET":
+        return JsonResponse(
+            {"success": False, "error": "Method not allowed"}, status=405
+        )
+    try:
+        latitude = float(request.GET["lat"])
+        longitude = float(request.GET["lng"])
+        k = int(request.GET.get("k", DEFAULT_NEAREST))
+        found = get_spatial_index().nearest_zip_codes(latitude, longitude, k)
+    except KeyError:
+        return JsonResponse(
+            {"success": False, "error": "lat and lng are required"}, status=400
+        )
+    except ValueError as e:
+        return JsonResponse({"success": False, "error": str(e)}, status=400)
+
+    return JsonResponse({"success": True, "results": _distance_results(found)})
+
+
+def location_within_view(request: HttpRequest) -> JsonResponse:
+    """ZIP codes within ``km`` kilometres of ZIP ``code``, nearest first"""
+    if request.method != "GET":
+        return JsonResponse(
+            {"success": False, "error": "Method not allowed"}, status=405
+        )
+    code = request.GET.get("code", "").strip()
+    if not code:
+        return JsonResponse({"success": False, "error": "code is required"}, status=400)
+    try:
+        km = float(request.GET.get("km", ""))
+        found = get_spatial_index().zip_codes_within(code, km)
+    except ValueError as e:
+        return JsonResponse({"success": False, "error": str(e)}, status=400)
+    if found is None:
+        return JsonResponse(
+            {"success": False, "error": "Unknown ZIP code or no coordinates"},
+            status=404,
+        )
+
+    return JsonResponse({"success": True, "results": _distance_results(found)})
+
+
+def location_snapshot_manifest_view(request: HttpRequest) -> HttpResponse:
+    """Current locations version and the snapshot files built for it"""
+    if request.method != "GET":
+        return JsonResponse(
+            {"success": False, "error": "Method not allowed"}, status=405
+        )
+
+    manifest = current_manifest()
+    validators = (f'"locations-{manifest["snapshot"]}"', None)
+    cached = not_modified(request, validators)
+    if cached is not None:
+        return cached
+
+    response = JsonResponse(
+        {
+            "success": True,
+            "version": manifest["version"],
+            "snapshot": manifest["snapshot"],
+            "generated_at": manifest["generated_at"],
+            "files": {
+                path: {
+                    **meta,
+                    "url": reverse(
+                        "api_location_snapshot",
+                        kwargs={"snapshot": manifest["snapshot"], "path": path},
+                    ),
+                }
+                for path, meta in manifest["files"].items()
+            },
+        }
+    )
+    return set_validators(response, validators)
+
+
+def location_snapshot_view(
+    request: HttpRequest, snapshot: str, path: str
+) -> HttpResponse:
+    """One file of a location snapshot, pre-compressed and cached forever"""
+    if request.method not in ("GET", "HEAD"):
+        return JsonResponse(
+            {"success": False, "error": "Method not allowed"}, status=405
+        )
+
+    found = snapshot_file(snapshot, path, request.META.get("HTTP_ACCEPT_ENCODING", ""))
+    if found is None:
+        return JsonResponse(
+            {"success": False, "error": "Snapshot file not found"}, status=404
+        )
+
+    file_path, encoding = found
+    # FileResponse streams the file (sendfile where the server supports it)
+    response = FileResponse(
+        open(file_path, "rb"),
+        content_type="application/json",
+        filename=path.rsplit("/", 1)[-1],
+    )
+    if encoding:
+        response["Content-Encoding"] = encoding
+    # A snapshot's files never change; new content gets a new URL
+    response["Cache-Control"] = "public, max-age=31536000, immutable"
+    patch_vary_headers(response, ("Accept-Encoding",))
+    return response
+
+
 @csrf_exempt
 # @login_required  # Temporarily disabled for development
-def tags_list_view(request: HttpRequest) -> JsonResponse:
+def tags_list_view(request: HttpRequest) -> HttpResponse:
     """Handle GET requests to list all available tags"""
     if request.method == "GET":
         try:
             # Get query parameters
             category = request.GET.get("category", "")
             search_query = request.GET.get("q", "")
+            match = request.GET.get("match", "contains")
             active_only = request.GET.get("active_only", "true").lower() == "true"
+            if match not in ("contains", "prefix", "similar"):
+                return JsonResponse(
+                    {"success": False, "error": "Invalid match"}, status=400
+                )
 
             # Start with base queryset
             tags = Tag.objects.all()
@@ -2320,12 +2874,17 @@ def tags_list_view(request: HttpRequest) -> JsonResponse:
             if category:
                 tags = tags.filter(category=category)
 
-            if search_query:
-                tags = tags.filter(
-                    Q(name__icontains=search_query)
-                    | Q(description__icontains=search_query)
-                    | Q(category__icontains=search_query)
-                )
+            if search_query and match == "prefix":
+                tags = startswith(tags, "name", search_query)
+            elif search_query and match == "similar":
+                tags = similar(tags, "name", search_query)
+            elif search_query:
+                tags = contains(tags, ["name", "description", "category"], search_query)
+
+            validators = queryset_validators(request, tags)
+            cached = not_modified(request, validators)
+            if cached is not None:
+                return cached
 
             # Prepare response data
             tags_data = []
@@ -2343,8 +2902,11 @@ def tags_list_view(request: HttpRequest) -> JsonResponse:
                 }
                 tags_data.append(tag_data)
 
-            return JsonResponse(
-                {"success": True, "tags": tags_data, "total_count": len(tags_data)}
+            return set_validators(
+                JsonResponse(
+                    {"success": True, "tags": tags_data, "total_count": len(tags_data)}
+                ),
+                validators,
             )
 
         except Exception as e:
@@ -2492,8 +3054,12 @@ def tag_create_view(request: HttpRequest) -> JsonResponse:
 
 # Activity Views
 @csrf_exempt
-def activity_list_view(request: HttpRequest) -> JsonResponse:
-    """Get list of activities with optional filtering"""
+def activity_list_view(request: HttpRequest) -> HttpResponse:
+    """Get a page of activities with optional filtering
+
+    GET takes ``cursor`` and ``limit`` for keyset paging and ``fields`` (comma
+    separated) to return only some columns.
+    """
 
     # Check JWT authentication first
     user = get_user_from_jwt(request)
@@ -2508,6 +3074,7 @@ def activity_list_view(request: HttpRequest) -> JsonResponse:
         )
 
     if request.method == "GET":
+        get_overdue_sweeper().ensure_running()
         try:
             # Get query parameters for filtering
             status_filter = request.GET.get("status")
@@ -2526,41 +3093,48 @@ def activity_list_view(request: HttpRequest) -> JsonResponse:
             if type_filter:
                 activities = activities.filter(type=type_filter)
             if assigned_to_filter:
-                activities = activities.filter(
-                    assigned_to__icontains=assigned_to_filter
+                activities = contains(activities, ["assigned_to"], assigned_to_filter)
+
+            try:
+                keys = parse_activity_fields(request.GET.get("fields"))
+                limit = min(
+                    max(int(request.GET.get("limit", DEFAULT_ACTIVITY_PAGE_SIZE)), 1),
+                    MAX_ACTIVITY_PAGE_SIZE,
                 )
+            except ValueError as e:
+                return JsonResponse({"success": False, "error": str(e)}, status=400)
 
-            # Serialize activities
-            activities_data = []
-            for activity in activities:
-                activities_data.append(
-                    {
-                        "id": str(activity.id),
-                        "title": activity.title,
-                        "description": activity.description,
-                        "type": activity.type,
-                        "status": activity.status,
-                        "priority": activity.priority,
-                        "startTime": activity.start_time.isoformat(),
-                        "endTime": activity.end_time.isoformat(),
-                        "assignedTo": activity.assigned_to,
-                        "assignedBy": activity.assigned_by,
-                        "location": activity.location,
-                        "progress": activity.progress,
-                        "estimatedDuration": activity.estimated_duration,
-                        "actualDuration": activity.actual_duration,
-                        "notes": activity.notes,
-                        "createdAt": activity.created_at.isoformat(),
-                        "updatedAt": activity.updated_at.isoformat(),
-                    }
+            try:
+                activities_data, next_cursor, stamps = load_activity_page(
+                    activities,
+                    keys,
+                    limit=limit,
+                    cursor=request.GET.get("cursor") or None,
+                )
+            except InvalidCursor:
+                return JsonResponse(
+                    {"success": False, "error": "Invalid cursor"}, status=400
                 )
 
-            return JsonResponse(
-                {
-                    "success": True,
-                    "activities": activities_data,
-                    "count": len(activities_data),
-                }
+            # From the page just read: an aggregate over every matching row
+            # would cost more than the page itself on a large table
+            validators = page_validators(
+                request, stamps, user=user, extra=(next_cursor or "",)
+            )
+            cached = not_modified(request, validators)
+            if cached is not None:
+                return cached
+
+            return set_validators(
+                JsonResponse(
+                    {
+                        "success": True,
+                        "activities": activities_data,
+                        "count": len(activities_data),
+                        "next_cursor": next_cursor,
+                    }
+                ),
+                validators,
             )
 
         except Exception as e:
@@ -2587,27 +3161,36 @@ def activity_list_view(request: HttpRequest) -> JsonResponse:
                         status=400,
                     )
 
-            # Create activity
-            activity = Activity.objects.create(
-                title=data["title"],
-                description=data["description"],
-                type=data["type"],
-                status=data.get("status", "planned"),
-                priority=data.get("priority", "medium"),
-                start_time=datetime.fromisoformat(
-                    data["start_time"].replace("Z", "+00:00")
-                ),
-                end_time=datetime.fromisoformat(
-                    data["end_time"].replace("Z", "+00:00")
-                ),
-                assigned_to=data["assigned_to"],
-                assigned_by=data.get("assigned_by", user.username),
-                location=data.get("location", ""),
-                progress=data.get("progress", 0),
-                estimated_duration=data["estimated_duration"],
-                notes=data.get("notes", ""),
-                created_by=user,
+            start_time = datetime.fromisoformat(
+                data["start_time"].replace("Z", "+00:00")
             )
+            end_time = datetime.fromisoformat(data["end_time"].replace("Z", "+00:00"))
+            status = data.get("status", "planned")
+            with transaction.atomic():
+                if status not in FREE_STATUSES:
+                    conflict = _schedule_conflict_response(
+                        data["assigned_to"], start_time, end_time
+                    )
+                    if conflict is not None:
+                        return conflict
+
+                # Create activity
+                activity = Activity.objects.create(
+                    title=data["title"],
+                    description=data["description"],
+                    type=data["type"],
+                    status=status,
+                    priority=data.get("priority", "medium"),
+                    start_time=start_time,
+                    end_time=end_time,
+                    assigned_to=data["assigned_to"],
+                    assigned_by=data.get("assigned_by", user.username),
+                    location=data.get("location", ""),
+                    progress=data.get("progress", 0),
+                    estimated_duration=data["estimated_duration"],
+                    notes=data.get("notes", ""),
+                    created_by=user,
+                )
 
             # Serialize the created activity
             activity_data = {
@@ -2640,9 +3223,129 @@ def activity_list_view(request: HttpRequest) -> JsonResponse:
     return JsonResponse({"success": False, "error": "Method not allowed"}, status=405)
 
 
+def _schedule_conflict_response(assigned_to, start_time, end_time, exclude_id=None):
+    """A 409 response when the assignee is already booked, else None
+
+    Call it inside the transaction that saves the activity: it locks the
+    assignee's schedule until that transaction ends.
+    """
+    lock_schedules(assigned_to)
+    conflicts = find_conflicts(assigned_to, start_time, end_time, exclude_id)
+    if not conflicts:
+        return None
+    return JsonResponse(
+        {
+            "success": False,
+            "error": f"{assigned_to} already has an activity at that time",
+            "code": "SCHEDULE_CONFLICT",
+            "conflicts": conflicts_payload(conflicts),
+        },
+        status=409,
+    )
+
+
+@jwt_login_required
+def activity_calendar_view(request: HttpRequest) -> HttpResponse:
+    """Activities overlapping a window (``from``/``to``), by start time
+
+    Optional ``assigned_to`` (exact name) limits it to one person's calendar
+    and ``fields`` works as for the activity list.
+    """
+    if request.method != "GET":
+        return JsonResponse(
+            {"success": False, "error": "Method not allowed"}, status=405
+        )
+
+    get_overdue_sweeper().ensure_running()
+    try:
+        start = parse_moment(request.GET.get("from"))
+        end = parse_moment(request.GET.get("to"), end_of_day=True)
+        keys = parse_activity_fields(request.GET.get("fields"))
+        activities = calendar_window(
+            start, end, assigned_to=request.GET.get("assigned_to") or None
+        )
+    except ValueError as e:
+        return JsonResponse({"success": False, "error": str(e)}, status=400)
+
+    validators = queryset_validators(request, activities, user=request.user)
+    cached = not_modified(request, validators)
+    if cached is not None:
+        return cached
+
+    activities_data = project_activities(activities[: MAX_CALENDAR_RESULTS + 1], keys)
+    truncated = len(activities_data) > MAX_CALENDAR_RESULTS
+    activities_data = activities_data[:MAX_CALENDAR_RESULTS]
+    return set_validators(
+        JsonResponse(
+            {
+                "success": True,
+                "from": start.isoformat(),
+                "to": end.isoformat(),
+                "activities": activities_data,
+                "count": len(activities_data),
+                "truncated": truncated,
+            }
+        ),
+        validators,
+    )
+
+
+@csrf_exempt
+@jwt_login_required
+def activity_batch_view(request: HttpRequest) -> HttpResponse:
+    """Apply a list of start/pause/reassign/reprioritize operations at once
+
+    Body: ``{"operations": [{"op": "start", "id": "..."}, ...]}``. Returns a
+    result per operation; failed operations do not stop the others.
+    """
+    if request.method != "POST":
+        return JsonResponse(
+            {"success": False, "error": "Method not allowed"}, status=405
+        )
+
+    try:
+        data = json.loads(request.body)
+        if not isinstance(data, dict):
+            raise ValueError("Body must be a JSON object")
+        outcome = apply_activity_batch(data.get("operations"))
+    except ValueError as e:
+        return JsonResponse({"success": False, "error": str(e)}, status=400)
+
+    return JsonResponse({"success": outcome["failed"] == 0, **outcome})
+
+
+@jwt_login_required
+def activity_stats_view(request: HttpRequest) -> HttpResponse:
+    """Activity counts by status, priority, type and day, from the rollup
+
+    Optional ``from``/``to`` (inclusive dates, by start day) and ``type``.
+    """
+    if request.method != "GET":
+        return JsonResponse(
+            {"success": False, "error": "Method not allowed"}, status=405
+        )
+
+    get_overdue_sweeper().ensure_running()
+    days = {}
+    for param in ("from", "to"):
+        value = request.GET.get(param)
+        if value:
+            try:
+                days[param] = date.fromisoformat(value)
+            except ValueError:
+                return JsonResponse(
+                    {"success": False, "error": f"Invalid {param} date"}, status=400
+                )
+
+    stats = activity_stats(
+        days.get("from"), days.get("to"), type=request.GET.get("type") or None
+    )
+    return JsonResponse({"success": True, **stats})
+
+
 @csrf_exempt
 @jwt_login_required
-def activity_detail_view(request: HttpRequest, activity_id: str) -> JsonResponse:
+def activity_detail_view(request: HttpRequest, activity_id: str) -> HttpResponse:
     """Get, update, or delete a specific activity"""
     try:
         activity = get_object_or_404(Activity, id=activity_id)
@@ -2653,6 +3356,11 @@ def activity_detail_view(request: HttpRequest, activity_id: str) -> JsonResponse
 
     if request.method == "GET":
         try:
+            validators = instance_validators(request, activity, user=request.user)
+            cached = not_modified(request, validators)
+            if cached is not None:
+                return cached
+
             activity_data = {
                 "id": str(activity.id),
                 "title": activity.title,
@@ -2673,7 +3381,9 @@ def activity_detail_view(request: HttpRequest, activity_id: str) -> JsonResponse
                 "updatedAt": activity.updated_at.isoformat(),
             }
 
-            return JsonResponse({"success": True, "activity": activity_data})
+            return set_validators(
+                JsonResponse({"success": True, "activity": activity_data}), validators
+            )
 
         except Exception as e:
             return JsonResponse({"success": False, "error": str(e)}, status=500)
@@ -2687,6 +3397,7 @@ def activity_detail_view(request: HttpRequest, activity_id: str) -> JsonResponse
                 )
 
             data = json.loads(request.body)
+            stored_schedule = schedule_of(activity)
 
             # Update fields
             if "title" in data:
@@ -2720,7 +3431,21 @@ def activity_detail_view(request: HttpRequest, activity_id: str) -> JsonResponse
             if "notes" in data:
                 activity.notes = data["notes"]
 
-            activity.save()
+            with transaction.atomic():
+                if (
+                    activity.status not in FREE_STATUSES
+                    and schedule_of(activity) != stored_schedule
+                ):
+                    conflict = _schedule_conflict_response(
+                        activity.assigned_to,
+                        activity.start_time,
+                        activity.end_time,
+                        exclude_id=activity.pk,
+                    )
+                    if conflict is not None:
+                        return conflict
+
+                activity.save()
 
             # Serialize the updated activity
             activity_data = {
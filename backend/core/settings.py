@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -52,6 +53,7 @@ MIDDLEWARE = [
     "django.middleware.csrf.CsrfViewMiddleware",
     "api.middleware.JWTAuthenticationMiddleware",  # JWT authentication must come BEFORE Django's auth middleware
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "api.middleware.RateLimitMiddleware",  # Needs the user, so after auth
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -112,9 +114,13 @@ ASGI_APPLICATION = "core.asgi.application"
 
 # Use Daphne as the ASGI server
 
+# Redis, so events published by one process (a request, the expiry sweeper,
+# a management command) reach /api/updates/stream/ clients on every other.
+# The in-memory layer only works with a single server process.
 CHANNEL_LAYERS = {
     "default": {
-        "BACKEND": "channels.layers.InMemoryChannelLayer",
+        "BACKEND": "channels_redis.core.RedisChannelLayer",
+        "CONFIG": {"hosts": [os.environ.get("REDIS_URL", "redis://localhost:6379/0")]},
     },
 }
 
@@ -137,6 +143,22 @@ DATABASES = {
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
+# The first hasher encodes new passwords; the rest only verify old hashes,
+# which are upgraded on the next successful login
+PASSWORD_HASHERS = [
+    "api.hashers.TunedPBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+PASSWORD_PBKDF2_ITERATIONS = 1_200_000  # Above Django 5.2's 1,000,000
+
+# Thread pool for login/register/change-password hashing
+PASSWORD_HASHING_WORKERS = 4
+PASSWORD_HASHING_MAX_PENDING = 32  # Queued + running hashes before shedding
+PASSWORD_HASHING_RETRY_AFTER = 2  # Seconds, sent with the 503
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
@@ -212,6 +234,49 @@ DATA_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024  # 10MB
 FILE_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024  # 10MB
 DATA_UPLOAD_MAX_NUMBER_FIELDS = 10000  # Increase field limit for complex forms
 
+# Rows written per transaction by POST /api/updates/bulk/ (overridable per request)
+UPDATE_BULK_CHUNK_SIZE = 500
+
+# Server-Sent Events feed at /api/updates/stream/
+UPDATE_STREAM_BUFFER_SIZE = 500  # Events kept per process for Last-Event-ID resume
+UPDATE_STREAM_HEARTBEAT_SECONDS = 15
+
+# Seconds between write-behind flushes of Update like/dislike counters
+LIKE_COUNTER_FLUSH_INTERVAL = 0.25
+
+# Thumbnail/responsive variant generation for UpdateMedia images
+UPDATE_MEDIA_WORKERS = 2  # Worker processes; 0 renders inline after commit
+UPDATE_MEDIA_VARIANT_WIDTHS = (320, 640, 1280)
+
+# Token-bucket limits per URL name: "<requests>/<s|min|hour>", counted per user
+# (or per IP when anonymous) in a table shared by all workers on the host
+RATE_LIMITS = {
+    "api_chat_list": "60/min",
+    "api_chat_messages": "120/min",
+    "api_update_search": "30/min",
+    "graphql": "120/min",
+}
+RATE_LIMIT_TABLE_SLOTS = 65536
+RATE_LIMIT_STORE_PATH = None  # Default: a private 0700 dir in /dev/shm (or temp)
+
+# Seconds between checks of the locations version by the in-memory gazetteer
+GAZETTEER_VERSION_CHECK_SECONDS = 30
+
+# Seconds between checks of the activity status/priority config version
+ACTIVITY_CONFIG_CHECK_SECONDS = 30
+
+# Seconds between in-process sweeps marking past-due activities overdue
+# (0 disables; cron can run `manage.py sweep_overdue_activities` instead)
+ACTIVITY_OVERDUE_SWEEP_SECONDS = 300
+
+# Pre-compressed location snapshots, one directory per locations version
+LOCATION_SNAPSHOT_ROOT = MEDIA_ROOT / "location_snapshots"
+LOCATION_SNAPSHOT_KEEP_VERSIONS = 3
+
+# Per-process cache of JWT-authenticated users, keyed by (user_id, iat)
+JWT_USER_CACHE_SIZE = 1024
+JWT_USER_CACHE_TTL = 60  # Seconds another process may serve a stale user row
+
 # Additional settings for handling large data
 MAX_UPLOAD_SIZE = 10 * 1024 * 1024  # 10MB
 CONTENT_TYPES = ["image/jpeg", "image/png", "image/gif", "application/pdf"]
@@ -1,3 +1,5 @@
+import tempfile
+
 from .settings import *  # noqa: F401,F403
 
 # Use SQLite for tests to avoid external DB dependency
@@ -14,3 +16,25 @@ PASSWORD_HASHERS = [
 ]
 
 EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+
+# Tests run in one process, so no Redis is needed for the update stream
+CHANNEL_LAYERS = {
+    "default": {
+        "BACKEND": "channels.layers.InMemoryChannelLayer",
+    },
+}
+
+# Flush like counters on commit instead of from a background thread
+LIKE_COUNTER_FLUSH_INTERVAL = 0
+
+# Tests run the overdue sweep explicitly
+ACTIVITY_OVERDUE_SWEEP_SECONDS = 0
+
+# Render media variants inline instead of in a process pool
+UPDATE_MEDIA_WORKERS = 0
+
+# Tests opt in to rate limits explicitly
+RATE_LIMITS = {}
+
+# Keep location snapshots out of MEDIA_ROOT; version numbers restart per run
+LOCATION_SNAPSHOT_ROOT = tempfile.mkdtemp(prefix="location-snapshots-")
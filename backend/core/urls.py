@@ -62,6 +62,7 @@ urlpatterns = [
     # Health and meta
     path("api/health/", views.healthcheck_view, name="api_health"),
     path("api/version/", views.version_view, name="api_version"),
+    path("api/auth/metrics/", views.auth_metrics_view, name="api_auth_metrics"),
     # Chat API endpoints
     path("api/chat/", views.chat_list_view, name="api_chat_list"),
     path(
@@ -82,6 +83,27 @@ urlpatterns = [
     path("api/chat/search/", views.chat_search_view, name="api_chat_search"),
     # Update API endpoints
     path("api/updates/", views.update_list_view, name="api_update_list"),
+    path("api/updates/search/", views.update_search_view, name="api_update_search"),
+    path(
+        "api/updates/bookmarks/",
+        views.update_bookmark_list_view,
+        name="api_update_bookmarks",
+    ),
+    path(
+        "api/updates/stream/",
+        views.update_stream_view,
+        name="api_update_stream",
+    ),
+    path(
+        "api/updates/bulk/",
+        views.update_bulk_create_view,
+        name="api_update_bulk_create",
+    ),
+    path(
+        "api/updates/mark-all-read/",
+        views.update_mark_all_read_view,
+        name="api_update_mark_all_read",
+    ),
     path(
         "api/updates/<str:update_id>/",
         views.update_detail_view,
@@ -92,7 +114,6 @@ urlpatterns = [
         views.update_status_view,
         name="api_update_status",
     ),
-    path("api/updates/search/", views.update_search_view, name="api_update_search"),
     # Update CRUD operations
     path("api/updates/create/", views.update_create_view, name="api_update_create"),
     path(
@@ -105,6 +126,32 @@ urlpatterns = [
         views.update_delete_view,
         name="api_update_delete",
     ),
+    # Location autocomplete and proximity search (in-memory gazetteer)
+    path(
+        "api/locations/autocomplete/",
+        views.location_autocomplete_view,
+        name="api_location_autocomplete",
+    ),
+    path(
+        "api/locations/nearest/",
+        views.location_nearest_view,
+        name="api_location_nearest",
+    ),
+    path(
+        "api/locations/within/",
+        views.location_within_view,
+        name="api_location_within",
+    ),
+    path(
+        "api/locations/snapshot/manifest/",
+        views.location_snapshot_manifest_view,
+        name="api_location_snapshot_manifest",
+    ),
+    path(
+        "api/locations/snapshot/<str:snapshot>/<path:path>",
+        views.location_snapshot_view,
+        name="api_location_snapshot",
+    ),
     # Tag management endpoints
     path("api/tags/", views.tags_list_view, name="api_tags_list"),
     path("api/tags/create/", views.tag_create_view, name="api_tag_create"),
@@ -127,6 +174,11 @@ urlpatterns = [
         views.comment_create_view,
         name="api_comment_create",
     ),
+    path(
+        "api/updates/<str:update_id>/comments/<int:comment_id>/replies/",
+        views.comment_replies_view,
+        name="api_comment_replies",
+    ),
     path(
         "api/comments/<int:comment_id>/edit/",
         views.comment_edit_view,
@@ -141,6 +193,21 @@ urlpatterns = [
     path("ws/test/", views.websocket_test_view, name="websocket_test"),
     # Activities API endpoints
     path("api/activities/", views.activity_list_view, name="api_activities_list"),
+    path(
+        "api/activities/calendar/",
+        views.activity_calendar_view,
+        name="api_activities_calendar",
+    ),
+    path(
+        "api/activities/batch/",
+        views.activity_batch_view,
+        name="api_activities_batch",
+    ),
+    path(
+        "api/activities/stats/",
+        views.activity_stats_view,
+        name="api_activities_stats",
+    ),
     path(
         "api/activities/<str:activity_id>/",
         views.activity_detail_view,
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 """
-Script to populate zip codes for California (USA) and Baja California (Mexico).
+Script to populate zip codes for California and Baja California.
+The data lives in api/management/data/zip_codes.csv.
 """
 
 import os
@@ -15,1601 +16,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
 django.setup()
 
-from api.models import City, Country, State, ZipCode
-
-
-def get_california_zipcodes():
-    """Get major California zip codes"""
-    return {
-        # Los Angeles area
-        "Los Angeles": [
-            "90001",
-            "90002",
-            "90003",
-            "90004",
-            "90005",
-            "90006",
-            "90007",
-            "90008",
-            "90009",
-            "90010",
-            "90011",
-            "90012",
-            "90013",
-            "90014",
-            "90015",
-            "90016",
-            "90017",
-            "90018",
-            "90019",
-            "90020",
-            "90021",
-            "90022",
-            "90023",
-            "90024",
-            "90025",
-            "90026",
-            "90027",
-            "90028",
-            "90029",
-            "90030",
-            "90031",
-            "90032",
-            "90033",
-            "90034",
-            "90035",
-            "90036",
-            "90037",
-            "90038",
-            "90039",
-            "90040",
-            "90041",
-            "90042",
-            "90043",
-            "90044",
-            "90045",
-            "90046",
-            "90047",
-            "90048",
-            "90049",
-            "90050",
-            "90051",
-            "90052",
-            "90053",
-            "90054",
-            "90055",
-            "90056",
-            "90057",
-            "90058",
-            "90059",
-            "90060",
-            "90061",
-            "90062",
-            "90063",
-            "90064",
-            "90065",
-            "90066",
-            "90067",
-            "90068",
-            "90069",
-            "90070",
-            "90071",
-            "90072",
-            "90073",
-            "90074",
-            "90075",
-            "90076",
-            "90077",
-            "90078",
-            "90079",
-            "90080",
-            "90081",
-            "90082",
-            "90083",
-            "90084",
-            "90085",
-            "90086",
-            "90087",
-            "90088",
-            "90089",
-            "90090",
-            "90091",
-            "90092",
-            "90093",
-            "90094",
-            "90095",
-            "90096",
-            "90097",
-            "90098",
-            "90099",
-            "90100",
-        ],
-        # San Francisco area
-        "San Francisco": [
-            "94102",
-            "94103",
-            "94104",
-            "94105",
-            "94107",
-            "94108",
-            "94109",
-            "94110",
-            "94111",
-            "94112",
-            "94114",
-            "94115",
-            "94116",
-            "94117",
-            "94118",
-            "94119",
-            "94120",
-            "94121",
-            "94122",
-            "94123",
-            "94124",
-            "94125",
-            "94126",
-            "94127",
-            "94128",
-            "94129",
-            "94130",
-            "94131",
-            "94132",
-            "94133",
-            "94134",
-            "94135",
-            "94136",
-            "94137",
-            "94138",
-            "94139",
-            "94140",
-            "94141",
-            "94142",
-            "94143",
-            "94144",
-            "94145",
-            "94146",
-            "94147",
-            "94148",
-            "94149",
-            "94150",
-            "94151",
-            "94152",
-            "94153",
-            "94154",
-            "94155",
-            "94156",
-            "94157",
-            "94158",
-            "94159",
-            "94160",
-            "94161",
-            "94162",
-            "94163",
-            "94164",
-            "94165",
-            "94166",
-            "94167",
-            "94168",
-            "94169",
-            "94170",
-            "94171",
-            "94172",
-            "94173",
-            "94174",
-            "94175",
-            "94176",
-            "94177",
-            "94178",
-            "94179",
-            "94180",
-            "94181",
-            "94182",
-            "94183",
-            "94184",
-            "94185",
-            "94186",
-            "94187",
-            "94188",
-            "94189",
-            "94190",
-            "94191",
-            "94192",
-            "94193",
-            "94194",
-            "94195",
-            "94196",
-            "94197",
-            "94198",
-            "94199",
-        ],
-        # San Diego area
-        "San Diego": [
-            "92101",
-            "92102",
-            "92103",
-            "92104",
-            "92105",
-            "92106",
-            "92107",
-            "92108",
-            "92109",
-            "92110",
-            "92111",
-            "92112",
-            "92113",
-            "92114",
-            "92115",
-            "92116",
-            "92117",
-            "92118",
-            "92119",
-            "92120",
-            "92121",
-            "92122",
-            "92123",
-            "92124",
-            "92125",
-            "92126",
-            "92127",
-            "92128",
-            "92129",
-            "92130",
-            "92131",
-            "92132",
-            "92133",
-            "92134",
-            "92135",
-            "92136",
-            "92137",
-            "92138",
-            "92139",
-            "92140",
-            "92141",
-            "92142",
-            "92143",
-            "92144",
-            "92145",
-            "92146",
-            "92147",
-            "92148",
-            "92149",
-            "92150",
-            "92151",
-            "92152",
-            "92153",
-            "92154",
-            "92155",
-            "92156",
-            "92157",
-            "92158",
-            "92159",
-            "92160",
-            "92161",
-            "92162",
-            "92163",
-            "92164",
-            "92165",
-            "92166",
-            "92167",
-            "92168",
-            "92169",
-            "92170",
-            "92171",
-            "92172",
-            "92173",
-            "92174",
-            "92175",
-            "92176",
-            "92177",
-            "92178",
-            "92179",
-            "92180",
-            "92181",
-            "92182",
-            "92183",
-            "92184",
-            "92185",
-            "92186",
-            "92187",
-            "92188",
-            "92189",
-            "92190",
-            "92191",
-            "92192",
-            "92193",
-            "92194",
-            "92195",
-            "92196",
-            "92197",
-            "92198",
-            "92199",
-        ],
-        # Sacramento area
-        "Sacramento": [
-            "95811",
-            "95812",
-            "95813",
-            "95814",
-            "95815",
-            "95816",
-            "95817",
-            "95818",
-            "95819",
-            "95820",
-            "95821",
-            "95822",
-            "95823",
-            "95824",
-            "95825",
-            "95826",
-            "95827",
-            "95828",
-            "95829",
-            "95830",
-            "95831",
-            "95832",
-            "95833",
-            "95834",
-            "95835",
-            "95836",
-            "95837",
-            "95838",
-            "95839",
-            "95840",
-            "95841",
-            "95842",
-            "95843",
-            "95844",
-            "95845",
-            "95846",
-            "95847",
-            "95848",
-            "95849",
-            "95850",
-            "95851",
-            "95852",
-            "95853",
-            "95854",
-            "95855",
-            "95856",
-            "95857",
-            "95858",
-            "95859",
-            "95860",
-            "95861",
-            "95862",
-            "95863",
-            "95864",
-            "95865",
-            "95866",
-            "95867",
-            "95868",
-            "95869",
-            "95870",
-            "95871",
-            "95872",
-            "95873",
-            "95874",
-            "95875",
-            "95876",
-            "95877",
-            "95878",
-            "95879",
-            "95880",
-            "95881",
-            "95882",
-            "95883",
-            "95884",
-            "95885",
-            "95886",
-            "95887",
-            "95888",
-            "95889",
-            "95890",
-            "95891",
-            "95892",
-            "95893",
-            "95894",
-            "95895",
-            "95896",
-            "95897",
-            "95898",
-            "95899",
-        ],
-        # San Jose area
-        "San Jose": [
-            "95110",
-            "95111",
-            "95112",
-            "95113",
-            "95114",
-            "95115",
-            "95116",
-            "95117",
-            "95118",
-            "95119",
-            "95120",
-            "95121",
-            "95122",
-            "95123",
-            "95124",
-            "95125",
-            "95126",
-            "95127",
-            "95128",
-            "95129",
-            "95130",
-            "95131",
-            "95132",
-            "95133",
-            "95134",
-            "95135",
-            "95136",
-            "95137",
-            "95138",
-            "95139",
-            "95140",
-            "95141",
-            "95142",
-            "95143",
-            "95144",
-            "95145",
-            "95146",
-            "95147",
-            "95148",
-            "95149",
-            "95150",
-            "95151",
-            "95152",
-            "95153",
-            "95154",
-            "95155",
-            "95156",
-            "95157",
-            "95158",
-            "95159",
-            "95160",
-            "95161",
-            "95162",
-            "95163",
-            "95164",
-            "95165",
-            "95166",
-            "95167",
-            "95168",
-            "95169",
-            "95170",
-            "95171",
-            "95172",
-            "95173",
-            "95174",
-            "95175",
-            "95176",
-            "95177",
-            "95178",
-            "95179",
-            "95180",
-            "95181",
-            "95182",
-            "95183",
-            "95184",
-            "95185",
-            "95186",
-            "95187",
-            "95188",
-            "95189",
-            "95190",
-            "95191",
-            "95192",
-            "95193",
-            "95194",
-            "95195",
-            "95196",
-            "95197",
-            "95198",
-            "95199",
-        ],
-        # Oakland area
-        "Oakland": [
-            "94601",
-            "94602",
-            "94603",
-            "94604",
-            "94605",
-            "94606",
-            "94607",
-            "94608",
-            "94609",
-            "94610",
-            "94611",
-            "94612",
-            "94613",
-            "94614",
-            "94615",
-            "94616",
-            "94617",
-            "94618",
-            "94619",
-            "94620",
-            "94621",
-            "94622",
-            "94623",
-            "94624",
-            "94625",
-            "94626",
-            "94627",
-            "94628",
-            "94629",
-            "94630",
-            "94631",
-            "94632",
-            "94633",
-            "94634",
-            "94635",
-            "94636",
-            "94637",
-            "94638",
-            "94639",
-            "94640",
-            "94641",
-            "94642",
-            "94643",
-            "94644",
-            "94645",
-            "94646",
-            "94647",
-            "94648",
-            "94649",
-            "94650",
-            "94651",
-            "94652",
-            "94653",
-            "94654",
-            "94655",
-            "94656",
-            "94657",
-            "94658",
-            "94659",
-            "94660",
-            "94661",
-            "94662",
-            "94663",
-            "94664",
-            "94665",
-            "94666",
-            "94667",
-            "94668",
-            "94669",
-            "94670",
-            "94671",
-            "94672",
-            "94673",
-            "94674",
-            "94675",
-            "94676",
-            "94677",
-            "94678",
-            "94679",
-            "94680",
-            "94681",
-            "94682",
-            "94683",
-            "94684",
-            "94685",
-            "94686",
-            "94687",
-            "94688",
-            "94689",
-            "94690",
-            "94691",
-            "94692",
-            "94693",
-            "94694",
-            "94695",
-            "94696",
-            "94697",
-            "94698",
-            "94699",
-        ],
-        # Fresno area
-        "Fresno": [
-            "93701",
-            "93702",
-            "93703",
-            "93704",
-            "93705",
-            "93706",
-            "93707",
-            "93708",
-            "93709",
-            "93710",
-            "93711",
-            "93712",
-            "93713",
-            "93714",
-            "93715",
-            "93716",
-            "93717",
-            "93718",
-            "93719",
-            "93720",
-            "93721",
-            "93722",
-            "93723",
-            "93724",
-            "93725",
-            "93726",
-            "93727",
-            "93728",
-            "93729",
-            "93730",
-            "93731",
-            "93732",
-            "93733",
-            "93734",
-            "93735",
-            "93736",
-            "93737",
-            "93738",
-            "93739",
-            "93740",
-            "93741",
-            "93742",
-            "93743",
-            "93744",
-            "93745",
-            "93746",
-            "93747",
-            "93748",
-            "93749",
-            "93750",
-            "93751",
-            "93752",
-            "93753",
-            "93754",
-            "93755",
-            "93756",
-            "93757",
-            "93758",
-            "93759",
-            "93760",
-            "93761",
-            "93762",
-            "93763",
-            "93764",
-            "93765",
-            "93766",
-            "93767",
-            "93768",
-            "93769",
-            "93770",
-            "93771",
-            "93772",
-            "93773",
-            "93774",
-            "93775",
-            "93776",
-            "93777",
-            "93778",
-            "93779",
-            "93780",
-            "93781",
-            "93782",
-            "93783",
-            "93784",
-            "93785",
-            "93786",
-            "93787",
-            "93788",
-            "93789",
-            "93790",
-            "93791",
-            "93792",
-            "93793",
-            "93794",
-            "93795",
-            "93796",
-            "93797",
-            "93798",
-            "93799",
-        ],
-        # Long Beach area
-        "Long Beach": [
-            "90801",
-            "90802",
-            "90803",
-            "90804",
-            "90805",
-            "90806",
-            "90807",
-            "90808",
-            "90809",
-            "90810",
-            "90811",
-            "90812",
-            "90813",
-            "90814",
-            "90815",
-            "90816",
-            "90817",
-            "90818",
-            "90819",
-            "90820",
-            "90821",
-            "90822",
-            "90823",
-            "90824",
-            "90825",
-            "90826",
-            "90827",
-            "90828",
-            "90829",
-            "90830",
-            "90831",
-            "90832",
-            "90833",
-            "90834",
-            "90835",
-            "90836",
-            "90837",
-            "90838",
-            "90839",
-            "90840",
-            "90841",
-            "90842",
-            "90843",
-            "90844",
-            "90845",
-            "90846",
-            "90847",
-            "90848",
-            "90849",
-            "90850",
-            "90851",
-            "90852",
-            "90853",
-            "90854",
-            "90855",
-            "90856",
-            "90857",
-            "90858",
-            "90859",
-            "90860",
-            "90861",
-            "90862",
-            "90863",
-            "90864",
-            "90865",
-            "90866",
-            "90867",
-            "90868",
-            "90869",
-            "90870",
-            "90871",
-            "90872",
-            "90873",
-            "90874",
-            "90875",
-            "90876",
-            "90877",
-            "90878",
-            "90879",
-            "90880",
-            "90881",
-            "90882",
-            "90883",
-            "90884",
-            "90885",
-            "90886",
-            "90887",
-            "90888",
-            "90889",
-            "90890",
-            "90891",
-            "90892",
-            "90893",
-            "90894",
-            "90895",
-            "90896",
-            "90897",
-            "90898",
-            "90899",
-        ],
-        # Bakersfield area
-        "Bakersfield": [
-            "93301",
-            "93302",
-            "93303",
-            "93304",
-            "93305",
-            "93306",
-            "93307",
-            "93308",
-            "93309",
-            "93310",
-            "93311",
-            "93312",
-            "93313",
-            "93314",
-            "93315",
-            "93316",
-            "93317",
-            "93318",
-            "93319",
-            "93320",
-            "93321",
-            "93322",
-            "93323",
-            "93324",
-            "93325",
-            "93326",
-            "93327",
-            "93328",
-            "93329",
-            "93330",
-            "93331",
-            "93332",
-            "93333",
-            "93334",
-            "93335",
-            "93336",
-            "93337",
-            "93338",
-            "93339",
-            "93340",
-            "93341",
-            "93342",
-            "93343",
-            "93344",
-            "93345",
-            "93346",
-            "93347",
-            "93348",
-            "93349",
-            "93350",
-            "93351",
-            "93352",
-            "93353",
-            "93354",
-            "93355",
-            "93356",
-            "93357",
-            "93358",
-            "93359",
-            "93360",
-            "93361",
-            "93362",
-            "93363",
-            "93364",
-            "93365",
-            "93366",
-            "93367",
-            "93368",
-            "93369",
-            "93370",
-            "93371",
-            "93372",
-            "93373",
-            "93374",
-            "93375",
-            "93376",
-            "93377",
-            "93378",
-            "93379",
-            "93380",
-            "93381",
-            "93382",
-            "93383",
-            "93384",
-            "93385",
-            "93386",
-            "93387",
-            "93388",
-            "93389",
-            "93390",
-            "93391",
-            "93392",
-            "93393",
-            "93394",
-            "93395",
-            "93396",
-            "93397",
-            "93398",
-            "93399",
-        ],
-        # Anaheim area
-        "Anaheim": [
-            "92801",
-            "92802",
-            "92803",
-            "92804",
-            "92805",
-            "92806",
-            "92807",
-            "92808",
-            "92809",
-            "92810",
-            "92811",
-            "92812",
-            "92813",
-            "92814",
-            "92815",
-            "92816",
-            "92817",
-            "92818",
-            "92819",
-            "92820",
-            "92821",
-            "92822",
-            "92823",
-            "92824",
-            "92825",
-            "92826",
-            "92827",
-            "92828",
-            "92829",
-            "92830",
-            "92831",
-            "92832",
-            "92833",
-            "92834",
-            "92835",
-            "92836",
-            "92837",
-            "92838",
-            "92839",
-            "92840",
-            "92841",
-            "92842",
-            "92843",
-            "92844",
-            "92845",
-            "92846",
-            "92847",
-            "92848",
-            "92849",
-            "92850",
-            "92851",
-            "92852",
-            "92853",
-            "92854",
-            "92855",
-            "92856",
-            "92857",
-            "92858",
-            "92859",
-            "92860",
-            "92861",
-            "92862",
-            "92863",
-            "92864",
-            "92865",
-            "92866",
-            "92867",
-            "92868",
-            "92869",
-            "92870",
-            "92871",
-            "92872",
-            "92873",
-            "92874",
-            "92875",
-            "92876",
-            "92877",
-            "92878",
-            "92879",
-            "92880",
-            "92881",
-            "92882",
-            "92883",
-            "92884",
-            "92885",
-            "92886",
-            "92887",
-            "92888",
-            "92889",
-            "92890",
-            "92891",
-            "92892",
-            "92893",
-            "92894",
-            "92895",
-            "92896",
-            "92897",
-            "92898",
-            "92899",
-        ],
-    }
-
-
-def get_baja_california_zipcodes():
-    """Get major Baja California zip codes"""
-    return {
-        # Tijuana area
-        "Tijuana": [
-            "22000",
-            "22010",
-            "22020",
-            "22030",
-            "22040",
-            "22050",
-            "22060",
-            "22070",
-            "22080",
-            "22090",
-            "22100",
-            "22110",
-            "22120",
-            "22130",
-            "22140",
-            "22150",
-            "22160",
-            "22170",
-            "22180",
-            "22190",
-            "22200",
-            "22210",
-            "22220",
-            "22230",
-            "22240",
-            "22250",
-            "22260",
-            "22270",
-            "22280",
-            "22290",
-            "22300",
-            "22310",
-            "22320",
-            "22330",
-            "22340",
-            "22350",
-            "22360",
-            "22370",
-            "22380",
-            "22390",
-            "22400",
-            "22410",
-            "22420",
-            "22430",
-            "22440",
-            "22450",
-            "22460",
-            "22470",
-            "22480",
-            "22490",
-            "22500",
-            "22510",
-            "22520",
-            "22530",
-            "22540",
-            "22550",
-            "22560",
-            "22570",
-            "22580",
-            "22590",
-            "22600",
-            "22610",
-            "22620",
-            "22630",
-            "22640",
-            "22650",
-            "22660",
-            "22670",
-            "22680",
-            "22690",
-            "22700",
-            "22710",
-            "22720",
-            "22730",
-            "22740",
-            "22750",
-            "22760",
-            "22770",
-            "22780",
-            "22790",
-            "22800",
-            "22810",
-            "22820",
-            "22830",
-            "22840",
-            "22850",
-            "22860",
-            "22870",
-            "22880",
-            "22890",
-            "22900",
-            "22910",
-            "22920",
-            "22930",
-            "22940",
-            "22950",
-            "22960",
-            "22970",
-            "22980",
-            "22990",
-        ],
-        # Mexicali area
-        "Mexicali": [
-            "21000",
-            "21010",
-            "21020",
-            "21030",
-            "21040",
-            "21050",
-            "21060",
-            "21070",
-            "21080",
-            "21090",
-            "21100",
-            "21110",
-            "21120",
-            "21130",
-            "21140",
-            "21150",
-            "21160",
-            "21170",
-            "21180",
-            "21190",
-            "21200",
-            "21210",
-            "21220",
-            "21230",
-            "21240",
-            "21250",
-            "21260",
-            "21270",
-            "21280",
-            "21290",
-            "21300",
-            "21310",
-            "21320",
-            "21330",
-            "21340",
-            "21350",
-            "21360",
-            "21370",
-            "21380",
-            "21390",
-            "21400",
-            "21410",
-            "21420",
-            "21430",
-            "21440",
-            "21450",
-            "21460",
-            "21470",
-            "21480",
-            "21490",
-            "21500",
-            "21510",
-            "21520",
-            "21530",
-            "21540",
-            "21550",
-            "21560",
-            "21570",
-            "21580",
-            "21590",
-            "21600",
-            "21610",
-            "21620",
-            "21630",
-            "21640",
-            "21650",
-            "21660",
-            "21670",
-            "21680",
-            "21690",
-            "21700",
-            "21710",
-            "21720",
-            "21730",
-            "21740",
-            "21750",
-            "21760",
-            "21770",
-            "21780",
-            "21790",
-            "21800",
-            "21810",
-            "21820",
-            "21830",
-            "21840",
-            "21850",
-            "21860",
-            "21870",
-            "21880",
-            "21890",
-            "21900",
-            "21910",
-            "21920",
-            "21930",
-            "21940",
-            "21950",
-            "21960",
-            "21970",
-            "21980",
-            "21990",
-        ],
-        # Ensenada area
-        "Ensenada": [
-            "22750",
-            "22760",
-            "22770",
-            "22780",
-            "22790",
-            "22800",
-            "22810",
-            "22820",
-            "22830",
-            "22840",
-            "22850",
-            "22860",
-            "22870",
-            "22880",
-            "22890",
-            "22900",
-            "22910",
-            "22920",
-            "22930",
-            "22940",
-            "22950",
-            "22960",
-            "22970",
-            "22980",
-            "22990",
-            "23000",
-            "23010",
-            "23020",
-            "23030",
-            "23040",
-            "23050",
-            "23060",
-            "23070",
-            "23080",
-            "23090",
-            "23100",
-            "23110",
-            "23120",
-            "23130",
-            "23140",
-            "23150",
-            "23160",
-            "23170",
-            "23180",
-            "23190",
-            "23200",
-            "23210",
-            "23220",
-            "23230",
-            "23240",
-            "23250",
-            "23260",
-            "23270",
-            "23280",
-            "23290",
-            "23300",
-            "23310",
-            "23320",
-            "23330",
-            "23340",
-            "23350",
-            "23360",
-            "23370",
-            "23380",
-            "23390",
-            "23400",
-            "23410",
-            "23420",
-            "23430",
-            "23440",
-            "23450",
-            "23460",
-            "23470",
-            "23480",
-            "23490",
-            "23500",
-            "23510",
-            "23520",
-            "23530",
-            "23540",
-            "23550",
-            "23560",
-            "23570",
-            "23580",
-            "23590",
-            "23600",
-            "23610",
-            "23620",
-            "23630",
-            "23640",
-            "23650",
-            "23660",
-            "23670",
-            "23680",
-            "23690",
-            "23700",
-            "23710",
-            "23720",
-            "23730",
-            "23740",
-        ],
-        # Tecate area
-        "Tecate": [
-            "21400",
-            "21410",
-            "21420",
-            "21430",
-            "21440",
-            "21450",
-            "21460",
-            "21470",
-            "21480",
-            "21490",
-            "21500",
-            "21510",
-            "21520",
-            "21530",
-            "21540",
-            "21550",
-            "21560",
-            "21570",
-            "21580",
-            "21590",
-            "21600",
-            "21610",
-            "21620",
-            "21630",
-            "21640",
-            "21650",
-            "21660",
-            "21670",
-            "21680",
-            "21690",
-            "21700",
-            "21710",
-            "21720",
-            "21730",
-            "21740",
-            "21750",
-            "21760",
-            "21770",
-            "21780",
-            "21790",
-            "21800",
-            "21810",
-            "21820",
-            "21830",
-            "21840",
-            "21850",
-            "21860",
-            "21870",
-            "21880",
-            "21890",
-            "21900",
-            "21910",
-            "21920",
-            "21930",
-            "21940",
-            "21950",
-            "21960",
-            "21970",
-            "21980",
-            "21990",
-            "22000",
-            "22010",
-            "22020",
-            "22030",
-            "22040",
-            "22050",
-            "22060",
-            "22070",
-            "22080",
-            "22090",
-            "22100",
-            "22110",
-            "22120",
-            "22130",
-            "22140",
-            "22150",
-            "22160",
-            "22170",
-            "22180",
-            "22190",
-            "22200",
-            "22210",
-            "22220",
-            "22230",
-            "22240",
-            "22250",
-            "22260",
-            "22270",
-            "22280",
-            "22290",
-            "22300",
-            "22310",
-            "22320",
-            "22330",
-            "22340",
-            "22350",
-            "22360",
-            "22370",
-            "22380",
-            "22390",
-        ],
-        # Rosarito area
-        "Rosarito": [
-            "22700",
-            "22710",
-            "22720",
-            "22730",
-            "22740",
-            "22750",
-            "22760",
-            "22770",
-            "22780",
-            "22790",
-            "22800",
-            "22810",
-            "22820",
-            "22830",
-            "22840",
-            "22850",
-            "22860",
-            "22870",
-            "22880",
-            "22890",
-            "22900",
-            "22910",
-            "22920",
-            "22930",
-            "22940",
-            "22950",
-            "22960",
-            "22970",
-            "22980",
-            "22990",
-            "23000",
-            "23010",
-            "23020",
-            "23030",
-            "23040",
-            "23050",
-            "23060",
-            "23070",
-            "23080",
-            "23090",
-            "23100",
-            "23110",
-            "23120",
-            "23130",
-            "23140",
-            "23150",
-            "23160",
-            "23170",
-            "23180",
-            "23190",
-            "23200",
-            "23210",
-            "23220",
-            "23230",
-            "23240",
-            "23250",
-            "23260",
-            "23270",
-            "23280",
-            "23290",
-            "23300",
-            "23310",
-            "23320",
-            "23330",
-            "23340",
-            "23350",
-            "23360",
-            "23370",
-            "23380",
-            "23390",
-            "23400",
-            "23410",
-            "23420",
-            "23430",
-            "23440",
-            "23450",
-            "23460",
-            "23470",
-            "23480",
-            "23490",
-            "23500",
-            "23510",
-            "23520",
-            "23530",
-            "23540",
-            "23550",
-            "23560",
-            "23570",
-            "23580",
-            "23590",
-            "23600",
-            "23610",
-            "23620",
-            "23630",
-            "23640",
-            "23650",
-            "23660",
-            "23670",
-            "23680",
-            "23690",
-        ],
-    }
-
-
-def populate_zipcodes_for_state(state_code, country_code, zipcodes_data):
-    """Populate zip codes for a specific state"""
-    print(f"\nAdding zip codes for {state_code} ({country_code})...")
-
-    # Get the country and state
-    try:
-        country = Country.objects.get(code=country_code)
-        state = State.objects.get(country=country, code=state_code)
-    except (Country.DoesNotExist, State.DoesNotExist) as e:
-        print(f"Error: {e}")
-        return
-
-    total_added = 0
-    for city_name, zipcode_list in zipcodes_data.items():
-        # Get the city
-        try:
-            city = City.objects.get(name=city_name, state=state, country=country)
-        except City.DoesNotExist:
-            print(f"  Warning: City {city_name} not found for {state.name}")
-            continue
-
-        print(f"  Adding zip codes for {city.name}:")
-        city_added = 0
-
-        for zipcode in zipcode_list:
-            zip_obj, created = ZipCode.objects.get_or_create(
-                code=zipcode,
-                city=city,
-                state=state,
-                country=country,
-                defaults={"is_active": True},
-            )
-            if created:
-                city_added += 1
-                total_added += 1
-
-        print(f"    {city_added} new zip codes added for {city.name}")
-
-    print(f"Total zip codes added for {state.name}: {total_added}")
-
-
-def main():
-    """Main function to populate zip codes for California and Baja California"""
-    print(
-        "📮 Populating zip codes for California (USA) and Baja California (Mexico)..."
-    )
-    print("=" * 70)
-
-    # Get zip code data
-    california_zipcodes = get_california_zipcodes()
-    baja_california_zipcodes = get_baja_california_zipcodes()
-
-    # Populate zip codes
-    populate_zipcodes_for_state("CA", "USA", california_zipcodes)
-    populate_zipcodes_for_state("BCN", "MEX", baja_california_zipcodes)
-
-    # Summary
-    ca_zipcodes = ZipCode.objects.filter(state__code="CA").count()
-    bcn_zipcodes = ZipCode.objects.filter(state__code="BCN").count()
-
-    print("\n" + "=" * 70)
-    print("✅ Zip code population complete!")
-    print(f"California zip codes: {ca_zipcodes}")
-    print(f"Baja California zip codes: {bcn_zipcodes}")
-    print(f"Total zip codes: {ca_zipcodes + bcn_zipcodes}")
-
+from django.core.management import call_command
 
 if __name__ == "__main__":
-    main()
+    call_command("load_locations", "zip_codes.csv")